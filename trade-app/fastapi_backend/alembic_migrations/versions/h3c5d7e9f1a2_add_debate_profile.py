@@ -0,0 +1,27 @@
+"""add profile to debates
+
+Revision ID: h3c5d7e9f1a2
+Revises: g2b4c6d8e0f1
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = "h3c5d7e9f1a2"
+down_revision: Union[str, None] = "g2b4c6d8e0f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("debates", sa.Column("profile", JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("debates", "profile")
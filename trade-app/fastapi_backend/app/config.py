@@ -56,10 +56,80 @@ class Settings(BaseSettings):
     guardian_llm_model: str = "gemini-2.5-flash"
     guardian_llm_temperature: float = 0.3
     guardian_enabled: bool = True
+    # Generate the next agent's turn while the Guardian reviews the last one;
+    # the speculative turn is discarded unbroadcast if the Guardian interrupts.
+    guardian_pipelined: bool = False
+    # Guardian prompts carry the last N arguments in full, older ones as a
+    # one-line summary, capped at an estimated token budget (0 = no cap).
+    guardian_context_recent_arguments: int = 4
+    guardian_context_token_budget: int = 3000
+    # LLM call governor: beyond these limits calls wait in a queue (Guardian
+    # first, then agent turns, then trading analysis) instead of running into
+    # provider 429s. Request and token buckets are per model; 0 = no limit.
+    # Token costs are estimated up front (prompt chars / 4 plus
+    # llm_estimated_output_tokens) and corrected from reported usage.
+    llm_max_concurrent: int = 16
+    llm_requests_per_minute: int = 1000
+    llm_tokens_per_minute: int = 1_000_000
+    llm_estimated_output_tokens: int = 512
+    # Ordered LLM provider chain, comma separated. "gemini" (needs
+    # google_api_key), "fake" (in-process canned text) or one of the offline
+    # providers below; "name:model" pins a model, e.g.
+    # "gemini,gemini:gemini-2.0-flash". With
+    # several providers, errors fail over down the chain and, when hedging is
+    # on, a primary with no first token within its rolling p95 time to first
+    # token races the next provider (initial delay until enough samples).
+    llm_providers: str = "gemini"
+    llm_hedging_enabled: bool = True
+    llm_hedge_initial_delay_seconds: float = 2.0
+    # Offline providers for benchmarks and CI. "record" wraps Gemini and
+    # appends every exchange, with token timing, to llm_record_path; "replay"
+    # streams that tape back llm_replay_speedup times faster (0 = no delays);
+    # "synthetic" streams llm_synthetic_tokens words at
+    # llm_synthetic_tokens_per_second after llm_synthetic_first_token_seconds.
+    llm_record_path: str = "llm_tape.jsonl"
+    llm_replay_speedup: float = 1.0
+    llm_synthetic_tokens: int = 200
+    llm_synthetic_tokens_per_second: float = 50.0
+    llm_synthetic_first_token_seconds: float = 0.5
+    # Redis cache of Guardian / trading-analyst results for calls re-run on
+    # identical inputs (archive retries, replays, resumes), keyed on model,
+    # temperature, rendered prompt and schema. Opt-in per call site, comma
+    # separated: "guardian", "trading_analyst". Bull/Bear turns never cache.
+    llm_cache_sites: str = ""
+    llm_cache_ttl_seconds: int = 86_400
+    llm_cache_max_entries: int = 10_000
 
     # Voting Capacity
     VOTE_CAPACITY_LIMIT: int = 10_000
 
+    # WebSocket fan-out
+    # Frames buffered per connection before the slow-consumer policy kicks in.
+    WS_SEND_QUEUE_SIZE: int = 256
+    # "latest_state" keeps only the newest non-token frame per action type;
+    # "drop" closes the socket with WebSocketCloseCodes.SLOW_CONSUMER.
+    WS_SLOW_CONSUMER_POLICY: str = "latest_state"
+    # "memory" fans out within this process only; "redis" relays every frame
+    # over pub/sub so viewers on any worker receive it.
+    WS_BACKPLANE: str = "memory"
+    # Per-debate replay log for reconnecting clients ("memory" or "redis").
+    WS_EVENT_LOG: str = "memory"
+    WS_EVENT_LOG_MAXLEN: int = 2000
+    # Handshake user cache: how long a verified user is trusted without a DB
+    # read, and how many users are kept per worker.
+    WS_USER_CACHE_TTL_SECONDS: int = 60
+    WS_USER_CACHE_SIZE: int = 10_000
+    # Admission control: connection caps (0 = no cap; the global cap is
+    # coordinated through Redis) and the utilisation at which a debate first
+    # gets fewer token frames, then status updates only. At 100% new
+    # connections are closed with 4029 and a retry hint.
+    WS_MAX_CONNECTIONS_GLOBAL: int = 0
+    WS_MAX_CONNECTIONS_PER_WORKER: int = 5000
+    WS_MAX_CONNECTIONS_PER_DEBATE: int = 2000
+    WS_ADMISSION_REDUCE_FPS_AT: float = 0.7
+    WS_ADMISSION_STATUS_ONLY_AT: float = 0.85
+    WS_ADMISSION_RETRY_AFTER_SECONDS: int = 15
+
     # Audit Trail (NFR-09)
     AUDIT_ENABLED: bool = False
     AUDIT_RECONCILIATION_INTERVAL_SECONDS: int = 300
@@ -91,18 +161,67 @@ class Settings(BaseSettings):
     # LangGraph Checkpointer
     CHECKPOINTER_TYPE: str = "memory"
     CHECKPOINTER_URL: str | None = None
+    # In-memory store: the newest N checkpoints per debate are kept, and whole
+    # debates are evicted least recently written first above the byte cap.
+    CHECKPOINTER_KEEP_PER_THREAD: int = 2
+    CHECKPOINTER_MEMORY_MAX_BYTES: int = 64 * 1024 * 1024
+    # Postgres store: size of the shared pool, and how often checkpoints of
+    # archived debates are deleted.
+    CHECKPOINTER_POOL_SIZE: int = 10
+    CHECKPOINTER_PRUNE_INTERVAL_SECONDS: int = 600
+    # Checkpoint payloads at least this large are stored zlib-compressed.
+    CHECKPOINTER_COMPRESS_MIN_BYTES: int = 1024
+
+    # Crash-safe debates: a running debate holds a Redis lease renewed every
+    # DEBATE_LEASE_RENEW_SECONDS. Once it lapses, any worker resumes the
+    # debate from its last checkpoint (needs a shared checkpointer, i.e.
+    # CHECKPOINTER_TYPE=postgres). On shutdown in-flight debates get
+    # DEBATE_DRAIN_TIMEOUT_SECONDS to finish before being handed off.
+    DEBATE_LEASES_ENABLED: bool = True
+    DEBATE_LEASE_TTL_SECONDS: int = 30
+    DEBATE_LEASE_RENEW_SECONDS: int = 10
+    DEBATE_DRAIN_TIMEOUT_SECONDS: int = 20
+
+    # Debate scheduling: at most DEBATE_MAX_CONCURRENT debates run per process
+    # and up to DEBATE_MAX_QUEUED more wait for a slot; starts beyond that are
+    # refused. "local" runs debates in the web process; "worker" only queues
+    # them in Redis for `python -m commands.debate_worker` processes (needed on
+    # serverless deployments; pair with WS_BACKPLANE=redis so viewers get the
+    # frames). Queue ETAs start from DEBATE_ESTIMATED_RUN_SECONDS and follow
+    # measured run times.
+    DEBATE_EXECUTION_MODE: str = "local"
+    DEBATE_MAX_CONCURRENT: int = 8
+    DEBATE_MAX_QUEUED: int = 100
+    DEBATE_ESTIMATED_RUN_SECONDS: int = 120
+
+    # Prometheus-style /metrics (per process; scrape every worker). Leave it
+    # unexposed publicly or disable it where there is no private scrape path.
+    METRICS_ENABLED: bool = True
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
     )
 
+    @property
+    def llm_provider_chain(self) -> list[tuple[str, str | None]]:
+        """``llm_providers`` parsed into ``(provider, pinned model or None)``."""
+        chain = []
+        for entry in self.llm_providers.split(","):
+            name, _, model = entry.strip().partition(":")
+            if name:
+                chain.append((name.strip().lower(), model.strip() or None))
+        return chain
+
     def validate_llm_config(self) -> None:
         """Validate LLM configuration at startup.
 
         Raises:
             ValueError: If required LLM settings are missing in production.
         """
-        if not self.google_api_key and self.ENVIRONMENT != "test":
+        needs_gemini = all(
+            name in ("gemini", "record") for name, _ in self.llm_provider_chain
+        )
+        if needs_gemini and not self.google_api_key and self.ENVIRONMENT != "test":
             raise ValueError(
                 "google_api_key is required for debate engine. "
                 "Set GOOGLE_API_KEY environment variable."
@@ -18,6 +18,7 @@ from app.routes.debate import router as debate_router
 from app.routes.landing import router as landing_router
 from app.routes.ws import router as ws_router
 from app.routes.admin import admin_router
+from app.routes.metrics import router as metrics_router
 from app.config import settings
 from app.middleware.mock_middleware import MockHeadersMiddleware
 
@@ -29,6 +30,16 @@ async def lifespan(application: FastAPI):
     from app.services.debate.archival_sweeper import sweep_loop
     from app.services.audit.writer import get_audit_writer, QueuedAuditWriter
     from app.services.audit.reconciliation import run_reconciliation_loop
+    from app.services.debate.sanitization import apply_phrases_control
+    from app.services.debate.streaming import connection_manager
+    from app.services.user_cache import apply_user_cache_control
+    from app.services.market.watcher import close_market_watcher
+    from app.routes.debate import get_debate_service, shutdown_debate_service
+    from app.services.debate.checkpoints import (
+        close_checkpointer,
+        open_checkpointer,
+        prune_loop,
+    )
 
     sweeper_task = asyncio.create_task(sweep_loop())
     logger.info("Archival sweeper started")
@@ -40,8 +51,34 @@ async def lifespan(application: FastAPI):
         reconciliation_task = asyncio.create_task(run_reconciliation_loop())
         logger.info("Audit writer and reconciliation started")
 
+    # Admin phrase reloads and user invalidations on any worker apply here too.
+    await connection_manager.backplane.subscribe_control(apply_phrases_control)
+    await connection_manager.backplane.subscribe_control(apply_user_cache_control)
+
+    await open_checkpointer()
+    prune_task: asyncio.Task | None = None
+    if settings.CHECKPOINTER_TYPE == "postgres":
+        prune_task = asyncio.create_task(prune_loop())
+        logger.info("Checkpoint pruning started")
+
+    # In worker mode the debate workers run and resume debates.
+    if settings.DEBATE_LEASES_ENABLED and settings.DEBATE_EXECUTION_MODE == "local":
+        try:
+            get_debate_service().start_recovery()
+            logger.info("Debate recovery started")
+        except Exception as e:
+            logger.warning(f"Debate recovery not started: {e}")
+
     yield
 
+    await shutdown_debate_service()
+    if prune_task:
+        prune_task.cancel()
+        try:
+            await prune_task
+        except asyncio.CancelledError:
+            pass
+    await close_checkpointer()
     if isinstance(audit_writer, QueuedAuditWriter):
         await audit_writer.close()
     if reconciliation_task:
@@ -58,6 +95,9 @@ async def lifespan(application: FastAPI):
         pass
     logger.info("Archival sweeper stopped")
 
+    await close_market_watcher()
+    await connection_manager.close()
+
 
 app = FastAPI(
     generate_unique_id_function=simple_generate_unique_route_id,
@@ -152,4 +192,5 @@ app.include_router(debate_router)
 app.include_router(landing_router, prefix="/api")
 app.include_router(ws_router)
 app.include_router(admin_router)
+app.include_router(metrics_router)
 add_pagination(app)
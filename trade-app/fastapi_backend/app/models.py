@@ -52,6 +52,8 @@ class Debate(Base):
     vote_bear = Column(Integer, nullable=True, default=None)
     vote_undecided = Column(Integer, nullable=True, default=None)
     trading_analysis = Column(JSONB, nullable=True)
+    # Compact timing profile (see app.services.debate.profiling.DebateProfile).
+    profile = Column(JSONB, nullable=True)
 
     votes = relationship("Vote", back_populates="debate", cascade="all, delete-orphan")
     audit_events = relationship(
@@ -15,6 +15,14 @@ from app.models import (
     HallucinationFlag,
 )
 from app.services.audit.dlq import list_dlq_entries, replay_dlq_entry
+from app.services.debate.profiling import summarize_profiles
+from app.services.debate.repository import DebateRepository
+from app.services.debate.sanitization import (
+    PHRASES_RELOAD_CONTROL,
+    get_phrase_set,
+    reload_forbidden_phrases,
+)
+from app.services.debate.streaming import connection_manager
 from app.users import current_superuser
 
 logger = logging.getLogger(__name__)
@@ -109,6 +117,12 @@ class AdminDebateDetailResponse(AdminEnvelope):
     audit_events: list[AdminAuditEventItem]
 
 
+class AdminDebateProfileResponse(AdminEnvelope):
+    debate_id: str
+    external_id: str
+    profile: dict
+
+
 class HallucinationFlagCreate(AdminEnvelope):
     turn: int
     agent: str
@@ -140,6 +154,15 @@ class HallucinationFlagListResponse(AdminEnvelope):
     page_size: int
 
 
+class ForbiddenPhrasesReload(AdminEnvelope):
+    phrases: list[str] | None = None
+
+
+class ForbiddenPhrasesResponse(AdminEnvelope):
+    version: int
+    phrases: list[str]
+
+
 # --- Debate Endpoints ---
 
 
@@ -431,6 +454,50 @@ async def get_debate_detail(
     }
 
 
+@admin_router.get("/debates/{debate_id}/profile")
+async def get_debate_profile(
+    debate_id: UUID,
+    session: AsyncSession = Depends(get_async_session),
+):
+    start = time.monotonic()
+
+    result = await session.execute(select(Debate).where(Debate.id == debate_id))
+    debate = result.scalar_one_or_none()
+    if not debate:
+        raise HTTPException(status_code=404, detail="Debate not found")
+    if not debate.profile:
+        raise HTTPException(status_code=404, detail="No profile recorded for debate")
+
+    latency_ms = int((time.monotonic() - start) * 1000)
+    return {
+        "data": AdminDebateProfileResponse(
+            debate_id=str(debate.id),
+            external_id=debate.external_id,
+            profile=debate.profile,
+        ),
+        "error": None,
+        "meta": {"latency_ms": latency_ms},
+    }
+
+
+@admin_router.get("/debates/profiles")
+async def summarize_debate_profiles(
+    limit: int = Query(100, ge=1, le=1000),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """p50/p90/p99 timings across the most recent profiled debates."""
+    start = time.monotonic()
+
+    profiles = await DebateRepository(session).get_recent_profiles(limit)
+
+    latency_ms = int((time.monotonic() - start) * 1000)
+    return {
+        "data": summarize_profiles(profiles),
+        "error": None,
+        "meta": {"latency_ms": latency_ms},
+    }
+
+
 # --- DLQ Endpoints ---
 
 
@@ -662,3 +729,45 @@ async def update_hallucination_flag(
         "error": None,
         "meta": {"latency_ms": latency_ms},
     }
+
+
+# --- Forbidden Phrases ---
+
+
+@admin_router.get("/sanitization/phrases")
+async def get_forbidden_phrases():
+    phrase_set = get_phrase_set()
+    return {
+        "data": ForbiddenPhrasesResponse(
+            version=phrase_set.version, phrases=list(phrase_set.phrases)
+        ),
+        "error": None,
+        "meta": {},
+    }
+
+
+@admin_router.post("/sanitization/phrases/reload")
+async def reload_phrases(body: ForbiddenPhrasesReload | None = None):
+    """Swap in a new forbidden-phrase list on every worker.
+
+    Without a body the list is re-read from the FORBIDDEN_PHRASES setting.
+    The list is applied here, then published over the broadcast backplane
+    so the other workers apply the same list; ``meta.propagated`` is false
+    if that publish failed and only this worker has the new list.
+    """
+    start = time.monotonic()
+    phrases = body.phrases if body is not None else None
+    if phrases is not None and not any(p.strip() for p in phrases):
+        raise HTTPException(status_code=400, detail="phrases must not be empty")
+    phrase_set = reload_forbidden_phrases(phrases)
+    propagated = await connection_manager.backplane.publish_control(
+        {"type": PHRASES_RELOAD_CONTROL, "phrases": list(phrase_set.phrases)}
+    )
+    latency_ms = int((time.monotonic() - start) * 1000)
+    return {
+        "data": ForbiddenPhrasesResponse(
+            version=phrase_set.version, phrases=list(phrase_set.phrases)
+        ),
+        "error": None,
+        "meta": {"latency_ms": latency_ms, "propagated": propagated},
+    }
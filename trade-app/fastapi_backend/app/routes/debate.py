@@ -4,7 +4,7 @@ import logging
 import math
 import time
 
-from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,10 +26,15 @@ from app.services.debate.vote_schemas import (
     VoteSuccessMeta,
 )
 from app.services.debate.repository import DebateRepository
-from app.services.debate.exceptions import StaleDataError, LLMProviderError
+from app.services.debate.exceptions import (
+    DebateQueueFullError,
+    LLMProviderError,
+    StaleDataError,
+)
 from app.services.rate_limiter import (
     RateLimiter,
     UniqueVoterCapacityLimiter,
+    create_debate_rate_limiter,
     create_vote_rate_limiter,
     create_vote_capacity_limiter,
 )
@@ -43,6 +48,7 @@ router = APIRouter(prefix="/api/debate", tags=["debate"])
 logger = logging.getLogger(__name__)
 
 _debate_service: DebateService | None = None
+_debate_limiter: RateLimiter | None = None
 _vote_limiter: RateLimiter | None = None
 _capacity_limiter: UniqueVoterCapacityLimiter | None = None
 
@@ -54,6 +60,23 @@ def get_debate_service() -> DebateService:
     return _debate_service
 
 
+async def shutdown_debate_service() -> None:
+    """Drain in-flight debates (handing off stragglers) and release clients."""
+    global _debate_service
+    if _debate_service is None:
+        return
+    service, _debate_service = _debate_service, None
+    await service.drain()
+    await service.close()
+
+
+def _get_debate_limiter() -> RateLimiter:
+    global _debate_limiter
+    if _debate_limiter is None:
+        _debate_limiter = create_debate_rate_limiter()
+    return _debate_limiter
+
+
 def _get_vote_limiter() -> RateLimiter:
     global _vote_limiter
     if _vote_limiter is None:
@@ -73,12 +96,50 @@ def _hash_fingerprint(fp: str) -> str:
 
 
 @router.post("/start", response_model=StandardDebateResponse)
-async def start_debate(request: DebateStartRequest) -> StandardDebateResponse:
+async def start_debate(
+    request: DebateStartRequest, http_request: Request
+) -> StandardDebateResponse:
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    rate_result = await _get_debate_limiter().check(client_ip)
+    if not rate_result.allowed:
+        retry_ms = max(0, int((rate_result.reset_at - time.time()) * 1000))
+        logger.warning(
+            "Debate start rejected: rate limited",
+            extra={"asset": request.asset, "retry_after_ms": retry_ms},
+        )
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "data": None,
+                "error": {
+                    "code": "RATE_LIMITED",
+                    "message": "Too many debates started. Please slow down.",
+                },
+                "meta": {"retryAfterMs": retry_ms},
+            },
+        )
+
     try:
         result = await get_debate_service().create_debate(request.asset)
         return StandardDebateResponse(
             data=result, error=None, meta=DebateMeta(latency_ms=0)
         )
+    except DebateQueueFullError as e:
+        logger.warning(f"Debate start rejected for {request.asset}: {e}")
+        meta = {}
+        if e.retry_after is not None:
+            meta["retryAfterMs"] = int(e.retry_after * 1000)
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "data": None,
+                "error": {
+                    "code": "DEBATE_QUEUE_FULL",
+                    "message": "Too many debates are waiting to start. Please try again later.",
+                },
+                "meta": meta,
+            },
+        )
     except StaleDataError as e:
         raise HTTPException(
             status_code=400,
@@ -387,7 +448,7 @@ async def cast_vote(
     try:
         from app.services.debate.streaming import connection_manager
 
-        if connection_manager.get_connection_count(request.debate_id) > 0:
+        if connection_manager.has_viewers(request.debate_id):
             updated_result = await repo.get_result(request.debate_id)
             if updated_result:
                 action = WebSocketAction(
@@ -8,6 +8,7 @@ from typing import Any
 
 from app.config import settings
 from app.database import engine
+from app.services.debate.streaming import connection_manager
 
 router = APIRouter(tags=["health"])
 
@@ -73,3 +74,23 @@ async def health_check() -> StandardResponse:
         error=None,
         meta=MetaResponse(version="1.0.0"),
     )
+
+
+class WebSocketAdmissionResponse(BaseModel):
+    data: dict[str, Any]
+    error: Any
+    meta: MetaResponse
+
+
+@router.get("/api/health/ws", response_model=WebSocketAdmissionResponse)
+async def websocket_admission_state(
+    debate_id: str | None = None,
+) -> WebSocketAdmissionResponse:
+    """Current WebSocket admission level and connection counts for this worker."""
+    state = connection_manager.admission.get_state(debate_id)
+    state["shedTokenFrames"] = connection_manager.shed_token_frames
+    return WebSocketAdmissionResponse(
+        data=state,
+        error=None,
+        meta=MetaResponse(version="1.0.0"),
+    )
@@ -0,0 +1,62 @@
+import logging
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models import AuditDLQ
+from app.routes.debate import get_debate_service
+from app.services.audit.writer import QueuedAuditWriter, get_audit_writer
+from app.services.debate.streaming import connection_manager
+from app.services.metrics import (
+    AUDIT_DLQ_SIZE,
+    AUDIT_QUEUE_DEPTH,
+    CONTENT_TYPE,
+    DEBATE_VIEWERS,
+    DEBATES_QUEUED,
+    REGISTRY,
+    WEBSOCKET_CONNECTIONS,
+)
+
+router = APIRouter(tags=["metrics"])
+
+logger = logging.getLogger(__name__)
+
+
+async def _refresh_gauges() -> None:
+    """Read point-in-time values that are cheaper to sample than to track."""
+    WEBSOCKET_CONNECTIONS.set(connection_manager.get_total_connections())
+    DEBATE_VIEWERS.replace(
+        {
+            (debate_id,): len(connections)
+            for debate_id, connections in connection_manager.active_debates.items()
+            if connections
+        }
+    )
+
+    audit_writer = get_audit_writer()
+    if isinstance(audit_writer, QueuedAuditWriter):
+        AUDIT_QUEUE_DEPTH.set(audit_writer.queue_depth)
+
+    try:
+        stats = await get_debate_service().scheduler.get_stats()
+        DEBATES_QUEUED.set(stats["queued"])
+    except Exception as e:
+        logger.warning(f"Metrics: debate queue stats unavailable: {e}")
+
+    try:
+        async with async_session_maker() as session:
+            result = await session.execute(select(func.count()).select_from(AuditDLQ))
+            AUDIT_DLQ_SIZE.set(result.scalar_one())
+    except Exception as e:
+        logger.warning(f"Metrics: DLQ size unavailable: {e}")
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+    await _refresh_gauges()
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -2,23 +2,30 @@ import asyncio
 import logging
 from typing import Any
 
+import jwt
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from fastapi_users.jwt import decode_jwt
 
 from app.config import settings
 from app.services.debate.streaming import (
     connection_manager,
     check_connection_rate_limit,
-    heartbeat,
     send_connected_action,
     send_error,
+    send_replay,
     stream_state,
 )
+from app.services.debate.admission import AdmissionDecision
+from app.services.debate.frames import build_frame
+from app.services.debate.protocol import FrameCodec, MsgpackCodec, negotiate_codec
 from app.services.debate.ws_schemas import (
+    ErrorPayload,
     WebSocketAction,
     WebSocketCloseCodes,
     CLOSE_CODE_REASONS,
 )
 from app.services.debate.engine import get_pause_event
+from app.services.user_cache import load_active_user, user_cache
 from app.users import get_jwt_strategy
 
 logger = logging.getLogger(__name__)
@@ -27,24 +34,40 @@ router = APIRouter(tags=["websocket"])
 
 
 async def validate_token(token: str) -> dict[str, Any] | None:
-    """Validate JWT token and return user info."""
+    """Validate JWT token and return user info.
+
+    The signature, audience and expiry are checked locally; the user record
+    comes from ``user_cache`` and only a miss touches the database.
+    """
     if settings.FIXED_QA_TOKEN and token == settings.FIXED_QA_TOKEN:
         return {"id": "qa-user", "email": "qa@test.com"}
 
+    strategy = get_jwt_strategy()
+    try:
+        claims = decode_jwt(
+            token,
+            strategy.decode_key,
+            strategy.token_audience,
+            algorithms=[strategy.algorithm],
+        )
+    except jwt.PyJWTError as e:
+        logger.warning(f"Token validation failed: {e}")
+        return None
+    user_id = claims.get("sub")
+    if not user_id:
+        return None
+
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
     try:
-        from app.database import async_session_maker, get_user_db
-        from app.users import get_user_manager
-
-        strategy = get_jwt_strategy()
-        async with async_session_maker() as session:
-            user_db = await anext(get_user_db(session))
-            user_manager = await anext(get_user_manager(user_db))
-            user = await strategy.read_token(token, user_manager)
-            if user:
-                return {"id": str(user.id), "email": user.email}
+        user = await load_active_user(user_id)
     except Exception as e:
         logger.warning(f"Token validation failed: {e}")
-    return None
+        return None
+    if user is not None:
+        user_cache.put(user_id, user)
+    return user
 
 
 async def validate_origin(websocket: WebSocket) -> bool:
@@ -58,13 +81,61 @@ async def validate_origin(websocket: WebSocket) -> bool:
     return False
 
 
+async def reject_overloaded(
+    websocket: WebSocket,
+    codec: FrameCodec,
+    subprotocol: str | None,
+    admission: AdmissionDecision,
+) -> None:
+    """Refuse a connection over capacity, telling the client when to retry.
+
+    Uses the rate-limit close code so existing clients back off; the
+    preceding DEBATE/ERROR frame carries ``SERVER_BUSY`` and ``retryAfter``.
+    """
+    close_code = WebSocketCloseCodes.RATE_LIMITED
+    logger.warning(
+        f"Rejecting WebSocket: {admission.scope} connection cap reached, "
+        f"retry after {admission.retry_after}s"
+    )
+    try:
+        await websocket.accept(subprotocol=subprotocol)
+        if isinstance(codec, MsgpackCodec):
+            await websocket.send_bytes(codec.handshake())
+        await codec.send(
+            websocket,
+            build_frame(
+                "DEBATE/ERROR",
+                ErrorPayload(
+                    code="SERVER_BUSY",
+                    message="Server busy",
+                    retry_after=admission.retry_after,
+                ),
+            ),
+        )
+        await websocket.close(
+            code=close_code, reason=f"Server busy; retry after {admission.retry_after}s"
+        )
+    except Exception as e:
+        logger.debug(f"Failed to reject WebSocket connection cleanly: {e}")
+
+
 @router.websocket("/ws/debate/{debate_id}")
 async def websocket_debate(
     websocket: WebSocket,
     debate_id: str,
     token: str = Query(...),
+    since: int | None = Query(None, ge=0),
+    protocol: str | None = Query(None),
 ):
-    """WebSocket endpoint for streaming debate tokens."""
+    """WebSocket endpoint for streaming debate tokens.
+
+    Reconnecting clients pass the last ``seq`` they saw as ``since`` to receive
+    everything they missed in a single DEBATE/REPLAY frame.
+
+    Frames are JSON text unless the client opts into the binary protocol with
+    ``?protocol=msgpack`` or the ``debate.msgpack.v1`` subprotocol; client to
+    server messages are JSON either way.
+    """
     client_ip = websocket.client.host if websocket.client else None
 
     if not client_ip:
@@ -92,19 +163,29 @@ async def websocket_debate(
         await websocket.close(code=close_code, reason=CLOSE_CODE_REASONS[close_code])
         return
 
-    try:
-        await websocket.accept()
-    except Exception as e:
-        logger.error(f"Failed to accept WebSocket connection: {e}")
+    codec, subprotocol = negotiate_codec(websocket, protocol)
+    admission = connection_manager.admission.admit(debate_id)
+    if not admission.admitted:
+        await reject_overloaded(websocket, codec, subprotocol, admission)
         return
 
-    await connection_manager.connect(debate_id, websocket)
-    logger.info(f"WebSocket connected: debate={debate_id}, user={user['id']}")
+    try:
+        try:
+            await websocket.accept(subprotocol=subprotocol)
+            if isinstance(codec, MsgpackCodec):
+                await websocket.send_bytes(codec.handshake())
+        except Exception as e:
+            logger.error(f"Failed to accept WebSocket connection: {e}")
+            return
 
-    stop_heartbeat = asyncio.Event()
-    heartbeat_task = asyncio.create_task(
-        heartbeat(websocket, connection_manager, debate_id, stop_heartbeat)
-    )
+        # Reconnects are held until their replay is out, so frames broadcast
+        # in between arrive once and in order.
+        await connection_manager.connect(
+            debate_id, websocket, codec, hold=since is not None
+        )
+    finally:
+        connection_manager.admission.settle(debate_id)
+    logger.info(f"WebSocket connected: debate={debate_id}, user={user['id']}")
 
     try:
         existing_state = await stream_state.get_state(debate_id)
@@ -114,10 +195,13 @@ async def websocket_debate(
             status = "ready"
 
         await send_connected_action(connection_manager, debate_id, status)
+        if since is not None:
+            await send_replay(connection_manager, debate_id, websocket, since)
 
         while True:
             try:
                 data = await asyncio.wait_for(websocket.receive_json(), timeout=60.0)
+                connection_manager.mark_alive(websocket)
                 action_type = data.get("type", "")
 
                 if action_type == "DEBATE/PONG":
@@ -142,7 +226,9 @@ async def websocket_debate(
                             type="DEBATE/STATUS_UPDATE",
                             payload={"debateId": debate_id, **state},
                         )
-                        await websocket.send_json(action.model_dump(by_alias=True))
+                        await connection_manager.send_to_connection(
+                            debate_id, websocket, action.model_dump(by_alias=True)
+                        )
 
             except asyncio.TimeoutError:
                 continue
@@ -161,13 +247,6 @@ async def websocket_debate(
         except Exception:
             pass
     finally:
-        stop_heartbeat.set()
-        heartbeat_task.cancel()
-        try:
-            await heartbeat_task
-        except asyncio.CancelledError:
-            pass
-
         pause_event = get_pause_event(debate_id)
         if pause_event and not pause_event.is_set():
             logger.info(
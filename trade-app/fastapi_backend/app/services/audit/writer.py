@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+import time
 from typing import Any, Protocol, runtime_checkable
 
 from sqlalchemy import text
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.config import settings
 from app.models import AuditDLQ
+from app.services.metrics import AUDIT_BATCH_LATENCY, AUDIT_DLQ_WRITES
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +119,10 @@ class QueuedAuditWriter:
         self._consumer_task: asyncio.Task | None = None
         self._running = False
 
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
     async def start(self) -> None:
         self._running = True
         self._consumer_task = asyncio.create_task(self._consumer_loop())
@@ -173,6 +179,13 @@ class QueuedAuditWriter:
                 raise
 
     async def _write_batch(self, batch: list[dict[str, Any]]) -> None:
+        started = time.monotonic()
+        try:
+            await self._write_events(batch)
+        finally:
+            AUDIT_BATCH_LATENCY.observe(time.monotonic() - started)
+
+    async def _write_events(self, batch: list[dict[str, Any]]) -> None:
         for event in batch:
             for attempt in range(_MAX_RETRIES):
                 try:
@@ -198,6 +211,7 @@ class QueuedAuditWriter:
                 )
                 session.add(dlq_entry)
                 await session.commit()
+                AUDIT_DLQ_WRITES.inc()
                 logger.info(f"Event sent to DLQ: {error}")
         except Exception as e:
             logger.critical(f"Failed to write to DLQ: {e}")
@@ -11,25 +11,70 @@ from app.services.debate.schemas import DebateResponse
 from app.services.debate.exceptions import StaleDataError
 from app.services.debate.repository import DebateRepository
 from app.services.debate.archival import archive_with_retry
+from app.services.debate.leases import DebateLeaseManager
+from app.services.debate.profiling import (
+    PHASE_ARCHIVAL,
+    PHASE_MARKET_CONTEXT,
+    PHASE_TRADING_ANALYSIS,
+    DebateProfile,
+    activate,
+    profiled,
+)
+from app.services.debate.scheduler import (
+    PRIORITY_RESUME,
+    DebateJob,
+    DebateScheduler,
+    RedisDebateScheduler,
+)
 from app.services.debate.agents.trading_analyst import generate_trading_analysis
+from app.services.metrics import DEBATES_ACTIVE
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
 class DebateService:
-    def __init__(self, redis_url: str | None = None):
+    """Starts debates as background runs and keeps them alive across workers.
+
+    Runs go through a scheduler: in ``local`` execution mode a bounded
+    ``DebateScheduler`` in this process, in ``worker`` mode a Redis queue
+    drained by ``commands.debate_worker`` processes. With
+    ``DEBATE_LEASES_ENABLED`` every run holds a lease (see
+    ``DebateLeaseManager``). ``recover_orphaned`` resumes debates whose
+    worker died from their last checkpoint, and ``drain`` lets in-flight runs
+    finish on shutdown, handing the rest off to other workers.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        leases: DebateLeaseManager | None = None,
+        execution_mode: str | None = None,
+    ):
         settings.validate_llm_config()
         self.market_service = MarketDataService(redis_url or settings.REDIS_URL)
         self.yfinance = YFinanceProvider()
         self.graph = create_debate_graph()
+        if leases is None and settings.DEBATE_LEASES_ENABLED:
+            leases = DebateLeaseManager(on_lost=self._on_lease_lost)
+        self.leases = leases
+        self.execution_mode = execution_mode or settings.DEBATE_EXECUTION_MODE
+        self.scheduler: DebateScheduler | RedisDebateScheduler
+        if self.execution_mode == "worker":
+            self.scheduler = RedisDebateScheduler()
+        else:
+            self.scheduler = DebateScheduler(self._execute)
+        self._runs: dict[str, asyncio.Task] = {}
+        self._recovery_task: asyncio.Task | None = None
 
     async def close(self) -> None:
         await self.market_service.close()
         await self.yfinance.close()
 
     async def create_debate(self, asset: str) -> DebateResponse:
-        market_context = await self.market_service.get_context(asset)
+        profile = DebateProfile()
+        with profile.measure(PHASE_MARKET_CONTEXT):
+            market_context = await self.market_service.get_context(asset)
 
         if market_context is None:
             raise StaleDataError(f"No market data available for {asset}")
@@ -61,28 +106,111 @@ class DebateService:
             "status": "running",
         }
 
-        asyncio.create_task(self._run_debate(debate_id, asset, initial_state))
+        try:
+            ticket = await self.scheduler.submit(
+                DebateJob(
+                    debate_id=debate_id,
+                    asset=asset,
+                    initial_state=initial_state,
+                    profile=profile.to_dict(),
+                )
+            )
+        except Exception:
+            await self._mark_failed(debate_id)
+            raise
 
         return DebateResponse(
             debate_id=debate_id,
             asset=asset,
-            status="running",
+            status="running" if ticket.position == 0 else "queued",
             messages=[],
             current_turn=0,
             max_turns=settings.debate_max_turns,
+            queue_position=ticket.position,
+            eta_seconds=ticket.eta_seconds,
+        )
+
+    async def _execute(self, job: DebateJob) -> None:
+        """Scheduler runner: take the lease of a new debate and run it.
+
+        Resumed debates were claimed before they were queued.
+        """
+        if job.initial_state is not None and self.leases is not None:
+            await self.leases.acquire(job.debate_id, {"asset": job.asset})
+        profile = DebateProfile.from_dict(job.profile) if job.profile else None
+        await self._start_run(job.debate_id, job.asset, job.initial_state, profile)
+
+    def _start_run(
+        self,
+        debate_id: str,
+        asset: str,
+        initial_state: dict | None,
+        profile: DebateProfile | None = None,
+    ) -> asyncio.Task:
+        task = asyncio.create_task(
+            self._run_debate(debate_id, asset, initial_state, profile)
         )
+        self._runs[debate_id] = task
+        task.add_done_callback(lambda _: self._runs.pop(debate_id, None))
+        return task
+
+    def _on_lease_lost(self, debate_id: str) -> None:
+        task = self._runs.get(debate_id)
+        if task is not None:
+            logger.warning(f"Stopping debate {debate_id}: lease taken over")
+            task.cancel()
 
     async def _run_debate(
         self,
         debate_id: str,
         asset: str,
-        initial_state: dict,
+        initial_state: dict | None,
+        profile: DebateProfile | None = None,
+    ) -> None:
+        """Run (``initial_state``) or resume (``None``) a debate to completion.
+
+        Timings go into ``profile``, which is stored with the debate once the
+        run ends either way. A cancelled run (drain or lost lease) keeps its
+        in-flight entry so the next owner resumes it; any other outcome
+        releases the lease.
+        """
+        profile = profile or DebateProfile()
+        DEBATES_ACTIVE.inc()
+        try:
+            with activate(profile):
+                await self._run_profiled(debate_id, asset, initial_state)
+        finally:
+            DEBATES_ACTIVE.dec()
+        await self._save_profile(debate_id, profile)
+
+    async def _run_profiled(
+        self,
+        debate_id: str,
+        asset: str,
+        initial_state: dict | None,
     ) -> None:
         start_time = time.time()
         try:
-            print(f"[DEBATE] Starting debate {debate_id} for {asset}", flush=True)
             config = {"configurable": {"thread_id": debate_id}}
-            result = await self.graph.ainvoke(initial_state, config)
+            if initial_state is None:
+                snapshot = await self.graph.aget_state(config)
+                if not snapshot.values:
+                    raise RuntimeError(
+                        f"No checkpoint to resume debate {debate_id} from"
+                    )
+                print(
+                    f"[DEBATE] Resuming debate {debate_id} for {asset} at turn "
+                    f"{snapshot.values.get('current_turn', 0)}",
+                    flush=True,
+                )
+                # A run that died after the last node only needs the epilogue.
+                if snapshot.next:
+                    result = await self.graph.ainvoke(None, config)
+                else:
+                    result = snapshot.values
+            else:
+                print(f"[DEBATE] Starting debate {debate_id} for {asset}", flush=True)
+                result = await self.graph.ainvoke(initial_state, config)
             print(
                 f"[DEBATE] Graph completed for {debate_id}, {len(result['messages'])} messages",
                 flush=True,
@@ -100,12 +228,13 @@ class DebateService:
                     for m in result["messages"]
                     if m["role"] in ("bull", "bear")
                 ]
-                trading_analysis = await generate_trading_analysis(
-                    asset=asset,
-                    messages=debate_messages,
-                    technical_data=tech_data,
-                    forex_meta=forex_meta,
-                )
+                with profiled(PHASE_TRADING_ANALYSIS):
+                    trading_analysis = await generate_trading_analysis(
+                        asset=asset,
+                        messages=debate_messages,
+                        technical_data=tech_data,
+                        forex_meta=forex_meta,
+                    )
                 logger.info(
                     f"Trading analysis generated for {debate_id}: {trading_analysis.get('direction', 'unknown')}"
                 )
@@ -126,8 +255,11 @@ class DebateService:
                 "guardian_interrupts": result.get("guardian_interrupts", []),
                 "trading_analysis": trading_analysis,
             }
-            archived = await archive_with_retry(debate_id, archive_state)
-            if not archived:
+            with profiled(PHASE_ARCHIVAL):
+                archived = await archive_with_retry(debate_id, archive_state)
+            if archived:
+                await self._drop_checkpoints(debate_id)
+            else:
                 logger.error(f"Failed to archive debate {debate_id} after completion")
                 print(f"[DEBATE-ERR] Archive failed for {debate_id}", flush=True)
 
@@ -139,15 +271,117 @@ class DebateService:
         except Exception as e:
             logger.error(f"Debate {debate_id} failed: {e}", exc_info=True)
             print(f"[DEBATE-ERR] Debate {debate_id} failed: {e}", flush=True)
-            try:
-                async with async_session_maker() as session:
-                    repo = DebateRepository(session)
-                    debate = await repo.get_by_external_id(debate_id)
-                    if debate and debate.status == "running":
-                        debate.status = "failed"
-                        await session.commit()
-                        logger.info(f"Debate {debate_id} marked as failed")
-            except Exception as cleanup_err:
-                logger.error(
-                    f"Failed to mark debate {debate_id} as failed: {cleanup_err}"
+            await self._mark_failed(debate_id)
+        if self.leases is not None:
+            await self.leases.release(debate_id)
+
+    async def _mark_failed(self, debate_id: str) -> None:
+        try:
+            async with async_session_maker() as session:
+                repo = DebateRepository(session)
+                debate = await repo.get_by_external_id(debate_id)
+                if debate and debate.status == "running":
+                    debate.status = "failed"
+                    await session.commit()
+                    logger.info(f"Debate {debate_id} marked as failed")
+        except Exception as cleanup_err:
+            logger.error(f"Failed to mark debate {debate_id} as failed: {cleanup_err}")
+
+    async def _save_profile(self, debate_id: str, profile: DebateProfile) -> None:
+        try:
+            async with async_session_maker() as session:
+                await DebateRepository(session).save_profile(
+                    debate_id, profile.to_dict()
                 )
+        except Exception as e:
+            logger.warning(f"Saving profile failed for {debate_id}: {e}")
+
+    async def _drop_checkpoints(self, debate_id: str) -> None:
+        """An archived debate never resumes, so its checkpoints can go."""
+        try:
+            await self.graph.checkpointer.adelete_thread(debate_id)
+        except Exception as e:
+            logger.warning(f"Checkpoint cleanup failed for {debate_id}: {e}")
+
+    async def _debate_status(self, debate_id: str) -> str | None:
+        async with async_session_maker() as session:
+            debate = await DebateRepository(session).get_by_external_id(debate_id)
+            return debate.status if debate else None
+
+    async def recover_orphaned(self) -> list[str]:
+        """Claim debates whose worker went away and resume them here."""
+        if self.leases is None:
+            return []
+        resumed = []
+        for debate_id, meta in (await self.leases.orphaned()).items():
+            if debate_id in self._runs or not await self.leases.claim(debate_id):
+                continue
+            try:
+                status = await self._debate_status(debate_id)
+            except Exception as e:
+                logger.warning(f"Could not check debate {debate_id} for resume: {e}")
+                await self.leases.handoff(debate_id)
+                continue
+            if status != "running":
+                await self.leases.release(debate_id)
+                continue
+            logger.info(f"Resuming orphaned debate {debate_id}")
+            await self.scheduler.submit(
+                DebateJob(
+                    debate_id=debate_id,
+                    asset=meta.get("asset", ""),
+                    initial_state=None,
+                    priority=PRIORITY_RESUME,
+                ),
+                force=True,
+            )
+            resumed.append(debate_id)
+        return resumed
+
+    def start_recovery(self) -> None:
+        """Resume orphaned debates now and then every lease TTL."""
+        if self.leases is None:
+            return
+        if self._recovery_task is None or self._recovery_task.done():
+            self._recovery_task = asyncio.create_task(self._recovery_loop())
+
+    async def _recovery_loop(self) -> None:
+        assert self.leases is not None
+        while True:
+            try:
+                await self.recover_orphaned()
+            except Exception as e:
+                logger.error(f"Debate recovery error: {e}", exc_info=True)
+            await asyncio.sleep(self.leases.ttl_seconds)
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Let in-flight debates finish, then hand the rest to other workers."""
+        if self._recovery_task is not None:
+            self._recovery_task.cancel()
+            self._recovery_task = None
+        if timeout is None:
+            timeout = settings.DEBATE_DRAIN_TIMEOUT_SECONDS
+        for job in self.scheduler.drain():
+            if job.initial_state is None and self.leases is not None:
+                # A claimed resume: give it straight back.
+                await self.leases.handoff(job.debate_id)
+            else:
+                logger.warning(f"Debate {job.debate_id} never started before shutdown")
+                await self._mark_failed(job.debate_id)
+        runs = dict(self._runs)
+        if runs:
+            logger.info(f"Draining {len(runs)} in-flight debate(s)")
+            await asyncio.wait(runs.values(), timeout=timeout)
+        for debate_id, task in runs.items():
+            if task.done():
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            if self.leases is not None:
+                await self.leases.handoff(debate_id)
+                logger.info(f"Handed off debate {debate_id}")
+        if self.leases is not None:
+            await self.leases.close()
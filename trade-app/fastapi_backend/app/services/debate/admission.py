@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from app.config import settings
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Degradation stages, mildest first. Each one includes the ones before it.
+ADMISSION_NORMAL = "normal"
+ADMISSION_REDUCED_FPS = "reduced_fps"
+ADMISSION_STATUS_ONLY = "status_only"
+ADMISSION_REJECTING = "rejecting"
+ADMISSION_LEVELS = (
+    ADMISSION_NORMAL,
+    ADMISSION_REDUCED_FPS,
+    ADMISSION_STATUS_ONLY,
+    ADMISSION_REJECTING,
+)
+REDUCED_FPS_SCALE = 0.5
+GLOBAL_SYNC_INTERVAL = 5.0
+# A worker that has not reported for this many sync intervals is presumed dead.
+GLOBAL_STALE_INTERVALS = 3
+GLOBAL_COUNTS_KEY = "ws_admission:workers"
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    admitted: bool
+    level: str
+    scope: str | None = None
+    retry_after: int | None = None
+
+
+class AdmissionController:
+    """Connection caps and staged load shedding for debate WebSockets.
+
+    Utilisation is the highest of connections/cap across the per-debate,
+    per-worker and (when enabled) global caps. As it rises the debate is
+    degraded in stages: token frames are sent at a lower rate
+    (``reduced_fps``), then not at all (``status_only``), and at 100% new
+    connections are refused with a jittered retry hint (``rejecting``).
+
+    The global count is this worker's live count plus the last counts other
+    workers reported to a Redis hash, refreshed every ``GLOBAL_SYNC_INTERVAL``.
+    A cap of 0 disables that scope.
+    """
+
+    def __init__(
+        self,
+        max_global: int | None = None,
+        max_per_worker: int | None = None,
+        max_per_debate: int | None = None,
+        reduce_fps_at: float | None = None,
+        status_only_at: float | None = None,
+        retry_after_seconds: int | None = None,
+        redis: Any = None,
+        worker_id: str | None = None,
+    ) -> None:
+        self.max_global = _pick(max_global, settings.WS_MAX_CONNECTIONS_GLOBAL)
+        self.max_per_worker = _pick(
+            max_per_worker, settings.WS_MAX_CONNECTIONS_PER_WORKER
+        )
+        self.max_per_debate = _pick(
+            max_per_debate, settings.WS_MAX_CONNECTIONS_PER_DEBATE
+        )
+        self.reduce_fps_at = _pick(reduce_fps_at, settings.WS_ADMISSION_REDUCE_FPS_AT)
+        self.status_only_at = _pick(
+            status_only_at, settings.WS_ADMISSION_STATUS_ONLY_AT
+        )
+        self.retry_after_seconds = _pick(
+            retry_after_seconds, settings.WS_ADMISSION_RETRY_AFTER_SECONDS
+        )
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._redis = redis
+        self._worker_count: Callable[[], int] = lambda: 0
+        self._debate_count: Callable[[str], int] = lambda debate_id: 0
+        # Handshakes admitted but not yet registered with the manager.
+        self._pending = 0
+        self._pending_debates: dict[str, int] = {}
+        self._other_workers = 0
+        self._sync_task: asyncio.Task | None = None
+        self.rejected = 0
+
+    def bind(
+        self,
+        worker_count: Callable[[], int],
+        debate_count: Callable[[str], int],
+    ) -> None:
+        """Attach the live connection counters of the owning manager."""
+        self._worker_count = worker_count
+        self._debate_count = debate_count
+
+    def _worker_connections(self) -> int:
+        return self._worker_count() + self._pending
+
+    def _debate_connections(self, debate_id: str) -> int:
+        return self._debate_count(debate_id) + self._pending_debates.get(debate_id, 0)
+
+    def _utilisation(self, debate_id: str | None) -> tuple[float, str | None]:
+        worker = self._worker_connections()
+        ratios = [
+            ("worker", worker, self.max_per_worker),
+            ("global", self._other_workers + worker, self.max_global),
+        ]
+        if debate_id is not None:
+            ratios.append(
+                ("debate", self._debate_connections(debate_id), self.max_per_debate)
+            )
+        worst, scope = 0.0, None
+        for name, count, cap in ratios:
+            if cap > 0 and count / cap > worst:
+                worst, scope = count / cap, name
+        return worst, scope
+
+    def level(self, debate_id: str | None = None) -> str:
+        utilisation, _ = self._utilisation(debate_id)
+        if utilisation >= 1:
+            return ADMISSION_REJECTING
+        if utilisation >= self.status_only_at:
+            return ADMISSION_STATUS_ONLY
+        if utilisation >= self.reduce_fps_at:
+            return ADMISSION_REDUCED_FPS
+        return ADMISSION_NORMAL
+
+    def token_fps_scale(self, debate_id: str) -> float:
+        """Multiplier for the token frame-rate cap of ``debate_id``."""
+        if self.level(debate_id) == ADMISSION_NORMAL:
+            return 1.0
+        return REDUCED_FPS_SCALE
+
+    def sheds_tokens(self, debate_id: str) -> bool:
+        """Whether viewers of ``debate_id`` only get status frames right now."""
+        return self.level(debate_id) in (ADMISSION_STATUS_ONLY, ADMISSION_REJECTING)
+
+    def admit(self, debate_id: str) -> AdmissionDecision:
+        """Decide whether a new viewer of ``debate_id`` may connect.
+
+        An admitted handshake holds a slot until ``settle`` is called, so a
+        burst of concurrent handshakes cannot all squeeze past the cap.
+        """
+        self._ensure_sync()
+        utilisation, scope = self._utilisation(debate_id)
+        if utilisation >= 1:
+            self.rejected += 1
+            jitter = random.randint(0, self.retry_after_seconds)
+            return AdmissionDecision(
+                admitted=False,
+                level=ADMISSION_REJECTING,
+                scope=scope,
+                retry_after=self.retry_after_seconds + jitter,
+            )
+        self._pending += 1
+        self._pending_debates[debate_id] = self._pending_debates.get(debate_id, 0) + 1
+        return AdmissionDecision(admitted=True, level=self.level(debate_id))
+
+    def settle(self, debate_id: str) -> None:
+        """Release the slot an admitted handshake held until it connected or failed."""
+        self._pending = max(0, self._pending - 1)
+        remaining = self._pending_debates.get(debate_id, 0) - 1
+        if remaining > 0:
+            self._pending_debates[debate_id] = remaining
+        else:
+            self._pending_debates.pop(debate_id, None)
+
+    def get_state(self, debate_id: str | None = None) -> dict[str, Any]:
+        worker = self._worker_connections()
+        state: dict[str, Any] = {
+            "level": self.level(debate_id),
+            "workerConnections": worker,
+            "maxPerWorker": self.max_per_worker,
+            "globalConnections": self._other_workers + worker,
+            "maxGlobal": self.max_global,
+            "maxPerDebate": self.max_per_debate,
+            "rejected": self.rejected,
+        }
+        if debate_id is not None:
+            state["debateConnections"] = self._debate_connections(debate_id)
+        return state
+
+    def _ensure_sync(self) -> None:
+        if self.max_global <= 0:
+            return
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.ensure_future(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await self.sync()
+            await asyncio.sleep(GLOBAL_SYNC_INTERVAL)
+
+    async def sync(self) -> None:
+        """Report this worker's count and re-read everyone else's."""
+        now = time.time()
+        stale_before = now - GLOBAL_SYNC_INTERVAL * GLOBAL_STALE_INTERVALS
+        try:
+            if self._redis is None:
+                self._redis = await get_redis_client()
+            await self._redis.hset(
+                GLOBAL_COUNTS_KEY, self.worker_id, f"{self._worker_count()}:{now}"
+            )
+            reports = await self._redis.hgetall(GLOBAL_COUNTS_KEY)
+        except Exception as e:
+            logger.warning(f"Admission count sync failed: {e}")
+            return
+        others, stale = 0, []
+        for worker_id, report in reports.items():
+            if worker_id == self.worker_id:
+                continue
+            count, reported_at = str(report).split(":", 1)
+            if float(reported_at) < stale_before:
+                stale.append(worker_id)
+            else:
+                others += int(count)
+        self._other_workers = others
+        if stale:
+            try:
+                await self._redis.hdel(GLOBAL_COUNTS_KEY, *stale)
+            except Exception as e:
+                logger.warning(f"Admission stale worker cleanup failed: {e}")
+
+    async def close(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        if self.max_global > 0 and self._redis is not None:
+            try:
+                await self._redis.hdel(GLOBAL_COUNTS_KEY, self.worker_id)
+            except Exception as e:
+                logger.warning(f"Admission count cleanup failed: {e}")
+
+
+def _pick(value: Any, default: Any) -> Any:
+    return default if value is None else value
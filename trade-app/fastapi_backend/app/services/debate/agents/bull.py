@@ -4,7 +4,13 @@ from langchain_core.callbacks import AsyncCallbackHandler
 
 from app.services.debate.state import DebateState
 from app.services.debate.sanitization import FORBIDDEN_PHRASES
-from app.services.debate.llm_provider import get_llm_with_failover
+from app.config import settings
+from app.services.debate.llm_provider import (
+    PRIORITY_AGENT,
+    get_llm_with_failover,
+    governed_ainvoke,
+    llm_call_config,
+)
 from app.services.market.twelvedata_provider import is_forex_asset as _is_forex
 
 logger = logging.getLogger(__name__)
@@ -38,17 +44,22 @@ Previous Bear Argument (if any) — REFUTE THIS:
 
 Generate your bullish argument with specific data points and price levels:"""
 
+BULL_PROMPT = ChatPromptTemplate.from_template(BULL_SYSTEM_PROMPT)
+
 
 class BullAgent:
+    """Stateless across debates: the client is pooled and the streaming
+    handler can be passed per call, so one instance serves every turn."""
+
     def __init__(self, llm=None, streaming_handler: AsyncCallbackHandler | None = None):
         self.streaming_handler = streaming_handler
         self._provided_llm = llm
-        self.prompt = ChatPromptTemplate.from_template(BULL_SYSTEM_PROMPT)
+        self.prompt = BULL_PROMPT
 
-    async def _get_llm(self, asset: str = ""):
+    async def _get_llm(self, asset: str = "", streaming: bool = False):
         if self._provided_llm is not None:
             return self._provided_llm
-        llm = await get_llm_with_failover(self.streaming_handler)
+        llm = await get_llm_with_failover(streaming)
         if asset and _is_forex(asset):
             from app.services.debate.tools import get_forex_tools
 
@@ -63,15 +74,27 @@ class BullAgent:
                 return msg.get("content", "")
         return ""
 
-    async def generate(self, state: DebateState) -> dict:
+    async def generate(
+        self,
+        state: DebateState,
+        callbacks: list[AsyncCallbackHandler] | None = None,
+        streaming_handler: AsyncCallbackHandler | None = None,
+    ) -> dict:
         asset = state.get("asset", "")
-        llm = await self._get_llm(asset)
+        handler = streaming_handler or self.streaming_handler
+        llm = await self._get_llm(asset, streaming=handler is not None)
         chain = self.prompt | llm
-        response = await chain.ainvoke(
+        response = await governed_ainvoke(
+            chain,
             {
                 "market_context": state["market_context"],
                 "bear_argument": self._get_last_bear_message(state),
-            }
+            },
+            agent="bull",
+            model=settings.debate_llm_model,
+            priority=PRIORITY_AGENT,
+            prompt_chars=len(BULL_SYSTEM_PROMPT),
+            config=llm_call_config(handler, callbacks),
         )
         raw_content = response.content
         if not isinstance(raw_content, str):
@@ -1,4 +1,3 @@
-import json
 import logging
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.callbacks import AsyncCallbackHandler
@@ -6,8 +5,15 @@ from pydantic import BaseModel, Field
 
 from typing import Literal
 
+from app.services.debate.agents.guardian_context import GuardianContext
 from app.services.debate.state import DebateState
-from app.services.debate.llm_provider import get_llm_with_failover
+from app.services.debate.llm_cache import get_llm_cache, llm_cache_key
+from app.services.debate.llm_provider import (
+    PRIORITY_GUARDIAN,
+    get_llm_with_failover,
+    governed_ainvoke,
+    llm_call_config,
+)
 from app.services.debate.sanitization import sanitize_response
 
 logger = logging.getLogger(__name__)
@@ -85,12 +91,21 @@ MARKET DATA VALIDATION GUIDELINES:
 Analyze the MOST RECENT argument for fallacies or dangerous logic.
 Respond with your analysis in the required format."""
 
+GUARDIAN_PROMPT = ChatPromptTemplate.from_template(GUARDIAN_SYSTEM_PROMPT)
+
 
 class GuardianAgent:
-    def __init__(self, llm=None, streaming_handler: AsyncCallbackHandler | None = None):
+    def __init__(
+        self,
+        llm=None,
+        streaming_handler: AsyncCallbackHandler | None = None,
+        context: GuardianContext | None = None,
+    ):
         self.streaming_handler = streaming_handler
         self._provided_llm = llm
-        self.prompt = ChatPromptTemplate.from_template(GUARDIAN_SYSTEM_PROMPT)
+        self.prompt = GUARDIAN_PROMPT
+        # One Guardian serves one debate, so it owns that debate's context.
+        self.context = context or GuardianContext()
 
     async def _get_llm(self):
         if self._provided_llm is not None:
@@ -98,50 +113,62 @@ class GuardianAgent:
         from app.config import settings
 
         return await get_llm_with_failover(
-            self.streaming_handler,
+            self.streaming_handler is not None,
             model=settings.guardian_llm_model,
             temperature=settings.guardian_llm_temperature,
         )
 
-    def _format_all_arguments(self, state: DebateState) -> str:
-        messages = state.get("messages", [])
-        if not messages:
-            return "No arguments yet."
-        lines = []
-        for msg in messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            lines.append(f"[{role.upper()}]: {content}")
-        return "\n".join(lines)
-
     async def analyze(self, state: DebateState) -> dict:
-        llm = await self._get_llm()
-        structured_llm = llm.with_structured_output(GuardianAnalysisResult)
-        chain = self.prompt | structured_llm
-        result = await chain.ainvoke(
-            {
-                "fallacy_categories": ", ".join(FALLACY_CATEGORIES),
-                "asset": state.get("asset", "unknown"),
-                "current_turn": str(state.get("current_turn", 0)),
-                "market_context": json.dumps(
-                    state.get("market_context", {}), default=str
-                ),
-                "all_arguments": self._format_all_arguments(state),
-            }
-        )
+        from app.config import settings
 
-        if isinstance(result, GuardianAnalysisResult):
-            analysis = result.model_dump()
-        else:
-            analysis = {
-                "should_interrupt": False,
-                "risk_level": "low",
-                "fallacy_type": None,
-                "reason": "Unable to parse structured output",
-                "summary_verdict": "Caution",
-                "safe": True,
-                "detailed_reasoning": "",
-            }
+        market_context, all_arguments = self.context.build(state)
+        inputs = {
+            "fallacy_categories": ", ".join(FALLACY_CATEGORIES),
+            "asset": state.get("asset", "unknown"),
+            "current_turn": str(state.get("current_turn", 0)),
+            "market_context": market_context,
+            "all_arguments": all_arguments,
+        }
+        # Replays and resumes re-review identical transcripts; the cache
+        # (opt-in via llm_cache_sites) only ever holds parsed results.
+        cache = get_llm_cache("guardian")
+        cache_key = None
+        analysis = None
+        if cache is not None:
+            cache_key = llm_cache_key(
+                settings.guardian_llm_model,
+                settings.guardian_llm_temperature,
+                self.prompt.format_messages(**inputs),
+                GuardianAnalysisResult.model_json_schema(),
+            )
+            analysis = await cache.get(cache_key)
+
+        if analysis is None:
+            llm = await self._get_llm()
+            chain = self.prompt | llm.with_structured_output(GuardianAnalysisResult)
+            result = await governed_ainvoke(
+                chain,
+                inputs,
+                agent="guardian",
+                model=settings.guardian_llm_model,
+                priority=PRIORITY_GUARDIAN,
+                prompt_chars=len(GUARDIAN_SYSTEM_PROMPT),
+                config=llm_call_config(self.streaming_handler),
+            )
+            if isinstance(result, GuardianAnalysisResult):
+                analysis = result.model_dump()
+                if cache is not None and cache_key is not None:
+                    await cache.set(cache_key, analysis)
+            else:
+                analysis = {
+                    "should_interrupt": False,
+                    "risk_level": "low",
+                    "fallacy_type": None,
+                    "reason": "Unable to parse structured output",
+                    "summary_verdict": "Caution",
+                    "safe": True,
+                    "detailed_reasoning": "",
+                }
 
         if analysis.get("reason"):
             analysis["reason"] = sanitize_response(analysis["reason"])
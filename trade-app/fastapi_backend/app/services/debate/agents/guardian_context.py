@@ -0,0 +1,226 @@
+import json
+import re
+from typing import Any
+
+from app.config import settings
+from app.services.debate.state import DebateState
+
+# Rough chars-per-token for English prose and JSON; good enough for budgeting
+# without shipping a tokenizer for every provider.
+CHARS_PER_TOKEN = 4
+SUMMARY_LINE_CHARS = 160
+RECENT_CANDLES = 5
+MAX_LIST_ITEMS = 5
+# Room left for the section headers added by ``GuardianContext._render``.
+_HEADER_CHARS = 80
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def _chars_to_tokens(chars: int) -> int:
+    return (chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    return _chars_to_tokens(len(text))
+
+
+def _summarise_candles(candles: list[Any]) -> dict[str, Any]:
+    rows = [c for c in candles if isinstance(c, dict)]
+    if not rows:
+        return {"count": len(candles)}
+    highs = [c["high"] for c in rows if c.get("high") is not None]
+    lows = [c["low"] for c in rows if c.get("low") is not None]
+    return {
+        "count": len(rows),
+        "first_open": rows[0].get("open"),
+        "last_close": rows[-1].get("close"),
+        "high": max(highs) if highs else None,
+        "low": min(lows) if lows else None,
+        "recent_ohlc": [
+            [c.get("open"), c.get("high"), c.get("low"), c.get("close")]
+            for c in rows[-RECENT_CANDLES:]
+        ],
+    }
+
+
+def _dump(compact: dict[str, Any]) -> str:
+    return json.dumps(compact, default=str, separators=(",", ":"))
+
+
+def compact_market_context(market_context: dict[str, Any]) -> dict[str, Any]:
+    """The market context with candles summarised and empty fields dropped."""
+    compact: dict[str, Any] = {}
+    for key, value in market_context.items():
+        if value is None or value == [] or value == {}:
+            continue
+        if key == "ohlcv" and isinstance(value, list):
+            compact[key] = _summarise_candles(value)
+        elif isinstance(value, dict):
+            compact[key] = {k: v for k, v in value.items() if v is not None}
+        elif isinstance(value, list) and len(value) > MAX_LIST_ITEMS:
+            compact[key] = value[:MAX_LIST_ITEMS]
+        else:
+            compact[key] = value
+    return compact
+
+
+def render_market_context(market_context: dict[str, Any]) -> str:
+    """Compact JSON of the market context: candles summarised, empties dropped."""
+    return _dump(compact_market_context(market_context))
+
+
+def trim_market_context(compact: dict[str, Any], max_chars: int) -> str:
+    """Re-dump ``compact`` with parts dropped until it fits in ``max_chars``.
+
+    Recent candle rows go first, oldest first, then whole fields, largest
+    first, so the result is always valid JSON (``{}`` at worst).
+    """
+    compact = dict(compact)
+    ohlcv = compact.get("ohlcv")
+    if isinstance(ohlcv, dict) and ohlcv.get("recent_ohlc"):
+        compact["ohlcv"] = {**ohlcv, "recent_ohlc": list(ohlcv["recent_ohlc"])}
+        rows = compact["ohlcv"]["recent_ohlc"]
+        while rows and len(_dump(compact)) > max_chars:
+            rows.pop(0)
+    while compact and len(_dump(compact)) > max_chars:
+        del compact[max(compact, key=lambda key: len(_dump({key: compact[key]})))]
+    return _dump(compact)
+
+
+def _format_message(message: dict[str, Any]) -> str:
+    role = message.get("role", "unknown")
+    return f"[{role.upper()}]: {message.get('content', '')}"
+
+
+def _summary_line(message: dict[str, Any]) -> str:
+    content = " ".join(str(message.get("content", "")).split())
+    first = _SENTENCE_END.split(content, 1)[0]
+    if len(first) > SUMMARY_LINE_CHARS:
+        first = first[: SUMMARY_LINE_CHARS - 3].rstrip() + "..."
+    return f"- [{message.get('role', 'unknown').upper()}] {first}"
+
+
+class GuardianContext:
+    """Bounded, incrementally built debate context for one Guardian.
+
+    The market context is rendered once. Arguments older than the last
+    ``recent_arguments`` are folded into a rolling one-line-per-turn summary
+    as they age out, so each turn only processes the new messages. The
+    rendered context never exceeds ``token_budget`` (estimated) tokens: the
+    oldest summary lines go first, then older full arguments, then parts of
+    the market context (see ``trim_market_context``), and the latest
+    argument is truncated last. A budget of 0 disables the cap.
+    """
+
+    def __init__(
+        self,
+        recent_arguments: int | None = None,
+        token_budget: int | None = None,
+    ) -> None:
+        if recent_arguments is None:
+            recent_arguments = settings.guardian_context_recent_arguments
+        if token_budget is None:
+            token_budget = settings.guardian_context_token_budget
+        self.recent_arguments = max(1, recent_arguments)
+        self.token_budget = token_budget
+        self._market_source: dict[str, Any] | None = None
+        self._market_compact: dict[str, Any] = {}
+        self._market_text = "{}"
+        self._market_full_chars = 2
+        self._summary: list[str] = []
+        self._summarised = 0
+        self._transcript_chars = 0
+        self._seen = 0
+        self.prompts = 0
+        self.full_tokens = 0
+        self.sent_tokens = 0
+
+    def _market(self, market_context: dict[str, Any]) -> str:
+        if market_context is not self._market_source:
+            self._market_source = market_context
+            self._market_compact = compact_market_context(market_context)
+            self._market_text = _dump(self._market_compact)
+            self._market_full_chars = len(json.dumps(market_context, default=str))
+        return self._market_text
+
+    def _advance(self, messages: list[dict[str, Any]]) -> None:
+        if len(messages) < self._seen:
+            # A different (or rewound) transcript: start over.
+            self._summary, self._summarised = [], 0
+            self._transcript_chars, self._seen = 0, 0
+        for message in messages[self._seen :]:
+            self._transcript_chars += len(_format_message(message)) + 1
+        self._seen = len(messages)
+        keep_from = max(0, len(messages) - self.recent_arguments)
+        for message in messages[self._summarised : keep_from]:
+            self._summary.append(_summary_line(message))
+        self._summarised = max(self._summarised, keep_from)
+
+    def build(self, state: DebateState) -> tuple[str, str]:
+        """Return ``(market_context, arguments)`` prompt sections for ``state``."""
+        messages = state.get("messages", [])
+        market = self._market(state.get("market_context", {}))
+        self._advance(messages)
+        recent = [_format_message(m) for m in messages[self._summarised :]]
+        summary = list(self._summary)
+
+        if self.token_budget > 0:
+            market, summary, recent = self._fit(market, summary, recent)
+
+        omitted = len(messages) - len(summary) - len(recent)
+        arguments = self._render(summary, recent, omitted)
+        self.prompts += 1
+        self.full_tokens += _chars_to_tokens(
+            self._market_full_chars + self._transcript_chars
+        )
+        self.sent_tokens += estimate_tokens(market) + estimate_tokens(arguments)
+        return market, arguments
+
+    def _fit(
+        self, market: str, summary: list[str], recent: list[str]
+    ) -> tuple[str, list[str], list[str]]:
+        budget_chars = self.token_budget * CHARS_PER_TOKEN - _HEADER_CHARS
+
+        def size() -> int:
+            return (
+                len(market)
+                + sum(len(line) + 1 for line in summary)
+                + sum(len(line) + 1 for line in recent)
+            )
+
+        while summary and size() > budget_chars:
+            summary.pop(0)
+        while len(recent) > 1 and size() > budget_chars:
+            recent.pop(0)
+        if size() > budget_chars:
+            room = budget_chars - size() + len(market)
+            market = trim_market_context(self._market_compact, room)
+        if recent and size() > budget_chars:
+            room = max(0, budget_chars - size() + len(recent[-1]))
+            recent[-1] = recent[-1][:room]
+        return market, summary, recent
+
+    @staticmethod
+    def _render(summary: list[str], recent: list[str], omitted: int) -> str:
+        if not recent:
+            return "No arguments yet."
+        if not summary and not omitted:
+            return "\n".join(recent)
+        header = "Earlier turns (summarised"
+        header += f", {omitted} oldest omitted):" if omitted else "):"
+        return "\n\n".join(
+            [
+                "\n".join([header, *summary]),
+                "\n".join(["Most recent arguments:", *recent]),
+            ]
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        saved = 1 - self.sent_tokens / self.full_tokens if self.full_tokens else 0.0
+        return {
+            "prompts": self.prompts,
+            "full_tokens": self.full_tokens,
+            "sent_tokens": self.sent_tokens,
+            "saved_ratio": round(saved, 4),
+        }
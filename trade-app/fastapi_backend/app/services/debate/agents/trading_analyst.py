@@ -3,10 +3,18 @@ import logging
 
 from langchain_core.prompts import ChatPromptTemplate
 
-from app.services.debate.llm_provider import get_llm_with_failover
+from app.config import settings
+from app.services.debate.llm_cache import get_llm_cache, llm_cache_key
+from app.services.debate.llm_provider import (
+    PRIORITY_ANALYSIS,
+    get_llm_with_failover,
+    governed_ainvoke,
+)
 
 logger = logging.getLogger(__name__)
 
+ANALYST_TEMPERATURE = 0.3
+
 TRADING_ANALYST_PROMPT = """You are a senior trading analyst and debate judge. Given a debate between a Bull and Bear agent about {asset}, along with technical market data, produce a structured trading analysis AND declare a clear winner.
 
 DEBATE TRANSCRIPT:
@@ -60,6 +68,8 @@ FOREX-SPECIFIC RULES (when forex data is present):
 - NEVER use forbidden promissory language (guaranteed, risk-free, can't lose, etc.)
 """
 
+TRADING_ANALYST_CHAT_PROMPT = ChatPromptTemplate.from_template(TRADING_ANALYST_PROMPT)
+
 
 async def generate_trading_analysis(
     asset: str,
@@ -67,8 +77,6 @@ async def generate_trading_analysis(
     technical_data: dict | None = None,
     forex_meta: dict | None = None,
 ) -> dict:
-    llm = await get_llm_with_failover(temperature=0.3)
-
     transcript_lines = []
     for msg in messages:
         role = msg.get("role", "unknown").upper()
@@ -89,16 +97,36 @@ async def generate_trading_analysis(
     else:
         forex_section = ""
 
-    prompt = ChatPromptTemplate.from_template(TRADING_ANALYST_PROMPT)
-    chain = prompt | llm
-
-    response = await chain.ainvoke(
-        {
-            "asset": asset.upper(),
-            "transcript": transcript,
-            "technical_data": tech_str,
-            "forex_section": forex_section,
-        }
+    inputs = {
+        "asset": asset.upper(),
+        "transcript": transcript,
+        "technical_data": tech_str,
+        "forex_section": forex_section,
+    }
+    # Archive retries re-run the analysis on the same transcript; with
+    # "trading_analyst" in llm_cache_sites a parsed result is reused.
+    cache = get_llm_cache("trading_analyst")
+    cache_key = None
+    if cache is not None:
+        cache_key = llm_cache_key(
+            settings.debate_llm_model,
+            ANALYST_TEMPERATURE,
+            TRADING_ANALYST_CHAT_PROMPT.format_messages(**inputs),
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    llm = await get_llm_with_failover(temperature=ANALYST_TEMPERATURE)
+    chain = TRADING_ANALYST_CHAT_PROMPT | llm
+
+    response = await governed_ainvoke(
+        chain,
+        inputs,
+        agent="trading_analyst",
+        model=settings.debate_llm_model,
+        priority=PRIORITY_ANALYSIS,
+        prompt_chars=len(TRADING_ANALYST_PROMPT),
     )
 
     raw = response.content
@@ -111,6 +139,8 @@ async def generate_trading_analysis(
 
     try:
         analysis = json.loads(raw)
+        if cache is not None and cache_key is not None:
+            await cache.set(cache_key, analysis)
     except json.JSONDecodeError:
         logger.warning(f"Trading analyst returned non-JSON: {raw[:200]}")
         analysis = {
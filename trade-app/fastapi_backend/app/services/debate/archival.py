@@ -9,6 +9,7 @@ from app.database import async_session_maker
 from app.models import Vote
 from app.services.debate.repository import DebateRepository
 from app.services.debate.streaming import stream_state
+from app.services.metrics import ARCHIVE_FAILURES, ARCHIVE_RETRIES
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +113,8 @@ async def archive_with_retry(
                 exc_info=True,
             )
             if attempt < MAX_ARCHIVE_RETRIES:
+                ARCHIVE_RETRIES.inc()
                 await asyncio.sleep(ARCHIVE_RETRY_DELAY_S * attempt)
+    ARCHIVE_FAILURES.inc()
     logger.error(f"All {MAX_ARCHIVE_RETRIES} archive attempts failed for {debate_id}")
     return False
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
+
+from app.config import settings
+from app.services.debate.frames import ActionFrame
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "debate_ws:"
+# Worker-wide control messages, e.g. a forbidden-phrase reload. Outside
+# CHANNEL_PREFIX so no debate id can collide with it.
+CONTROL_CHANNEL = "debate_ws_control"
+_LISTEN_POLL_TIMEOUT = 1.0
+_LISTEN_RETRY_DELAY = 1.0
+
+DeliverFn = Callable[[str, ActionFrame], Awaitable[None]]
+ControlFn = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@runtime_checkable
+class BroadcastBackplane(Protocol):
+    """Carries debate frames to every worker that has viewers for a debate.
+
+    A publisher calls ``publish`` once per frame; each worker's backplane
+    hands the frame to ``deliver`` (its connection manager's local fan-out)
+    for the debates it has subscribed to.
+
+    ``publish_control`` sends a JSON-able message to the ``subscribe_control``
+    handlers of every *other* worker; the publisher applies it itself. Each
+    handler ignores message types it does not own. It returns False if the
+    message could not be sent.
+
+    ``channel`` names the Redis channel a debate's frames travel on, for
+    publishers that can PUBLISH there themselves, or None if there is none.
+    """
+
+    is_distributed: bool
+
+    def bind(self, deliver: DeliverFn) -> None:
+        ...
+
+    def channel(self, debate_id: str) -> str | None:
+        ...
+
+    async def publish(self, debate_id: str, frame: ActionFrame) -> None:
+        ...
+
+    async def subscribe(self, debate_id: str) -> None:
+        ...
+
+    async def unsubscribe(self, debate_id: str) -> None:
+        ...
+
+    async def publish_control(self, message: dict[str, Any]) -> bool:
+        ...
+
+    async def subscribe_control(self, handler: ControlFn) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class InMemoryBackplane:
+    """Single-process backplane: publishing delivers straight to local sockets."""
+
+    is_distributed = False
+
+    def __init__(self) -> None:
+        self._deliver: DeliverFn | None = None
+
+    def bind(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    def channel(self, debate_id: str) -> str | None:
+        return None
+
+    async def publish(self, debate_id: str, frame: ActionFrame) -> None:
+        if self._deliver is not None:
+            await self._deliver(debate_id, frame)
+
+    async def subscribe(self, debate_id: str) -> None:
+        pass
+
+    async def unsubscribe(self, debate_id: str) -> None:
+        pass
+
+    async def publish_control(self, message: dict[str, Any]) -> bool:
+        # No other workers to reach.
+        return True
+
+    async def subscribe_control(self, handler: ControlFn) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisBackplane:
+    """Redis pub/sub backplane with one channel per debate.
+
+    Frames are published as their pre-encoded JSON text, so a broadcast costs
+    one PUBLISH regardless of how many workers or viewers are listening.
+    Each worker subscribes only to debates with local sockets and delivers
+    incoming frames without re-encoding them. If Redis is unavailable,
+    frames are delivered to local sockets only. Control messages carry the
+    publishing backplane's ``instance_id`` so it can skip its own.
+    """
+
+    is_distributed = True
+
+    def __init__(self, redis: Any = None) -> None:
+        self._redis = redis
+        self._pubsub: Any = None
+        self._deliver: DeliverFn | None = None
+        self._listener: asyncio.Task | None = None
+        self._channels: set[str] = set()
+        self._lock = asyncio.Lock()
+        self._control: list[ControlFn] = []
+        self.instance_id = uuid.uuid4().hex
+
+    def bind(self, deliver: DeliverFn) -> None:
+        self._deliver = deliver
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    def channel(self, debate_id: str) -> str | None:
+        return f"{CHANNEL_PREFIX}{debate_id}"
+
+    async def publish(self, debate_id: str, frame: ActionFrame) -> None:
+        try:
+            redis = await self._get_redis()
+            await redis.publish(self.channel(debate_id), frame.text)
+        except Exception as e:
+            logger.warning(
+                f"Backplane publish failed for debate {debate_id}, "
+                f"delivering locally only: {e}"
+            )
+            if self._deliver is not None:
+                await self._deliver(debate_id, frame)
+
+    async def subscribe(self, debate_id: str) -> None:
+        await self._subscribe(f"{CHANNEL_PREFIX}{debate_id}")
+
+    async def _subscribe(self, channel: str) -> None:
+        async with self._lock:
+            if channel in self._channels:
+                return
+            try:
+                if self._pubsub is None:
+                    redis = await self._get_redis()
+                    self._pubsub = redis.pubsub()
+                await self._pubsub.subscribe(channel)
+            except Exception as e:
+                logger.warning(f"Backplane subscribe failed for {channel}: {e}")
+                return
+            self._channels.add(channel)
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, debate_id: str) -> None:
+        channel = f"{CHANNEL_PREFIX}{debate_id}"
+        async with self._lock:
+            if channel not in self._channels:
+                return
+            self._channels.discard(channel)
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except Exception as e:
+                logger.warning(
+                    f"Backplane unsubscribe failed for debate {debate_id}: {e}"
+                )
+
+    async def publish_control(self, message: dict[str, Any]) -> bool:
+        try:
+            redis = await self._get_redis()
+            await redis.publish(
+                CONTROL_CHANNEL, json.dumps({**message, "origin": self.instance_id})
+            )
+        except Exception as e:
+            logger.warning(f"Backplane control publish failed: {e}")
+            return False
+        return True
+
+    async def subscribe_control(self, handler: ControlFn) -> None:
+        self._control.append(handler)
+        await self._subscribe(CONTROL_CHANNEL)
+
+    async def _apply_control(self, data: str | bytes) -> None:
+        message = json.loads(data)
+        if message.get("origin") == self.instance_id:
+            return
+        for handler in self._control:
+            await handler(message)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_LISTEN_POLL_TIMEOUT
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Backplane listener error: {e}")
+                await asyncio.sleep(_LISTEN_RETRY_DELAY)
+                continue
+            if message is None or message.get("type") != "message":
+                continue
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            if channel not in self._channels:
+                continue
+            try:
+                if channel == CONTROL_CHANNEL:
+                    await self._apply_control(message["data"])
+                elif self._deliver is not None:
+                    frame = ActionFrame.from_text(message["data"])
+                    await self._deliver(channel.removeprefix(CHANNEL_PREFIX), frame)
+            except Exception as e:
+                logger.warning(f"Backplane delivery failed on {channel}: {e}")
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.reset()
+            except Exception:
+                pass
+            self._pubsub = None
+        self._channels.clear()
+
+
+def create_backplane() -> BroadcastBackplane:
+    """Build the backplane selected by ``settings.WS_BACKPLANE``."""
+    if settings.WS_BACKPLANE == "redis":
+        return RedisBackplane()
+    return InMemoryBackplane()
@@ -0,0 +1,297 @@
+import asyncio
+import logging
+import zlib
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import async_session_maker
+from app.models import Debate
+
+logger = logging.getLogger(__name__)
+
+_ZLIB_SUFFIX = "+zlib"
+PRUNE_BATCH_SIZE = 500
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """msgpack checkpoints, zlib-compressed once they reach ``min_bytes``.
+
+    Debate checkpoints are dominated by the growing transcript, which is
+    repetitive prose and compresses several-fold. Payloads stay readable by
+    the stock serializer's type tags plus a ``+zlib`` suffix.
+    """
+
+    def __init__(self, min_bytes: int | None = None) -> None:
+        super().__init__()
+        if min_bytes is None:
+            min_bytes = settings.CHECKPOINTER_COMPRESS_MIN_BYTES
+        self.min_bytes = min_bytes
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = super().dumps_typed(obj)
+        if type_ in ("msgpack", "json") and len(data) >= self.min_bytes:
+            packed = zlib.compress(data)
+            if len(packed) < len(data):
+                return type_ + _ZLIB_SUFFIX, packed
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(_ZLIB_SUFFIX):
+            return super().loads_typed(
+                (type_[: -len(_ZLIB_SUFFIX)], zlib.decompress(payload))
+            )
+        return super().loads_typed(data)
+
+
+_Key = tuple[str, str, str]
+
+
+class BoundedMemorySaver(MemorySaver):
+    """``MemorySaver`` that only keeps what resuming a debate needs.
+
+    Each thread keeps its newest ``keep_per_thread`` checkpoints (and only
+    the channel blobs and pending writes those reference). When the store
+    holds more than ``max_bytes`` of serialized data, whole threads are
+    evicted least recently written first; the thread being written is never
+    evicted. ``delete_thread`` drops a finished debate outright.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        keep_per_thread: int | None = None,
+        serde: Any = None,
+    ) -> None:
+        super().__init__(serde=serde or CompactSerializer())
+        self.max_bytes = (
+            settings.CHECKPOINTER_MEMORY_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.keep_per_thread = max(
+            1,
+            settings.CHECKPOINTER_KEEP_PER_THREAD
+            if keep_per_thread is None
+            else keep_per_thread,
+        )
+        self._versions: dict[_Key, dict[str, Any]] = {}
+        self._blob_keys: defaultdict[str, set[tuple]] = defaultdict(set)
+        self._write_keys: defaultdict[str, set[_Key]] = defaultdict(set)
+        self._thread_bytes: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self.evicted_threads = 0
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        result = super().put(config, checkpoint, metadata, new_versions)
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        self._versions[(thread_id, checkpoint_ns, checkpoint["id"])] = dict(
+            checkpoint["channel_versions"]
+        )
+        for channel, version in new_versions.items():
+            self._blob_keys[thread_id].add((thread_id, checkpoint_ns, channel, version))
+        self._prune(thread_id, checkpoint_ns)
+        self._account(thread_id)
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        super().put_writes(config, writes, task_id, task_path)
+        thread_id = config["configurable"]["thread_id"]
+        self._write_keys[thread_id].add(
+            (
+                thread_id,
+                config["configurable"].get("checkpoint_ns", ""),
+                config["configurable"]["checkpoint_id"],
+            )
+        )
+        self._account(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self.storage.pop(thread_id, None)
+        for key in self._write_keys.pop(thread_id, ()):
+            self.writes.pop(key, None)
+        for key in self._blob_keys.pop(thread_id, ()):
+            self.blobs.pop(key, None)
+        for key in [k for k in self._versions if k[0] == thread_id]:
+            del self._versions[key]
+        self._total_bytes -= self._thread_bytes.pop(thread_id, 0)
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if len(checkpoints) <= self.keep_per_thread:
+            return
+        # Checkpoint ids sort chronologically.
+        for checkpoint_id in sorted(checkpoints)[: -self.keep_per_thread]:
+            del checkpoints[checkpoint_id]
+            key = (thread_id, checkpoint_ns, checkpoint_id)
+            self._versions.pop(key, None)
+            self.writes.pop(key, None)
+            self._write_keys[thread_id].discard(key)
+        live = {
+            (thread_id, checkpoint_ns, channel, version)
+            for checkpoint_id in checkpoints
+            for channel, version in self._versions.get(
+                (thread_id, checkpoint_ns, checkpoint_id), {}
+            ).items()
+        }
+        blob_keys = self._blob_keys[thread_id]
+        for key in [k for k in blob_keys if k[1] == checkpoint_ns and k not in live]:
+            self.blobs.pop(key, None)
+            blob_keys.discard(key)
+
+    def _measure(self, thread_id: str) -> int:
+        size = sum(
+            len(checkpoint[1]) + len(metadata[1])
+            for namespace in self.storage.get(thread_id, {}).values()
+            for checkpoint, metadata, _ in namespace.values()
+        )
+        size += sum(
+            len(self.blobs[key][1])
+            for key in self._blob_keys.get(thread_id, ())
+            if key in self.blobs
+        )
+        size += sum(
+            len(write[2][1])
+            for key in self._write_keys.get(thread_id, ())
+            for write in self.writes.get(key, {}).values()
+        )
+        return size
+
+    def _account(self, thread_id: str) -> None:
+        size = self._measure(thread_id)
+        self._total_bytes += size - self._thread_bytes.get(thread_id, 0)
+        self._thread_bytes[thread_id] = size
+        self._thread_bytes.move_to_end(thread_id)
+        while self.max_bytes > 0 and self._total_bytes > self.max_bytes:
+            oldest = next(iter(self._thread_bytes))
+            if oldest == thread_id:
+                break
+            logger.warning(f"Checkpoint store over capacity, evicting {oldest}")
+            self.delete_thread(oldest)
+            self.evicted_threads += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "threads": len(self._thread_bytes),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "evicted_threads": self.evicted_threads,
+        }
+
+
+_checkpointer: BaseCheckpointSaver | None = None
+_pool: Any = None
+
+
+def _create_checkpointer() -> BaseCheckpointSaver:
+    global _pool
+    if settings.CHECKPOINTER_TYPE == "postgres":
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        if not settings.CHECKPOINTER_URL:
+            raise ValueError(
+                "CHECKPOINTER_URL is required when CHECKPOINTER_TYPE is 'postgres'"
+            )
+        # Opened and closed by the app lifespan (open_checkpointer /
+        # close_checkpointer); the kwargs are what AsyncPostgresSaver expects.
+        _pool = AsyncConnectionPool(
+            conninfo=settings.CHECKPOINTER_URL,
+            max_size=settings.CHECKPOINTER_POOL_SIZE,
+            open=False,
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+        )
+        return AsyncPostgresSaver(_pool, serde=CompactSerializer())
+    return BoundedMemorySaver()
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """The process-wide checkpoint store selected by ``CHECKPOINTER_TYPE``."""
+    global _checkpointer
+    if _checkpointer is None:
+        _checkpointer = _create_checkpointer()
+    return _checkpointer
+
+
+async def open_checkpointer() -> None:
+    """Open the shared Postgres pool and create the checkpoint tables."""
+    checkpointer = get_checkpointer()
+    if _pool is not None:
+        await _pool.open()
+        await checkpointer.setup()  # type: ignore[attr-defined]
+
+
+async def close_checkpointer() -> None:
+    global _checkpointer, _pool
+    if _pool is not None:
+        await _pool.close()
+    _checkpointer, _pool = None, None
+
+
+async def _checkpoint_thread_ids(checkpointer: BaseCheckpointSaver) -> list[str]:
+    if isinstance(checkpointer, MemorySaver):
+        return list(checkpointer.storage)
+    async with _pool.connection() as conn:
+        cursor = await conn.execute("SELECT DISTINCT thread_id FROM checkpoints")
+        return [row["thread_id"] for row in await cursor.fetchall()]
+
+
+async def prune_archived_checkpoints() -> int:
+    """Delete the checkpoints of debates that have been archived."""
+    checkpointer = get_checkpointer()
+    thread_ids = await _checkpoint_thread_ids(checkpointer)
+    pruned = 0
+    for start in range(0, len(thread_ids), PRUNE_BATCH_SIZE):
+        batch = thread_ids[start : start + PRUNE_BATCH_SIZE]
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(Debate.external_id)
+                .where(Debate.external_id.in_(batch))
+                .where(Debate.completed_at.is_not(None))
+            )
+            archived = list(result.scalars().all())
+        for thread_id in archived:
+            await checkpointer.adelete_thread(thread_id)
+        pruned += len(archived)
+    return pruned
+
+
+async def prune_loop() -> None:
+    while True:
+        try:
+            count = await prune_archived_checkpoints()
+            if count > 0:
+                logger.info(f"Pruned checkpoints of {count} archived debates")
+        except Exception as e:
+            logger.error(f"Checkpoint prune error: {e}", exc_info=True)
+        await asyncio.sleep(settings.CHECKPOINTER_PRUNE_INTERVAL_SECONDS)
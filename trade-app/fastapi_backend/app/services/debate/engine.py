@@ -1,12 +1,12 @@
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, cast
+from typing import Any, Awaitable, Callable, cast
 
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.checkpoint.memory import MemorySaver
 
 from app.services.debate.state import DebateState, RiskLevel
 from app.services.debate.agents.bull import BullAgent
@@ -35,7 +35,24 @@ from app.services.debate.sanitization import (
     sanitize_content,
 )
 from app.services.debate.archival import archive_with_retry
+from app.services.debate.checkpoints import get_checkpointer
+from app.services.debate.profiling import (
+    PHASE_ARCHIVAL,
+    PHASE_GUARDIAN,
+    PHASE_LLM,
+    PHASE_SANITIZATION,
+    LLMTimingHandler,
+    current_profile,
+    profiled,
+)
+from app.services.market.schemas import FreshnessStatus
 from app.services.market.stale_data_guardian import StaleDataGuardian
+from app.services.market.watcher import (
+    FRESHNESS_CHECK_INTERVAL,
+    MarketWatcherHub,
+    PriceTick,
+    get_market_watcher,
+)
 from app.services.audit.writer import AuditWriter
 
 logger = logging.getLogger(__name__)
@@ -54,7 +71,6 @@ class StaleDataError(Exception):
         super().__init__(message)
 
 
-FRESHNESS_CHECK_INTERVAL = 5
 GUARDIAN_ACK_TIMEOUT = 120
 
 _pause_events: dict[str, asyncio.Event] = {}
@@ -83,6 +99,114 @@ def should_continue(state: DebateState) -> bool:
     return state["current_turn"] < state["max_turns"]
 
 
+def _token_handler(
+    manager: DebateConnectionManager, debate_id: str, agent: str
+) -> TokenStreamingHandler:
+    # Sized once per turn: the frame-rate cap scales with the local audience
+    # and drops further while admission control is shedding load.
+    viewers = len(manager.active_debates.get(debate_id, ()))
+    fps_scale = manager.admission.token_fps_scale(debate_id)
+    return TokenStreamingHandler(
+        manager, debate_id, agent, viewers=viewers, fps_scale=fps_scale
+    )
+
+
+class _DeferredBroadcast:
+    """Stands in for the connection manager during a speculative turn.
+
+    Broadcasts and post-publish actions are held back until ``publish``
+    replays them in order and switches to pass-through; ``discard`` drops
+    them for good. Everything else is delegated to the real manager.
+    """
+
+    def __init__(self, manager: DebateConnectionManager) -> None:
+        self._manager = manager
+        self._frames: list[tuple[str, dict[str, Any]]] = []
+        self._actions: list[Callable[[], Awaitable[None]]] = []
+        self._live = False
+        self._discarded = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._manager, name)
+
+    async def broadcast_to_debate(self, debate_id: str, action: dict[str, Any]) -> None:
+        if self._live:
+            await self._manager.broadcast_to_debate(debate_id, action)
+        elif not self._discarded:
+            self._frames.append((debate_id, action))
+
+    async def when_published(self, action: Callable[[], Awaitable[None]]) -> None:
+        if self._live:
+            await action()
+        elif not self._discarded:
+            self._actions.append(action)
+
+    async def publish(self) -> None:
+        # The turn may still be generating; keep draining until the buffer
+        # is empty so frames it adds meanwhile stay in order.
+        while self._frames:
+            debate_id, action = self._frames.pop(0)
+            await self._manager.broadcast_to_debate(debate_id, action)
+        self._live = True
+        actions, self._actions = self._actions, []
+        for deferred in actions:
+            await deferred()
+
+    def discard(self) -> None:
+        self._discarded = True
+        self._frames.clear()
+        self._actions.clear()
+
+
+async def _when_published(
+    manager: DebateConnectionManager, action: Callable[[], Awaitable[None]]
+) -> None:
+    """Run ``action`` now, or once the speculative turn it belongs to is published."""
+    if isinstance(manager, _DeferredBroadcast):
+        await manager.when_published(action)
+    else:
+        await action()
+
+
+# Bull and Bear agents hold no per-debate state (pooled client, prompt
+# compiled at import, streaming handler passed per call), so one instance
+# per class serves every turn of every debate.
+_shared_agents: dict[type, BullAgent | BearAgent] = {}
+
+
+def _shared_agent(agent_cls: type) -> BullAgent | BearAgent:
+    agent = _shared_agents.get(agent_cls)
+    if agent is None:
+        agent = _shared_agents[agent_cls] = agent_cls()
+    return agent
+
+
+async def _generate_turn(
+    agent: BullAgent | BearAgent,
+    state: DebateState,
+    role: str,
+    streaming_handler: TokenStreamingHandler | None = None,
+) -> dict[str, Any]:
+    """Run one agent turn, recording its LLM timing into the active profile."""
+    profile = current_profile()
+    extra = {"streaming_handler": streaming_handler} if streaming_handler else {}
+    if profile is None:
+        return await agent.generate(state, **extra)
+    timing = LLMTimingHandler()
+    turn = state["current_turn"] + 1
+    started = time.monotonic()
+    with profile.measure(PHASE_LLM, turn):
+        result = await agent.generate(state, callbacks=[timing], **extra)
+    profile.record_turn(
+        turn,
+        role,
+        time.monotonic() - started,
+        first_token_seconds=timing.first_token,
+        output_tokens=timing.output_tokens,
+    )
+    return result
+
+
 async def bull_agent_node(
     state: DebateState,
     manager: DebateConnectionManager | None = None,
@@ -90,10 +214,9 @@ async def bull_agent_node(
 ) -> dict[str, Any]:
     handler = None
     if manager and debate_id:
-        handler = TokenStreamingHandler(manager, debate_id, "bull")
+        handler = _token_handler(manager, debate_id, "bull")
 
-    agent = BullAgent(streaming_handler=handler)
-    result = await agent.generate(state)
+    result = await _generate_turn(_shared_agent(BullAgent), state, "bull", handler)
     logger.info(f"Bull agent generated argument, turn {state['current_turn']}")
 
     if manager and debate_id:
@@ -104,12 +227,13 @@ async def bull_agent_node(
             return result
 
         raw_content = messages[-1]["content"]
-        sanitization_result = sanitize_content(
-            raw_content,
-            SanitizationContext(
-                debate_id=debate_id, agent="bull", turn=result["current_turn"]
-            ),
-        )
+        with profiled(PHASE_SANITIZATION, result["current_turn"]):
+            sanitization_result = sanitize_content(
+                raw_content,
+                SanitizationContext(
+                    debate_id=debate_id, agent="bull", turn=result["current_turn"]
+                ),
+            )
         if sanitization_result.is_redacted and len(raw_content) > 0:
             redacted_count = len(sanitization_result.redacted_phrases)
             if redacted_count > 2 or sanitization_result.redaction_ratio > 0.5:
@@ -150,22 +274,25 @@ async def bull_agent_node(
         if _s.AUDIT_ENABLED:
             from app.services.audit.writer import get_audit_writer as _gaw
 
-            try:
-                await _gaw().write(
-                    {
-                        "debate_id": debate_id,
-                        "event_type": "SANITIZATION",
-                        "actor": "bull",
-                        "payload": {
-                            "redacted_phrases": sanitization_result.redacted_phrases,
-                            "redaction_ratio": sanitization_result.redaction_ratio,
-                            "original_length": len(raw_content),
-                            "turn": result["current_turn"],
-                        },
-                    }
-                )
-            except Exception as _audit_exc:
-                logger.warning(f"Audit write failed for SANITIZATION: {_audit_exc}")
+            async def _write_audit() -> None:
+                try:
+                    await _gaw().write(
+                        {
+                            "debate_id": debate_id,
+                            "event_type": "SANITIZATION",
+                            "actor": "bull",
+                            "payload": {
+                                "redacted_phrases": sanitization_result.redacted_phrases,
+                                "redaction_ratio": sanitization_result.redaction_ratio,
+                                "original_length": len(raw_content),
+                                "turn": result["current_turn"],
+                            },
+                        }
+                    )
+                except Exception as _audit_exc:
+                    logger.warning(f"Audit write failed for SANITIZATION: {_audit_exc}")
+
+            await _when_published(manager, _write_audit)
 
     return result
 
@@ -177,10 +304,9 @@ async def bear_agent_node(
 ) -> dict[str, Any]:
     handler = None
     if manager and debate_id:
-        handler = TokenStreamingHandler(manager, debate_id, "bear")
+        handler = _token_handler(manager, debate_id, "bear")
 
-    agent = BearAgent(streaming_handler=handler)
-    result = await agent.generate(state)
+    result = await _generate_turn(_shared_agent(BearAgent), state, "bear", handler)
     logger.info(f"Bear agent generated argument, turn {state['current_turn']}")
 
     if manager and debate_id:
@@ -191,12 +317,13 @@ async def bear_agent_node(
             return result
 
         raw_content = messages[-1]["content"]
-        sanitization_result = sanitize_content(
-            raw_content,
-            SanitizationContext(
-                debate_id=debate_id, agent="bear", turn=result["current_turn"]
-            ),
-        )
+        with profiled(PHASE_SANITIZATION, result["current_turn"]):
+            sanitization_result = sanitize_content(
+                raw_content,
+                SanitizationContext(
+                    debate_id=debate_id, agent="bear", turn=result["current_turn"]
+                ),
+            )
         if sanitization_result.is_redacted and len(raw_content) > 0:
             redacted_count = len(sanitization_result.redacted_phrases)
             if redacted_count > 2 or sanitization_result.redaction_ratio > 0.5:
@@ -237,41 +364,27 @@ async def bear_agent_node(
         if _s.AUDIT_ENABLED:
             from app.services.audit.writer import get_audit_writer as _gaw
 
-            try:
-                await _gaw().write(
-                    {
-                        "debate_id": debate_id,
-                        "event_type": "SANITIZATION",
-                        "actor": "bear",
-                        "payload": {
-                            "redacted_phrases": sanitization_result.redacted_phrases,
-                            "redaction_ratio": sanitization_result.redaction_ratio,
-                            "original_length": len(raw_content),
-                            "turn": result["current_turn"],
-                        },
-                    }
-                )
-            except Exception as _audit_exc:
-                logger.warning(f"Audit write failed for SANITIZATION: {_audit_exc}")
-
-    return result
-
-
-def get_checkpointer() -> BaseCheckpointSaver:
-    from app.config import settings
+            async def _write_audit() -> None:
+                try:
+                    await _gaw().write(
+                        {
+                            "debate_id": debate_id,
+                            "event_type": "SANITIZATION",
+                            "actor": "bear",
+                            "payload": {
+                                "redacted_phrases": sanitization_result.redacted_phrases,
+                                "redaction_ratio": sanitization_result.redaction_ratio,
+                                "original_length": len(raw_content),
+                                "turn": result["current_turn"],
+                            },
+                        }
+                    )
+                except Exception as _audit_exc:
+                    logger.warning(f"Audit write failed for SANITIZATION: {_audit_exc}")
 
-    checkpointer_type = settings.CHECKPOINTER_TYPE
-    if checkpointer_type == "postgres":
-        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
-        from psycopg_pool import AsyncConnectionPool
+            await _when_published(manager, _write_audit)
 
-        if not settings.CHECKPOINTER_URL:
-            raise ValueError(
-                "CHECKPOINTER_URL is required when CHECKPOINTER_TYPE is 'postgres'"
-            )
-        pool = AsyncConnectionPool(conninfo=settings.CHECKPOINTER_URL)
-        return AsyncPostgresSaver(pool)
-    return MemorySaver()
+    return result
 
 
 def create_debate_graph(
@@ -282,7 +395,8 @@ def create_debate_graph(
     For production deployments with multiple workers, use PostgresSaver
     by setting CHECKPOINTER_TYPE=postgres and CHECKPOINTER_URL in the
     environment. This ensures debate state persists across process
-    restarts and is accessible from any worker.
+    restarts and is accessible from any worker. Either way the graph shares
+    the process-wide store from ``get_checkpointer``.
     """
     if checkpointer is None:
         checkpointer = get_checkpointer()
@@ -318,6 +432,44 @@ async def _wait_for_guardian_ack(
         _clear_pause_event(debate_id)
 
 
+class _SpeculativeTurn:
+    """The next agent's turn, generated while the Guardian reviews the last one.
+
+    Nothing it broadcasts reaches viewers until ``publish``; ``discard``
+    cancels it and drops whatever it produced.
+    """
+
+    def __init__(
+        self,
+        state: dict[str, Any],
+        manager: DebateConnectionManager,
+        debate_id: str,
+    ) -> None:
+        node = bull_agent_node if state["current_agent"] == "bull" else bear_agent_node
+        self._broadcast = _DeferredBroadcast(manager)
+        # The Guardian may append to the live state while this turn runs.
+        snapshot = {**state, "messages": list(state["messages"])}
+        self._task = asyncio.create_task(
+            node(
+                cast(DebateState, snapshot),
+                cast(DebateConnectionManager, self._broadcast),
+                debate_id,
+            )
+        )
+
+    async def publish(self) -> dict[str, Any]:
+        await self._broadcast.publish()
+        return await self._task
+
+    async def discard(self) -> None:
+        self._broadcast.discard()
+        self._task.cancel()
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
 async def stream_debate(
     debate_id: str,
     asset: str,
@@ -327,15 +479,24 @@ async def stream_debate(
     stale_guardian: StaleDataGuardian | None = None,
     audit_writer: AuditWriter | None = None,
 ) -> dict[str, Any]:
-    """Stream debate tokens via async generator with WebSocket broadcasting."""
-    if stale_guardian is None:
-        from app.config import settings
+    """Stream debate tokens via async generator with WebSocket broadcasting.
 
-        stale_guardian = StaleDataGuardian(
-            cache_redis_url=settings.REDIS_URL,
+    Freshness and forex price updates come from the process-wide market
+    watcher, which polls each asset once for all of its debates. An injected
+    ``stale_guardian`` gets a watcher of its own for this debate.
+    """
+    private_watcher = stale_guardian is not None
+    watcher = (
+        MarketWatcherHub(
+            stale_guardian=stale_guardian,
+            freshness_interval=FRESHNESS_CHECK_INTERVAL,
+            price_interval=FOREX_PRICE_POLL_INTERVAL,
         )
+        if private_watcher
+        else get_market_watcher()
+    )
 
-    freshness = await stale_guardian.get_freshness_status(asset)
+    freshness = await watcher.check_freshness(asset)
     if freshness.is_stale:
         raise StaleDataError(
             code="DATA_STALE",
@@ -386,30 +547,44 @@ async def stream_debate(
     )
 
     stale_event = asyncio.Event()
-    freshness_monitor_task = asyncio.create_task(
-        _monitor_freshness(debate_id, asset, manager, stale_guardian, stale_event)
-    )
 
-    from app.services.market.twelvedata_provider import is_forex_asset as _is_forex
+    async def on_stale(freshness: FreshnessStatus) -> None:
+        logger.warning(
+            f"Data stale detected for {asset} in debate {debate_id}: "
+            f"{freshness.age_seconds}s old"
+        )
+        await send_data_stale(manager, debate_id, freshness)
+        stale_event.set()
 
-    forex_price_task: asyncio.Task | None = None
-    if _is_forex(asset):
-        forex_price_task = asyncio.create_task(
-            _poll_forex_price(debate_id, asset, manager, stale_event)
+    async def on_price(tick: PriceTick) -> None:
+        await send_forex_price_update(
+            manager,
+            debate_id,
+            asset=tick.asset,
+            price=tick.price,
+            previous_price=tick.previous_price,
+            change_pct=tick.change_pct,
         )
 
+    subscription = watcher.subscribe(asset, on_stale=on_stale, on_price=on_price)
+
     current_state = initial_state
     turn_arguments: dict[tuple[str, int], ArgumentEntry] = {}
 
     from app.config import settings as app_settings
 
     guardian = GuardianAgent() if app_settings.guardian_enabled else None
+    pipelined = guardian is not None and app_settings.guardian_pipelined
+    speculative: _SpeculativeTurn | None = None
 
     try:
         while should_continue(current_state) and not stale_event.is_set():
             current_agent = current_state["current_agent"]
 
-            if current_agent == "bull":
+            if speculative is not None:
+                result = await speculative.publish()
+                speculative = None
+            elif current_agent == "bull":
                 result = await bull_agent_node(current_state, manager, debate_id)  # type: ignore[arg-type]
             else:
                 result = await bear_agent_node(current_state, manager, debate_id)  # type: ignore[arg-type]
@@ -440,7 +615,8 @@ async def stream_debate(
                 "_sanitization_result"
             )
             if sanitization_result is None:
-                sanitization_result = sanitize_content(argument_content)
+                with profiled(PHASE_SANITIZATION, result["current_turn"]):
+                    sanitization_result = sanitize_content(argument_content)
 
             turn_arguments[(current_agent, result["current_turn"])] = ArgumentEntry(
                 raw=argument_content,
@@ -464,8 +640,11 @@ async def stream_debate(
             # unfiltered context to accurately evaluate argument quality and detect risks.
             # Sanitized content is only sent to the user-facing WebSocket and reasoning graph.
             if guardian is not None:
+                if pipelined and should_continue(current_state):  # type: ignore[arg-type]
+                    speculative = _SpeculativeTurn(current_state, manager, debate_id)
                 try:
-                    analysis = await guardian.analyze(current_state)
+                    with profiled(PHASE_GUARDIAN, result["current_turn"]):
+                        analysis = await guardian.analyze(current_state)
 
                     if audit_writer is not None:
                         try:
@@ -499,6 +678,9 @@ async def stream_debate(
                             )
 
                     if analysis["should_interrupt"]:
+                        if speculative is not None:
+                            await speculative.discard()
+                            speculative = None
                         risk_lvl: RiskLevel = cast(RiskLevel, analysis["risk_level"])
                         await send_guardian_interrupt(
                             manager,
@@ -640,7 +822,8 @@ async def stream_debate(
 
         if guardian is not None:
             try:
-                final_analysis = await guardian.analyze(current_state)  # type: ignore[arg-type]
+                with profiled(PHASE_GUARDIAN):
+                    final_analysis = await guardian.analyze(current_state)  # type: ignore[arg-type]
                 await send_guardian_verdict(
                     manager,
                     debate_id,
@@ -668,6 +851,10 @@ async def stream_debate(
                     reasoning="Final verdict could not be generated",
                     total_interrupts=len(current_state.get("guardian_interrupts", [])),
                 )
+            logger.info(
+                f"Guardian context for debate {debate_id}: "
+                f"{guardian.context.get_stats()}"
+            )
 
         # TODO: Epic 3 will replace this placeholder with real voting-based winner determination
         final_turn = current_state["current_turn"]
@@ -716,7 +903,8 @@ async def stream_debate(
                 logger.warning(f"Audit write failed for DEBATE_COMPLETED: {e}")
 
         try:
-            await archive_with_retry(debate_id, current_state)
+            with profiled(PHASE_ARCHIVAL):
+                await archive_with_retry(debate_id, current_state)
         except Exception as e:
             logger.error(f"Archival failed for debate {debate_id}: {e}")
 
@@ -748,99 +936,9 @@ async def stream_debate(
                 logger.warning(f"Audit write failed for DEBATE_ERROR: {audit_err}")
         raise
     finally:
+        if speculative is not None:
+            await speculative.discard()
         _clear_pause_event(debate_id)
-        freshness_monitor_task.cancel()
-        if forex_price_task:
-            forex_price_task.cancel()
-        try:
-            await freshness_monitor_task
-        except asyncio.CancelledError:
-            pass
-        if forex_price_task:
-            try:
-                await forex_price_task
-            except asyncio.CancelledError:
-                pass
-
-
-async def _monitor_freshness(
-    debate_id: str,
-    asset: str,
-    manager: DebateConnectionManager,
-    guardian: StaleDataGuardian,
-    stale_event: asyncio.Event | None = None,
-) -> None:
-    try:
-        while True:
-            freshness = await guardian.get_freshness_status(asset)
-            if freshness.is_stale:
-                logger.warning(
-                    f"Data stale detected for {asset} in debate {debate_id}: "
-                    f"{freshness.age_seconds}s old"
-                )
-                await send_data_stale(manager, debate_id, freshness)
-                if stale_event is not None:
-                    stale_event.set()
-                break
-            await asyncio.sleep(FRESHNESS_CHECK_INTERVAL)
-    except asyncio.CancelledError:
-        pass
-    except Exception as e:
-        logger.error(f"Freshness monitor error for debate {debate_id}: {e}")
-
-
-async def _poll_forex_price(
-    debate_id: str,
-    asset: str,
-    manager: DebateConnectionManager,
-    stop_event: asyncio.Event,
-) -> None:
-    from app.services.market.twelvedata_provider import (
-        TwelveDataForexProvider,
-    )
-    from app.config import settings
-
-    if not settings.TWELVEDATA_API_KEY:
-        return
-
-    provider = TwelveDataForexProvider(
-        api_key=settings.TWELVEDATA_API_KEY,
-        base_url=settings.TWELVEDATA_BASE_URL,
-    )
-    last_price: float | None = None
-
-    try:
-        while not stop_event.is_set():
-            try:
-                result = await provider.fetch_price(asset)
-                if result and result.get("price"):
-                    current_price = result["price"]
-                    change_pct = None
-                    if last_price is not None and last_price > 0:
-                        change_pct = round(
-                            ((current_price - last_price) / last_price) * 100, 4
-                        )
-                    await send_forex_price_update(
-                        manager,
-                        debate_id,
-                        asset=asset,
-                        price=current_price,
-                        previous_price=last_price,
-                        change_pct=change_pct,
-                    )
-                    last_price = current_price
-            except Exception as e:
-                logger.debug(f"Forex price poll error for {asset}: {e}")
-
-            try:
-                await asyncio.wait_for(
-                    stop_event.wait(), timeout=FOREX_PRICE_POLL_INTERVAL
-                )
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-    except asyncio.CancelledError:
-        pass
-    finally:
-        await provider.close()
+        await watcher.unsubscribe(subscription)
+        if private_watcher:
+            await watcher.close()
@@ -0,0 +1,211 @@
+import logging
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Protocol, runtime_checkable
+
+from app.config import settings
+from app.services.debate.frames import ActionFrame, encode_json, with_seq
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REPLAY_ACTION_TYPE = "DEBATE/REPLAY"
+# Per-connection greetings and keep-alives are meaningless to replay.
+UNLOGGED_ACTION_TYPES = frozenset({"DEBATE/CONNECTED", "DEBATE/PING"})
+EVENT_LOG_TTL = 3600
+_MAX_IN_MEMORY_DEBATES = 256
+
+# INCR the debate's sequence counter and append the frame under that id in one
+# atomic step, so concurrent publishers (e.g. vote updates from another
+# worker) can never write out of order.
+_APPEND_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[1], seq .. '-0', 'f', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+return seq
+"""
+# The append above, then PUBLISH the frame with its ``seq`` spliced in the way
+# ``with_seq`` does, so a logged broadcast over the Redis backplane costs one
+# round trip instead of EVAL followed by PUBLISH.
+_APPEND_AND_PUBLISH_SCRIPT = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[1], seq .. '-0', 'f', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('PUBLISH', ARGV[4], '{"seq":' .. seq .. ',' .. string.sub(ARGV[2], 2))
+return seq
+"""
+
+
+def build_replay_frame(
+    debate_id: str,
+    since: int,
+    last_seq: int,
+    truncated: bool,
+    events: list[str],
+) -> ActionFrame:
+    """Assemble a DEBATE/REPLAY frame around already-encoded event texts.
+
+    The events are spliced in as raw JSON, so replaying hundreds of frames
+    costs one string join rather than a decode/encode round trip each.
+    """
+    payload = {
+        "debateId": debate_id,
+        "fromSeq": since,
+        "lastSeq": last_seq,
+        "truncated": truncated,
+    }
+    payload_text = encode_json(payload)
+    text = (
+        f'{{"type":"{REPLAY_ACTION_TYPE}","payload":{payload_text[:-1]},'
+        f'"events":[{",".join(events)}]}},'
+        f'"timestamp":{encode_json(datetime.now(timezone.utc).isoformat())}}}'
+    )
+    return ActionFrame.encoded({"type": REPLAY_ACTION_TYPE, "payload": payload}, text)
+
+
+@runtime_checkable
+class DebateEventLog(Protocol):
+    """Capped, sequence-numbered history of the frames broadcast for a debate.
+
+    A log with ``publishes`` set also publishes the stamped frame to the
+    Redis ``channel`` passed to ``append`` when the append succeeds.
+    """
+
+    publishes: bool
+
+    async def append(
+        self, debate_id: str, frame: ActionFrame, channel: str | None = None
+    ) -> int | None:
+        ...
+
+    async def replay(self, debate_id: str, since: int) -> ActionFrame | None:
+        ...
+
+
+class InMemoryEventLog:
+    """Process-local event log; only sees broadcasts made by this worker."""
+
+    publishes = False
+
+    def __init__(
+        self,
+        maxlen: int | None = None,
+        max_debates: int = _MAX_IN_MEMORY_DEBATES,
+    ) -> None:
+        self.maxlen = maxlen or settings.WS_EVENT_LOG_MAXLEN
+        self.max_debates = max_debates
+        self._logs: OrderedDict[str, deque[tuple[int, ActionFrame]]] = OrderedDict()
+        self._last_seq: dict[str, int] = {}
+
+    async def append(
+        self, debate_id: str, frame: ActionFrame, channel: str | None = None
+    ) -> int | None:
+        log = self._logs.get(debate_id)
+        if log is None:
+            log = self._logs[debate_id] = deque(maxlen=self.maxlen)
+            while len(self._logs) > self.max_debates:
+                evicted, _ = self._logs.popitem(last=False)
+                self._last_seq.pop(evicted, None)
+        else:
+            self._logs.move_to_end(debate_id)
+        seq = self._last_seq.get(debate_id, 0) + 1
+        self._last_seq[debate_id] = seq
+        frame.stamp_seq(seq)
+        log.append((seq, frame))
+        return seq
+
+    async def replay(self, debate_id: str, since: int) -> ActionFrame | None:
+        log = self._logs.get(debate_id)
+        if log is None:
+            return None
+        last_seq = self._last_seq[debate_id]
+        events = [frame.text for seq, frame in log if seq > since]
+        # A client ahead of the log saw a previous incarnation of it (restart
+        # or expiry), so its history cannot be stitched together either.
+        truncated = since > last_seq or (bool(log) and log[0][0] > since + 1)
+        return build_replay_frame(debate_id, since, last_seq, truncated, events)
+
+
+class RedisEventLog:
+    """Event log backed by a capped Redis Stream per debate.
+
+    Entry ids are ``<seq>-0``, so replay is a single XRANGE from ``since + 1``
+    and any worker can serve a reconnect regardless of who ran the debate.
+    Redis failures are logged and the frame is broadcast without a ``seq``.
+    """
+
+    publishes = True
+
+    def __init__(self, redis: Any = None, maxlen: int | None = None) -> None:
+        self._redis = redis
+        self._script: Any = None
+        self._publish_script: Any = None
+        self.maxlen = maxlen or settings.WS_EVENT_LOG_MAXLEN
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    @staticmethod
+    def _keys(debate_id: str) -> tuple[str, str]:
+        return f"debate_log_seq:{debate_id}", f"debate_log:{debate_id}"
+
+    async def append(
+        self, debate_id: str, frame: ActionFrame, channel: str | None = None
+    ) -> int | None:
+        args = [self.maxlen, frame.text, EVENT_LOG_TTL]
+        try:
+            redis = await self._get_redis()
+            if channel is None:
+                if self._script is None:
+                    self._script = redis.register_script(_APPEND_SCRIPT)
+                script = self._script
+            else:
+                if self._publish_script is None:
+                    self._publish_script = redis.register_script(
+                        _APPEND_AND_PUBLISH_SCRIPT
+                    )
+                script = self._publish_script
+                args.append(channel)
+            seq = int(await script(keys=list(self._keys(debate_id)), args=args))
+        except Exception as e:
+            logger.warning(f"Event log append failed for debate {debate_id}: {e}")
+            return None
+        frame.stamp_seq(seq)
+        return seq
+
+    async def replay(self, debate_id: str, since: int) -> ActionFrame | None:
+        seq_key, stream_key = self._keys(debate_id)
+        try:
+            redis = await self._get_redis()
+            last_seq = await redis.get(seq_key)
+            if last_seq is None:
+                return None
+            # Stop at ``last_seq``: later frames are still live for the caller.
+            entries = await redis.xrange(
+                stream_key, min=f"{since + 1}-0", max=f"{int(last_seq)}-0"
+            )
+        except Exception as e:
+            logger.warning(f"Event log replay failed for debate {debate_id}: {e}")
+            return None
+        events = []
+        for entry_id, fields in entries:
+            seq = int(str(entry_id).split("-", 1)[0])
+            events.append(with_seq(fields["f"], seq))
+        last_seq = int(last_seq)
+        if entries:
+            truncated = int(str(entries[0][0]).split("-", 1)[0]) > since + 1
+        else:
+            # Nothing retained past ``since``: fine only if nothing was missed.
+            truncated = last_seq != since
+        return build_replay_frame(debate_id, since, last_seq, truncated, events)
+
+
+def create_event_log() -> DebateEventLog:
+    """Build the event log selected by ``settings.WS_EVENT_LOG``."""
+    if settings.WS_EVENT_LOG == "redis":
+        return RedisEventLog()
+    return InMemoryEventLog()
@@ -17,3 +17,11 @@ class LLMProviderError(Exception):
     """Raised when LLM provider fails (NFR-07 failover exhausted)."""
 
     pass
+
+
+class DebateQueueFullError(Exception):
+    """Raised when the debate scheduler cannot accept another debate."""
+
+    def __init__(self, message: str = "", retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,131 @@
+import json
+from datetime import date, datetime, timezone
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from app.services.debate.ws_schemas import WebSocketActionType
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langsmith
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(data: Any) -> str:
+    """Encode ``data`` as compact JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default).decode()
+    return json.dumps(data, default=_json_default, separators=(",", ":"))
+
+
+def decode_json(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class ActionFrame(dict):
+    """A WebSocket action that is encoded to JSON text at most once.
+
+    Behaves like the plain action dict (so callers and tests can still read
+    ``frame["type"]``) but caches its encoded text, letting a broadcast hand
+    the same string to every connection instead of re-encoding per viewer.
+    Encodings for other wire protocols are cached alongside it via
+    ``encode_cached``. Frames must not be mutated after being encoded.
+    """
+
+    __slots__ = ("_text", "_partial", "_encodings")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._text: str | None = None
+        self._partial = False
+        self._encodings: dict[str, bytes] | None = None
+
+    @classmethod
+    def from_text(cls, text: str | bytes) -> "ActionFrame":
+        """Rebuild a frame received already encoded, keeping its original text."""
+        if isinstance(text, bytes):
+            text = text.decode()
+        frame = cls(decode_json(text))
+        frame._text = text
+        return frame
+
+    @property
+    def text(self) -> str:
+        return self.encode()
+
+    def encode(self) -> str:
+        """Encode the frame now, if not already, and return the cached text."""
+        if self._text is None:
+            self._text = encode_json(self)
+        return self._text
+
+    @classmethod
+    def encoded(cls, data: dict[str, Any], text: str) -> "ActionFrame":
+        """Frame whose wire text was assembled by hand; ``data`` is its summary."""
+        frame = cls(data)
+        frame._text = text
+        frame._partial = True
+        return frame
+
+    def to_dict(self) -> dict[str, Any]:
+        """The complete action, decoding the text for hand-assembled frames."""
+        return decode_json(self.text) if self._partial else self
+
+    def encode_cached(
+        self, codec: str, encoder: Callable[["ActionFrame"], bytes]
+    ) -> bytes:
+        """Encode for ``codec`` once and reuse the result for every socket."""
+        if self._encodings is None:
+            self._encodings = {}
+        data = self._encodings.get(codec)
+        if data is None:
+            data = self._encodings[codec] = encoder(self)
+        return data
+
+    def stamp_seq(self, seq: int) -> None:
+        """Attach an event-log sequence number without re-encoding the frame."""
+        self["seq"] = seq
+        if self._text is not None:
+            self._text = with_seq(self._text, seq)
+        self._encodings = None
+
+
+def with_seq(text: str, seq: int) -> str:
+    """Prefix an encoded action object with its ``seq`` field."""
+    return f'{{"seq":{seq},{text[1:]}'
+
+
+def as_frame(action: dict[str, Any]) -> ActionFrame:
+    """Wrap a plain action dict, leaving existing frames untouched."""
+    if isinstance(action, ActionFrame):
+        return action
+    return ActionFrame(action)
+
+
+def build_frame(
+    action_type: WebSocketActionType,
+    payload: BaseModel | dict[str, Any] | None = None,
+) -> ActionFrame:
+    """Build a frame with the same shape as ``WebSocketAction.model_dump(by_alias=True)``.
+
+    Pydantic payload models are dumped exactly once; the action envelope is
+    assembled directly rather than validated and dumped a second time.
+    """
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(by_alias=True)
+    return ActionFrame(
+        type=action_type,
+        payload=payload or {},
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
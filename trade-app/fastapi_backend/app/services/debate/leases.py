@@ -0,0 +1,188 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import Any, Callable
+
+from app.config import settings
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY_PREFIX = "debate_lease:"
+# debate_id -> JSON run metadata for every debate some worker still owes.
+INFLIGHT_KEY = "debate_leases:inflight"
+
+# Extend / drop a lease only while this worker still holds it, so a worker
+# that stalled past its TTL cannot clobber the lease of whoever took over.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class DebateLeaseManager:
+    """Redis leases marking which worker is running which debate.
+
+    A running debate holds ``debate_lease:<id>`` (value: worker id) with a
+    TTL that a background task keeps renewing, and has an entry in the
+    ``debate_leases:inflight`` hash until it finishes. A debate that is in
+    flight but whose lease key has expired lost its worker and may be
+    ``claim``-ed by another one. ``handoff`` drops the lease but keeps the
+    in-flight entry so a peer picks the debate up without waiting for the TTL.
+    ``on_lost`` is called with the debate id when a renewal finds the lease
+    gone, so the stalled run can be stopped instead of racing its successor.
+    """
+
+    def __init__(
+        self,
+        redis: Any = None,
+        worker_id: str | None = None,
+        ttl_seconds: float | None = None,
+        renew_interval: float | None = None,
+        on_lost: Callable[[str], None] | None = None,
+    ) -> None:
+        self._redis = redis
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.ttl_seconds = ttl_seconds or settings.DEBATE_LEASE_TTL_SECONDS
+        self.renew_interval = renew_interval or settings.DEBATE_LEASE_RENEW_SECONDS
+        self._on_lost = on_lost
+        self._held: set[str] = set()
+        self._renew_script: Any = None
+        self._release_script: Any = None
+        self._renew_task: asyncio.Task | None = None
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        if self._renew_script is None:
+            self._renew_script = self._redis.register_script(_RENEW_SCRIPT)
+            self._release_script = self._redis.register_script(_RELEASE_SCRIPT)
+        return self._redis
+
+    @staticmethod
+    def _key(debate_id: str) -> str:
+        return f"{LEASE_KEY_PREFIX}{debate_id}"
+
+    async def acquire(self, debate_id: str, meta: dict[str, Any]) -> bool:
+        """Take the lease for a new debate and record it as in flight."""
+        try:
+            redis = await self._get_redis()
+            await redis.hset(INFLIGHT_KEY, debate_id, json.dumps(meta))
+        except Exception as e:
+            logger.warning(f"Debate lease registration failed for {debate_id}: {e}")
+            return False
+        return await self.claim(debate_id)
+
+    async def claim(self, debate_id: str) -> bool:
+        """Take the lease if nobody holds it; True when this worker now owns it."""
+        try:
+            redis = await self._get_redis()
+            acquired = await redis.set(
+                self._key(debate_id),
+                self.worker_id,
+                nx=True,
+                px=int(self.ttl_seconds * 1000),
+            )
+        except Exception as e:
+            logger.warning(f"Debate lease claim failed for {debate_id}: {e}")
+            return False
+        if not acquired:
+            return False
+        self._held.add(debate_id)
+        self._ensure_renewal()
+        return True
+
+    async def release(self, debate_id: str) -> None:
+        """The debate is finished (either way): forget it entirely."""
+        self._held.discard(debate_id)
+        try:
+            redis = await self._get_redis()
+            await self._release_script(
+                keys=[self._key(debate_id)], args=[self.worker_id]
+            )
+            await redis.hdel(INFLIGHT_KEY, debate_id)
+        except Exception as e:
+            logger.warning(f"Debate lease release failed for {debate_id}: {e}")
+
+    async def handoff(self, debate_id: str) -> None:
+        """Give the debate up for another worker to resume straight away."""
+        self._held.discard(debate_id)
+        try:
+            await self._get_redis()
+            await self._release_script(
+                keys=[self._key(debate_id)], args=[self.worker_id]
+            )
+        except Exception as e:
+            logger.warning(f"Debate lease handoff failed for {debate_id}: {e}")
+
+    async def orphaned(self) -> dict[str, dict[str, Any]]:
+        """In-flight debates whose lease has expired or been handed off."""
+        try:
+            redis = await self._get_redis()
+            inflight = await redis.hgetall(INFLIGHT_KEY)
+            orphans: dict[str, dict[str, Any]] = {}
+            for debate_id, meta in inflight.items():
+                if debate_id in self._held:
+                    continue
+                if await redis.exists(self._key(debate_id)):
+                    continue
+                try:
+                    orphans[debate_id] = json.loads(meta)
+                except (TypeError, ValueError):
+                    orphans[debate_id] = {}
+            return orphans
+        except Exception as e:
+            logger.warning(f"Debate lease scan failed: {e}")
+            return {}
+
+    async def renew(self) -> None:
+        """Extend every lease this worker holds; drop the ones it lost."""
+        if not self._held:
+            return
+        ttl_ms = int(self.ttl_seconds * 1000)
+        try:
+            await self._get_redis()
+            for debate_id in list(self._held):
+                renewed = await self._renew_script(
+                    keys=[self._key(debate_id)], args=[self.worker_id, ttl_ms]
+                )
+                if not renewed:
+                    logger.warning(
+                        f"Debate lease for {debate_id} was lost by {self.worker_id}"
+                    )
+                    self._held.discard(debate_id)
+                    if self._on_lost is not None:
+                        self._on_lost(debate_id)
+        except Exception as e:
+            logger.warning(f"Debate lease renewal failed: {e}")
+
+    def owns(self, debate_id: str) -> bool:
+        return debate_id in self._held
+
+    def _ensure_renewal(self) -> None:
+        if self._renew_task is None or self._renew_task.done():
+            self._renew_task = asyncio.ensure_future(self._renew_loop())
+
+    async def _renew_loop(self) -> None:
+        while self._held:
+            await asyncio.sleep(self.renew_interval)
+            await self.renew()
+
+    async def close(self) -> None:
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            try:
+                await self._renew_task
+            except asyncio.CancelledError:
+                pass
+            self._renew_task = None
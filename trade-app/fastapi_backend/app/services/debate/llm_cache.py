@@ -0,0 +1,124 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+
+from langchain_core.messages import BaseMessage
+from redis import asyncio as aioredis
+
+from app.config import settings
+from app.services.metrics import LLM_CACHE_EVICTIONS, LLM_CACHE_REQUESTS
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "llm_cache"
+# Sorted set of cached keys scored by write time; drives size-bounded eviction.
+INDEX_KEY = f"{KEY_PREFIX}:index"
+
+# Call sites whose output is a function of their inputs closely enough to
+# reuse: the Guardian (low temperature, structured output) and the
+# post-debate trading analysis. Bull/Bear turns are deliberately absent, a
+# replayed or resumed debate should argue afresh.
+CACHEABLE_SITES = frozenset({"guardian", "trading_analyst"})
+
+
+def llm_cache_key(
+    model: str,
+    temperature: float,
+    messages: list[BaseMessage],
+    schema: dict[str, Any] | None = None,
+) -> str:
+    """Content address of one call: model, temperature, rendered prompt, schema."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "messages": [[message.type, message.content] for message in messages],
+            "schema": schema,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Redis cache of parsed LLM results for one call site.
+
+    Entries expire after ``ttl_seconds``; beyond ``max_entries`` the oldest
+    writes are evicted. Redis errors count as misses, so a cache outage only
+    costs the LLM call it would have saved.
+    """
+
+    def __init__(
+        self,
+        site: str,
+        redis: aioredis.Redis | None = None,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+    ):
+        self.site = site
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or settings.llm_cache_ttl_seconds
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+
+    async def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        return self._redis
+
+    @staticmethod
+    def _entry_key(key: str) -> str:
+        return f"{KEY_PREFIX}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            redis = await self._get_redis()
+            data = await redis.get(self._entry_key(key))
+        except Exception as e:
+            logger.warning(f"LLM cache read failed for {self.site}: {e}")
+            LLM_CACHE_REQUESTS.inc(self.site, "error")
+            return None
+        LLM_CACHE_REQUESTS.inc(self.site, "hit" if data is not None else "miss")
+        return json.loads(data) if data is not None else None
+
+    async def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        try:
+            redis = await self._get_redis()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.set(self._entry_key(key), json.dumps(value), ex=self.ttl_seconds)
+                pipe.zadd(INDEX_KEY, {key: now})
+                pipe.zremrangebyscore(INDEX_KEY, "-inf", now - self.ttl_seconds)
+                pipe.zcard(INDEX_KEY)
+                *_, size = await pipe.execute()
+            if size > self.max_entries:
+                await self._evict(redis, size - self.max_entries)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed for {self.site}: {e}")
+
+    async def _evict(self, redis: aioredis.Redis, count: int) -> None:
+        oldest = await redis.zrange(INDEX_KEY, 0, count - 1)
+        if not oldest:
+            return
+        await redis.delete(*(self._entry_key(key) for key in oldest))
+        await redis.zrem(INDEX_KEY, *oldest)
+        LLM_CACHE_EVICTIONS.inc(self.site, amount=len(oldest))
+
+
+_caches: dict[str, LLMResponseCache] = {}
+
+
+def get_llm_cache(site: str) -> LLMResponseCache | None:
+    """The cache for ``site`` if it is enabled in ``llm_cache_sites``, else None."""
+    if site not in CACHEABLE_SITES:
+        raise ValueError(f"LLM call site {site!r} is not cacheable")
+    enabled = {s.strip() for s in settings.llm_cache_sites.split(",") if s.strip()}
+    if site not in enabled:
+        return None
+    cache = _caches.get(site)
+    if cache is None:
+        cache = _caches[site] = LLMResponseCache(site)
+    return cache
@@ -0,0 +1,358 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import (
+    BaseChatModel,
+    agenerate_from_stream,
+)
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from app.services.metrics import LLM_FAILOVERS, LLM_HEDGES, LLM_PROVIDER_HEALTH
+
+logger = logging.getLogger(__name__)
+
+TTFT_WINDOW = 100
+MIN_TTFT_SAMPLES = 10
+HEALTH_DECAY = 0.8
+HEALTHY_SCORE = 0.5
+DEMOTION_SECONDS = 30.0
+
+
+class ProviderHealth:
+    """Rolling health of one provider in the chain.
+
+    ``score`` is an exponentially weighted success rate (1.0 = every recent
+    call succeeded). Dropping below ``HEALTHY_SCORE`` demotes the provider to
+    the back of the chain for ``DEMOTION_SECONDS``, after which it gets the
+    primary slot again as a probe. ``ttft`` keeps the last ``TTFT_WINDOW``
+    times to first token, whose p95 is the hedge delay.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.score = 1.0
+        self.ttft: deque[float] = deque(maxlen=TTFT_WINDOW)
+        self.demoted_until = 0.0
+        self.successes = 0
+        self.failures = 0
+
+    def healthy(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.monotonic()) >= self.demoted_until
+
+    def record_first_token(self, seconds: float) -> None:
+        self.ttft.append(seconds)
+
+    def record_success(self) -> None:
+        self.successes += 1
+        self.score = HEALTH_DECAY * self.score + (1 - HEALTH_DECAY)
+        if self.score >= HEALTHY_SCORE:
+            self.demoted_until = 0.0
+        LLM_PROVIDER_HEALTH.set(self.score, self.name)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.score = HEALTH_DECAY * self.score
+        if self.score < HEALTHY_SCORE:
+            self.demoted_until = time.monotonic() + DEMOTION_SECONDS
+        LLM_PROVIDER_HEALTH.set(self.score, self.name)
+
+    def p95_ttft(self) -> float | None:
+        if len(self.ttft) < MIN_TTFT_SAMPLES:
+            return None
+        ordered = sorted(self.ttft)
+        return ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+
+    def to_dict(self) -> dict[str, Any]:
+        p95 = self.p95_ttft()
+        return {
+            "score": round(self.score, 3),
+            "healthy": self.healthy(),
+            "successes": self.successes,
+            "failures": self.failures,
+            "p95TtftMs": round(p95 * 1000, 1) if p95 is not None else None,
+        }
+
+
+_health: dict[str, ProviderHealth] = {}
+
+
+def provider_health(name: str) -> ProviderHealth:
+    health = _health.get(name)
+    if health is None:
+        health = _health[name] = ProviderHealth(name)
+    return health
+
+
+def get_provider_stats() -> dict[str, dict[str, Any]]:
+    return {name: health.to_dict() for name, health in _health.items()}
+
+
+def reset_provider_health() -> None:
+    _health.clear()
+
+
+async def _first_chunk(stream: AsyncIterator[Any]) -> Any | None:
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+@dataclass
+class _Attempt:
+    name: str
+    stream: AsyncIterator[Any] = field(repr=False)
+    started: float
+    first: asyncio.Task = field(repr=False)
+
+    async def cancel(self) -> None:
+        self.first.cancel()
+        await asyncio.gather(self.first, return_exceptions=True)
+        aclose = getattr(self.stream, "aclose", None)
+        if aclose is not None:
+            try:
+                await aclose()
+            except Exception:
+                pass
+
+
+class HedgedChatModel(BaseChatModel):
+    """Ordered chain of chat models with failover and hedged requests.
+
+    Healthy providers are tried in configured order, demoted ones last. A
+    provider that errors before its first token fails over to the next one.
+    When the primary has produced no token within its rolling p95
+    time-to-first-token (``initial_hedge_delay`` until it has enough samples),
+    the next provider is started as well; whichever streams first wins and
+    the other is cancelled. Nothing is emitted before a winner is picked, so
+    callbacks only ever see one provider's tokens. Errors after the first
+    token propagate, since tokens may already have reached viewers.
+
+    ``providers`` are ``(name, runnable)`` pairs; anything with ``astream``
+    over messages works, including the result of ``bind_tools``.
+    """
+
+    providers: list[tuple[str, Any]]
+    streaming: bool = False
+    hedging: bool = True
+    initial_hedge_delay: float = 2.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged-chain"
+
+    @property
+    def _identifying_params(self) -> dict[str, Any]:
+        return {"providers": [name for name, _ in self.providers]}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "HedgedChatModel":
+        return self.model_copy(
+            update={
+                "providers": [
+                    (name, llm.bind_tools(tools, **kwargs))
+                    for name, llm in self.providers
+                ]
+            }
+        )
+
+    def _should_stream(self, *, async_api: bool, **kwargs: Any) -> bool:
+        return self.streaming or super()._should_stream(async_api=async_api, **kwargs)
+
+    def _ordered(self) -> list[tuple[str, Any]]:
+        now = time.monotonic()
+        return sorted(
+            self.providers, key=lambda entry: not provider_health(entry[0]).healthy(now)
+        )
+
+    def _hedge_delay(self, name: str) -> float:
+        p95 = provider_health(name).p95_ttft()
+        return p95 if p95 is not None else self.initial_hedge_delay
+
+    @staticmethod
+    def _launch(
+        name: str, llm: Any, messages: list[BaseMessage], stop: Any, kwargs: dict
+    ) -> _Attempt:
+        # An empty callback list, not None: ensure_config drops None values
+        # and would hand the child the caller's handlers from the runnable
+        # context, so every token (and a hedged loser's) would reach them.
+        stream = llm.astream(
+            messages, config={"callbacks": []}, stop=stop, **kwargs
+        ).__aiter__()
+        return _Attempt(
+            name=name,
+            stream=stream,
+            started=time.monotonic(),
+            first=asyncio.ensure_future(_first_chunk(stream)),
+        )
+
+    async def _race(
+        self, messages: list[BaseMessage], stop: Any, kwargs: dict
+    ) -> tuple[_Attempt, Any | None]:
+        """Start providers until one yields a first chunk; cancel the rest."""
+        remaining = self._ordered()
+        primary = remaining.pop(0)
+        attempts = [self._launch(*primary, messages, stop, kwargs)]
+        hedged = False
+        hedge_at = None
+        if self.hedging and remaining:
+            hedge_at = time.monotonic() + self._hedge_delay(primary[0])
+        last_error: BaseException | None = None
+        try:
+            while True:
+                if not attempts:
+                    if not remaining:
+                        assert last_error is not None
+                        raise last_error
+                    name, llm = remaining.pop(0)
+                    LLM_FAILOVERS.inc(name)
+                    attempts.append(self._launch(name, llm, messages, stop, kwargs))
+                    continue
+                timeout = None
+                if hedge_at is not None and remaining:
+                    timeout = max(0.0, hedge_at - time.monotonic())
+                done, _ = await asyncio.wait(
+                    [attempt.first for attempt in attempts],
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    hedge_at = None
+                    hedged = True
+                    name, llm = remaining.pop(0)
+                    LLM_HEDGES.inc("fired")
+                    logger.info(
+                        f"Hedging LLM call: {attempts[0].name} slow, starting {name}"
+                    )
+                    attempts.append(self._launch(name, llm, messages, stop, kwargs))
+                    continue
+                for attempt in [a for a in attempts if a.first in done]:
+                    attempts.remove(attempt)
+                    error = attempt.first.exception()
+                    if error is None:
+                        health = provider_health(attempt.name)
+                        health.record_first_token(time.monotonic() - attempt.started)
+                        if hedged:
+                            LLM_HEDGES.inc(
+                                "primary_won"
+                                if attempt.name == primary[0]
+                                else "backup_won"
+                            )
+                        return attempt, attempt.first.result()
+                    provider_health(attempt.name).record_failure()
+                    logger.warning(f"LLM provider {attempt.name} failed: {error}")
+                    last_error = error
+        finally:
+            for attempt in attempts:
+                await attempt.cancel()
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        winner, chunk = await self._race(messages, stop, kwargs)
+        health = provider_health(winner.name)
+        try:
+            while chunk is not None:
+                yield ChatGenerationChunk(message=chunk)
+                chunk = await _first_chunk(winner.stream)
+        except Exception:
+            health.record_failure()
+            raise
+        else:
+            health.record_success()
+        finally:
+            await winner.cancel()
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(
+            self._astream(messages, stop=stop, run_manager=run_manager, **kwargs)
+        )
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("HedgedChatModel is async-only")
+
+
+class FakeChatModel(BaseChatModel):
+    """In-process chat model for running the chain offline.
+
+    Streams ``responses`` (cycled per call) word by word after
+    ``first_token_delay``, with ``token_delay`` between words, and reports
+    word counts as token usage. ``error`` makes every call fail before its
+    first token. Tools are accepted and ignored.
+    """
+
+    responses: list[str] = ["This is a canned response from the fake LLM provider."]
+    first_token_delay: float = 0.0
+    token_delay: float = 0.0
+    error: str | None = None
+    streaming: bool = False
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "FakeChatModel":
+        return self
+
+    def _should_stream(self, *, async_api: bool, **kwargs: Any) -> bool:
+        return self.streaming or super()._should_stream(async_api=async_api, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        await asyncio.sleep(self.first_token_delay)
+        if self.error:
+            raise RuntimeError(self.error)
+        words = text.split(" ")
+        prompt_tokens = sum(len(str(m.content).split()) for m in messages)
+        for index, word in enumerate(words):
+            if index:
+                await asyncio.sleep(self.token_delay)
+            last = index == len(words) - 1
+            chunk = AIMessageChunk(
+                content=word if last else word + " ",
+                usage_metadata=(
+                    {
+                        "input_tokens": prompt_tokens,
+                        "output_tokens": len(words),
+                        "total_tokens": prompt_tokens + len(words),
+                    }
+                    if last
+                    else None
+                ),
+            )
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop=stop, **kwargs))
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("FakeChatModel is async-only")
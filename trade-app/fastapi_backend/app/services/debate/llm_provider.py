@@ -1,5 +1,10 @@
+import asyncio
+import itertools
 import logging
-from typing import Any
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
 
 from langchain_core.callbacks import AsyncCallbackHandler
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -7,9 +12,29 @@ from pydantic import SecretStr
 
 from app.config import settings
 from app.services.debate.exceptions import LLMProviderError
+from app.services.debate.llm_chain import FakeChatModel, HedgedChatModel
+from app.services.debate.llm_replay import (
+    RecordingChatModel,
+    ReplayChatModel,
+    load_tape,
+    synthetic_text,
+)
+from app.services.metrics import (
+    LLM_CALL_LATENCY,
+    LLM_CALLS_INFLIGHT,
+    LLM_CALLS_QUEUED,
+    LLM_QUEUE_SECONDS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Process-wide clients keyed by (model, temperature, streaming). Each client
+# keeps its HTTP transport, so sharing one across turns and debates skips
+# connection setup and TLS handshakes. Per-debate callbacks (token streaming,
+# timing) go in the per-call config, never on the shared client. With several
+# providers configured the pooled entry is a HedgedChatModel over them.
+_client_pool: dict[tuple[str, float, bool], Any] = {}
+
 
 def _build_gemini(
     streaming: bool = False,
@@ -19,30 +44,398 @@ def _build_gemini(
 ) -> ChatGoogleGenerativeAI:
     return ChatGoogleGenerativeAI(
         model=model or settings.debate_llm_model,
-        temperature=temperature if temperature is not None else settings.debate_llm_temperature,
-        google_api_key=SecretStr(settings.google_api_key) if settings.google_api_key else None,
+        temperature=temperature
+        if temperature is not None
+        else settings.debate_llm_temperature,
+        google_api_key=SecretStr(settings.google_api_key)
+        if settings.google_api_key
+        else None,
         streaming=streaming,
         callbacks=callbacks,
     )
 
 
-async def get_llm_with_failover(
+def llm_call_config(
     streaming_handler: AsyncCallbackHandler | None = None,
-    model: str | None = None,
-    temperature: float | None = None,
-) -> Any:
+    callbacks: list[AsyncCallbackHandler] | None = None,
+) -> dict[str, Any] | None:
+    """RunnableConfig carrying one call's callbacks for a pooled client."""
+    handlers = ([streaming_handler] if streaming_handler else []) + (callbacks or [])
+    return {"callbacks": handlers} if handlers else None
+
+
+def _gemini_provider(streaming: bool, model: str, temperature: float) -> Any:
     if not settings.google_api_key:
-        raise LLMProviderError("google_api_key is required. Set GOOGLE_API_KEY environment variable.")
-    try:
-        streaming = streaming_handler is not None
-        callbacks = [streaming_handler] if streaming_handler else None
-        llm = _build_gemini(
-            streaming=streaming,
-            callbacks=callbacks,
-            model=model,
-            temperature=temperature,
+        raise LLMProviderError(
+            "google_api_key is required. Set GOOGLE_API_KEY environment variable."
         )
-        logger.info("Using LLM provider: gemini (model=%s)", model or settings.debate_llm_model)
-        return llm
+    try:
+        return _build_gemini(streaming=streaming, model=model, temperature=temperature)
     except Exception as exc:
         raise LLMProviderError(f"Gemini provider failed: {exc}") from exc
+
+
+def _fake_provider(streaming: bool, model: str, temperature: float) -> Any:
+    return FakeChatModel(streaming=streaming)
+
+
+def _record_provider(streaming: bool, model: str, temperature: float) -> Any:
+    return RecordingChatModel(
+        inner=_gemini_provider(streaming, model, temperature),
+        path=settings.llm_record_path,
+        model_name=model,
+        temperature=temperature,
+        streaming=streaming,
+    )
+
+
+def _replay_provider(streaming: bool, model: str, temperature: float) -> Any:
+    load_tape(settings.llm_record_path)
+    return ReplayChatModel(
+        path=settings.llm_record_path,
+        model_name=model,
+        temperature=temperature,
+        streaming=streaming,
+        speedup=settings.llm_replay_speedup,
+    )
+
+
+def _synthetic_provider(streaming: bool, model: str, temperature: float) -> Any:
+    rate = settings.llm_synthetic_tokens_per_second
+    return FakeChatModel(
+        responses=[synthetic_text(settings.llm_synthetic_tokens)],
+        first_token_delay=settings.llm_synthetic_first_token_seconds,
+        token_delay=1 / rate if rate > 0 else 0.0,
+        streaming=streaming,
+    )
+
+
+# Provider name (as used in settings.llm_providers) -> builder taking
+# (streaming, model, temperature). Builders raise LLMProviderError when the
+# provider cannot be used in this environment (e.g. a missing API key).
+_PROVIDERS: dict[str, Callable[[bool, str, float], Any]] = {
+    "gemini": _gemini_provider,
+    "fake": _fake_provider,
+    "record": _record_provider,
+    "replay": _replay_provider,
+    "synthetic": _synthetic_provider,
+}
+
+
+def register_llm_provider(
+    name: str, builder: Callable[[bool, str, float], Any]
+) -> None:
+    _PROVIDERS[name] = builder
+
+
+def _build_chain(streaming: bool, model: str, temperature: float) -> Any:
+    built: list[tuple[str, Any]] = []
+    errors: list[str] = []
+    for name, pinned in settings.llm_provider_chain or [("gemini", None)]:
+        builder = _PROVIDERS.get(name)
+        if builder is None:
+            errors.append(f"Unknown LLM provider {name!r}")
+            continue
+        try:
+            llm = builder(streaming, pinned or model, temperature)
+        except LLMProviderError as exc:
+            errors.append(str(exc))
+            continue
+        built.append((f"{name}:{pinned or model}", llm))
+    if not built:
+        raise LLMProviderError("; ".join(errors))
+    for error in errors:
+        logger.warning(f"LLM provider skipped: {error}")
+    if len(built) == 1:
+        return built[0][1]
+    return HedgedChatModel(
+        providers=built,
+        streaming=streaming,
+        hedging=settings.llm_hedging_enabled,
+        initial_hedge_delay=settings.llm_hedge_initial_delay_seconds,
+    )
+
+
+async def get_llm_with_failover(
+    streaming: bool = False,
+    model: str | None = None,
+    temperature: float | None = None,
+) -> Any:
+    """Pooled chat model over the configured provider chain.
+
+    A single usable provider is returned as-is; several are wrapped in a
+    ``HedgedChatModel`` that fails over and hedges between them. Providers
+    that cannot be built (no API key) are skipped; if none remain this raises
+    ``LLMProviderError``.
+    """
+    model = model or settings.debate_llm_model
+    temperature = (
+        temperature if temperature is not None else settings.debate_llm_temperature
+    )
+    key = (model, temperature, streaming)
+    llm = _client_pool.get(key)
+    if llm is not None:
+        return llm
+    llm = _build_chain(streaming, model, temperature)
+    _client_pool[key] = llm
+    logger.info(
+        "Pooled LLM client: %s (model=%s, temperature=%s, streaming=%s)",
+        settings.llm_providers,
+        model,
+        temperature,
+        streaming,
+    )
+    return llm
+
+
+def clear_llm_pool() -> None:
+    """Drop pooled clients, e.g. after the API key or model settings change."""
+    _client_pool.clear()
+
+
+# Governor priority classes, most urgent first: Guardian analysis (it can
+# interrupt a live debate), then Bull/Bear turns, then the post-debate
+# trading analysis.
+PRIORITY_GUARDIAN = 0
+PRIORITY_AGENT = 1
+PRIORITY_ANALYSIS = 2
+PRIORITY_NAMES = {
+    PRIORITY_GUARDIAN: "guardian",
+    PRIORITY_AGENT: "agent",
+    PRIORITY_ANALYSIS: "analysis",
+}
+CHARS_PER_TOKEN = 4
+
+
+class _TokenBucket:
+    """Per-minute budget that refills continuously."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` fits (oversized amounts wait for a full bucket)."""
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+@dataclass
+class _Waiter:
+    model: str
+    tokens: int
+    future: asyncio.Future = field(repr=False)
+
+
+@dataclass
+class LLMGrant:
+    """An admitted call; ``settle`` corrects the token estimate afterwards."""
+
+    governor: "LLMGovernor"
+    model: str
+    estimated_tokens: int
+
+    def settle(self, actual_tokens: int) -> None:
+        self.governor._settle(self.model, actual_tokens - self.estimated_tokens)
+
+
+class LLMGovernor:
+    """Admits LLM calls under a concurrency cap and per-model rate buckets.
+
+    Waiting calls are admitted strictly by priority class, then arrival. A
+    model whose oldest waiter does not fit its request/token buckets blocks
+    only that model's waiters (so small calls cannot starve a large one);
+    other models keep flowing. Calls wait rather than fail.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 16,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.inflight = 0
+        self._waiters: dict[tuple[int, int], _Waiter] = {}
+        self._seq = itertools.count()
+        self._buckets: dict[str, tuple[_TokenBucket | None, _TokenBucket | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def _model_buckets(
+        self, model: str
+    ) -> tuple[_TokenBucket | None, _TokenBucket | None]:
+        buckets = self._buckets.get(model)
+        if buckets is None:
+            buckets = self._buckets[model] = (
+                _TokenBucket(self.requests_per_minute)
+                if self.requests_per_minute > 0
+                else None,
+                _TokenBucket(self.tokens_per_minute)
+                if self.tokens_per_minute > 0
+                else None,
+            )
+        return buckets
+
+    def _wait_time(self, waiter: _Waiter, now: float) -> float:
+        requests, tokens = self._model_buckets(waiter.model)
+        return max(
+            requests.wait_time(1, now) if requests else 0.0,
+            tokens.wait_time(waiter.tokens, now) if tokens else 0.0,
+        )
+
+    def _admit(self, key: tuple[int, int], waiter: _Waiter) -> None:
+        del self._waiters[key]
+        requests, tokens = self._model_buckets(waiter.model)
+        if requests:
+            requests.take(1)
+        if tokens:
+            tokens.take(waiter.tokens)
+        self.inflight += 1
+        waiter.future.set_result(None)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = time.monotonic()
+        blocked: set[str] = set()
+        retry_in: float | None = None
+        for key in sorted(self._waiters):
+            if self.inflight >= self.max_concurrent:
+                break
+            waiter = self._waiters[key]
+            if waiter.model in blocked:
+                continue
+            wait = self._wait_time(waiter, now)
+            if wait > 0:
+                blocked.add(waiter.model)
+                retry_in = wait if retry_in is None else min(retry_in, wait)
+                continue
+            self._admit(key, waiter)
+        if retry_in is not None and self.inflight < self.max_concurrent:
+            self._timer = asyncio.get_running_loop().call_later(
+                retry_in, self._dispatch
+            )
+        LLM_CALLS_QUEUED.set(len(self._waiters))
+        LLM_CALLS_INFLIGHT.set(self.inflight)
+
+    def _settle(self, model: str, delta: int) -> None:
+        _, tokens = self._model_buckets(model)
+        if tokens is None or delta == 0:
+            return
+        if delta > 0:
+            tokens.level -= delta
+        else:
+            tokens.refund(-delta)
+            self._dispatch()
+
+    def _release(self) -> None:
+        self.inflight -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self, model: str, priority: int = PRIORITY_AGENT, tokens: int = 0
+    ) -> AsyncIterator[LLMGrant]:
+        """Wait for admission, hold a concurrency slot for the block."""
+        enqueued = time.monotonic()
+        key = (priority, next(self._seq))
+        waiter = _Waiter(model, tokens, asyncio.get_running_loop().create_future())
+        self._waiters[key] = waiter
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if self._waiters.pop(key, None) is None:
+                # Admitted in the same tick the caller was cancelled.
+                self._release()
+            else:
+                self._dispatch()
+            raise
+        LLM_QUEUE_SECONDS.observe(
+            time.monotonic() - enqueued, PRIORITY_NAMES.get(priority, str(priority))
+        )
+        try:
+            yield LLMGrant(self, model, tokens)
+        finally:
+            self._release()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "inflight": self.inflight,
+            "queued": self.queued,
+            "maxConcurrent": self.max_concurrent,
+            "requestsPerMinute": self.requests_per_minute,
+            "tokensPerMinute": self.tokens_per_minute,
+        }
+
+
+_governor: LLMGovernor | None = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    global _governor
+    if _governor is None:
+        _governor = LLMGovernor(
+            max_concurrent=settings.llm_max_concurrent,
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+        )
+    return _governor
+
+
+def estimate_call_tokens(prompt_chars: int, inputs: dict[str, Any]) -> int:
+    chars = prompt_chars + sum(len(str(value)) for value in inputs.values())
+    return chars // CHARS_PER_TOKEN + settings.llm_estimated_output_tokens
+
+
+def _reported_tokens(response: Any) -> int | None:
+    usage = getattr(response, "usage_metadata", None)
+    if isinstance(usage, dict) and usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+    return None
+
+
+async def governed_ainvoke(
+    chain: Any,
+    inputs: dict[str, Any],
+    *,
+    agent: str,
+    model: str,
+    priority: int,
+    prompt_chars: int = 0,
+    config: dict[str, Any] | None = None,
+) -> Any:
+    """``chain.ainvoke`` through the governor, timing only the call itself."""
+    estimate = estimate_call_tokens(prompt_chars, inputs)
+    async with get_llm_governor().slot(model, priority, estimate) as grant:
+        started = time.monotonic()
+        try:
+            response = await chain.ainvoke(inputs, config=config)
+        finally:
+            LLM_CALL_LATENCY.observe(time.monotonic() - started, agent)
+        actual = _reported_tokens(response)
+        if actual is not None:
+            grant.settle(actual)
+        return response
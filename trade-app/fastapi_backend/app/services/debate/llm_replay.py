@@ -0,0 +1,270 @@
+"""Record and replay LLM exchanges for offline runs and benchmarks.
+
+``RecordingChatModel`` wraps a real provider and appends every exchange to a
+JSONL tape: a key for the request, and the streamed chunks with their offsets
+from the start of the call. ``ReplayChatModel`` streams those chunks back with
+the recorded timing (divided by ``speedup``). Requests are matched by key;
+one that was never recorded (prompts carry live prices) gets the next
+recording made with the same tools bound, so Guardian calls still get
+Guardian-shaped answers. Both lookups cycle in file order, so a replay is
+deterministic for a given sequence of calls.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import (
+    BaseChatModel,
+    agenerate_from_stream,
+)
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from app.services.debate.exceptions import LLMProviderError
+
+logger = logging.getLogger(__name__)
+
+TAPE_VERSION = 1
+SYNTHETIC_WORDS = (
+    "momentum",
+    "support",
+    "resistance",
+    "volume",
+    "breakout",
+    "trend",
+    "liquidity",
+    "risk",
+    "the",
+    "market",
+    "is",
+    "showing",
+    "strong",
+    "signals",
+)
+
+
+def exchange_key(
+    model: str, temperature: float, tools: Sequence[str], messages: list[BaseMessage]
+) -> str:
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "tools": list(tools),
+            "messages": [[message.type, message.content] for message in messages],
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _tool_names(tools: Sequence[Any]) -> list[str]:
+    return [convert_to_openai_tool(tool)["function"]["name"] for tool in tools]
+
+
+def _encode_chunk(offset: float, chunk: AIMessageChunk) -> dict[str, Any]:
+    encoded: dict[str, Any] = {"t": round(offset, 4), "content": chunk.content}
+    if chunk.tool_call_chunks:
+        encoded["toolCallChunks"] = [dict(tc) for tc in chunk.tool_call_chunks]
+    if chunk.usage_metadata:
+        encoded["usage"] = dict(chunk.usage_metadata)
+    return encoded
+
+
+def _decode_chunk(encoded: dict[str, Any]) -> AIMessageChunk:
+    return AIMessageChunk(
+        content=encoded.get("content", ""),
+        tool_call_chunks=encoded.get("toolCallChunks", []),
+        usage_metadata=encoded.get("usage"),
+    )
+
+
+def synthetic_text(tokens: int) -> str:
+    """``tokens`` words of deterministic filler."""
+    return " ".join(SYNTHETIC_WORDS[i % len(SYNTHETIC_WORDS)] for i in range(tokens))
+
+
+class _Tape:
+    def __init__(self, records: list[dict[str, Any]]) -> None:
+        self.by_key: dict[str, list[dict[str, Any]]] = {}
+        self.by_tools: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for record in records:
+            self.by_key.setdefault(record["key"], []).append(record)
+            self.by_tools.setdefault(tuple(record.get("tools", [])), []).append(record)
+        self._cursors: dict[Any, int] = {}
+
+    def _next(self, cursor: Any, records: list[dict[str, Any]]) -> dict[str, Any]:
+        index = self._cursors.get(cursor, 0)
+        self._cursors[cursor] = index + 1
+        return records[index % len(records)]
+
+    def lookup(self, key: str, tools: Sequence[str]) -> dict[str, Any] | None:
+        if key in self.by_key:
+            return self._next(key, self.by_key[key])
+        fallback = self.by_tools.get(tuple(tools))
+        if fallback:
+            return self._next(("tools", tuple(tools)), fallback)
+        return None
+
+
+_tapes: dict[str, _Tape] = {}
+
+
+def load_tape(path: str) -> _Tape:
+    """Parse a tape once per process; raises ``LLMProviderError`` if missing."""
+    tape = _tapes.get(path)
+    if tape is None:
+        file = Path(path)
+        if not file.is_file():
+            raise LLMProviderError(f"LLM replay tape not found: {path}")
+        records = [
+            json.loads(line)
+            for line in file.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        tape = _tapes[path] = _Tape(records)
+        logger.info(f"Loaded LLM replay tape {path} ({len(records)} exchanges)")
+    return tape
+
+
+def clear_tapes() -> None:
+    _tapes.clear()
+
+
+def _append(path: str, line: str) -> None:
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(line + "\n")
+
+
+class RecordingChatModel(BaseChatModel):
+    """Streams from ``inner`` and appends each exchange to the tape at ``path``."""
+
+    inner: Any
+    path: str
+    model_name: str
+    temperature: float
+    streaming: bool = False
+    tools: list[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "RecordingChatModel":
+        return self.model_copy(
+            update={
+                "inner": self.inner.bind_tools(tools, **kwargs),
+                "tools": _tool_names(tools),
+            }
+        )
+
+    def _should_stream(self, *, async_api: bool, **kwargs: Any) -> bool:
+        return self.streaming or super()._should_stream(async_api=async_api, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        started = time.monotonic()
+        chunks: list[dict[str, Any]] = []
+        # Empty, not None: None would inherit the caller's handlers from the
+        # runnable context and every recorded token would reach them twice.
+        async for chunk in self.inner.astream(
+            messages, config={"callbacks": []}, stop=stop, **kwargs
+        ):
+            chunks.append(_encode_chunk(time.monotonic() - started, chunk))
+            yield ChatGenerationChunk(message=chunk)
+        record = {
+            "v": TAPE_VERSION,
+            "key": exchange_key(
+                self.model_name, self.temperature, self.tools, messages
+            ),
+            "model": self.model_name,
+            "tools": self.tools,
+            "prompt": str(messages[-1].content)[:120] if messages else "",
+            "chunks": chunks,
+        }
+        try:
+            await asyncio.to_thread(_append, self.path, json.dumps(record, default=str))
+        except Exception as e:
+            logger.warning(f"Failed to record LLM exchange to {self.path}: {e}")
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop=stop, **kwargs))
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("RecordingChatModel is async-only")
+
+
+class ReplayChatModel(BaseChatModel):
+    """Streams recorded exchanges from the tape at ``path``.
+
+    ``speedup`` divides the recorded delays (2.0 = twice as fast); 0 or less
+    replays without any delay.
+    """
+
+    path: str
+    model_name: str
+    temperature: float
+    streaming: bool = False
+    speedup: float = 1.0
+    tools: list[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ReplayChatModel":
+        return self.model_copy(update={"tools": _tool_names(tools)})
+
+    def _should_stream(self, *, async_api: bool, **kwargs: Any) -> bool:
+        return self.streaming or super()._should_stream(async_api=async_api, **kwargs)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        key = exchange_key(self.model_name, self.temperature, self.tools, messages)
+        record = load_tape(self.path).lookup(key, self.tools)
+        if record is None:
+            raise LLMProviderError(
+                f"No recorded exchange for tools {self.tools} in {self.path}"
+            )
+        elapsed = 0.0
+        for encoded in record["chunks"]:
+            if self.speedup > 0 and encoded["t"] > elapsed:
+                await asyncio.sleep((encoded["t"] - elapsed) / self.speedup)
+                elapsed = encoded["t"]
+            yield ChatGenerationChunk(message=_decode_chunk(encoded))
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await agenerate_from_stream(self._astream(messages, stop=stop, **kwargs))
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        raise NotImplementedError("ReplayChatModel is async-only")
@@ -0,0 +1,245 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+PROFILE_VERSION = 1
+
+PHASE_MARKET_CONTEXT = "market_context"
+PHASE_LLM = "llm"
+PHASE_SANITIZATION = "sanitization"
+PHASE_GUARDIAN = "guardian"
+PHASE_BROADCAST = "broadcast"
+PHASE_TRADING_ANALYSIS = "trading_analysis"
+PHASE_ARCHIVAL = "archival"
+PHASES = (
+    PHASE_MARKET_CONTEXT,
+    PHASE_LLM,
+    PHASE_SANITIZATION,
+    PHASE_GUARDIAN,
+    PHASE_BROADCAST,
+    PHASE_TRADING_ANALYSIS,
+    PHASE_ARCHIVAL,
+)
+# Broadcasts happen once per token frame, so they only feed the phase totals;
+# every other phase also gets a span on the timeline.
+_TOTALS_ONLY = frozenset({PHASE_BROADCAST})
+MAX_SPANS = 200
+PERCENTILES = (50, 90, 99)
+
+_current: ContextVar["DebateProfile | None"] = ContextVar(
+    "debate_profile", default=None
+)
+
+
+class DebateProfile:
+    """Where one debate spent its time.
+
+    ``phases`` holds ``[count, total_ms, max_ms]`` per phase, ``spans`` a
+    timeline of ``[phase, offset_ms, duration_ms, turn]`` (offsets from the
+    start of the profile, at most ``MAX_SPANS``), and ``turns`` one entry per
+    agent turn with LLM time-to-first-token, generation time and tokens/sec.
+    ``to_dict`` is the compact form stored with the debate.
+    """
+
+    __slots__ = ("started_at", "_origin", "phases", "spans", "turns")
+
+    def __init__(self, started_at: float | None = None) -> None:
+        self.started_at = started_at if started_at is not None else time.time()
+        # Monotonic clock aligned with started_at, for span offsets.
+        self._origin = time.monotonic() - (time.time() - self.started_at)
+        self.phases: dict[str, list[float]] = {}
+        self.spans: list[list[Any]] = []
+        self.turns: list[dict[str, Any]] = []
+
+    def record(
+        self,
+        phase: str,
+        seconds: float,
+        turn: int | None = None,
+        started: float | None = None,
+    ) -> None:
+        """Add ``seconds`` spent in ``phase``; ``started`` is a monotonic time."""
+        ms = seconds * 1000
+        totals = self.phases.setdefault(phase, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += ms
+        totals[2] = max(totals[2], ms)
+        if phase in _TOTALS_ONLY or len(self.spans) >= MAX_SPANS:
+            return
+        if started is None:
+            started = time.monotonic() - seconds
+        self.spans.append(
+            [phase, round((started - self._origin) * 1000), round(ms, 1), turn]
+        )
+
+    @contextmanager
+    def measure(self, phase: str, turn: int | None = None) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(phase, time.monotonic() - started, turn, started)
+
+    def record_turn(
+        self,
+        turn: int,
+        agent: str,
+        generation_seconds: float,
+        first_token_seconds: float | None = None,
+        output_tokens: int | None = None,
+    ) -> None:
+        tokens_per_sec = None
+        if output_tokens and generation_seconds > 0:
+            tokens_per_sec = round(output_tokens / generation_seconds, 1)
+        self.turns.append(
+            {
+                "turn": turn,
+                "agent": agent,
+                "ttftMs": (
+                    round(first_token_seconds * 1000, 1)
+                    if first_token_seconds is not None
+                    else None
+                ),
+                "genMs": round(generation_seconds * 1000, 1),
+                "tokens": output_tokens,
+                "tokensPerSec": tokens_per_sec,
+            }
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "v": PROFILE_VERSION,
+            "startedAt": round(self.started_at, 3),
+            "totalMs": round((time.monotonic() - self._origin) * 1000),
+            "phases": {
+                phase: [int(count), round(total, 1), round(peak, 1)]
+                for phase, (count, total, peak) in self.phases.items()
+            },
+            "turns": self.turns,
+            "spans": self.spans,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DebateProfile":
+        """Continue a profile begun elsewhere (e.g. before the debate was queued)."""
+        profile = cls(started_at=data.get("startedAt"))
+        profile.phases = {
+            phase: [count, total, peak]
+            for phase, (count, total, peak) in data.get("phases", {}).items()
+        }
+        profile.spans = [list(span) for span in data.get("spans", [])]
+        profile.turns = list(data.get("turns", []))
+        return profile
+
+
+def current_profile() -> DebateProfile | None:
+    return _current.get()
+
+
+@contextmanager
+def activate(profile: DebateProfile) -> Iterator[DebateProfile]:
+    """Make ``profile`` the one ``profiled`` records into, in this context."""
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def profiled(phase: str, turn: int | None = None) -> Iterator[None]:
+    """Time the block into the active profile; a no-op when there is none."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    with profile.measure(phase, turn):
+        yield
+
+
+class LLMTimingHandler(AsyncCallbackHandler):
+    """Measures one LLM call: time to first token and output tokens.
+
+    Without streaming there is no first-token callback, so ``first_token``
+    stays None. Output tokens come from the provider's usage metadata when
+    reported, else from the number of streamed chunks.
+    """
+
+    def __init__(self) -> None:
+        self.started: float | None = None
+        self.first_token: float | None = None
+        self.chunks = 0
+        self.output_tokens: int | None = None
+
+    async def on_chat_model_start(
+        self, serialized: Any, messages: Any, **kwargs: Any
+    ) -> None:
+        self.started = time.monotonic()
+
+    async def on_llm_start(self, serialized: Any, prompts: Any, **kwargs: Any) -> None:
+        self.started = time.monotonic()
+
+    async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        if self.first_token is None and self.started is not None:
+            self.first_token = time.monotonic() - self.started
+        self.chunks += 1
+
+    async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        total = 0
+        for generations in getattr(response, "generations", None) or []:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None) or {}
+                total += usage.get("output_tokens", 0)
+        self.output_tokens = total or self.chunks or None
+
+
+def _percentile(ordered: list[float], pct: int) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, -(-pct * len(ordered) // 100) - 1))
+    return round(ordered[index], 1)
+
+
+def _distribution(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {f"p{pct}": _percentile(ordered, pct) for pct in PERCENTILES}
+
+
+def summarize_profiles(profiles: list[dict[str, Any]]) -> dict[str, Any]:
+    """p50/p90/p99 across debates of total time, per-phase time and LLM turns.
+
+    Phase distributions are over each debate's total for that phase; LLM
+    distributions are over individual turns.
+    """
+    phases: dict[str, list[float]] = {}
+    totals: list[float] = []
+    ttft: list[float] = []
+    generation: list[float] = []
+    throughput: list[float] = []
+    for profile in profiles:
+        totals.append(profile.get("totalMs", 0))
+        for phase, (_, total_ms, _) in profile.get("phases", {}).items():
+            phases.setdefault(phase, []).append(total_ms)
+        for turn in profile.get("turns", []):
+            if turn.get("ttftMs") is not None:
+                ttft.append(turn["ttftMs"])
+            generation.append(turn["genMs"])
+            if turn.get("tokensPerSec") is not None:
+                throughput.append(turn["tokensPerSec"])
+    return {
+        "debates": len(profiles),
+        "totalMs": _distribution(totals),
+        "phasesMs": {
+            phase: _distribution(phases[phase]) for phase in PHASES if phase in phases
+        },
+        "llm": {
+            "ttftMs": _distribution(ttft),
+            "genMs": _distribution(generation),
+            "tokensPerSec": _distribution(throughput),
+        },
+    }
@@ -0,0 +1,190 @@
+import logging
+from datetime import datetime
+from typing import Any, Protocol
+
+from fastapi import WebSocket
+
+from app.services.debate.frames import ActionFrame
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - ormsgpack ships with langgraph
+    ormsgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_SUBPROTOCOL = "debate.msgpack.v1"
+MSGPACK_QUERY_VALUE = "msgpack"
+PROTOCOL_VERSION = 1
+
+# Wire dictionaries for protocol v1. Codes are append-only: never renumber or
+# reuse one, add a new protocol version instead.
+ACTION_CODES: dict[str, int] = {
+    "DEBATE/CONNECTED": 1,
+    "DEBATE/TOKEN_RECEIVED": 2,
+    "DEBATE/ARGUMENT_COMPLETE": 3,
+    "DEBATE/TURN_CHANGE": 4,
+    "DEBATE/STATUS_UPDATE": 5,
+    "DEBATE/ERROR": 6,
+    "DEBATE/PING": 7,
+    "DEBATE/DATA_STALE": 8,
+    "DEBATE/DATA_REFRESHED": 9,
+    "DEBATE/REASONING_NODE": 10,
+    "DEBATE/GUARDIAN_INTERRUPT": 11,
+    "DEBATE/GUARDIAN_VERDICT": 12,
+    "DEBATE/DEBATE_PAUSED": 13,
+    "DEBATE/DEBATE_RESUMED": 14,
+    "DEBATE/GUARDIAN_INTERRUPT_ACK": 15,
+    "DEBATE/VOTE_UPDATE": 16,
+    "DEBATE/FOREX_PRICE_UPDATE": 17,
+    "DEBATE/REPLAY": 18,
+}
+
+FIELD_CODES: dict[str, int] = {
+    "agent": 1,
+    "token": 2,
+    "turn": 3,
+    "content": 4,
+    "status": 5,
+    "currentAgent": 6,
+    "isRedacted": 7,
+    "redactedPhrases": 8,
+    "code": 9,
+    "message": 10,
+    "nodeId": 11,
+    "nodeType": 12,
+    "label": 13,
+    "summary": 14,
+    "parentId": 15,
+    "isWinning": 16,
+    "riskLevel": 17,
+    "reason": 18,
+    "fallacyType": 19,
+    "originalAgent": 20,
+    "summaryVerdict": 21,
+    "verdict": 22,
+    "reasoning": 23,
+    "totalInterrupts": 24,
+    "totalVotes": 25,
+    "voteBreakdown": 26,
+    "asset": 27,
+    "price": 28,
+    "previousPrice": 29,
+    "changePct": 30,
+    "spread": 31,
+    "timestamp": 32,
+    "lastUpdate": 33,
+    "ageSeconds": 34,
+    "fromSeq": 35,
+    "lastSeq": 36,
+    "truncated": 37,
+    "events": 38,
+}
+
+# The connection is already scoped to one debate, so the id is not resent.
+_CONNECTION_SCOPED_FIELDS = frozenset({"debateId"})
+
+
+class FrameCodec(Protocol):
+    """How one connection's frames are put on the wire."""
+
+    name: str
+
+    async def send(self, websocket: WebSocket, frame: ActionFrame) -> None: ...
+
+
+class JsonCodec:
+    """Default protocol: camelCase JSON text frames."""
+
+    name = "json"
+
+    async def send(self, websocket: WebSocket, frame: ActionFrame) -> None:
+        await websocket.send_text(frame.text)
+
+
+def _timestamp_ms(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return int(datetime.fromisoformat(value).timestamp() * 1000)
+        except ValueError:
+            return value
+    return value
+
+
+def compact_action(action: dict[str, Any]) -> list[Any]:
+    """Map an action dict onto the v1 ``[code, seq, timestamp_ms, payload]`` array.
+
+    Known payload keys become integer field codes; unknown keys are kept as
+    strings so new fields degrade gracefully on older clients.
+    """
+    action_type = action.get("type", "")
+    payload = {}
+    for key, value in (action.get("payload") or {}).items():
+        if key in _CONNECTION_SCOPED_FIELDS:
+            continue
+        if key == "events" and isinstance(value, list):
+            value = [compact_action(event) for event in value]
+        payload[FIELD_CODES.get(key, key)] = value
+    return [
+        ACTION_CODES.get(action_type, action_type),
+        action.get("seq"),
+        _timestamp_ms(action.get("timestamp")),
+        payload,
+    ]
+
+
+def _encode_msgpack(frame: ActionFrame) -> bytes:
+    return ormsgpack.packb(
+        compact_action(frame.to_dict()),
+        option=ormsgpack.OPT_NON_STR_KEYS,
+    )
+
+
+class MsgpackCodec:
+    """Opt-in binary protocol: msgpack arrays with integer action/field codes.
+
+    Each frame is packed at most once per broadcast (cached on the frame) and
+    the same bytes go to every msgpack viewer.
+    """
+
+    name = MSGPACK_SUBPROTOCOL
+
+    async def send(self, websocket: WebSocket, frame: ActionFrame) -> None:
+        await websocket.send_bytes(frame.encode_cached(self.name, _encode_msgpack))
+
+    def handshake(self) -> bytes:
+        """Per-connection dictionary frame sent before any debate traffic."""
+        return ormsgpack.packb(
+            {
+                "v": PROTOCOL_VERSION,
+                "actions": {code: name for name, code in ACTION_CODES.items()},
+                "fields": {code: name for name, code in FIELD_CODES.items()},
+            },
+            option=ormsgpack.OPT_NON_STR_KEYS,
+        )
+
+
+JSON_CODEC = JsonCodec()
+MSGPACK_CODEC = MsgpackCodec()
+
+
+def negotiate_codec(
+    websocket: WebSocket, protocol: str | None = None
+) -> tuple[FrameCodec, str | None]:
+    """Pick the codec a client asked for and the subprotocol to accept with.
+
+    Clients opt in with ``?protocol=msgpack`` or by offering the
+    ``debate.msgpack.v1`` subprotocol. Anything else, or a server without
+    ormsgpack installed, gets the JSON protocol.
+    """
+    offered = websocket.scope.get("subprotocols") or []
+    wants_msgpack = protocol == MSGPACK_QUERY_VALUE or MSGPACK_SUBPROTOCOL in offered
+    if not wants_msgpack:
+        return JSON_CODEC, None
+    if ormsgpack is None:
+        logger.warning("msgpack protocol requested but ormsgpack is not installed")
+        return JSON_CODEC, None
+    return (
+        MSGPACK_CODEC,
+        MSGPACK_SUBPROTOCOL if MSGPACK_SUBPROTOCOL in offered else None,
+    )
@@ -2,7 +2,7 @@ import json
 import logging
 from uuid import UUID
 
-from sqlalchemy import select, func, case, literal
+from sqlalchemy import select, func, case, literal, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Debate, Vote
@@ -118,6 +118,24 @@ class DebateRepository:
         await self.session.refresh(debate)
         return debate
 
+    async def save_profile(self, external_id: str, profile: dict) -> None:
+        await self.session.execute(
+            update(Debate)
+            .where(Debate.external_id == external_id)
+            .values(profile=profile)
+        )
+        await self.session.commit()
+
+    async def get_recent_profiles(self, limit: int = 100) -> list[dict]:
+        stmt = (
+            select(Debate.profile)
+            .where(Debate.profile.is_not(None))
+            .order_by(Debate.created_at.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_result(
         self, external_id: str, include_transcript: bool = False
     ) -> DebateResultResponse | None:
@@ -2,7 +2,7 @@ import json
 import logging
 import re
 from datetime import datetime, timezone
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel
 
@@ -28,32 +28,235 @@ _DEFAULT_PHRASES = [
 ]
 
 
-def _load_forbidden_phrases() -> list[str]:
+def _load_forbidden_phrases(source: Any = None) -> list[str]:
     try:
-        from app.config import settings
+        if source is None:
+            from app.config import settings as source
 
-        if settings.FORBIDDEN_PHRASES:
-            return settings.FORBIDDEN_PHRASES
+        if source.FORBIDDEN_PHRASES:
+            return list(source.FORBIDDEN_PHRASES)
     except Exception as exc:
         logger.warning(
             f"Failed to load FORBIDDEN_PHRASES from settings, using defaults: {exc}"
         )
-    return _DEFAULT_PHRASES
+    return list(_DEFAULT_PHRASES)
 
 
-FORBIDDEN_PHRASES = _load_forbidden_phrases()
+_REDACTED = "[REDACTED]"
+
+
+def _prefix_pattern(phrase: str) -> str:
+    """Regex for any non-empty prefix of ``phrase``: ``a(?:b(?:c)?)?``."""
+    pattern = ""
+    for char in reversed(phrase[1:]):
+        pattern = f"(?:{re.escape(char)}{pattern})?"
+    return re.escape(phrase[0]) + pattern
+
+
+def _trie_pattern(phrases: tuple[str, ...]) -> str:
+    """Alternation of ``phrases`` with shared prefixes factored out.
+
+    ``c(?:an't lose|annot fail)`` instead of ``can't lose|cannot fail`` keeps
+    the regex engine from retrying every phrase at every position. A phrase
+    that is a prefix of another becomes a greedy optional group, so the
+    longest phrase starting at a position wins.
+    """
+    trie: dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(c) + emit(node[c]) for c in sorted(node) if c]
+        if not branches:
+            return ""
+        if "" in node:
+            return f"(?:{'|'.join(branches)})?"
+        if len(branches) == 1:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})"
+
+    return emit(trie)
+
+
+class PhraseSet:
+    """An immutable, compiled snapshot of the forbidden-phrase list.
+
+    All phrases are compiled into one case-insensitive, prefix-factored
+    pattern behind a first-character lookahead, so a single left-to-right
+    scan finds every match. Where two phrases overlap the longer match wins
+    and replaced text is never rescanned.
+    """
+
+    def __init__(self, phrases: list[str], version: int) -> None:
+        self.version = version
+        self.phrases: tuple[str, ...] = tuple(
+            dict.fromkeys(p for p in phrases if p.strip())
+        )
+        # Lower-cased match text -> index of the first phrase it spells.
+        self._index: dict[str, int] = {}
+        for i, phrase in enumerate(self.phrases):
+            self._index.setdefault(phrase.lower(), i)
+        self.pattern: re.Pattern[str] | None = None
+        self.tail_pattern: re.Pattern[str] | None = None
+        if self.phrases:
+            first = "".join(sorted({re.escape(p[0].lower()) for p in self.phrases}))
+            self.pattern = re.compile(
+                f"(?=[{first}]){_trie_pattern(self.phrases)}", re.IGNORECASE
+            )
+        # Suffixes that could still grow into a phrase, for streaming.
+        prefixes = [_prefix_pattern(p[:-1]) for p in self.phrases if len(p) > 1]
+        if prefixes:
+            self.tail_pattern = re.compile(
+                f"(?:{'|'.join(prefixes)})\\Z", re.IGNORECASE
+            )
+        self.max_length = max((len(p) for p in self.phrases), default=0)
+
+    def _phrase_index(self, text: str) -> int:
+        index = self._index.get(text.lower())
+        if index is None:
+            # Case-insensitive regex matching folds a few characters that
+            # str.lower() does not (e.g. the long s), so fall back to a search.
+            index = next(
+                i
+                for i, phrase in enumerate(self.phrases)
+                if re.fullmatch(re.escape(phrase), text, re.IGNORECASE)
+            )
+        return index
+
+    def scan(self, content: str) -> tuple[str, list[str], int]:
+        """Redact ``content`` in one pass.
+
+        Returns the redacted text, the matched phrases in list order and the
+        number of characters that were redacted.
+        """
+        if self.pattern is None:
+            return content, [], 0
+        found: set[int] = set()
+        redacted_chars = 0
+
+        def _replace(match: re.Match[str]) -> str:
+            nonlocal redacted_chars
+            found.add(self._phrase_index(match.group()))
+            redacted_chars += match.end() - match.start()
+            return _REDACTED
+
+        sanitized = self.pattern.sub(_replace, content)
+        return sanitized, [self.phrases[i] for i in sorted(found)], redacted_chars
+
+    def redact(self, content: str) -> str:
+        if self.pattern is None:
+            return content
+        return self.pattern.sub(_REDACTED, content)
+
+
+_phrase_set = PhraseSet(_load_forbidden_phrases(), version=1)
+FORBIDDEN_PHRASES = list(_phrase_set.phrases)
 
 logger.info(
     f"Sanitization module loaded: {len(FORBIDDEN_PHRASES)} forbidden phrases compiled"
 )
 
-# TODO: _COMPILED_PATTERNS is compiled once at module load. Runtime config changes
-# (e.g., env var hot-reload) will NOT update patterns. If runtime reconfiguration is
-# needed, either recompile per-request (negligible cost at 16 phrases) or add a
-# reload_forbidden_phrases() function that recompiles the list.
-_COMPILED_PATTERNS = [
-    re.compile(re.escape(phrase), re.IGNORECASE) for phrase in FORBIDDEN_PHRASES
-]
+
+def get_phrase_set() -> PhraseSet:
+    return _phrase_set
+
+
+def reload_forbidden_phrases(phrases: list[str] | None = None) -> PhraseSet:
+    """Compile a new phrase set and swap it in atomically.
+
+    ``phrases`` defaults to ``FORBIDDEN_PHRASES`` re-read from the environment.
+    Calls already in progress finish with the set they started with. Prompts
+    built at import time keep the list they were built with.
+    """
+    global _phrase_set, FORBIDDEN_PHRASES
+
+    if phrases is None:
+        from app.config import Settings
+
+        try:
+            source = Settings()  # type: ignore[call-arg]
+        except Exception as exc:
+            logger.warning(f"Failed to re-read settings for FORBIDDEN_PHRASES: {exc}")
+            source = None
+        phrases = _load_forbidden_phrases(source)
+    new_set = PhraseSet(phrases, version=_phrase_set.version + 1)
+    _phrase_set = new_set
+    FORBIDDEN_PHRASES = list(new_set.phrases)
+    logger.info(
+        f"Forbidden phrases reloaded: version {new_set.version}, "
+        f"{len(new_set.phrases)} phrases"
+    )
+    return new_set
+
+
+# Backplane control message telling the other workers to apply a reload.
+PHRASES_RELOAD_CONTROL = "sanitization/phrases_reload"
+
+
+async def apply_phrases_control(message: dict[str, Any]) -> None:
+    """Apply a phrase reload another worker published over the backplane."""
+    if message.get("type") == PHRASES_RELOAD_CONTROL:
+        reload_forbidden_phrases(message["phrases"])
+
+
+class StreamingSanitizer:
+    """Incremental forbidden-phrase redaction for text that arrives in chunks.
+
+    Only the shortest tail that could still be (or become) a forbidden phrase
+    is held back; everything before it is redacted and released at once. Each
+    ``feed`` rescans just the new chunk plus at most one phrase-length of held
+    text, so a whole argument costs O(n) rather than re-sanitizing the
+    accumulated text on every flush.
+
+    The phrase set is pinned when the sanitizer is created, so a reload never
+    changes the rules halfway through a stream. Text is never split inside a
+    possible match, so the concatenated output is identical to
+    ``sanitize_response`` over the whole text.
+    """
+
+    def __init__(self, phrase_set: PhraseSet | None = None) -> None:
+        self._phrases = phrase_set or _phrase_set
+        self._held = ""
+
+    def feed(self, chunk: str) -> str:
+        """Add ``chunk`` and return the newly releasable, redacted text."""
+        text = self._held + chunk
+        phrases = self._phrases
+        if phrases.pattern is None:
+            self._held = ""
+            return text
+        cut = len(text)
+        if phrases.tail_pattern is not None:
+            tail = phrases.tail_pattern.search(
+                text, max(0, len(text) - phrases.max_length)
+            )
+            if tail:
+                cut = tail.start()
+        # ``text`` starts on a match boundary, so scanning it from the start
+        # sees the same matches a scan of the whole stream would.
+        out, pos = [], 0
+        for match in phrases.pattern.finditer(text):
+            if match.end() > cut:
+                cut = min(cut, match.start())
+                break
+            out.append(text[pos : match.start()])
+            out.append(_REDACTED)
+            pos = match.end()
+        out.append(text[pos:cut])
+        self._held = text[cut:]
+        return "".join(out)
+
+    def finish(self) -> str:
+        """Release and redact whatever is still held at the end of the stream."""
+        text, self._held = self._held, ""
+        return self._phrases.redact(text)
+
+    @property
+    def held(self) -> int:
+        return len(self._held)
 
 
 class SanitizationResult(BaseModel):
@@ -98,23 +301,8 @@ def sanitize_content(
             content="", is_redacted=False, redacted_phrases=[], redaction_ratio=0.0
         )
 
-    matched_phrases: list[str] = []
-    for phrase, pattern in zip(FORBIDDEN_PHRASES, _COMPILED_PATTERNS):
-        if pattern.search(content):
-            matched_phrases.append(phrase)
-
-    sanitized = content
-    for phrase, pattern in zip(FORBIDDEN_PHRASES, _COMPILED_PATTERNS):
-        sanitized = pattern.sub("[REDACTED]", sanitized)
-
-    redaction_ratio = 0.0
-    if matched_phrases and len(content) > 0:
-        redacted_text = content
-        for phrase in matched_phrases:
-            redacted_text = re.sub(
-                re.escape(phrase), "", redacted_text, flags=re.IGNORECASE
-            )
-        redaction_ratio = round(1 - len(redacted_text) / len(content), 4)
+    sanitized, matched_phrases, redacted_chars = _phrase_set.scan(content)
+    redaction_ratio = round(redacted_chars / len(content), 4)
 
     for phrase in matched_phrases:
         if context is not None:
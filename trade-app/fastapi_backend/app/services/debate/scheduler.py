@@ -0,0 +1,383 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.services.debate.exceptions import DebateQueueFullError
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first. Resumed debates already have viewers and a transcript, so
+# they go ahead of new ones.
+PRIORITY_RESUME = 0
+PRIORITY_NEW = 10
+
+QUEUE_KEY = "debate_jobs:queue"
+PAYLOADS_KEY = "debate_jobs:payloads"
+# worker_id -> JSON capacity report, refreshed every WORKER_HEARTBEAT_INTERVAL.
+WORKERS_KEY = "debate_jobs:workers"
+WORKER_HEARTBEAT_INTERVAL = 5.0
+# A worker that has not reported for this many intervals is presumed dead.
+WORKER_STALE_INTERVALS = 3
+# Weight of the newest run when updating the average run time.
+RUN_TIME_SMOOTHING = 0.2
+# How often an idle worker polls the Redis queue within one pop timeout.
+POP_POLL_INTERVAL = 0.2
+
+# Check the cap and enqueue in one step, so concurrent submits from several
+# web processes cannot overshoot max_queued. A negative cap means forced.
+_SUBMIT_SCRIPT = """
+local cap = tonumber(ARGV[4])
+if cap >= 0 and redis.call('ZCARD', KEYS[1]) >= cap then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[3])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+return 1
+"""
+# Take the next job together with its payload, so an error or a dead worker
+# can never leave a job popped from the queue but not yet read.
+_POP_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then
+    return nil
+end
+local payload = redis.call('HGET', KEYS[2], popped[1])
+redis.call('HDEL', KEYS[2], popped[1])
+return {popped[1], payload}
+"""
+
+
+@dataclass(frozen=True)
+class DebateJob:
+    debate_id: str
+    asset: str
+    # None resumes the debate from its checkpoint.
+    initial_state: dict[str, Any] | None
+    priority: int = PRIORITY_NEW
+    enqueued_at: float = field(default_factory=time.time)
+    # DebateProfile.to_dict() of the work done before queueing.
+    profile: dict[str, Any] | None = None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "debate_id": self.debate_id,
+                "asset": self.asset,
+                "initial_state": self.initial_state,
+                "priority": self.priority,
+                "enqueued_at": self.enqueued_at,
+                "profile": self.profile,
+            },
+            default=str,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "DebateJob":
+        return cls(**json.loads(raw))
+
+
+@dataclass(frozen=True)
+class QueueTicket:
+    """Where a submitted debate stands: position 0 means it is running."""
+
+    debate_id: str
+    position: int
+    eta_seconds: float | None
+
+
+def _eta(position: int, slots: int, run_seconds: float) -> float:
+    """Seconds until the job at ``position`` starts, assuming full slots."""
+    if position <= 0:
+        return 0.0
+    return math.ceil(position / max(1, slots)) * run_seconds
+
+
+class DebateScheduler:
+    """Runs debates in this process, at most ``max_concurrent`` at a time.
+
+    Submitted jobs beyond that wait in a priority queue (lower ``priority``
+    first, FIFO within a priority) of at most ``max_queued`` entries; further
+    submissions raise ``DebateQueueFullError`` unless forced. ETAs assume
+    every slot frees after ``average_run_seconds``, which tracks measured run
+    times. ``runner`` runs one job to completion.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[DebateJob], Awaitable[None]],
+        max_concurrent: int | None = None,
+        max_queued: int | None = None,
+        average_run_seconds: float | None = None,
+    ) -> None:
+        self._runner = runner
+        self.max_concurrent = max(
+            1, _pick(max_concurrent, settings.DEBATE_MAX_CONCURRENT)
+        )
+        self.max_queued = _pick(max_queued, settings.DEBATE_MAX_QUEUED)
+        self.average_run_seconds = float(
+            _pick(average_run_seconds, settings.DEBATE_ESTIMATED_RUN_SECONDS)
+        )
+        self._queue: list[tuple[int, int, DebateJob]] = []
+        self._sequence = itertools.count()
+        self._active: dict[str, asyncio.Task] = {}
+        self._slot_freed = asyncio.Event()
+        self._closed = False
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def running(self) -> int:
+        return len(self._active)
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    async def submit(self, job: DebateJob, force: bool = False) -> QueueTicket:
+        """Queue ``job`` and start it straight away if a slot is free."""
+        if self._closed:
+            raise DebateQueueFullError("Debate scheduler is shutting down")
+        if not force and self.queued >= self.max_queued:
+            self.rejected += 1
+            raise DebateQueueFullError(
+                f"Debate queue is full ({self.queued} waiting)",
+                retry_after=self._eta_for(self.queued + 1),
+            )
+        heapq.heappush(self._queue, (job.priority, next(self._sequence), job))
+        self._dispatch()
+        return await self.position(job.debate_id) or QueueTicket(
+            debate_id=job.debate_id, position=0, eta_seconds=0.0
+        )
+
+    async def position(self, debate_id: str) -> QueueTicket | None:
+        """The ticket of a queued or running debate, None if unknown here."""
+        if debate_id in self._active:
+            return QueueTicket(debate_id=debate_id, position=0, eta_seconds=0.0)
+        for index, (_, _, job) in enumerate(sorted(self._queue)):
+            if job.debate_id == debate_id:
+                return QueueTicket(
+                    debate_id=debate_id,
+                    position=index + 1,
+                    eta_seconds=self._eta_for(index + 1),
+                )
+        return None
+
+    def _eta_for(self, position: int) -> float:
+        return _eta(position, self.max_concurrent, self.average_run_seconds)
+
+    def has_free_slot(self) -> bool:
+        return self.running + self.queued < self.max_concurrent
+
+    async def wait_for_slot(self) -> None:
+        """Return once a submitted job would start without queueing."""
+        while not self.has_free_slot():
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+
+    def _dispatch(self) -> None:
+        while self._queue and self.running < self.max_concurrent:
+            _, _, job = heapq.heappop(self._queue)
+            self._active[job.debate_id] = asyncio.create_task(self._run(job))
+
+    async def _run(self, job: DebateJob) -> None:
+        started_at = time.monotonic()
+        try:
+            await self._runner(job)
+            self._record_run_time(time.monotonic() - started_at)
+            self.completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled debate {job.debate_id} failed: {e}", exc_info=True)
+        finally:
+            self._active.pop(job.debate_id, None)
+            if not self._closed:
+                self._dispatch()
+            self._slot_freed.set()
+
+    def _record_run_time(self, seconds: float) -> None:
+        self.average_run_seconds += RUN_TIME_SMOOTHING * (
+            seconds - self.average_run_seconds
+        )
+
+    async def join(self) -> None:
+        """Wait until every started job has finished."""
+        while self._active:
+            await asyncio.gather(*self._active.values(), return_exceptions=True)
+
+    def drain(self) -> list[DebateJob]:
+        """Stop starting jobs and return the ones that never started.
+
+        Running jobs are left alone; the caller decides how long to wait for
+        them.
+        """
+        self._closed = True
+        pending = [job for _, _, job in sorted(self._queue)]
+        self._queue.clear()
+        return pending
+
+    async def get_stats(self) -> dict[str, Any]:
+        return {
+            "mode": "local",
+            "running": self.running,
+            "queued": self.queued,
+            "maxConcurrent": self.max_concurrent,
+            "maxQueued": self.max_queued,
+            "averageRunSeconds": round(self.average_run_seconds, 1),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+class RedisDebateScheduler:
+    """Queues debates in Redis for ``commands.debate_worker`` processes.
+
+    The web process only enqueues; workers pop jobs in priority order as
+    they free slots and report their capacity and average run time, from
+    which queue ETAs are estimated. With no live worker the ETA is unknown.
+    """
+
+    def __init__(self, redis: Any = None, max_queued: int | None = None) -> None:
+        self._redis = redis
+        self.max_queued = _pick(max_queued, settings.DEBATE_MAX_QUEUED)
+        self.rejected = 0
+        self._submit_script: Any = None
+        self._pop_script: Any = None
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        if self._submit_script is None:
+            self._submit_script = self._redis.register_script(_SUBMIT_SCRIPT)
+            self._pop_script = self._redis.register_script(_POP_SCRIPT)
+        return self._redis
+
+    @staticmethod
+    def _score(job: DebateJob) -> float:
+        # Priority first, then enqueue time (ms fits below 10**13).
+        return job.priority * 10**13 + int(job.enqueued_at * 1000)
+
+    async def submit(self, job: DebateJob, force: bool = False) -> QueueTicket:
+        await self._get_redis()
+        accepted = await self._submit_script(
+            keys=[QUEUE_KEY, PAYLOADS_KEY],
+            args=[
+                job.debate_id,
+                self._score(job),
+                job.to_json(),
+                -1 if force else self.max_queued,
+            ],
+        )
+        if not int(accepted):
+            self.rejected += 1
+            slots, run_seconds = await self._capacity()
+            raise DebateQueueFullError(
+                "Debate queue is full",
+                retry_after=_eta(self.max_queued + 1, slots, run_seconds)
+                if slots
+                else None,
+            )
+        ticket = await self.position(job.debate_id)
+        return ticket or QueueTicket(
+            debate_id=job.debate_id, position=0, eta_seconds=0.0
+        )
+
+    async def position(self, debate_id: str) -> QueueTicket | None:
+        redis = await self._get_redis()
+        rank = await redis.zrank(QUEUE_KEY, debate_id)
+        if rank is None:
+            return None
+        slots, run_seconds = await self._capacity()
+        return QueueTicket(
+            debate_id=debate_id,
+            position=rank + 1,
+            eta_seconds=_eta(rank + 1, slots, run_seconds) if slots else None,
+        )
+
+    async def pop(self, timeout: float = 1.0) -> DebateJob | None:
+        """Take the next job, waiting up to ``timeout`` seconds for one.
+
+        The pop is a script rather than BZPOPMIN, which cannot be made
+        atomic with the payload read, so an idle worker polls every
+        ``POP_POLL_INTERVAL`` seconds instead of blocking.
+        """
+        await self._get_redis()
+        deadline = time.monotonic() + timeout
+        while True:
+            popped = await self._pop_script(keys=[QUEUE_KEY, PAYLOADS_KEY], args=[])
+            if popped:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            await asyncio.sleep(min(POP_POLL_INTERVAL, remaining))
+        debate_id, raw = popped
+        if raw is None:
+            logger.warning(f"Debate job {debate_id} has no payload, skipping")
+            return None
+        return DebateJob.from_json(raw)
+
+    async def report(self, worker_id: str, slots: int, run_seconds: float) -> None:
+        """Publish a worker's capacity for ETA estimates."""
+        try:
+            redis = await self._get_redis()
+            await redis.hset(
+                WORKERS_KEY,
+                worker_id,
+                json.dumps({"slots": slots, "run": run_seconds, "at": time.time()}),
+            )
+        except Exception as e:
+            logger.warning(f"Debate worker heartbeat failed: {e}")
+
+    async def withdraw(self, worker_id: str) -> None:
+        try:
+            redis = await self._get_redis()
+            await redis.hdel(WORKERS_KEY, worker_id)
+        except Exception as e:
+            logger.warning(f"Debate worker deregistration failed: {e}")
+
+    async def _capacity(self) -> tuple[int, float]:
+        """Total slots of live workers and their slot-weighted run time."""
+        stale_before = time.time() - WORKER_HEARTBEAT_INTERVAL * WORKER_STALE_INTERVALS
+        try:
+            redis = await self._get_redis()
+            reports = await redis.hgetall(WORKERS_KEY)
+        except Exception as e:
+            logger.warning(f"Debate worker capacity read failed: {e}")
+            return 0, 0.0
+        slots, weighted = 0, 0.0
+        for raw in reports.values():
+            report = json.loads(raw)
+            if report["at"] < stale_before:
+                continue
+            slots += report["slots"]
+            weighted += report["slots"] * report["run"]
+        return slots, (weighted / slots if slots else 0.0)
+
+    def drain(self) -> list[DebateJob]:
+        # Queued jobs live in Redis and outlast this process.
+        return []
+
+    async def get_stats(self) -> dict[str, Any]:
+        redis = await self._get_redis()
+        slots, run_seconds = await self._capacity()
+        return {
+            "mode": "worker",
+            "queued": await redis.zcard(QUEUE_KEY),
+            "maxQueued": self.max_queued,
+            "workerSlots": slots,
+            "averageRunSeconds": round(run_seconds, 1),
+            "rejected": self.rejected,
+        }
+
+
+def _pick(value: Any, default: Any) -> Any:
+    return default if value is None else value
@@ -41,6 +41,9 @@ class DebateResponse(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc),
         serialization_alias="createdAt",
     )
+    # 0 once the debate is running; otherwise its place in the start queue.
+    queue_position: int = Field(0, serialization_alias="queuePosition")
+    eta_seconds: float | None = Field(None, serialization_alias="etaSeconds")
 
 
 class DebateMeta(BaseModel):
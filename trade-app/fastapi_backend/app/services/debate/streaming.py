@@ -1,11 +1,25 @@
 import asyncio
 import json
 import logging
-from typing import Any
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable
 
 from fastapi import WebSocket
 from langchain_core.callbacks import AsyncCallbackHandler
 
+from app.config import settings
+from app.services.debate.admission import AdmissionController
+from app.services.debate.backplane import BroadcastBackplane, create_backplane
+from app.services.debate.event_log import (
+    UNLOGGED_ACTION_TYPES,
+    DebateEventLog,
+    create_event_log,
+)
+from app.services.debate.frames import ActionFrame, as_frame, build_frame
+from app.services.debate.profiling import PHASE_BROADCAST, profiled
+from app.services.debate.protocol import JSON_CODEC, FrameCodec
+from app.services.debate.sanitization import StreamingSanitizer
 from app.services.debate.state import RiskLevel
 from app.services.debate.ws_schemas import (
     ArgumentCompletePayload,
@@ -17,67 +31,518 @@ from app.services.debate.ws_schemas import (
     GuardianInterruptPayload,
     GuardianVerdictPayload,
     ReasoningNodePayload,
-    WebSocketAction,
+    WebSocketCloseCodes,
+    CLOSE_CODE_REASONS,
 )
 from app.services.market.schemas import FreshnessStatus
+from app.services.metrics import BROADCAST_FRAMES, BROADCAST_LATENCY
 from app.services.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
 CONNECTION_RATE_LIMIT = 10
 HEARTBEAT_INTERVAL = 30
+# Connections silent for this many intervals count as stale, then get reaped.
+HEARTBEAT_STALE_INTERVALS = 2
+HEARTBEAT_REAP_INTERVALS = 3
 STREAM_STATE_TTL = 3600
 RATE_LIMIT_WINDOW = 60
+CLOSE_DRAIN_TIMEOUT = 1.0
+TOKEN_ACTION_TYPE = "DEBATE/TOKEN_RECEIVED"
+SLOW_CONSUMER_DROP = "drop"
+SLOW_CONSUMER_LATEST_STATE = "latest_state"
+# Token frame-rate cap: TOKEN_MAX_FPS for small audiences, halved at
+# TOKEN_FPS_VIEWER_SCALE local viewers, never below TOKEN_MIN_FPS.
+TOKEN_MAX_FPS = 20.0
+TOKEN_MIN_FPS = 4.0
+TOKEN_FPS_VIEWER_SCALE = 500
+STREAM_STATS_LATENCY_SAMPLES = 512
+STREAM_STATS_MAX_DEBATES = 256
+
+
+class _ConnectionSender:
+    """Outbound buffer for one websocket, drained by its own writer task.
+
+    Broadcasts only append to the buffer, so a slow socket delays nobody but
+    itself. Once the buffer overflows under the ``latest_state`` policy the
+    connection stops receiving token frames and keeps only the newest frame of
+    every other action type until the writer catches up.
+
+    A held sender parks broadcast frames until ``release``, so a reconnecting
+    client can be sent its replay first without missing or repeating a frame.
+    """
+
+    def __init__(
+        self,
+        debate_id: str,
+        websocket: WebSocket,
+        max_queue_size: int,
+        on_failure: Callable[[WebSocket], Awaitable[None]],
+        codec: FrameCodec = JSON_CODEC,
+    ) -> None:
+        self.debate_id = debate_id
+        self.websocket = websocket
+        self.codec = codec
+        self.last_seen = time.monotonic()
+        self.max_queue_size = max_queue_size
+        self.latest_state_only = False
+        self.dropped_frames = 0
+        self._pending: deque[ActionFrame] = deque()
+        self._latest: dict[str, ActionFrame] = {}
+        self._held: list[ActionFrame] | None = None
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        self._on_failure = on_failure
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def queued(self) -> int:
+        return len(self._pending) + len(self._latest)
+
+    def offer(self, action: ActionFrame, policy: str) -> bool:
+        """Queue a frame without blocking. Returns False if the socket must be dropped."""
+        if self._closed:
+            return True
+        if self._held is not None:
+            return self._hold(action, policy)
+        return self.send(action, policy)
+
+    def send(self, action: ActionFrame, policy: str) -> bool:
+        """Like ``offer``, but bypasses a hold."""
+        if self._closed:
+            return True
+        if self.latest_state_only:
+            self._offer_latest(action)
+        elif len(self._pending) >= self.max_queue_size:
+            if policy == SLOW_CONSUMER_DROP:
+                return False
+            self._enter_latest_state()
+            self._offer_latest(action)
+        else:
+            self._pending.append(action)
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def hold(self) -> None:
+        self._held = []
+
+    def _hold(self, action: ActionFrame, policy: str) -> bool:
+        if len(self._held) >= self.max_queue_size:
+            if policy == SLOW_CONSUMER_DROP:
+                return False
+            if action.get("type") == TOKEN_ACTION_TYPE:
+                self.dropped_frames += 1
+                return True
+        self._held.append(action)
+        return True
+
+    def release(
+        self, policy: str, lead: ActionFrame | None = None, after_seq: int | None = None
+    ) -> bool:
+        """Queue ``lead`` and the held frames, skipping those ``lead`` covers.
+
+        Unsequenced frames (greetings, pings) go ahead of ``lead``; logged
+        frames with ``seq`` at or below ``after_seq`` are dropped as already
+        replayed.
+        """
+        held, self._held = self._held or [], None
+        unsequenced = [a for a in held if a.get("seq") is None]
+        live = [
+            a
+            for a in held
+            if a.get("seq") is not None and (after_seq is None or a["seq"] > after_seq)
+        ]
+        return all(
+            self.send(action, policy)
+            for action in [*unsequenced, *([lead] if lead is not None else []), *live]
+        )
+
+    def _enter_latest_state(self) -> None:
+        self.latest_state_only = True
+        backlog, self._pending = self._pending, deque()
+        for action in backlog:
+            self._offer_latest(action)
+        logger.warning(
+            "WebSocket send queue overflowed, switching connection to latest-state mode"
+        )
+
+    def _offer_latest(self, action: ActionFrame) -> None:
+        action_type = action.get("type", "")
+        if action_type == TOKEN_ACTION_TYPE:
+            self.dropped_frames += 1
+            return
+        if self._latest.pop(action_type, None) is not None:
+            self.dropped_frames += 1
+        self._latest[action_type] = action
+
+    def _next_frame(self) -> ActionFrame | None:
+        if self._pending:
+            return self._pending.popleft()
+        if self._latest:
+            return self._latest.pop(next(iter(self._latest)))
+        self.latest_state_only = False
+        return None
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while (action := self._next_frame()) is not None:
+                    try:
+                        await self.codec.send(self.websocket, action)
+                    except Exception as e:
+                        logger.warning(f"Failed to send to websocket: {e}")
+                        self.close()
+                        await self._on_failure(self.websocket)
+                        return
+                self._idle.set()
+        finally:
+            self._idle.set()
+
+    async def wait_idle(self) -> None:
+        await self._idle.wait()
+
+    def close(self) -> None:
+        self._closed = True
+        self._pending.clear()
+        self._latest.clear()
+        self._held = None
+
+    def stop(self) -> None:
+        self.close()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    async def join(self) -> None:
+        """Wait for the writer task to exit after ``stop``."""
+        await asyncio.gather(self._task, return_exceptions=True)
 
 
 class DebateConnectionManager:
-    """Manages WebSocket connections for debate broadcasting with isolation."""
+    """Manages WebSocket connections for debate broadcasting with isolation.
+
+    Each connection owns a bounded outbound queue and a writer task, so
+    ``broadcast_to_debate`` never waits on a socket. Actions are encoded once
+    per broadcast and the same JSON text is written to every connection.
+
+    Broadcasts go through a ``BroadcastBackplane``. The backplane hands each
+    frame back to ``deliver_local`` on every worker that has viewers for the
+    debate, so a debate running on one worker reaches sockets on any worker.
+    Every broadcast is first appended to a ``DebateEventLog``, which stamps it
+    with a per-debate ``seq`` that reconnecting clients pass back as ``since``.
+    With both on Redis the log publishes the frame in the same script, so
+    logging adds no round trip to a broadcast.
+
+    A single heartbeat task serves every connection: each tick it queues one
+    pre-encoded PING frame on all sockets and reaps, in bulk, any connection
+    that has not been heard from for ``HEARTBEAT_REAP_INTERVALS`` ticks.
+
+    New viewers are gated by an ``AdmissionController``; once it puts a debate
+    in ``status_only`` mode, token frames are not delivered to local sockets.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_queue_size: int | None = None,
+        slow_consumer_policy: str | None = None,
+        backplane: BroadcastBackplane | None = None,
+        event_log: DebateEventLog | None = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        admission: AdmissionController | None = None,
+    ) -> None:
         self.active_debates: dict[str, set[WebSocket]] = {}
+        self.backplane = backplane or create_backplane()
+        self.backplane.bind(self.deliver_local)
+        self.event_log = event_log or create_event_log()
+        self.max_queue_size = max_queue_size or settings.WS_SEND_QUEUE_SIZE
+        self.slow_consumer_policy = (
+            slow_consumer_policy or settings.WS_SLOW_CONSUMER_POLICY
+        )
+        self.heartbeat_interval = heartbeat_interval
+        self.admission = admission or AdmissionController()
+        self.admission.bind(self.get_total_connections, self.get_connection_count)
+        self.shed_token_frames = 0
+        self._senders: dict[WebSocket, _ConnectionSender] = {}
+        self._background: set[asyncio.Task] = set()
+        self._heartbeat_task: asyncio.Task | None = None
         self._lock = asyncio.Lock()
 
-    async def connect(self, debate_id: str, websocket: WebSocket) -> None:
-        """Register a websocket connection for a debate."""
+    def _attach(
+        self,
+        debate_id: str,
+        websocket: WebSocket,
+        codec: FrameCodec = JSON_CODEC,
+    ) -> _ConnectionSender:
+        async def on_failure(ws: WebSocket) -> None:
+            await self.disconnect(debate_id, ws)
+
+        sender = _ConnectionSender(
+            debate_id, websocket, self.max_queue_size, on_failure, codec
+        )
+        self._senders[websocket] = sender
+        self._ensure_heartbeat()
+        return sender
+
+    def _ensure_heartbeat(self) -> None:
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self) -> None:
+        while self._senders:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.heartbeat_tick()
+            except Exception as e:
+                logger.warning(f"Heartbeat tick failed: {e}")
+
+    async def heartbeat_tick(self) -> None:
+        """Ping every connection with one shared frame and reap silent ones."""
+        if not self._senders:
+            return
+        reap_before = (
+            time.monotonic() - self.heartbeat_interval * HEARTBEAT_REAP_INTERVALS
+        )
+        ping = build_frame("DEBATE/PING")
+        # Encode up front so every socket is handed the same string.
+        ping.encode()
+        dead: list[_ConnectionSender] = []
+        overflowed: list[_ConnectionSender] = []
+        for sender in list(self._senders.values()):
+            if sender.last_seen < reap_before:
+                dead.append(sender)
+            elif not sender.offer(ping, self.slow_consumer_policy):
+                overflowed.append(sender)
+
+        if dead:
+            logger.info(f"Reaping {len(dead)} WebSocket connections with no heartbeat")
+        await asyncio.gather(
+            *(
+                self._evict(
+                    s.debate_id, s.websocket, WebSocketCloseCodes.HEARTBEAT_TIMEOUT
+                )
+                for s in dead
+            ),
+            *(
+                self._evict(s.debate_id, s.websocket, WebSocketCloseCodes.SLOW_CONSUMER)
+                for s in overflowed
+            ),
+        )
+
+    def mark_alive(self, websocket: WebSocket) -> None:
+        """Record that the client just sent something (PONG or any action)."""
+        sender = self._senders.get(websocket)
+        if sender is not None:
+            sender.last_seen = time.monotonic()
+
+    def get_heartbeat_stats(self) -> dict[str, int]:
+        """Count connections by how recently their client was heard from."""
+        stale_before = (
+            time.monotonic() - self.heartbeat_interval * HEARTBEAT_STALE_INTERVALS
+        )
+        stale = sum(1 for s in self._senders.values() if s.last_seen < stale_before)
+        return {"live": len(self._senders) - stale, "stale": stale}
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def connect(
+        self,
+        debate_id: str,
+        websocket: WebSocket,
+        codec: FrameCodec = JSON_CODEC,
+        hold: bool = False,
+    ) -> None:
+        """Register a websocket connection for a debate, framed with ``codec``.
+
+        With ``hold`` the socket's broadcast frames are parked until
+        ``release``, which is how a reconnect gets its replay in first.
+        """
         async with self._lock:
-            if debate_id not in self.active_debates:
+            first_local_viewer = debate_id not in self.active_debates
+            if first_local_viewer:
                 self.active_debates[debate_id] = set()
             self.active_debates[debate_id].add(websocket)
+            if websocket not in self._senders:
+                sender = self._attach(debate_id, websocket, codec)
+                if hold:
+                    sender.hold()
+        if first_local_viewer:
+            await self.backplane.subscribe(debate_id)
         logger.info(f"WebSocket connected to debate {debate_id}")
 
     async def disconnect(self, debate_id: str, websocket: WebSocket) -> None:
         """Remove a websocket connection from a debate."""
+        last_local_viewer = False
         async with self._lock:
             if debate_id in self.active_debates:
                 self.active_debates[debate_id].discard(websocket)
                 if not self.active_debates[debate_id]:
                     del self.active_debates[debate_id]
+                    last_local_viewer = True
+            sender = self._senders.pop(websocket, None)
+        if sender is not None:
+            sender.stop()
+        if last_local_viewer:
+            await self.backplane.unsubscribe(debate_id)
         logger.info(f"WebSocket disconnected from debate {debate_id}")
 
     async def broadcast_to_debate(self, debate_id: str, action: dict[str, Any]) -> None:
-        """Send action to all clients watching the debate."""
-        connections = self.active_debates.get(debate_id, set()).copy()
-        disconnected = []
+        """Log action and publish it to every client watching the debate, on any worker."""
+        started = time.monotonic()
+        with profiled(PHASE_BROADCAST):
+            frame = as_frame(action)
+            frame_type = frame.get("type", "unknown")
+            published = False
+            if frame_type not in UNLOGGED_ACTION_TYPES:
+                channel = (
+                    self.backplane.channel(debate_id)
+                    if self.event_log.publishes
+                    else None
+                )
+                seq = await self.event_log.append(debate_id, frame, channel)
+                published = channel is not None and seq is not None
+            if not published:
+                if (
+                    not self.backplane.is_distributed
+                    and debate_id not in self.active_debates
+                ):
+                    return
+                await self.backplane.publish(debate_id, frame)
+        BROADCAST_FRAMES.inc(frame_type)
+        BROADCAST_LATENCY.observe(time.monotonic() - started)
+
+    async def deliver_local(self, debate_id: str, frame: ActionFrame) -> None:
+        """Queue frame for this worker's sockets without awaiting sends."""
+        connections = self.active_debates.get(debate_id)
+        if not connections:
+            return
+        if frame.get("type") == TOKEN_ACTION_TYPE and self.admission.sheds_tokens(
+            debate_id
+        ):
+            self.shed_token_frames += 1
+            return
+        overflowed: list[WebSocket] = []
         for ws in connections:
-            try:
-                await ws.send_json(action)
-            except Exception as e:
-                logger.warning(f"Failed to send to websocket: {e}")
-                disconnected.append(ws)
+            sender = self._senders.get(ws)
+            if sender is not None and not sender.offer(
+                frame, self.slow_consumer_policy
+            ):
+                overflowed.append(ws)
+
+        for ws in overflowed:
+            self._senders[ws].close()
+            self._spawn(self._evict(debate_id, ws, WebSocketCloseCodes.SLOW_CONSUMER))
+
+    async def send_to_connection(
+        self, debate_id: str, websocket: WebSocket, action: dict[str, Any]
+    ) -> None:
+        """Queue action for a single connection behind its pending frames."""
+        sender = self._senders.get(websocket)
+        if sender is None:
+            return
+        if not sender.send(as_frame(action), self.slow_consumer_policy):
+            sender.close()
+            self._spawn(
+                self._evict(debate_id, websocket, WebSocketCloseCodes.SLOW_CONSUMER)
+            )
 
-        for ws in disconnected:
-            await self.disconnect(debate_id, ws)
+    async def release(
+        self,
+        debate_id: str,
+        websocket: WebSocket,
+        lead: dict[str, Any] | None = None,
+        after_seq: int | None = None,
+    ) -> None:
+        """Send ``lead``, then the frames held since ``connect(hold=True)``.
+
+        Held frames with ``seq`` at or below ``after_seq`` are dropped, since
+        ``lead`` (a replay) already carried them.
+        """
+        sender = self._senders.get(websocket)
+        if sender is None:
+            return
+        lead_frame = as_frame(lead) if lead is not None else None
+        if not sender.release(self.slow_consumer_policy, lead_frame, after_seq):
+            sender.close()
+            self._spawn(
+                self._evict(debate_id, websocket, WebSocketCloseCodes.SLOW_CONSUMER)
+            )
+
+    async def _evict(
+        self, debate_id: str, websocket: WebSocket, close_code: int
+    ) -> None:
+        logger.warning(
+            f"Evicting WebSocket from debate {debate_id}: {CLOSE_CODE_REASONS[close_code]}"
+        )
+        await self.disconnect(debate_id, websocket)
+        try:
+            await websocket.close(
+                code=close_code, reason=CLOSE_CODE_REASONS[close_code]
+            )
+        except Exception:
+            pass
+
+    async def drain(self, debate_id: str, timeout: float | None = None) -> None:
+        """Wait until every queued frame for the debate has been written."""
+        senders = [
+            self._senders[ws]
+            for ws in self.active_debates.get(debate_id, set())
+            if ws in self._senders
+        ]
+        if not senders:
+            return
+        await asyncio.wait_for(
+            asyncio.gather(*(s.wait_idle() for s in senders)), timeout=timeout
+        )
 
     def get_connection_count(self, debate_id: str) -> int:
         """Get the number of active connections for a debate."""
         return len(self.active_debates.get(debate_id, set()))
 
+    def get_total_connections(self) -> int:
+        """Get the number of connections on this worker across all debates."""
+        return len(self._senders)
+
+    def has_viewers(self, debate_id: str) -> bool:
+        """Whether a broadcast could reach anyone, counting other workers."""
+        return self.backplane.is_distributed or debate_id in self.active_debates
+
+    def get_backpressure_stats(self, debate_id: str) -> dict[str, int]:
+        """Summarise outbound queue pressure for a debate's connections."""
+        senders = [
+            self._senders[ws]
+            for ws in self.active_debates.get(debate_id, set())
+            if ws in self._senders
+        ]
+        return {
+            "connections": len(senders),
+            "queued_frames": sum(s.queued for s in senders),
+            "max_queued_frames": max((s.queued for s in senders), default=0),
+            "latest_state_connections": sum(1 for s in senders if s.latest_state_only),
+            "dropped_frames": sum(s.dropped_frames for s in senders),
+        }
+
     async def close_all_for_debate(
         self, debate_id: str, code: int = 1000, reason: str = ""
     ) -> None:
-        """Close all connections for a debate."""
+        """Close all connections for a debate after flushing queued frames."""
+        try:
+            await self.drain(debate_id, timeout=CLOSE_DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timed out flushing WebSocket queues for debate {debate_id}"
+            )
         connections = self.active_debates.get(debate_id, set()).copy()
         for ws in connections:
+            sender = self._senders.pop(ws, None)
+            if sender is not None:
+                sender.stop()
             try:
                 await ws.close(code=code, reason=reason)
             except Exception:
@@ -85,6 +550,26 @@ class DebateConnectionManager:
         async with self._lock:
             if debate_id in self.active_debates:
                 del self.active_debates[debate_id]
+        await self.backplane.unsubscribe(debate_id)
+
+    async def close(self) -> None:
+        """Stop writer, heartbeat and eviction tasks and release resources on shutdown."""
+        senders = list(self._senders.values())
+        self._senders.clear()
+        self.active_debates.clear()
+        for sender in senders:
+            sender.stop()
+        tasks = list(self._background)
+        if self._heartbeat_task is not None:
+            tasks.append(self._heartbeat_task)
+            self._heartbeat_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(
+            *tasks, *(s.join() for s in senders), return_exceptions=True
+        )
+        await self.admission.close()
+        await self.backplane.close()
 
 
 connection_manager = DebateConnectionManager()
@@ -107,86 +592,190 @@ async def check_connection_rate_limit(ip: str) -> bool:
         return True
 
 
+class _StreamStats:
+    """Frame rate and token-to-frame latency of one debate's token stream."""
+
+    __slots__ = ("frames", "chars", "started", "last_frame", "latencies")
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.chars = 0
+        self.started = time.monotonic()
+        self.last_frame = self.started
+        self.latencies: deque[float] = deque(maxlen=STREAM_STATS_LATENCY_SAMPLES)
+
+    def record(self, chars: int, latency: float) -> None:
+        self.frames += 1
+        self.chars += chars
+        self.last_frame = time.monotonic()
+        self.latencies.append(latency)
+
+    def snapshot(self) -> dict[str, float | int]:
+        elapsed = max(self.last_frame - self.started, 1e-6)
+        latencies = sorted(self.latencies) or [0.0]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        fps = self.frames / elapsed if self.frames > 1 else 0.0
+        return {
+            "frames": self.frames,
+            "chars": self.chars,
+            "frames_per_sec": round(fps, 2),
+            "avg_latency_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+            "p95_latency_ms": round(p95 * 1000, 2),
+            "max_latency_ms": round(latencies[-1] * 1000, 2),
+        }
+
+
+_stream_stats: "OrderedDict[str, _StreamStats]" = OrderedDict()
+
+
+def _stats_for(debate_id: str) -> _StreamStats:
+    stats = _stream_stats.get(debate_id)
+    if stats is None:
+        stats = _stream_stats[debate_id] = _StreamStats()
+        while len(_stream_stats) > STREAM_STATS_MAX_DEBATES:
+            _stream_stats.popitem(last=False)
+    else:
+        _stream_stats.move_to_end(debate_id)
+    return stats
+
+
+def get_stream_stats(debate_id: str) -> dict[str, float | int] | None:
+    """Token frames/sec and token-to-frame latency for a debate, if it streamed."""
+    stats = _stream_stats.get(debate_id)
+    return stats.snapshot() if stats else None
+
+
+def max_token_fps(viewers: int) -> float:
+    """Token frame-rate cap for an audience of ``viewers`` local sockets.
+
+    Every frame is fanned out to every viewer, so large audiences get fewer,
+    bigger frames: 20 fps for a handful of viewers, 10 fps at 500, never below 4.
+    """
+    scale = 1 + max(viewers, 0) / TOKEN_FPS_VIEWER_SCALE
+    return max(TOKEN_MIN_FPS, TOKEN_MAX_FPS / scale)
+
+
 class TokenStreamingHandler(AsyncCallbackHandler):
     """Streams LLM tokens to WebSocket via connection manager with sanitization.
 
-    Tokens are accumulated. On flush (threshold or LLM end), the ENTIRE
-    accumulated text is sanitized at once so forbidden phrases that span
-    token boundaries are always caught. The handler tracks how much
-    sanitized text has already been sent and only emits the new portion.
+    Tokens are buffered and, on flush, fed through a ``StreamingSanitizer``
+    that redacts incrementally: it holds back only a tail that could still
+    turn into a forbidden phrase, so phrases that span token boundaries are
+    always caught without re-sanitizing the whole argument on every flush.
+
+    Buffered tokens are flushed by whichever comes first: ``_BUFFER_FLUSH_THRESHOLD``
+    new characters, or ``_MAX_FLUSH_LATENCY`` seconds after the oldest unsent
+    token (enforced by a timer, so a stalled model still reaches the screen).
+    Either way flushes are spaced by a frame-rate cap scaled by ``viewers``
+    and by ``fps_scale``, which admission control lowers under load.
     """
 
-    _TAIL_OVERLAP = 20
     _BUFFER_FLUSH_THRESHOLD = 80
+    _MAX_FLUSH_LATENCY = 0.05
 
     def __init__(
         self,
         manager: DebateConnectionManager,
         debate_id: str,
         agent: str,
+        viewers: int = 0,
+        fps_scale: float = 1.0,
     ):
         self.manager = manager
         self.debate_id = debate_id
         self.agent = agent
-        self._accumulated: str = ""
-        self._sanitized_sent: int = 0
-
-    def _sanitize_text(self, text: str) -> str:
-        from app.services.debate.sanitization import sanitize_response
-
-        return sanitize_response(text)
-
-    async def _try_flush(self) -> None:
-        if len(self._accumulated) < self._BUFFER_FLUSH_THRESHOLD:
-            return
-        full_sanitized = self._sanitize_text(self._accumulated)
-        new_part = full_sanitized[self._sanitized_sent :]
-        if not new_part:
-            return
-        self._sanitized_sent = max(0, len(full_sanitized) - self._TAIL_OVERLAP)
+        self._pending_text: str = ""
+        self._sanitizer = StreamingSanitizer()
+        self._min_frame_interval = 1.0 / (max_token_fps(viewers) * fps_scale)
+        self._pending_chars = 0
+        self._pending_since: float | None = None
+        self._last_flush = float("-inf")
+        self._timer: asyncio.Task | None = None
+        self._timer_at = 0.0
+        self._flush_lock = asyncio.Lock()
+
+    async def _broadcast(self, new_part: str) -> None:
         try:
-            action = WebSocketAction(
-                type="DEBATE/TOKEN_RECEIVED",
-                payload={
+            frame = build_frame(
+                TOKEN_ACTION_TYPE,
+                {
                     "debateId": self.debate_id,
                     "agent": self.agent,
                     "token": new_part,
                 },
             )
-            await self.manager.broadcast_to_debate(
-                self.debate_id, action.model_dump(by_alias=True)
-            )
+            await self.manager.broadcast_to_debate(self.debate_id, frame)
         except Exception as e:
             logger.warning(f"Failed to broadcast token: {e}")
 
+    def _take_pending(self) -> float:
+        """Reset the pending window and return how long its oldest token waited."""
+        now = time.monotonic()
+        latency = now - self._pending_since if self._pending_since is not None else 0.0
+        self._pending_chars = 0
+        self._pending_since = None
+        self._last_flush = now
+        return latency
+
+    async def _try_flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending_chars:
+                return
+            latency = self._take_pending()
+            new_part = self._sanitizer.feed(self._pending_text)
+            self._pending_text = ""
+            if not new_part:
+                return
+            _stats_for(self.debate_id).record(len(new_part), latency)
+            await self._broadcast(new_part)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    def _schedule_flush(self, due: float) -> None:
+        if self._timer is not None and self._timer_at <= due:
+            return
+        self._cancel_timer()
+        self._timer_at = due
+        self._timer = asyncio.ensure_future(self._flush_at(due))
+
+    async def _flush_at(self, due: float) -> None:
+        await asyncio.sleep(max(0.0, due - time.monotonic()))
+        self._timer = None
+        await self._try_flush()
+
     async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
-        self._accumulated += token
-        if len(self._accumulated) >= self._BUFFER_FLUSH_THRESHOLD:
-            await self._try_flush()
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        self._pending_text += token
+        self._pending_chars += len(token)
+
+        next_frame = self._last_flush + self._min_frame_interval
+        if self._pending_chars >= self._BUFFER_FLUSH_THRESHOLD:
+            if now >= next_frame:
+                self._cancel_timer()
+                await self._try_flush()
+                return
+            self._schedule_flush(next_frame)
+        else:
+            deadline = self._pending_since + self._MAX_FLUSH_LATENCY
+            self._schedule_flush(max(deadline, next_frame))
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self._cancel_timer()
 
     async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
-        if not self._accumulated:
-            return
-        full_sanitized = self._sanitize_text(self._accumulated)
-        new_part = full_sanitized[self._sanitized_sent :]
-        self._accumulated = ""
-        self._sanitized_sent = 0
+        self._cancel_timer()
+        latency = self._take_pending()
+        new_part = self._sanitizer.feed(self._pending_text) + self._sanitizer.finish()
+        self._pending_text = ""
         if not new_part:
             return
-        try:
-            action = WebSocketAction(
-                type="DEBATE/TOKEN_RECEIVED",
-                payload={
-                    "debateId": self.debate_id,
-                    "agent": self.agent,
-                    "token": new_part,
-                },
-            )
-            await self.manager.broadcast_to_debate(
-                self.debate_id, action.model_dump(by_alias=True)
-            )
-        except Exception as e:
-            logger.warning(f"Failed to broadcast token: {e}")
+        _stats_for(self.debate_id).record(len(new_part), latency)
+        await self._broadcast(new_part)
 
 
 class DebateStreamState:
@@ -224,44 +813,52 @@ async def send_connected_action(
     manager: DebateConnectionManager, debate_id: str, status: str
 ) -> None:
     """Send DEBATE/CONNECTED action to all viewers."""
-    action = WebSocketAction(
-        type="DEBATE/CONNECTED",
-        payload={"debateId": debate_id, "status": status},
-    )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
+    frame = build_frame("DEBATE/CONNECTED", {"debateId": debate_id, "status": status})
+    await manager.broadcast_to_debate(debate_id, frame)
+
+
+async def send_replay(
+    manager: DebateConnectionManager,
+    debate_id: str,
+    websocket: WebSocket,
+    since: int,
+) -> None:
+    """Send one DEBATE/REPLAY frame with every logged action after ``since``.
+
+    The socket must have connected with ``hold=True``: the frames broadcast
+    meanwhile are released behind the replay, minus those it already holds.
+    """
+    frame = await manager.event_log.replay(debate_id, since)
+    last_seq = frame["payload"]["lastSeq"] if frame is not None else None
+    await manager.release(debate_id, websocket, frame, after_seq=last_seq)
 
 
 async def send_status_update(
     manager: DebateConnectionManager, debate_id: str, status: str
 ) -> None:
     """Send DEBATE/STATUS_UPDATE action to all viewers."""
-    action = WebSocketAction(
-        type="DEBATE/STATUS_UPDATE",
-        payload={"debateId": debate_id, "status": status},
+    frame = build_frame(
+        "DEBATE/STATUS_UPDATE", {"debateId": debate_id, "status": status}
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
+    await manager.broadcast_to_debate(debate_id, frame)
 
 
 async def send_turn_change(
     manager: DebateConnectionManager, debate_id: str, current_agent: str
 ) -> None:
     """Send DEBATE/TURN_CHANGE action to all viewers."""
-    action = WebSocketAction(
-        type="DEBATE/TURN_CHANGE",
-        payload={"debateId": debate_id, "currentAgent": current_agent},
+    frame = build_frame(
+        "DEBATE/TURN_CHANGE", {"debateId": debate_id, "currentAgent": current_agent}
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
+    await manager.broadcast_to_debate(debate_id, frame)
 
 
 async def send_error(
     manager: DebateConnectionManager, debate_id: str, code: str, message: str
 ) -> None:
     """Send DEBATE/ERROR action to all viewers."""
-    action = WebSocketAction(
-        type="DEBATE/ERROR",
-        payload={"code": code, "message": message},
-    )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
+    frame = build_frame("DEBATE/ERROR", {"code": code, "message": message})
+    await manager.broadcast_to_debate(debate_id, frame)
 
 
 async def send_argument_complete(
@@ -282,33 +879,9 @@ async def send_argument_complete(
         is_redacted=is_redacted,
         redacted_phrases=redacted_phrases or [],
     )
-    action = WebSocketAction(
-        type="DEBATE/ARGUMENT_COMPLETE",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/ARGUMENT_COMPLETE", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
-
-
-async def heartbeat(
-    websocket: WebSocket,
-    manager: DebateConnectionManager,
-    debate_id: str,
-    stop_event: asyncio.Event,
-) -> None:
-    """Send periodic pings to keep connection alive."""
-    while not stop_event.is_set():
-        try:
-            await asyncio.sleep(HEARTBEAT_INTERVAL)
-            if not stop_event.is_set():
-                action = WebSocketAction(
-                    type="DEBATE/PING",
-                    payload={},
-                )
-                await websocket.send_json(action.model_dump(by_alias=True))
-        except asyncio.CancelledError:
-            break
-        except Exception:
-            break
 
 
 async def send_data_stale(
@@ -323,11 +896,9 @@ async def send_data_stale(
         age_seconds=freshness.age_seconds,
         message=f"Market data is {freshness.age_seconds} seconds old",
     )
-    action = WebSocketAction(
-        type="DEBATE/DATA_STALE",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/DATA_STALE", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_data_refreshed(
@@ -339,11 +910,9 @@ async def send_data_refreshed(
         debate_id=debate_id,
         message="Market data has been refreshed",
     )
-    action = WebSocketAction(
-        type="DEBATE/DATA_REFRESHED",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/DATA_REFRESHED", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_reasoning_node(
@@ -370,11 +939,9 @@ async def send_reasoning_node(
         is_winning=is_winning,
         turn=turn,
     )
-    action = WebSocketAction(
-        type="DEBATE/REASONING_NODE",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/REASONING_NODE", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_guardian_interrupt(
@@ -397,11 +964,9 @@ async def send_guardian_interrupt(
         summary_verdict=summary_verdict,
         turn=turn,
     )
-    action = WebSocketAction(
-        type="DEBATE/GUARDIAN_INTERRUPT",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/GUARDIAN_INTERRUPT", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_guardian_verdict(
@@ -422,11 +987,9 @@ async def send_guardian_verdict(
         reasoning=reasoning,
         total_interrupts=total_interrupts,
     )
-    action = WebSocketAction(
-        type="DEBATE/GUARDIAN_VERDICT",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/GUARDIAN_VERDICT", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_debate_paused(
@@ -445,11 +1008,9 @@ async def send_debate_paused(
         summary_verdict=summary_verdict,
         turn=turn,
     )
-    action = WebSocketAction(
-        type="DEBATE/DEBATE_PAUSED",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/DEBATE_PAUSED", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 async def send_debate_resumed(
@@ -462,11 +1023,9 @@ async def send_debate_resumed(
         debate_id=debate_id,
         turn=turn,
     )
-    action = WebSocketAction(
-        type="DEBATE/DEBATE_RESUMED",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/DEBATE_RESUMED", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
 
 
 FOREX_PRICE_POLL_INTERVAL = 15
@@ -493,8 +1052,6 @@ async def send_forex_price_update(
         spread=spread,
         timestamp=datetime.now(timezone.utc).isoformat(),
     )
-    action = WebSocketAction(
-        type="DEBATE/FOREX_PRICE_UPDATE",
-        payload=payload.model_dump(by_alias=True),
+    await manager.broadcast_to_debate(
+        debate_id, build_frame("DEBATE/FOREX_PRICE_UPDATE", payload)
     )
-    await manager.broadcast_to_debate(debate_id, action.model_dump(by_alias=True))
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import os
+import socket
+
+from app.services.debate import DebateService
+from app.services.debate.scheduler import (
+    WORKER_HEARTBEAT_INTERVAL,
+    DebateScheduler,
+    RedisDebateScheduler,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DebateWorker:
+    """Runs debates that web processes queued in Redis (worker mode).
+
+    The worker pops a job only when its own ``DebateScheduler`` has a free
+    slot, so jobs it cannot start yet stay in the shared queue for other
+    workers. It also resumes orphaned debates like a web process would, and
+    reports its slots and average run time for the web side's queue ETAs.
+    """
+
+    def __init__(
+        self,
+        service: DebateService | None = None,
+        queue: RedisDebateScheduler | None = None,
+        worker_id: str | None = None,
+        pop_timeout: float = 1.0,
+    ) -> None:
+        self.service = service or DebateService(execution_mode="local")
+        if not isinstance(self.service.scheduler, DebateScheduler):
+            raise ValueError("DebateWorker needs a service in local execution mode")
+        self.scheduler: DebateScheduler = self.service.scheduler
+        self.queue = queue or RedisDebateScheduler()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.pop_timeout = pop_timeout
+        self._heartbeat_task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        """Pull and start jobs until cancelled."""
+        self.service.start_recovery()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        logger.info(
+            f"Debate worker {self.worker_id} started with "
+            f"{self.scheduler.max_concurrent} slots"
+        )
+        while True:
+            await self.scheduler.wait_for_slot()
+            try:
+                job = await self.queue.pop(timeout=self.pop_timeout)
+            except Exception as e:
+                logger.warning(f"Debate queue pop failed: {e}")
+                await asyncio.sleep(self.pop_timeout)
+                continue
+            if job is not None:
+                logger.info(f"Worker {self.worker_id} picked up debate {job.debate_id}")
+                await self.scheduler.submit(job, force=True)
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await self.queue.report(
+                self.worker_id,
+                self.scheduler.max_concurrent,
+                self.scheduler.average_run_seconds,
+            )
+            await asyncio.sleep(WORKER_HEARTBEAT_INTERVAL)
+
+    async def shutdown(self) -> None:
+        """Stop heartbeating, then drain running debates like a web process."""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        await self.queue.withdraw(self.worker_id)
+        await self.service.drain()
+        await self.service.close()
@@ -25,6 +25,7 @@ WebSocketActionType = Literal[
     "DEBATE/GUARDIAN_INTERRUPT_ACK",
     "DEBATE/VOTE_UPDATE",
     "DEBATE/FOREX_PRICE_UPDATE",
+    "DEBATE/REPLAY",
 ]
 
 
@@ -100,6 +101,8 @@ class ErrorPayload(BaseModel):
 
     code: str
     message: str
+    # Seconds the client should wait before reconnecting, when it may retry.
+    retry_after: int | None = Field(default=None, serialization_alias="retryAfter")
 
 
 class WebSocketCloseCodes:
@@ -108,7 +111,9 @@ class WebSocketCloseCodes:
     UNAUTHORIZED = 4001
     ORIGIN_NOT_ALLOWED = 4003
     DEBATE_NOT_FOUND = 4004
+    SLOW_CONSUMER = 4008
     DEBATE_ALREADY_RUNNING = 4009
+    HEARTBEAT_TIMEOUT = 4010
     RATE_LIMITED = 4029
     INTERNAL_ERROR = 4500
 
@@ -117,7 +122,9 @@ CLOSE_CODE_REASONS = {
     WebSocketCloseCodes.UNAUTHORIZED: "Unauthorized",
     WebSocketCloseCodes.ORIGIN_NOT_ALLOWED: "Origin not allowed",
     WebSocketCloseCodes.DEBATE_NOT_FOUND: "Debate not found",
+    WebSocketCloseCodes.SLOW_CONSUMER: "Client too slow",
     WebSocketCloseCodes.DEBATE_ALREADY_RUNNING: "Debate already running",
+    WebSocketCloseCodes.HEARTBEAT_TIMEOUT: "Heartbeat timeout",
     WebSocketCloseCodes.RATE_LIMITED: "Rate limited",
     WebSocketCloseCodes.INTERNAL_ERROR: "Internal error",
 }
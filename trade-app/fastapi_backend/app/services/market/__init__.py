@@ -19,6 +19,7 @@ from app.services.market.schemas import (
     TechnicalIndicators,
     ForexMeta,
 )
+from app.services.metrics import MARKET_CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +65,10 @@ class MarketDataService:
             and self.cache.is_cache_valid(cached_data)
             and not mock_providers_down
         ):
+            MARKET_CACHE_REQUESTS.inc(self.provider.get_name(), "hit")
             latency_ms = int((time.time() - start_time) * 1000)
             return cached_data, MarketMeta(latency_ms=latency_ms, provider="cache")
+        MARKET_CACHE_REQUESTS.inc(self.provider.get_name(), "miss")
 
         if mock_providers_down:
             if cached_data:
@@ -0,0 +1,254 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from app.config import settings
+from app.services.market.schemas import FreshnessStatus
+from app.services.market.stale_data_guardian import StaleDataGuardian
+from app.services.market.twelvedata_provider import (
+    TwelveDataForexProvider,
+    is_forex_asset,
+)
+
+logger = logging.getLogger(__name__)
+
+FRESHNESS_CHECK_INTERVAL = 5
+PRICE_POLL_INTERVAL = 15
+
+
+@dataclass(frozen=True)
+class PriceTick:
+    asset: str
+    price: float
+    previous_price: float | None = None
+    change_pct: float | None = None
+
+
+StaleCallback = Callable[[FreshnessStatus], Awaitable[None]]
+PriceCallback = Callable[[PriceTick], Awaitable[None]]
+
+
+@dataclass(eq=False)
+class WatchSubscription:
+    asset: str
+    on_stale: StaleCallback | None = None
+    on_price: PriceCallback | None = None
+    # Stale is terminal for a debate, so each subscriber hears it once.
+    stale_notified: bool = False
+
+
+@dataclass(eq=False)
+class _AssetWatch:
+    asset: str
+    subscribers: list[WatchSubscription] = field(default_factory=list)
+    freshness_task: asyncio.Task | None = None
+    price_task: asyncio.Task | None = None
+    last_price: float | None = None
+
+
+class MarketWatcherHub:
+    """One freshness poller and one price poller per asset, shared by debates.
+
+    Debates ``subscribe`` to an asset with callbacks; the hub starts that
+    asset's pollers on the first subscriber, fans each event out to every
+    subscriber concurrently, and stops the pollers when the last one
+    leaves. All pollers share a single ``StaleDataGuardian`` (one Redis
+    client) and a single ``TwelveDataForexProvider`` (one HTTP client).
+    """
+
+    def __init__(
+        self,
+        stale_guardian: StaleDataGuardian | None = None,
+        price_provider: TwelveDataForexProvider | None = None,
+        freshness_interval: float = FRESHNESS_CHECK_INTERVAL,
+        price_interval: float = PRICE_POLL_INTERVAL,
+    ):
+        self._guardian = stale_guardian
+        self._owns_guardian = stale_guardian is None
+        self._provider = price_provider
+        self._owns_provider = price_provider is None
+        self.freshness_interval = freshness_interval
+        self.price_interval = price_interval
+        self._watches: dict[str, _AssetWatch] = {}
+
+    @property
+    def guardian(self) -> StaleDataGuardian:
+        if self._guardian is None:
+            self._guardian = StaleDataGuardian(cache_redis_url=settings.REDIS_URL)
+        return self._guardian
+
+    def _price_provider(self) -> TwelveDataForexProvider | None:
+        if self._provider is None and settings.TWELVEDATA_API_KEY:
+            self._provider = TwelveDataForexProvider(
+                api_key=settings.TWELVEDATA_API_KEY,
+                base_url=settings.TWELVEDATA_BASE_URL,
+            )
+        return self._provider
+
+    async def check_freshness(self, asset: str) -> FreshnessStatus:
+        return await self.guardian.get_freshness_status(asset)
+
+    def subscribe(
+        self,
+        asset: str,
+        *,
+        on_stale: StaleCallback | None = None,
+        on_price: PriceCallback | None = None,
+    ) -> WatchSubscription:
+        """Register callbacks for ``asset``, starting its pollers if needed.
+
+        Price ticks are only polled for forex assets and only when a price
+        provider is available.
+        """
+        key = asset.lower()
+        watch = self._watches.get(key)
+        if watch is None:
+            watch = _AssetWatch(asset=asset)
+            self._watches[key] = watch
+        subscription = WatchSubscription(
+            asset=asset, on_stale=on_stale, on_price=on_price
+        )
+        watch.subscribers.append(subscription)
+
+        if on_stale is not None and watch.freshness_task is None:
+            watch.freshness_task = asyncio.create_task(self._watch_freshness(watch))
+        if (
+            on_price is not None
+            and watch.price_task is None
+            and is_forex_asset(asset)
+            and self._price_provider() is not None
+        ):
+            watch.price_task = asyncio.create_task(self._watch_price(watch))
+        return subscription
+
+    async def unsubscribe(self, subscription: WatchSubscription) -> None:
+        key = subscription.asset.lower()
+        watch = self._watches.get(key)
+        if watch is None or subscription not in watch.subscribers:
+            return
+        watch.subscribers.remove(subscription)
+        if watch.subscribers:
+            return
+        del self._watches[key]
+        await self._stop(watch)
+
+    async def close(self) -> None:
+        watches = list(self._watches.values())
+        self._watches.clear()
+        for watch in watches:
+            await self._stop(watch)
+        if self._owns_guardian and self._guardian is not None:
+            await self._guardian.close()
+            self._guardian = None
+        if self._owns_provider and self._provider is not None:
+            await self._provider.close()
+            self._provider = None
+
+    def get_stats(self) -> dict[str, Any]:
+        watches = list(self._watches.values())
+        return {
+            "assets": len(watches),
+            "subscribers": sum(len(w.subscribers) for w in watches),
+            "freshness_pollers": sum(1 for w in watches if w.freshness_task),
+            "price_pollers": sum(1 for w in watches if w.price_task),
+        }
+
+    @staticmethod
+    async def _stop(watch: _AssetWatch) -> None:
+        current = asyncio.current_task()
+        for task in (watch.freshness_task, watch.price_task):
+            if task is None or task is current:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @staticmethod
+    async def _fan_out(asset: str, deliveries: list[Awaitable[None]]) -> None:
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Market watcher subscriber failed for {asset}: {result}"
+                )
+
+    async def _watch_freshness(self, watch: _AssetWatch) -> None:
+        try:
+            while True:
+                try:
+                    await self._check_and_notify(watch)
+                except Exception as e:
+                    # One bad Redis read must not stop monitoring for every
+                    # debate on the asset; try again on the next tick.
+                    logger.error(f"Freshness watcher error for {watch.asset}: {e}")
+                await asyncio.sleep(self.freshness_interval)
+        except asyncio.CancelledError:
+            pass
+
+    async def _check_and_notify(self, watch: _AssetWatch) -> None:
+        freshness = await self.guardian.get_freshness_status(watch.asset)
+        if not freshness.is_stale:
+            return
+        pending = [s for s in watch.subscribers if s.on_stale and not s.stale_notified]
+        if not pending:
+            return
+        logger.warning(
+            f"Data stale detected for {watch.asset}: {freshness.age_seconds}s old, "
+            f"notifying {len(pending)} subscriber(s)"
+        )
+        for subscription in pending:
+            subscription.stale_notified = True
+        await self._fan_out(
+            watch.asset, [s.on_stale(freshness) for s in pending if s.on_stale]
+        )
+
+    async def _watch_price(self, watch: _AssetWatch) -> None:
+        provider = self._price_provider()
+        if provider is None:
+            return
+        try:
+            while True:
+                try:
+                    result = await provider.fetch_price(watch.asset)
+                    if result and result.get("price"):
+                        price = result["price"]
+                        previous = watch.last_price
+                        change_pct = None
+                        if previous is not None and previous > 0:
+                            change_pct = round(((price - previous) / previous) * 100, 4)
+                        tick = PriceTick(
+                            asset=watch.asset,
+                            price=price,
+                            previous_price=previous,
+                            change_pct=change_pct,
+                        )
+                        watch.last_price = price
+                        await self._fan_out(
+                            watch.asset,
+                            [s.on_price(tick) for s in watch.subscribers if s.on_price],
+                        )
+                except Exception as e:
+                    logger.debug(f"Forex price poll error for {watch.asset}: {e}")
+                await asyncio.sleep(self.price_interval)
+        except asyncio.CancelledError:
+            pass
+
+
+_hub_instance: MarketWatcherHub | None = None
+
+
+def get_market_watcher() -> MarketWatcherHub:
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = MarketWatcherHub()
+    return _hub_instance
+
+
+async def close_market_watcher() -> None:
+    global _hub_instance
+    if _hub_instance is not None:
+        await _hub_instance.close()
+        _hub_instance = None
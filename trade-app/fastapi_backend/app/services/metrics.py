@@ -0,0 +1,305 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Each worker process aggregates into plain dicts and lists. Everything runs on
+the event loop thread, so recording is a couple of dict/list updates with no
+locks, which keeps it cheap enough for per-token paths. A scraper hits every
+worker's ``/metrics`` and sums across them.
+
+Values that are cheaper to read than to track (queue depths, viewer counts)
+are gauges set at scrape time by the ``/metrics`` route.
+"""
+
+from bisect import bisect_left
+from typing import Iterable
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+LLM_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labelvalues: tuple[str, ...]) -> tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {labelvalues}"
+            )
+        return labelvalues
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        key = self._key(labelvalues)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        self._values[self._key(labelvalues)] = value
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        key = self._key(labelvalues)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        self.inc(*labelvalues, amount=-amount)
+
+    def replace(self, values: dict[tuple[str, ...], float]) -> None:
+        """Swap in a full set of labelled values (drops series no longer present)."""
+        self._values = {self._key(key): value for key, value in values.items()}
+
+    def get(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (+Inf last), then sum.
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[self._key(labelvalues)] = [0] * (
+                len(self.buckets) + 2
+            )
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self) -> list[str]:
+        lines: list[str] = []
+        for key, series in self._series.items():
+            cumulative = 0
+            for bound, hits in zip((*self.buckets, float("inf")), series[:-1]):
+                cumulative += hits
+                le = _labels((*self.labelnames, "le"), (*key, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{le} {int(cumulative)}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{labels} {int(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# --- Debates and WebSockets ---
+
+DEBATES_ACTIVE = REGISTRY.gauge(
+    "debates_active", "Debates currently running in this process."
+)
+DEBATES_QUEUED = REGISTRY.gauge(
+    "debates_queued", "Debates waiting for a run slot (shared queue in worker mode)."
+)
+DEBATE_VIEWERS = REGISTRY.gauge(
+    "debate_viewers",
+    "WebSocket viewers connected to this process, per debate.",
+    ("debate_id",),
+)
+WEBSOCKET_CONNECTIONS = REGISTRY.gauge(
+    "websocket_connections", "WebSocket connections open on this process."
+)
+BROADCAST_FRAMES = REGISTRY.counter(
+    "debate_broadcast_frames_total",
+    "Frames broadcast to debates, by action type.",
+    ("type",),
+)
+BROADCAST_LATENCY = REGISTRY.histogram(
+    "debate_broadcast_seconds",
+    "Time to log and publish one broadcast frame.",
+    buckets=FAST_BUCKETS,
+)
+
+# --- LLM ---
+
+LLM_CALL_LATENCY = REGISTRY.histogram(
+    "llm_call_seconds", "LLM call latency by agent.", ("agent",), buckets=LLM_BUCKETS
+)
+LLM_QUEUE_SECONDS = REGISTRY.histogram(
+    "llm_queue_seconds",
+    "Time LLM calls waited for the governor, by priority class.",
+    ("priority",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+LLM_CALLS_INFLIGHT = REGISTRY.gauge(
+    "llm_calls_inflight", "LLM calls admitted by the governor and not finished."
+)
+LLM_CALLS_QUEUED = REGISTRY.gauge(
+    "llm_calls_queued", "LLM calls waiting for the governor."
+)
+LLM_PROVIDER_HEALTH = REGISTRY.gauge(
+    "llm_provider_health",
+    "Weighted recent success rate of each provider in the LLM chain.",
+    ("provider",),
+)
+LLM_HEDGES = REGISTRY.counter(
+    "llm_hedges_total",
+    "Hedged LLM requests by outcome (fired/primary_won/backup_won).",
+    ("outcome",),
+)
+LLM_CACHE_REQUESTS = REGISTRY.counter(
+    "llm_cache_requests_total",
+    "LLM response cache lookups by call site and result (hit/miss/error).",
+    ("site", "result"),
+)
+LLM_CACHE_EVICTIONS = REGISTRY.counter(
+    "llm_cache_evictions_total",
+    "LLM response cache entries evicted to stay under the size bound.",
+    ("site",),
+)
+LLM_FAILOVERS = REGISTRY.counter(
+    "llm_failovers_total",
+    "LLM calls retried on the next provider after an error, by that provider.",
+    ("provider",),
+)
+
+# --- Market data ---
+
+MARKET_CACHE_REQUESTS = REGISTRY.counter(
+    "market_cache_requests_total",
+    "Market data cache lookups by provider and result (hit/miss).",
+    ("provider", "result"),
+)
+
+# --- Rate limiting ---
+
+RATE_LIMIT_DECISIONS = REGISTRY.counter(
+    "rate_limit_decisions_total",
+    "Rate limiter decisions by limiter and decision (allow/deny).",
+    ("limiter", "decision"),
+)
+
+# --- Audit ---
+
+AUDIT_QUEUE_DEPTH = REGISTRY.gauge(
+    "audit_queue_depth", "Events waiting in the QueuedAuditWriter queue."
+)
+AUDIT_BATCH_LATENCY = REGISTRY.histogram(
+    "audit_batch_seconds", "Time to write one audit batch, retries included."
+)
+AUDIT_DLQ_WRITES = REGISTRY.counter(
+    "audit_dlq_writes_total", "Audit events sent to the dead-letter queue."
+)
+AUDIT_DLQ_SIZE = REGISTRY.gauge(
+    "audit_dlq_size", "Rows in the audit dead-letter queue."
+)
+
+# --- Archival ---
+
+ARCHIVE_RETRIES = REGISTRY.counter(
+    "debate_archive_retries_total", "Archive attempts that failed and were retried."
+)
+ARCHIVE_FAILURES = REGISTRY.counter(
+    "debate_archive_failures_total", "Debates whose archival failed every attempt."
+)
@@ -3,6 +3,7 @@ import time
 import uuid
 from dataclasses import dataclass
 
+from app.services.metrics import RATE_LIMIT_DECISIONS
 from app.services.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,7 @@ class RateLimiter:
                 reset_at = now + self.window_seconds
 
             allowed = current <= self.max_requests
+            RATE_LIMIT_DECISIONS.inc(self.prefix, "allow" if allowed else "deny")
             remaining = max(0, self.max_requests - current)
 
             return RateLimitResult(
@@ -67,6 +69,7 @@ class RateLimiter:
             )
         except Exception as e:
             logger.warning(f"Redis rate limit check failed, allowing request: {e}")
+            RATE_LIMIT_DECISIONS.inc(self.prefix, "fail_open")
             return RateLimitResult(
                 allowed=True,
                 current=0,
@@ -127,6 +130,7 @@ class UniqueVoterCapacityLimiter:
             await redis.expire(key, self.ttl_seconds)
 
             allowed = current <= self.max_voters
+            RATE_LIMIT_DECISIONS.inc(self.prefix, "allow" if allowed else "deny")
             remaining = max(0, self.max_voters - current)
 
             if not allowed:
@@ -144,6 +148,7 @@ class UniqueVoterCapacityLimiter:
             logger.warning(
                 f"Redis unique voter capacity check failed, allowing request: {e}"
             )
+            RATE_LIMIT_DECISIONS.inc(self.prefix, "fail_open")
             return RateLimitResult(
                 allowed=True,
                 current=0,
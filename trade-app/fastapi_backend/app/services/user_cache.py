@@ -0,0 +1,102 @@
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Backplane control message dropping one user from every worker's cache.
+USER_INVALIDATE_CONTROL = "user_invalidate"
+
+
+class UserCache:
+    """Process-local TTL/LRU cache of the user fields WebSocket handshakes need.
+
+    Only active users are cached. Entries expire after ``ttl_seconds``; when a
+    user is updated or deleted, ``invalidate_user`` drops the entry here and
+    on every other worker straight away.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        self.ttl_seconds = (
+            settings.WS_USER_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        )
+        self.max_size = settings.WS_USER_CACHE_SIZE if max_size is None else max_size
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> dict[str, Any] | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, user_id: str, user: dict[str, Any]) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str | uuid.UUID) -> None:
+        self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+async def load_active_user(user_id: str) -> dict[str, Any] | None:
+    """Fetch a user's handshake fields from the database; None if missing or inactive."""
+    from app.database import async_session_maker
+    from app.models import User
+
+    try:
+        parsed_id = uuid.UUID(user_id)
+    except ValueError:
+        return None
+    async with async_session_maker() as session:
+        user = await session.get(User, parsed_id)
+        if user is None or not user.is_active:
+            return None
+        return {"id": str(user.id), "email": user.email}
+
+
+user_cache = UserCache()
+
+
+async def invalidate_user(user_id: str | uuid.UUID) -> None:
+    """Drop ``user_id`` from this worker's cache and, via the backplane, all others."""
+    # Imported here: the debate stack is heavy and app.users imports this module.
+    from app.services.debate.streaming import connection_manager
+
+    user_cache.invalidate(user_id)
+    if not await connection_manager.backplane.publish_control(
+        {"type": USER_INVALIDATE_CONTROL, "user_id": str(user_id)}
+    ):
+        logger.warning(
+            f"User {user_id} invalidated on this worker only; "
+            "others keep it until their cache entry expires"
+        )
+
+
+async def apply_user_cache_control(message: dict[str, Any]) -> None:
+    """Apply a user invalidation another worker published over the backplane."""
+    if message.get("type") == USER_INVALIDATE_CONTROL:
+        user_cache.invalidate(message["user_id"])
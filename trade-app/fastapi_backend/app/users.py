@@ -1,7 +1,7 @@
 import uuid
 import re
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastapi import Depends, Request
 from fastapi_users import (
@@ -23,6 +23,7 @@ from .database import get_user_db
 from .email import send_reset_password_email
 from .models import User
 from .schemas import UserCreate
+from .services.user_cache import invalidate_user
 
 AUTH_URL_PATH = "auth"
 
@@ -44,6 +45,19 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     ):
         print(f"Verification requested for user {user.id}. Verification token: {token}")
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: Dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        # WebSocket handshakes trust cached users; drop this one on every
+        # worker so a deactivation or e-mail change is seen on the next connect.
+        await invalidate_user(user.id)
+
+    async def on_after_delete(self, user: User, request: Optional[Request] = None):
+        await invalidate_user(user.id)
+
     async def validate_password(
         self,
         password: str,
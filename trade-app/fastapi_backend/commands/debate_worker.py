@@ -0,0 +1,45 @@
+"""Debate worker process for ``DEBATE_EXECUTION_MODE=worker``.
+
+Web processes then only queue debates in Redis; each worker runs up to
+``DEBATE_MAX_CONCURRENT`` of them, so LLM capacity scales independently of
+the web tier. Run as many as needed:
+
+    DEBATE_EXECUTION_MODE=worker WS_BACKPLANE=redis python -m commands.debate_worker
+
+SIGINT/SIGTERM stop pulling jobs and give running debates
+``DEBATE_DRAIN_TIMEOUT_SECONDS`` to finish before handing them off.
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+
+from app.services.debate.checkpoints import close_checkpointer, open_checkpointer
+from app.services.debate.streaming import connection_manager
+from app.services.debate.worker import DebateWorker
+from app.services.market.watcher import close_market_watcher
+from app.services.redis_client import close_redis_client
+
+
+async def main() -> None:
+    await open_checkpointer()
+    worker = DebateWorker()
+    loop = asyncio.get_running_loop()
+    run = asyncio.create_task(worker.run())
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, run.cancel)
+    try:
+        with contextlib.suppress(asyncio.CancelledError):
+            await run
+    finally:
+        await worker.shutdown()
+        await close_checkpointer()
+        await close_market_watcher()
+        await connection_manager.close()
+        await close_redis_client()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,559 @@
+"""Load-test harness for the debate WebSocket fan-out path.
+
+Drives thousands of in-process fake clients (some slow, some failing) through
+three scenarios and prints one JSON document of results:
+
+* ``broadcast`` - ``DebateConnectionManager.broadcast_to_debate`` fan-out
+* ``tokens``    - ``TokenStreamingHandler`` fed at a steady token rate
+* ``route``     - full ``/ws/debate/{id}`` handshakes over ASGI, then fan-out
+
+Each scenario reports fan-out latency percentiles (event-log append to client
+``send``), delivered-frame throughput, memory per connection and event-loop
+lag. Redis, the database and auth are replaced with in-process stand-ins so
+only the streaming stack is measured.
+
+    python -m commands.ws_load_test --clients 5000 --slow-ratio 0.05 \\
+        --fail-ratio 0.01 --output ws-load.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+from unittest.mock import patch
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.services.debate.admission import AdmissionController  # noqa: E402
+from app.services.debate.backplane import InMemoryBackplane  # noqa: E402
+from app.services.debate.event_log import InMemoryEventLog  # noqa: E402
+from app.services.debate.frames import ActionFrame, build_frame  # noqa: E402
+from app.services.debate.streaming import (  # noqa: E402
+    DebateConnectionManager,
+    TokenStreamingHandler,
+    get_stream_stats,
+)
+
+HARNESS_VERSION = 1
+SCENARIOS = ("broadcast", "tokens", "route")
+LOOP_LAG_INTERVAL = 0.005
+DEBATE_ID = "load-test"
+
+
+@dataclass
+class LoadTestConfig:
+    clients: int = 1000
+    frames: int = 100
+    tokens: int = 400
+    token_interval: float = 0.002
+    slow_ratio: float = 0.0
+    slow_delay: float = 0.05
+    fail_ratio: float = 0.0
+    fail_after: int = 5
+    queue_size: int = 256
+    slow_consumer_policy: str = "latest_state"
+    drain_timeout: float = 30.0
+    seed: int = 7
+    scenarios: list[str] = field(default_factory=lambda: list(SCENARIOS))
+
+
+class _TimedEventLog(InMemoryEventLog):
+    """Event log that remembers when each ``seq`` was handed to the backplane."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent_at: dict[int, float] = {}
+
+    async def append(
+        self, debate_id: str, frame: ActionFrame, channel: str | None = None
+    ) -> int | None:
+        seq = await super().append(debate_id, frame, channel)
+        if seq is not None:
+            self.sent_at[seq] = time.perf_counter()
+        return seq
+
+
+class _Recorder:
+    """Shared sink for every client's receive timestamps."""
+
+    def __init__(self, sent_at: dict[int, float]) -> None:
+        self.sent_at = sent_at
+        self.latencies: list[float] = []
+        self.delivered = 0
+
+    def record(self, text: str | None) -> None:
+        # Read "seq":N without decoding the frame. It leads frames encoded
+        # before they were logged and trails the rest.
+        start = text.find('"seq":', 0, 8) if text else -1
+        if start < 0:
+            start = text.rfind('"seq":') if text else -1
+            if start < 0:
+                return
+        start += 6
+        end = start
+        while end < len(text) and text[end].isdigit():
+            end += 1
+        sent = self.sent_at.get(int(text[start:end]))
+        if sent is not None:
+            self.delivered += 1
+            self.latencies.append(time.perf_counter() - sent)
+
+
+class _ClientBehaviour:
+    def __init__(self, config: LoadTestConfig, rng: random.Random) -> None:
+        roll = rng.random()
+        self.fails = roll < config.fail_ratio
+        self.slow = not self.fails and roll < config.fail_ratio + config.slow_ratio
+        self.slow_delay = config.slow_delay
+        self.fail_after = config.fail_after
+        self.received = 0
+
+    async def on_send(self) -> None:
+        self.received += 1
+        if self.fails and self.received > self.fail_after:
+            raise ConnectionError("load-test client dropped")
+        if self.slow:
+            await asyncio.sleep(self.slow_delay)
+
+
+class FakeWebSocket:
+    """Stand-in for ``fastapi.WebSocket`` as seen by the connection manager."""
+
+    def __init__(self, recorder: _Recorder, behaviour: _ClientBehaviour) -> None:
+        self._recorder = recorder
+        self._behaviour = behaviour
+        self.close_code: int | None = None
+
+    async def send_text(self, text: str) -> None:
+        await self._behaviour.on_send()
+        self._recorder.record(text)
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._behaviour.on_send()
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        self.close_code = code
+
+
+class AsgiWebSocketClient:
+    """Drives one ``/ws/debate/{id}`` connection through the ASGI interface."""
+
+    def __init__(
+        self,
+        app: Any,
+        index: int,
+        recorder: _Recorder,
+        behaviour: _ClientBehaviour,
+    ) -> None:
+        self._app = app
+        self._index = index
+        self._recorder = recorder
+        self._behaviour = behaviour
+        self._inbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.settled = asyncio.Event()
+        self.accepted = False
+        self.close_code: int | None = None
+        self.task: asyncio.Task | None = None
+
+    async def _receive(self) -> dict[str, Any]:
+        return await self._inbox.get()
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind == "websocket.accept":
+            self.accepted = True
+        elif kind == "websocket.send":
+            await self._behaviour.on_send()
+            self._recorder.record(message.get("text"))
+            self.settled.set()
+        elif kind == "websocket.close":
+            self.close_code = message.get("code", 1000)
+            self.settled.set()
+
+    def start(self) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "http_version": "1.1",
+            "path": f"/ws/debate/{DEBATE_ID}",
+            "raw_path": f"/ws/debate/{DEBATE_ID}".encode(),
+            "root_path": "",
+            "query_string": b"token=load-test",
+            "headers": [(b"host", b"load-test")],
+            "client": (f"10.0.{self._index // 256 % 256}.{self._index % 256}", 40000),
+            "server": ("load-test", 80),
+            "subprotocols": [],
+            "state": {},
+        }
+        self._inbox.put_nowait({"type": "websocket.connect"})
+        self.task = asyncio.ensure_future(self._run(scope))
+
+    async def _run(self, scope: dict[str, Any]) -> None:
+        try:
+            await self._app(scope, self._receive, self._send)
+        except Exception:
+            pass
+        finally:
+            self.settled.set()
+
+    def disconnect(self) -> None:
+        self._inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes a timer, i.e. scheduling lag."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - started - self.interval))
+
+    def __enter__(self) -> "LoopLagMonitor":
+        self._task = asyncio.ensure_future(self._run())
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+def percentiles_ms(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50": pick(0.50),
+        "p95": pick(0.95),
+        "p99": pick(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def _measure_memory(connect: Callable[[], Awaitable[int]]) -> tuple[int, float]:
+    """Run ``connect`` under tracemalloc; return (connections, bytes per connection)."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        connected = await connect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return connected, round((after - before) / max(connected, 1), 1)
+
+
+def _build_manager(
+    config: LoadTestConfig,
+) -> tuple[DebateConnectionManager, _TimedEventLog]:
+    event_log = _TimedEventLog()
+    manager = DebateConnectionManager(
+        max_queue_size=config.queue_size,
+        slow_consumer_policy=config.slow_consumer_policy,
+        backplane=InMemoryBackplane(),
+        event_log=event_log,
+        admission=AdmissionController(max_global=0, max_per_worker=0, max_per_debate=0),
+    )
+    return manager, event_log
+
+
+async def _drain(manager: DebateConnectionManager, config: LoadTestConfig) -> bool:
+    try:
+        await manager.drain(DEBATE_ID, timeout=config.drain_timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+def _summarise(
+    manager: DebateConnectionManager,
+    recorder: _Recorder,
+    monitor: LoopLagMonitor,
+    config: LoadTestConfig,
+    connected: int,
+    bytes_per_connection: float,
+    frames_broadcast: int,
+    duration: float,
+    drained: bool,
+) -> dict[str, Any]:
+    backpressure = manager.get_backpressure_stats(DEBATE_ID)
+    return {
+        "clients": config.clients,
+        "connected": connected,
+        # Failed writes and slow-consumer evictions both drop the connection.
+        "disconnected": connected - manager.get_connection_count(DEBATE_ID),
+        "frames_broadcast": frames_broadcast,
+        "frames_delivered": recorder.delivered,
+        "frames_dropped": backpressure["dropped_frames"],
+        "drained": drained,
+        "duration_s": round(duration, 4),
+        "broadcasts_per_s": round(frames_broadcast / max(duration, 1e-9), 1),
+        "deliveries_per_s": round(recorder.delivered / max(duration, 1e-9), 1),
+        "fanout_latency_ms": percentiles_ms(recorder.latencies),
+        "memory_per_connection_bytes": bytes_per_connection,
+        "event_loop_lag_ms": percentiles_ms(monitor.samples),
+    }
+
+
+async def _connect_fake_clients(
+    manager: DebateConnectionManager,
+    recorder: _Recorder,
+    config: LoadTestConfig,
+    rng: random.Random,
+) -> tuple[int, float]:
+    clients = [
+        FakeWebSocket(recorder, _ClientBehaviour(config, rng))
+        for _ in range(config.clients)
+    ]
+
+    async def connect() -> int:
+        for ws in clients:
+            await manager.connect(DEBATE_ID, ws)
+        return manager.get_connection_count(DEBATE_ID)
+
+    return await _measure_memory(connect)
+
+
+async def run_broadcast_scenario(config: LoadTestConfig) -> dict[str, Any]:
+    rng = random.Random(config.seed)
+    manager, event_log = _build_manager(config)
+    recorder = _Recorder(event_log.sent_at)
+    connected, per_connection = await _connect_fake_clients(
+        manager, recorder, config, rng
+    )
+
+    with LoopLagMonitor() as monitor:
+        started = time.perf_counter()
+        for i in range(config.frames):
+            await manager.broadcast_to_debate(
+                DEBATE_ID,
+                build_frame(
+                    "DEBATE/TOKEN_RECEIVED",
+                    {"debateId": DEBATE_ID, "agent": "bull", "token": f"token {i} "},
+                ),
+            )
+            await asyncio.sleep(0)
+        drained = await _drain(manager, config)
+        duration = time.perf_counter() - started
+
+    result = _summarise(
+        manager,
+        recorder,
+        monitor,
+        config,
+        connected,
+        per_connection,
+        config.frames,
+        duration,
+        drained,
+    )
+    await manager.close_all_for_debate(DEBATE_ID)
+    return result
+
+
+async def run_token_scenario(config: LoadTestConfig) -> dict[str, Any]:
+    rng = random.Random(config.seed)
+    manager, event_log = _build_manager(config)
+    recorder = _Recorder(event_log.sent_at)
+    connected, per_connection = await _connect_fake_clients(
+        manager, recorder, config, rng
+    )
+    handler = TokenStreamingHandler(manager, DEBATE_ID, "bull", viewers=connected)
+
+    with LoopLagMonitor() as monitor:
+        started = time.perf_counter()
+        for i in range(config.tokens):
+            await handler.on_llm_new_token(f"w{i} ")
+            await asyncio.sleep(config.token_interval)
+        await handler.on_llm_end(None)
+        drained = await _drain(manager, config)
+        duration = time.perf_counter() - started
+
+    result = _summarise(
+        manager,
+        recorder,
+        monitor,
+        config,
+        connected,
+        per_connection,
+        len(event_log.sent_at),
+        duration,
+        drained,
+    )
+    result["tokens"] = config.tokens
+    result["coalescing"] = get_stream_stats(DEBATE_ID)
+    await manager.close_all_for_debate(DEBATE_ID)
+    return result
+
+
+async def run_route_scenario(config: LoadTestConfig) -> dict[str, Any]:
+    from fastapi import FastAPI
+
+    from app.routes import ws as ws_routes
+
+    rng = random.Random(config.seed)
+    manager, event_log = _build_manager(config)
+    recorder = _Recorder(event_log.sent_at)
+    app = FastAPI()
+    app.include_router(ws_routes.router)
+
+    async def allow(*args: Any) -> bool:
+        return True
+
+    async def user(token: str) -> dict[str, Any]:
+        return {"id": "load-test", "email": "load@test"}
+
+    async def no_state(debate_id: str) -> None:
+        return None
+
+    clients = [
+        AsgiWebSocketClient(app, i, recorder, _ClientBehaviour(config, rng))
+        for i in range(config.clients)
+    ]
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch.object(ws_routes, "connection_manager", manager))
+        stack.enter_context(
+            patch.object(ws_routes, "check_connection_rate_limit", allow)
+        )
+        stack.enter_context(patch.object(ws_routes, "validate_origin", allow))
+        stack.enter_context(patch.object(ws_routes, "validate_token", user))
+        stack.enter_context(patch.object(ws_routes.stream_state, "get_state", no_state))
+
+        async def connect() -> int:
+            for client in clients:
+                client.start()
+            # Settled = first frame (DEBATE/CONNECTED) received or closed.
+            await asyncio.gather(*(c.settled.wait() for c in clients))
+            return manager.get_connection_count(DEBATE_ID)
+
+        handshake_started = time.perf_counter()
+        connected, per_connection = await _measure_memory(connect)
+        handshake_duration = time.perf_counter() - handshake_started
+
+        with LoopLagMonitor() as monitor:
+            started = time.perf_counter()
+            for i in range(config.frames):
+                await manager.broadcast_to_debate(
+                    DEBATE_ID,
+                    build_frame(
+                        "DEBATE/TOKEN_RECEIVED",
+                        {"debateId": DEBATE_ID, "agent": "bear", "token": f"t{i} "},
+                    ),
+                )
+                await asyncio.sleep(0)
+            drained = await _drain(manager, config)
+            duration = time.perf_counter() - started
+
+        result = _summarise(
+            manager,
+            recorder,
+            monitor,
+            config,
+            connected,
+            per_connection,
+            config.frames,
+            duration,
+            drained,
+        )
+        result["handshakes_per_s"] = round(
+            config.clients / max(handshake_duration, 1e-9), 1
+        )
+        for client in clients:
+            client.disconnect()
+        await asyncio.gather(*(c.task for c in clients if c.task is not None))
+    return result
+
+
+_RUNNERS: dict[str, Callable[[LoadTestConfig], Awaitable[dict[str, Any]]]] = {
+    "broadcast": run_broadcast_scenario,
+    "tokens": run_token_scenario,
+    "route": run_route_scenario,
+}
+
+
+async def run_load_test(config: LoadTestConfig) -> dict[str, Any]:
+    """Run the configured scenarios and return the machine-readable report."""
+    results = {}
+    for name in config.scenarios:
+        results[name] = await _RUNNERS[name](config)
+    return {
+        "harness": "ws_load_test",
+        "version": HARNESS_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "config": asdict(config),
+        "scenarios": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> tuple[LoadTestConfig, str | None]:
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--frames", type=int, default=defaults.frames)
+    parser.add_argument("--tokens", type=int, default=defaults.tokens)
+    parser.add_argument("--token-interval", type=float, default=defaults.token_interval)
+    parser.add_argument("--slow-ratio", type=float, default=defaults.slow_ratio)
+    parser.add_argument("--slow-delay", type=float, default=defaults.slow_delay)
+    parser.add_argument("--fail-ratio", type=float, default=defaults.fail_ratio)
+    parser.add_argument("--fail-after", type=int, default=defaults.fail_after)
+    parser.add_argument("--queue-size", type=int, default=defaults.queue_size)
+    parser.add_argument(
+        "--policy",
+        dest="slow_consumer_policy",
+        choices=("latest_state", "drop"),
+        default=defaults.slow_consumer_policy,
+    )
+    parser.add_argument("--drain-timeout", type=float, default=defaults.drain_timeout)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run; repeat for several (default: all)",
+    )
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = vars(parser.parse_args(argv))
+    output = args.pop("output")
+    if not args["scenarios"]:
+        args["scenarios"] = list(SCENARIOS)
+    return LoadTestConfig(**args), output
+
+
+def main(argv: list[str] | None = None) -> None:
+    config, output = _parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    report = json.dumps(asyncio.run(run_load_test(config)), indent=2)
+    if output:
+        with open(output, "w") as f:
+            f.write(report)
+        print(f"WebSocket load-test report saved to {output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from commands.ws_load_test import LoadTestConfig, main, percentiles_ms, run_load_test
+
+
+def test_percentiles_are_reported_in_milliseconds():
+    stats = percentiles_ms([0.001 * i for i in range(1, 101)])
+    assert stats["count"] == 100
+    assert stats["p50"] == 51.0
+    assert stats["max"] == 100.0
+
+
+def test_percentiles_of_nothing_are_zero():
+    assert percentiles_ms([])["p99"] == 0.0
+
+
+@pytest.mark.p2
+@pytest.mark.asyncio
+async def test_all_scenarios_report_machine_readable_results():
+    config = LoadTestConfig(
+        clients=40,
+        frames=10,
+        tokens=30,
+        token_interval=0.001,
+        slow_ratio=0.1,
+        slow_delay=0.001,
+        fail_ratio=0.1,
+        fail_after=2,
+        drain_timeout=5,
+    )
+
+    report = json.loads(json.dumps(await run_load_test(config)))
+
+    assert set(report["scenarios"]) == {"broadcast", "tokens", "route"}
+    for result in report["scenarios"].values():
+        assert result["frames_delivered"] > 0
+        assert result["fanout_latency_ms"]["p99"] >= result["fanout_latency_ms"]["p50"]
+        assert result["memory_per_connection_bytes"] > 0
+        assert "max" in result["event_loop_lag_ms"]
+    assert report["scenarios"]["broadcast"]["disconnected"] > 0
+    assert report["scenarios"]["route"]["handshakes_per_s"] > 0
+    assert report["scenarios"]["tokens"]["coalescing"]["frames"] > 0
+
+
+def test_cli_writes_report_file(tmp_path):
+    output = tmp_path / "ws-load.json"
+
+    main(
+        [
+            "--clients",
+            "5",
+            "--frames",
+            "2",
+            "--tokens",
+            "5",
+            "--scenario",
+            "broadcast",
+            "--output",
+            str(output),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert list(report["scenarios"]) == ["broadcast"]
+    assert report["config"]["clients"] == 5
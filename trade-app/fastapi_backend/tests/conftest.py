@@ -11,6 +11,7 @@ from app.models import User, Base
 
 from app.database import get_user_db, get_async_session
 from app.main import app
+from app.services.debate.streaming import DebateConnectionManager
 from app.users import get_jwt_strategy
 
 pytest_plugins = ["tests.conftest_history"]
@@ -137,3 +138,18 @@ async def authenticated_admin_user(test_client, db_session):
         "user": user,
         "user_data": {"email": user_data["email"], "password": "AdminPass1!"},
     }
+
+
+@pytest_asyncio.fixture(scope="function")
+async def make_manager():
+    """Build DebateConnectionManagers that are closed when the test ends."""
+    managers: list[DebateConnectionManager] = []
+
+    def make(**kwargs) -> DebateConnectionManager:
+        manager = DebateConnectionManager(**kwargs)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        await manager.close()
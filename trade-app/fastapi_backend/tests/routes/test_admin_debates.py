@@ -245,3 +245,39 @@ async def test_admin_debates_debate_scoped_audit_events(
     body = response.json()
     assert len(body["data"]["events"]) == 1
     assert body["data"]["events"][0]["eventType"] == "SANITIZATION"
+
+
+@pytest.mark.asyncio
+async def test_admin_debate_profile(test_client, authenticated_admin_user, db_session):
+    debate = Debate(
+        external_id=f"ext-{uuid.uuid4()}",
+        asset="BTC",
+        status="completed",
+        profile={"v": 1, "totalMs": 1200, "phases": {}, "turns": [], "spans": []},
+    )
+    db_session.add(debate)
+    await db_session.commit()
+
+    response = await test_client.get(
+        f"/api/admin/debates/{debate.id}/profile",
+        headers=authenticated_admin_user["headers"],
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["externalId"] == debate.external_id
+    assert data["profile"]["totalMs"] == 1200
+
+    summary = await test_client.get(
+        "/api/admin/debates/profiles", headers=authenticated_admin_user["headers"]
+    )
+    assert summary.status_code == 200
+    assert summary.json()["data"]["debates"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_admin_debate_profile_missing(test_client, authenticated_admin_user):
+    response = await test_client.get(
+        f"/api/admin/debates/{uuid.uuid4()}/profile",
+        headers=authenticated_admin_user["headers"],
+    )
+    assert response.status_code == 404
@@ -0,0 +1,63 @@
+import pytest
+
+from app.services.debate.sanitization import get_phrase_set, reload_forbidden_phrases
+
+
+@pytest.fixture
+def restore_phrases():
+    original = list(get_phrase_set().phrases)
+    yield
+    reload_forbidden_phrases(original)
+
+
+@pytest.mark.asyncio
+async def test_admin_forbidden_phrases_list(test_client, authenticated_admin_user):
+    response = await test_client.get(
+        "/api/admin/sanitization/phrases",
+        headers=authenticated_admin_user["headers"],
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["version"] == get_phrase_set().version
+    assert "guaranteed" in data["phrases"]
+
+
+@pytest.mark.asyncio
+async def test_admin_forbidden_phrases_reload_swaps_set(
+    test_client, authenticated_admin_user, restore_phrases
+):
+    before = get_phrase_set().version
+
+    response = await test_client.post(
+        "/api/admin/sanitization/phrases/reload",
+        json={"phrases": ["lambo soon"]},
+        headers=authenticated_admin_user["headers"],
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["version"] == before + 1
+    assert data["phrases"] == ["lambo soon"]
+    assert response.json()["meta"]["propagated"] is True
+    assert get_phrase_set().phrases == ("lambo soon",)
+
+
+@pytest.mark.asyncio
+async def test_admin_forbidden_phrases_reload_rejects_empty_list(
+    test_client, authenticated_admin_user
+):
+    response = await test_client.post(
+        "/api/admin/sanitization/phrases/reload",
+        json={"phrases": ["  "]},
+        headers=authenticated_admin_user["headers"],
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_non_admin_cannot_reload_phrases(test_client, authenticated_user):
+    response = await test_client.post(
+        "/api/admin/sanitization/phrases/reload",
+        headers=authenticated_user["headers"],
+    )
+    assert response.status_code == 403
@@ -0,0 +1,92 @@
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.services.debate.exceptions import DebateQueueFullError
+from app.services.debate.schemas import DebateResponse
+from app.services.rate_limiter import RateLimitResult
+
+
+def _rate_result(allowed: bool) -> RateLimitResult:
+    return RateLimitResult(
+        allowed=allowed,
+        current=11 if not allowed else 1,
+        limit=10,
+        remaining=0 if not allowed else 9,
+        reset_at=time.time() + 30,
+    )
+
+
+def _patched(rate_allowed: bool = True, create_debate: AsyncMock | None = None):
+    limiter = MagicMock()
+    limiter.check = AsyncMock(return_value=_rate_result(rate_allowed))
+    service = MagicMock()
+    service.create_debate = create_debate or AsyncMock()
+    return (
+        patch("app.routes.debate._get_debate_limiter", return_value=limiter),
+        patch("app.routes.debate.get_debate_service", return_value=service),
+        service,
+    )
+
+
+async def _start(asset: str = "bitcoin"):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://localhost:8000"
+    ) as client:
+        return await client.post("/api/debate/start", json={"asset": asset})
+
+
+class TestDebateStartScheduling:
+    @pytest.mark.asyncio
+    async def test_rate_limited_start_returns_429_without_creating(self):
+        limiter_patch, service_patch, service = _patched(rate_allowed=False)
+        with limiter_patch, service_patch:
+            response = await _start()
+
+        assert response.status_code == 429
+        body = response.json()
+        assert body["error"]["code"] == "RATE_LIMITED"
+        assert 0 < body["meta"]["retryAfterMs"] <= 30_000
+        service.create_debate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queued_start_reports_position_and_eta(self):
+        queued = DebateResponse(
+            debate_id="deb_q1",
+            asset="bitcoin",
+            status="queued",
+            messages=[],
+            current_turn=0,
+            max_turns=6,
+            queue_position=3,
+            eta_seconds=240.0,
+        )
+        limiter_patch, service_patch, _ = _patched(
+            create_debate=AsyncMock(return_value=queued)
+        )
+        with limiter_patch, service_patch:
+            response = await _start()
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["status"] == "queued"
+        assert data["queuePosition"] == 3
+        assert data["etaSeconds"] == 240.0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_returns_503_with_retry_hint(self):
+        limiter_patch, service_patch, _ = _patched(
+            create_debate=AsyncMock(
+                side_effect=DebateQueueFullError("full", retry_after=90)
+            )
+        )
+        with limiter_patch, service_patch:
+            response = await _start()
+
+        assert response.status_code == 503
+        body = response.json()
+        assert body["error"]["code"] == "DEBATE_QUEUE_FULL"
+        assert body["meta"]["retryAfterMs"] == 90_000
@@ -60,3 +60,14 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["data"]["status"] == "unhealthy"
         assert data["data"]["redis"] == "disconnected"
+
+
+class TestWebSocketAdmissionEndpoint:
+    def test_reports_admission_state(self):
+        response = client.get("/api/health/ws", params={"debate_id": "deb-1"})
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["level"] == "normal"
+        assert data["debateConnections"] == 0
+        assert "shedTokenFrames" in data
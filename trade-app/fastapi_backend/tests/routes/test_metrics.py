@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.metrics import BROADCAST_FRAMES, CONTENT_TYPE
+
+client = TestClient(app)
+
+
+def _service(queued: int) -> MagicMock:
+    service = MagicMock()
+    service.scheduler.get_stats = AsyncMock(return_value={"queued": queued})
+    return service
+
+
+class TestMetricsEndpoint:
+    @patch("app.routes.metrics.async_session_maker", side_effect=RuntimeError("no db"))
+    def test_renders_prometheus_text(self, _session):
+        BROADCAST_FRAMES.inc("token")
+        with patch("app.routes.metrics.get_debate_service", return_value=_service(4)):
+            response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        body = response.text
+        assert "# TYPE debate_broadcast_frames_total counter" in body
+        assert 'debate_broadcast_frames_total{type="token"}' in body
+        assert "debates_queued 4" in body
+        assert "# TYPE llm_call_seconds histogram" in body
+
+    @patch("app.routes.metrics.async_session_maker", side_effect=RuntimeError("no db"))
+    def test_reports_viewers_per_debate(self, _session):
+        from app.services.debate.streaming import connection_manager
+
+        with (
+            patch.dict(
+                connection_manager.active_debates,
+                {"deb_metrics": {object(), object()}},
+            ),
+            patch("app.routes.metrics.get_debate_service", return_value=_service(0)),
+        ):
+            response = client.get("/metrics")
+
+        assert 'debate_viewers{debate_id="deb_metrics"} 2' in response.text
+
+    def test_disabled_returns_404(self):
+        with patch("app.routes.metrics.settings.METRICS_ENABLED", False):
+            response = client.get("/metrics")
+
+        assert response.status_code == 404
@@ -14,6 +14,7 @@ def _make_connection_manager_mock(connection_count: int = 1) -> MagicMock:
     manager = MagicMock()
     manager.broadcast_to_debate = AsyncMock()
     manager.get_connection_count = MagicMock(return_value=connection_count)
+    manager.has_viewers = MagicMock(return_value=connection_count > 0)
     return manager
 
 
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -81,6 +82,64 @@ class TestTokenValidation:
         result = await validate_token("invalid-token")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_validate_token_caches_user_lookup(self):
+        from app.routes.ws import validate_token
+        from app.services.user_cache import UserCache
+        from app.users import get_jwt_strategy
+
+        user = MagicMock(id="9b2f6c1e-7f4e-4a6a-9d7e-2c5b8f1d0a11", email="a@b.com")
+        token = await get_jwt_strategy().write_token(user)
+        loader = AsyncMock(return_value={"id": str(user.id), "email": user.email})
+
+        with (
+            patch("app.routes.ws.user_cache", UserCache(ttl_seconds=60)),
+            patch("app.routes.ws.load_active_user", loader),
+        ):
+            first = await validate_token(token)
+            second = await validate_token(token)
+
+        assert first == second == {"id": str(user.id), "email": "a@b.com"}
+        loader.assert_awaited_once_with(str(user.id))
+
+    @pytest.mark.asyncio
+    async def test_validate_token_rejects_expired_without_db(self):
+        from fastapi_users.jwt import generate_jwt
+
+        from app.config import settings
+        from app.routes.ws import validate_token
+
+        token = generate_jwt(
+            {
+                "sub": "9b2f6c1e-7f4e-4a6a-9d7e-2c5b8f1d0a11",
+                "aud": ["fastapi-users:auth"],
+            },
+            settings.ACCESS_SECRET_KEY,
+            lifetime_seconds=-10,
+        )
+        loader = AsyncMock()
+
+        with patch("app.routes.ws.load_active_user", loader):
+            assert await validate_token(token) is None
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_validate_token_rejects_inactive_user(self):
+        from app.routes.ws import validate_token
+        from app.services.user_cache import UserCache
+        from app.users import get_jwt_strategy
+
+        user = MagicMock(id="9b2f6c1e-7f4e-4a6a-9d7e-2c5b8f1d0a11")
+        token = await get_jwt_strategy().write_token(user)
+        cache = UserCache(ttl_seconds=60)
+
+        with (
+            patch("app.routes.ws.user_cache", cache),
+            patch("app.routes.ws.load_active_user", AsyncMock(return_value=None)),
+        ):
+            assert await validate_token(token) is None
+        assert cache.get_stats()["size"] == 0
+
 
 class TestOriginValidation:
     @pytest.mark.asyncio
@@ -156,9 +215,12 @@ class TestWebSocketManager:
 
         action = {"type": "DEBATE/TOKEN_RECEIVED", "payload": {"token": "test"}}
         await manager.broadcast_to_debate(debate_id, action)
+        await manager.drain(debate_id)
 
-        mock_ws1.send_json.assert_called_once_with(action)
-        mock_ws2.send_json.assert_called_once_with(action)
+        mock_ws1.send_text.assert_called_once()
+        assert json.loads(mock_ws1.send_text.call_args[0][0]) == {**action, "seq": 1}
+        mock_ws2.send_text.assert_called_once()
+        assert json.loads(mock_ws2.send_text.call_args[0][0]) == {**action, "seq": 1}
 
         await manager.disconnect(debate_id, mock_ws1)
         await manager.disconnect(debate_id, mock_ws2)
@@ -166,20 +228,70 @@ class TestWebSocketManager:
 
 class TestHeartbeat:
     @pytest.mark.asyncio
-    async def test_heartbeat_sends_ping(self):
-        from app.services.debate.streaming import heartbeat
+    async def test_heartbeat_sends_ping(self, make_manager):
         import asyncio
 
+        manager = make_manager(heartbeat_interval=0.01)
         mock_ws = AsyncMock()
-        mock_manager = MagicMock()
-        stop_event = asyncio.Event()
+        await manager.connect("debate-1", mock_ws)
+
+        for _ in range(100):
+            if mock_ws.send_text.called:
+                break
+            await asyncio.sleep(0.01)
+
+        ping = json.loads(mock_ws.send_text.call_args[0][0])
+        assert ping["type"] == "DEBATE/PING"
+        await manager.disconnect("debate-1", mock_ws)
+
+    @pytest.mark.asyncio
+    async def test_tick_shares_one_ping_frame_across_debates(self, make_manager):
+        manager = make_manager()
+        sockets = [AsyncMock() for _ in range(3)]
+        await manager.connect("debate-1", sockets[0])
+        await manager.connect("debate-1", sockets[1])
+        await manager.connect("debate-2", sockets[2])
+
+        await manager.heartbeat_tick()
+        await manager.drain("debate-1", timeout=1)
+        await manager.drain("debate-2", timeout=1)
+
+        texts = [ws.send_text.call_args[0][0] for ws in sockets]
+        assert all(text is texts[0] for text in texts)
+        assert manager.get_heartbeat_stats() == {"live": 3, "stale": 0}
 
-        async def stop_immediately():
-            stop_event.set()
+    @pytest.mark.asyncio
+    async def test_silent_connections_are_reaped(self, make_manager):
+        from app.services.debate.streaming import HEARTBEAT_REAP_INTERVALS
+
+        manager = make_manager(heartbeat_interval=10)
+        silent, chatty = AsyncMock(), AsyncMock()
+        await manager.connect("debate-1", silent)
+        await manager.connect("debate-1", chatty)
+        manager._senders[silent].last_seen -= 10 * HEARTBEAT_REAP_INTERVALS + 1
+        manager._senders[chatty].last_seen -= 10 * HEARTBEAT_REAP_INTERVALS + 1
+        manager.mark_alive(chatty)
+
+        assert manager.get_heartbeat_stats() == {"live": 1, "stale": 1}
+
+        await manager.heartbeat_tick()
+
+        assert manager.get_connection_count("debate-1") == 1
+        assert silent.close.call_args.kwargs["code"] == (
+            WebSocketCloseCodes.HEARTBEAT_TIMEOUT
+        )
+        assert manager.get_heartbeat_stats() == {"live": 1, "stale": 0}
+
+    @pytest.mark.asyncio
+    async def test_close_stops_heartbeat_loop(self, make_manager):
+        manager = make_manager(heartbeat_interval=10)
+        await manager.connect("debate-1", AsyncMock())
+        heartbeat = manager._heartbeat_task
 
-        mock_ws.send_json.side_effect = stop_immediately
+        await manager.close()
 
-        await heartbeat(mock_ws, mock_manager, "debate-1", stop_event)
+        assert heartbeat.done()
+        assert manager.get_total_connections() == 0
 
 
 class TestWebSocketCloseCodes:
@@ -188,5 +300,6 @@ class TestWebSocketCloseCodes:
         assert WebSocketCloseCodes.ORIGIN_NOT_ALLOWED == 4003
         assert WebSocketCloseCodes.DEBATE_NOT_FOUND == 4004
         assert WebSocketCloseCodes.DEBATE_ALREADY_RUNNING == 4009
+        assert WebSocketCloseCodes.HEARTBEAT_TIMEOUT == 4010
         assert WebSocketCloseCodes.RATE_LIMITED == 4029
         assert WebSocketCloseCodes.INTERNAL_ERROR == 4500
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.routes.ws import validate_token
+from app.services.user_cache import UserCache
+from app.users import get_jwt_strategy
+
+logger = logging.getLogger(__name__)
+
+HANDSHAKES = 500
+# Round trip of the previous path: new session, user manager, SELECT by id.
+SIMULATED_DB_LATENCY = 0.002
+
+
+async def _handshakes_per_sec(token: str, cache: UserCache) -> tuple[float, int]:
+    """Handshake rate and the number of DB lookups it took."""
+    lookups = 0
+
+    async def db_lookup(user_id: str) -> dict:
+        nonlocal lookups
+        lookups += 1
+        await asyncio.sleep(SIMULATED_DB_LATENCY)
+        return {"id": user_id, "email": "bench@example.com"}
+
+    with (
+        patch("app.routes.ws.user_cache", cache),
+        patch("app.routes.ws.load_active_user", db_lookup),
+    ):
+        start = time.perf_counter()
+        for _ in range(HANDSHAKES):
+            assert await validate_token(token) is not None
+        return HANDSHAKES / (time.perf_counter() - start), lookups
+
+
+@pytest.mark.p2
+@pytest.mark.asyncio
+async def test_cached_handshake_beats_db_lookup():
+    token = await get_jwt_strategy().write_token(MagicMock(id=uuid.uuid4()))
+
+    uncached, uncached_lookups = await _handshakes_per_sec(
+        token, UserCache(ttl_seconds=0)
+    )
+    cached, cached_lookups = await _handshakes_per_sec(token, UserCache(ttl_seconds=60))
+
+    logger.info(f"{HANDSHAKES} handshakes: db={uncached:.0f}/s cached={cached:.0f}/s")
+    # The lookup counts are the real check; the rates are only logged and
+    # compared loosely so a loaded CI machine cannot flip the result.
+    assert uncached_lookups == HANDSHAKES
+    assert cached_lookups == 1
+    assert cached > uncached
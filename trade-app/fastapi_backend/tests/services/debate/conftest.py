@@ -62,6 +62,16 @@ def make_guardian_result(**overrides):
     return GuardianAnalysisResult(**{**defaults, **overrides})
 
 
+@pytest.fixture(autouse=True)
+async def fresh_market_watcher():
+    """Give each test its own process-wide market watcher and close it after."""
+    from app.services.market import watcher
+
+    watcher._hub_instance = None
+    yield
+    await watcher.close_market_watcher()
+
+
 @pytest.fixture
 def mock_llm():
     response_mock = MagicMock()
@@ -166,14 +176,14 @@ def mock_stale_guardian():
 
 @pytest.fixture
 def mock_agents_with_generate():
-    async def bull_gen(state):
+    async def bull_gen(state, **kwargs):
         return {
             "messages": state["messages"] + [{"role": "bull", "content": "Bull arg"}],
             "current_turn": state["current_turn"] + 1,
             "current_agent": "bear",
         }
 
-    async def bear_gen(state):
+    async def bear_gen(state, **kwargs):
         return {
             "messages": state["messages"] + [{"role": "bear", "content": "Bear arg"}],
             "current_turn": state["current_turn"] + 1,
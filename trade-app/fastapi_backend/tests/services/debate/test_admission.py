@@ -0,0 +1,164 @@
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.routes.ws import reject_overloaded
+from app.services.debate.admission import (
+    ADMISSION_NORMAL,
+    ADMISSION_REDUCED_FPS,
+    ADMISSION_REJECTING,
+    ADMISSION_STATUS_ONLY,
+    GLOBAL_COUNTS_KEY,
+    REDUCED_FPS_SCALE,
+    AdmissionController,
+)
+from app.services.debate.frames import build_frame
+from app.services.debate.protocol import JSON_CODEC
+from app.services.debate.ws_schemas import WebSocketCloseCodes
+
+
+def _controller(worker: int = 0, debate: int = 0, **kwargs) -> AdmissionController:
+    options = {
+        "max_global": 0,
+        "max_per_worker": 100,
+        "max_per_debate": 10,
+        "reduce_fps_at": 0.7,
+        "status_only_at": 0.85,
+        "retry_after_seconds": 10,
+        **kwargs,
+    }
+    controller = AdmissionController(**options)
+    controller.bind(lambda: worker, lambda debate_id: debate)
+    return controller
+
+
+class TestStagedDegradation:
+    @pytest.mark.parametrize(
+        ("debate", "level"),
+        [
+            (0, ADMISSION_NORMAL),
+            (7, ADMISSION_REDUCED_FPS),
+            (9, ADMISSION_STATUS_ONLY),
+            (10, ADMISSION_REJECTING),
+        ],
+    )
+    def test_level_follows_debate_utilisation(self, debate, level):
+        assert _controller(debate=debate).level("debate-1") == level
+
+    def test_worker_cap_applies_to_every_debate(self):
+        controller = _controller(worker=90)
+        assert controller.level("quiet-debate") == ADMISSION_STATUS_ONLY
+        assert controller.sheds_tokens("quiet-debate") is True
+
+    def test_token_fps_scale_drops_under_pressure(self):
+        assert _controller(debate=0).token_fps_scale("debate-1") == 1.0
+        assert _controller(debate=7).token_fps_scale("debate-1") == REDUCED_FPS_SCALE
+
+    def test_zero_cap_disables_scope(self):
+        controller = _controller(debate=10_000, max_per_debate=0)
+        assert controller.level("debate-1") == ADMISSION_NORMAL
+
+
+class TestAdmit:
+    def test_rejects_at_cap_with_jittered_retry_hint(self):
+        decision = _controller(debate=10).admit("debate-1")
+
+        assert decision.admitted is False
+        assert decision.scope == "debate"
+        assert 10 <= decision.retry_after <= 20
+
+    def test_admitted_handshakes_hold_a_slot_until_settled(self):
+        controller = _controller(max_per_debate=2)
+
+        assert controller.admit("debate-1").admitted
+        assert controller.admit("debate-1").admitted
+        assert controller.admit("debate-1").admitted is False
+
+        controller.settle("debate-1")
+        assert controller.admit("debate-1").admitted
+
+    def test_state_reports_counts_and_rejections(self):
+        controller = _controller(worker=5, debate=10)
+        controller.admit("debate-1")
+
+        state = controller.get_state("debate-1")
+
+        assert state["level"] == ADMISSION_REJECTING
+        assert state["workerConnections"] == 5
+        assert state["debateConnections"] == 10
+        assert state["rejected"] == 1
+
+
+class TestGlobalSync:
+    @pytest.mark.asyncio
+    async def test_sync_sums_live_workers_and_prunes_stale(self):
+        now = time.time()
+        redis = MagicMock()
+        redis.hset = AsyncMock()
+        redis.hdel = AsyncMock()
+        redis.hgetall = AsyncMock(
+            return_value={
+                "me": f"3:{now}",
+                "w2": f"40:{now}",
+                "dead": f"500:{now - 3600}",
+            }
+        )
+        controller = _controller(worker=3, max_global=50, redis=redis, worker_id="me")
+
+        await controller.sync()
+
+        redis.hset.assert_awaited_once()
+        redis.hdel.assert_awaited_once_with(GLOBAL_COUNTS_KEY, "dead")
+        assert controller.get_state()["globalConnections"] == 43
+        assert controller.level() == ADMISSION_STATUS_ONLY
+
+    @pytest.mark.asyncio
+    async def test_sync_failure_keeps_last_known_counts(self):
+        redis = MagicMock()
+        redis.hset = AsyncMock(side_effect=ConnectionError("redis down"))
+        controller = _controller(max_global=50, redis=redis)
+
+        await controller.sync()
+
+        assert controller.level() == ADMISSION_NORMAL
+
+
+class TestManagerLoadShedding:
+    @pytest.mark.asyncio
+    async def test_status_only_debate_skips_token_frames(self, make_manager):
+        manager = make_manager(
+            admission=AdmissionController(
+                max_global=0, max_per_worker=0, max_per_debate=1
+            )
+        )
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws)
+
+        await manager.broadcast_to_debate(
+            "debate-1", build_frame("DEBATE/TOKEN_RECEIVED", {"token": "hi"})
+        )
+        await manager.broadcast_to_debate(
+            "debate-1", build_frame("DEBATE/STATUS_UPDATE", {"status": "running"})
+        )
+        await manager.drain("debate-1", timeout=1)
+
+        (call,) = ws.send_text.call_args_list
+        assert json.loads(call.args[0])["type"] == "DEBATE/STATUS_UPDATE"
+        assert manager.shed_token_frames == 1
+        await manager.disconnect("debate-1", ws)
+
+
+class TestRejectOverloaded:
+    @pytest.mark.asyncio
+    async def test_sends_retry_hint_then_closes_with_4029(self):
+        ws = AsyncMock()
+        decision = _controller(debate=10).admit("debate-1")
+
+        await reject_overloaded(ws, JSON_CODEC, None, decision)
+
+        error = json.loads(ws.send_text.call_args[0][0])
+        assert error["payload"]["code"] == "SERVER_BUSY"
+        assert error["payload"]["retryAfter"] == decision.retry_after
+        assert ws.close.call_args.kwargs["code"] == WebSocketCloseCodes.RATE_LIMITED
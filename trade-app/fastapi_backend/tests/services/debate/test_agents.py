@@ -14,18 +14,14 @@ class TestBullAgent:
             new_callable=AsyncMock,
         ) as mock_get_llm:
             mock_get_llm.return_value = MagicMock()
-            with patch(
-                "app.services.debate.agents.bull.ChatPromptTemplate"
-            ) as mock_prompt_class:
+            with patch("app.services.debate.agents.bull.BULL_PROMPT") as mock_prompt:
                 response_mock = MagicMock()
                 response_mock.content = "Test argument"
 
                 chain_mock = MagicMock()
                 chain_mock.ainvoke = AsyncMock(return_value=response_mock)
 
-                mock_prompt = MagicMock()
                 mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-                mock_prompt_class.from_template.return_value = mock_prompt
 
                 agent = BullAgent()
                 yield agent
@@ -48,18 +44,14 @@ class TestBullAgent:
             new_callable=AsyncMock,
         ) as mock_get_llm:
             mock_get_llm.return_value = MagicMock()
-            with patch(
-                "app.services.debate.agents.bull.ChatPromptTemplate"
-            ) as mock_prompt_class:
+            with patch("app.services.debate.agents.bull.BULL_PROMPT") as mock_prompt:
                 response_mock = MagicMock()
                 response_mock.content = "Test argument"
 
                 chain_mock = MagicMock()
                 chain_mock.ainvoke = AsyncMock(return_value=response_mock)
 
-                mock_prompt = MagicMock()
                 mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-                mock_prompt_class.from_template.return_value = mock_prompt
 
                 debate_state["messages"] = [
                     {"role": "bear", "content": "Previous bear argument"}
@@ -87,18 +79,14 @@ class TestBearAgent:
             new_callable=AsyncMock,
         ) as mock_get_llm:
             mock_get_llm.return_value = MagicMock()
-            with patch(
-                "app.services.debate.agents.bear.ChatPromptTemplate"
-            ) as mock_prompt_class:
+            with patch("app.services.debate.agents.bear.BEAR_PROMPT") as mock_prompt:
                 response_mock = MagicMock()
                 response_mock.content = "Test argument"
 
                 chain_mock = MagicMock()
                 chain_mock.ainvoke = AsyncMock(return_value=response_mock)
 
-                mock_prompt = MagicMock()
                 mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-                mock_prompt_class.from_template.return_value = mock_prompt
 
                 agent = BearAgent()
                 yield agent
@@ -37,7 +37,7 @@ class TestArchivalEngineWiring:
             with patch("app.services.debate.engine.archive_with_retry") as mock_archive:
                 mock_archive.return_value = AsyncMock()
                 with patch(
-                    "app.services.debate.engine.StaleDataGuardian"
+                    "app.services.market.watcher.StaleDataGuardian"
                 ) as mock_sg_cls:
                     mock_sg = MagicMock()
                     mock_sg.get_freshness_status = AsyncMock(
@@ -49,6 +49,7 @@ class TestArchivalEngineWiring:
                             threshold_seconds=60,
                         )
                     )
+                    mock_sg.close = AsyncMock()
                     mock_sg_cls.return_value = mock_sg
 
                     await stream_debate(
@@ -90,7 +91,7 @@ class TestArchivalEngineWiring:
             with patch("app.services.debate.engine.archive_with_retry") as mock_archive:
                 mock_archive.return_value = AsyncMock()
                 with patch(
-                    "app.services.debate.engine.StaleDataGuardian"
+                    "app.services.market.watcher.StaleDataGuardian"
                 ) as mock_sg_cls:
                     mock_sg = MagicMock()
                     mock_sg.get_freshness_status = AsyncMock(
@@ -102,6 +103,7 @@ class TestArchivalEngineWiring:
                             threshold_seconds=60,
                         )
                     )
+                    mock_sg.close = AsyncMock()
                     mock_sg_cls.return_value = mock_sg
 
                     await stream_debate(
@@ -124,7 +126,7 @@ class TestArchivalEngineWiring:
             with patch("app.services.debate.engine.archive_with_retry") as mock_archive:
                 mock_archive.side_effect = Exception("Archival exploded")
                 with patch(
-                    "app.services.debate.engine.StaleDataGuardian"
+                    "app.services.market.watcher.StaleDataGuardian"
                 ) as mock_sg_cls:
                     mock_sg = MagicMock()
                     mock_sg.get_freshness_status = AsyncMock(
@@ -136,6 +138,7 @@ class TestArchivalEngineWiring:
                             threshold_seconds=60,
                         )
                     )
+                    mock_sg.close = AsyncMock()
                     mock_sg_cls.return_value = mock_sg
 
                     result = await stream_debate(
@@ -159,7 +162,7 @@ class TestArchivalEngineWiring:
             )
             with patch("app.services.debate.engine.archive_with_retry") as mock_archive:
                 with patch(
-                    "app.services.debate.engine.StaleDataGuardian"
+                    "app.services.market.watcher.StaleDataGuardian"
                 ) as mock_sg_cls:
                     mock_sg = MagicMock()
                     mock_sg.get_freshness_status = AsyncMock(
@@ -171,6 +174,7 @@ class TestArchivalEngineWiring:
                             threshold_seconds=60,
                         )
                     )
+                    mock_sg.close = AsyncMock()
                     mock_sg_cls.return_value = mock_sg
 
                     with pytest.raises(Exception):
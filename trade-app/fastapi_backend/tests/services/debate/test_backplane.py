@@ -0,0 +1,202 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.debate.backplane import (
+    CHANNEL_PREFIX,
+    InMemoryBackplane,
+    RedisBackplane,
+)
+from app.services.debate.frames import ActionFrame
+from app.services.debate.sanitization import (
+    PHRASES_RELOAD_CONTROL,
+    apply_phrases_control,
+    get_phrase_set,
+    reload_forbidden_phrases,
+)
+from app.services.user_cache import apply_user_cache_control, user_cache
+
+
+class _FakePubSub:
+    def __init__(self, hub: "_FakeRedis") -> None:
+        self._hub = hub
+        self.channels: set[str] = set()
+        self._messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self.channels.add(channel)
+        self._hub.pubsubs.add(self)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self._messages.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def reset(self) -> None:
+        self.channels.clear()
+        self._hub.pubsubs.discard(self)
+
+
+class _FakeRedis:
+    """Minimal shared pub/sub hub standing in for one Redis server."""
+
+    def __init__(self) -> None:
+        self.pubsubs: set[_FakePubSub] = set()
+        self.published: list[tuple[str, str]] = []
+
+    def pubsub(self) -> _FakePubSub:
+        return _FakePubSub(self)
+
+    async def publish(self, channel: str, data: str) -> int:
+        self.published.append((channel, data))
+        receivers = [p for p in self.pubsubs if channel in p.channels]
+        for p in receivers:
+            p._messages.put_nowait(
+                {"type": "message", "channel": channel, "data": data}
+            )
+        return len(receivers)
+
+
+def _status(status: str) -> dict:
+    return {"type": "DEBATE/STATUS_UPDATE", "payload": {"status": status}}
+
+
+async def _wait_for_sends(ws: AsyncMock, count: int = 1) -> None:
+    for _ in range(100):
+        if ws.send_text.call_count >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+class TestInMemoryBackplane:
+    @pytest.mark.asyncio
+    async def test_publish_delivers_locally(self):
+        backplane = InMemoryBackplane()
+        deliver = AsyncMock()
+        backplane.bind(deliver)
+
+        frame = ActionFrame(_status("running"))
+        await backplane.publish("debate-1", frame)
+
+        deliver.assert_awaited_once_with("debate-1", frame)
+
+    def test_manager_defaults_to_in_memory_backplane(self, make_manager):
+        manager = make_manager()
+        assert isinstance(manager.backplane, InMemoryBackplane)
+        assert manager.has_viewers("debate-1") is False
+
+
+class TestRedisBackplane:
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_socket_on_other_worker(self, make_manager):
+        redis = _FakeRedis()
+        publisher = make_manager(backplane=RedisBackplane(redis))
+        viewer_worker = make_manager(backplane=RedisBackplane(redis))
+        ws = AsyncMock()
+        await viewer_worker.connect("debate-1", ws)
+
+        assert publisher.get_connection_count("debate-1") == 0
+        assert publisher.has_viewers("debate-1") is True
+
+        await publisher.broadcast_to_debate("debate-1", _status("running"))
+        await _wait_for_sends(ws)
+
+        expected = {**_status("running"), "seq": 1}
+        ((channel, text),) = redis.published
+        assert channel == f"{CHANNEL_PREFIX}debate-1"
+        assert json.loads(text) == expected
+        ws.send_text.assert_called_once_with(text)
+
+        await viewer_worker.disconnect("debate-1", ws)
+        await viewer_worker.close()
+        await publisher.close()
+
+    @pytest.mark.asyncio
+    async def test_last_disconnect_unsubscribes(self, make_manager):
+        redis = _FakeRedis()
+        manager = make_manager(backplane=RedisBackplane(redis))
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws)
+        (pubsub,) = redis.pubsubs
+        assert pubsub.channels == {f"{CHANNEL_PREFIX}debate-1"}
+
+        await manager.disconnect("debate-1", ws)
+
+        assert pubsub.channels == set()
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_falls_back_to_local_delivery(self, make_manager):
+        redis = _FakeRedis()
+        redis.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+        manager = make_manager(backplane=RedisBackplane(redis))
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws)
+
+        await manager.broadcast_to_debate("debate-1", _status("running"))
+        await manager.drain("debate-1", timeout=1)
+
+        ws.send_text.assert_called_once()
+        await manager.disconnect("debate-1", ws)
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_phrase_reload_reaches_other_workers_only(self):
+        redis = _FakeRedis()
+        publisher, peer = RedisBackplane(redis), RedisBackplane(redis)
+        own = AsyncMock()
+        await publisher.subscribe_control(own)
+        await peer.subscribe_control(apply_phrases_control)
+        original = list(get_phrase_set().phrases)
+
+        try:
+            assert await publisher.publish_control(
+                {"type": PHRASES_RELOAD_CONTROL, "phrases": ["lambo soon"]}
+            )
+            for _ in range(100):
+                if get_phrase_set().phrases == ("lambo soon",):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert get_phrase_set().phrases == ("lambo soon",)
+            own.assert_not_awaited()
+        finally:
+            reload_forbidden_phrases(original)
+            await publisher.close()
+            await peer.close()
+
+    @pytest.mark.asyncio
+    async def test_control_publish_failure_is_reported(self):
+        redis = _FakeRedis()
+        redis.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        assert await RedisBackplane(redis).publish_control({"type": "x"}) is False
+
+    @pytest.mark.asyncio
+    async def test_user_invalidation_reaches_other_workers(self):
+        redis = _FakeRedis()
+        publisher, peer = RedisBackplane(redis), RedisBackplane(redis)
+        await peer.subscribe_control(apply_phrases_control)
+        await peer.subscribe_control(apply_user_cache_control)
+        user_cache.put("user-1", {"id": "user-1", "email": "a@example.com"})
+
+        try:
+            await publisher.publish_control(
+                {"type": "user_invalidate", "user_id": "user-1"}
+            )
+            for _ in range(100):
+                if user_cache.get("user-1") is None:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert user_cache.get("user-1") is None
+        finally:
+            user_cache.clear()
+            await publisher.close()
+            await peer.close()
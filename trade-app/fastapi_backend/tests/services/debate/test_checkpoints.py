@@ -0,0 +1,150 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.services.debate import checkpoints
+from app.services.debate.checkpoints import (
+    BoundedMemorySaver,
+    CompactSerializer,
+    prune_archived_checkpoints,
+)
+from app.services.debate.engine import create_debate_graph
+
+
+def _node(role: str, next_agent: str):
+    async def node(state, manager=None, debate_id=None):
+        turn = state["current_turn"] + 1
+        content = f"{role} turn {turn}: RSI is neutral and volume is flat. " * 20
+        return {
+            "messages": state["messages"] + [{"role": role, "content": content}],
+            "current_turn": turn,
+            "current_agent": next_agent,
+        }
+
+    return node
+
+
+def _graph(checkpointer):
+    with (
+        patch("app.services.debate.engine.bull_agent_node", _node("bull", "bear")),
+        patch("app.services.debate.engine.bear_agent_node", _node("bear", "bull")),
+    ):
+        return create_debate_graph(checkpointer)
+
+
+async def _run(graph, thread_id: str, max_turns: int = 6) -> dict:
+    return await graph.ainvoke(
+        {
+            "asset": "BTC",
+            "market_context": {"price": 61250.5},
+            "messages": [],
+            "current_turn": 0,
+            "max_turns": max_turns,
+            "current_agent": "bull",
+            "status": "running",
+        },
+        {"configurable": {"thread_id": thread_id}},
+    )
+
+
+class TestCompactSerializer:
+    def test_large_payload_is_compressed_and_round_trips(self):
+        serde = CompactSerializer(min_bytes=256)
+        messages = [{"role": "bull", "content": "volume is flat " * 200}]
+
+        type_, data = serde.dumps_typed(messages)
+
+        assert type_ == "msgpack+zlib"
+        assert len(data) < len(
+            CompactSerializer(min_bytes=10**9).dumps_typed(messages)[1]
+        )
+        assert serde.loads_typed((type_, data)) == messages
+
+    def test_small_payload_is_left_alone(self):
+        serde = CompactSerializer(min_bytes=256)
+        assert serde.dumps_typed({"turn": 1})[0] == "msgpack"
+
+
+class TestBoundedMemorySaver:
+    @pytest.mark.asyncio
+    async def test_keeps_latest_checkpoints_and_resumable_state(self):
+        saver = BoundedMemorySaver(keep_per_thread=2, max_bytes=0)
+        graph = _graph(saver)
+
+        await _run(graph, "deb_a")
+
+        assert len(saver.storage["deb_a"][""]) == 2
+        snapshot = await graph.aget_state({"configurable": {"thread_id": "deb_a"}})
+        assert snapshot.values["current_turn"] == 6
+        assert len(snapshot.values["messages"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_much_smaller_than_unbounded_saver(self):
+        bounded = BoundedMemorySaver(max_bytes=0)
+        unbounded = MemorySaver()
+
+        await _run(_graph(bounded), "deb_a", max_turns=12)
+        await _run(_graph(unbounded), "deb_a", max_turns=12)
+
+        unbounded_bytes = sum(len(v[1]) for v in unbounded.blobs.values())
+        assert bounded.get_stats()["bytes"] * 4 < unbounded_bytes
+
+    @pytest.mark.asyncio
+    async def test_byte_cap_evicts_least_recently_written_threads(self):
+        saver = BoundedMemorySaver(max_bytes=10**9)
+        graph = _graph(saver)
+        await _run(graph, "deb_a")
+        per_thread = saver.get_stats()["bytes"]
+        saver.max_bytes = per_thread * 3
+
+        threads = ["deb_a", "deb_b", "deb_c", "deb_d"]
+        for thread_id in threads[1:]:
+            await _run(graph, thread_id)
+
+        kept = list(saver.storage)
+        stats = saver.get_stats()
+        assert kept == threads[-len(kept) :]
+        assert "deb_a" not in kept and "deb_d" in kept
+        assert stats["evicted_threads"] == len(threads) - len(kept)
+        assert stats["bytes"] <= saver.max_bytes
+
+    @pytest.mark.asyncio
+    async def test_delete_thread_releases_everything(self):
+        saver = BoundedMemorySaver(max_bytes=0)
+        await _run(_graph(saver), "deb_a")
+
+        await saver.adelete_thread("deb_a")
+
+        assert saver.get_stats()["bytes"] == 0
+        assert not saver.blobs and not saver.writes and "deb_a" not in saver.storage
+
+
+class TestPruneArchived:
+    @pytest.mark.asyncio
+    async def test_deletes_only_archived_threads(self):
+        saver = BoundedMemorySaver(max_bytes=0)
+        graph = _graph(saver)
+        await _run(graph, "deb_done")
+        await _run(graph, "deb_live")
+
+        session = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["deb_done"]
+        session.execute = AsyncMock(return_value=result)
+        session_maker = MagicMock()
+        session_maker.return_value.__aenter__ = AsyncMock(return_value=session)
+        session_maker.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch.object(checkpoints, "_checkpointer", saver),
+            patch.object(checkpoints, "async_session_maker", session_maker),
+        ):
+            assert await prune_archived_checkpoints() == 1
+
+        assert set(saver.storage) == {"deb_live"}
+
+
+def test_checkpointer_is_shared():
+    with patch.object(checkpoints, "_checkpointer", None):
+        assert checkpoints.get_checkpointer() is checkpoints.get_checkpointer()
@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.debate.streaming import (
+    SLOW_CONSUMER_DROP,
+    SLOW_CONSUMER_LATEST_STATE,
+)
+from app.services.debate.ws_schemas import WebSocketCloseCodes
+
+
+def _token(i: int) -> dict:
+    return {"type": "DEBATE/TOKEN_RECEIVED", "payload": {"token": f"t{i}"}}
+
+
+def _status(status: str) -> dict:
+    return {"type": "DEBATE/STATUS_UPDATE", "payload": {"status": status}}
+
+
+class _BlockedSocket:
+    """Fake socket whose sends hang until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.sent: list[dict] = []
+        self.close = AsyncMock()
+
+    async def send_text(self, data: str) -> None:
+        await self.release.wait()
+        self.sent.append(json.loads(data))
+
+
+class TestBackpressureFanOut:
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_socket(self, make_manager):
+        manager = make_manager(max_queue_size=16)
+        slow = _BlockedSocket()
+        fast = AsyncMock()
+        await manager.connect("debate-1", slow)
+        await manager.connect("debate-1", fast)
+
+        await asyncio.wait_for(
+            manager.broadcast_to_debate("debate-1", _token(0)), timeout=0.1
+        )
+        await asyncio.sleep(0)
+
+        fast.send_text.assert_called_once()
+        assert json.loads(fast.send_text.call_args[0][0]) == {**_token(0), "seq": 1}
+        assert slow.sent == []
+
+        slow.release.set()
+        await manager.drain("debate-1", timeout=1)
+        assert slow.sent == [{**_token(0), "seq": 1}]
+
+    @pytest.mark.asyncio
+    async def test_frames_are_delivered_in_order(self, make_manager):
+        manager = make_manager(max_queue_size=64)
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws)
+
+        for i in range(10):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+        await manager.drain("debate-1", timeout=1)
+
+        sent = [
+            json.loads(c.args[0])["payload"]["token"]
+            for c in ws.send_text.call_args_list
+        ]
+        assert sent == [f"t{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_overflow_switches_to_latest_state_mode(self, make_manager):
+        manager = make_manager(
+            max_queue_size=4, slow_consumer_policy=SLOW_CONSUMER_LATEST_STATE
+        )
+        slow = _BlockedSocket()
+        await manager.connect("debate-1", slow)
+
+        for i in range(10):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+        await manager.broadcast_to_debate("debate-1", _status("running"))
+        await manager.broadcast_to_debate("debate-1", _status("completed"))
+
+        stats = manager.get_backpressure_stats("debate-1")
+        assert stats["latest_state_connections"] == 1
+        assert stats["dropped_frames"] > 0
+
+        slow.release.set()
+        await manager.drain("debate-1", timeout=1)
+
+        types = [frame["type"] for frame in slow.sent]
+        assert types.count("DEBATE/STATUS_UPDATE") == 1
+        assert slow.sent[-1] == {**_status("completed"), "seq": 12}
+        assert manager.get_connection_count("debate-1") == 1
+        assert (
+            manager.get_backpressure_stats("debate-1")["latest_state_connections"] == 0
+        )
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_connection_with_close_code(self, make_manager):
+        manager = make_manager(
+            max_queue_size=2, slow_consumer_policy=SLOW_CONSUMER_DROP
+        )
+        slow = _BlockedSocket()
+        fast = AsyncMock()
+        await manager.connect("debate-1", slow)
+        await manager.connect("debate-1", fast)
+
+        for i in range(5):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+            await asyncio.sleep(0)
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert manager.get_connection_count("debate-1") == 1
+        slow.close.assert_called_once()
+        assert slow.close.call_args.kwargs["code"] == WebSocketCloseCodes.SLOW_CONSUMER
+
+        await manager.drain("debate-1", timeout=1)
+        assert fast.send_text.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_frame_once(self, make_manager):
+        manager = make_manager()
+        sockets = [AsyncMock() for _ in range(3)]
+        for ws in sockets:
+            await manager.connect("debate-1", ws)
+
+        await manager.broadcast_to_debate("debate-1", _token(0))
+        await manager.drain("debate-1", timeout=1)
+
+        texts = [ws.send_text.call_args[0][0] for ws in sockets]
+        assert all(text is texts[0] for text in texts)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self, make_manager):
+        manager = make_manager()
+        slow = _BlockedSocket()
+        await manager.connect("debate-1", slow)
+        await manager.broadcast_to_debate("debate-1", _token(0))
+
+        await manager.disconnect("debate-1", slow)
+        slow.release.set()
+        await asyncio.sleep(0)
+
+        assert slow.sent == []
+        assert manager.get_backpressure_stats("debate-1")["connections"] == 0
@@ -1,25 +1,23 @@
 import pytest
 from unittest.mock import AsyncMock
 
-from app.services.debate.streaming import DebateConnectionManager
-
 
 class TestDebateConnectionManagerAdvanced:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def mock_ws_1(self):
         ws = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         ws.close = AsyncMock()
         return ws
 
     @pytest.fixture
     def mock_ws_2(self):
         ws = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         ws.close = AsyncMock()
         return ws
 
@@ -77,14 +75,15 @@ class TestDebateConnectionManagerAdvanced:
     async def test_broadcast_to_debate_cleans_up_disconnected(
         self, manager, mock_ws_1, mock_ws_2
     ):
-        mock_ws_1.send_json.side_effect = RuntimeError("Connection closed")
+        mock_ws_1.send_text.side_effect = RuntimeError("Connection closed")
         await manager.connect("debate-1", mock_ws_1)
         await manager.connect("debate-1", mock_ws_2)
 
         await manager.broadcast_to_debate("debate-1", {"type": "DEBATE/STATUS_UPDATE"})
+        await manager.drain("debate-1")
 
         assert manager.get_connection_count("debate-1") == 1
-        mock_ws_2.send_json.assert_called_once()
+        mock_ws_2.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_disconnect_removes_empty_debate(self, manager, mock_ws_1):
@@ -1,9 +1,9 @@
+import json
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
 from app.services.debate.streaming import (
-    DebateConnectionManager,
     send_data_stale,
     send_data_refreshed,
 )
@@ -12,13 +12,13 @@ from app.services.market.schemas import FreshnessStatus
 
 class TestDataStaleWebSocketActions:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def mock_websocket(self):
         ws = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         return ws
 
     @pytest.fixture
@@ -38,9 +38,10 @@ class TestDataStaleWebSocketActions:
         await manager.connect("debate-1", mock_websocket)
 
         await send_data_stale(manager, "debate-1", stale_freshness)
+        await manager.drain("debate-1")
 
-        mock_websocket.send_json.assert_called_once()
-        action = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["type"] == "DEBATE/DATA_STALE"
         assert action["payload"]["debateId"] == "debate-1"
         assert action["payload"]["ageSeconds"] == 75
@@ -53,9 +54,10 @@ class TestDataStaleWebSocketActions:
         await manager.connect("debate-1", mock_websocket)
 
         await send_data_refreshed(manager, "debate-1")
+        await manager.drain("debate-1")
 
-        mock_websocket.send_json.assert_called_once()
-        action = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["type"] == "DEBATE/DATA_REFRESHED"
         assert action["payload"]["debateId"] == "debate-1"
         assert "refreshed" in action["payload"]["message"].lower()
@@ -73,7 +75,8 @@ class TestDataStaleWebSocketActions:
         )
 
         await send_data_stale(manager, "debate-1", freshness)
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["type"] == "DEBATE/DATA_STALE"
         assert action["payload"]["lastUpdate"] is None
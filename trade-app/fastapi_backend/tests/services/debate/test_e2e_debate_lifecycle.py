@@ -108,7 +108,7 @@ class TestEndToEndDebateLifecycle:
 
         with patched_debate_engine(fake_analyze, ack_timeout=2) as mocks:
 
-            async def dynamic_bull(state):
+            async def dynamic_bull(state, **kwargs):
                 turn = state["current_turn"] + 1
                 return {
                     "messages": state.get("messages", [])
@@ -117,7 +117,7 @@ class TestEndToEndDebateLifecycle:
                     "current_agent": "bear",
                 }
 
-            async def dynamic_bear(state):
+            async def dynamic_bear(state, **kwargs):
                 turn = state["current_turn"] + 1
                 msgs = state.get("messages", [])
                 last_bull = (
@@ -334,7 +334,7 @@ class TestEndToEndDebateLifecycle:
 
         with patched_debate_engine(fake_analyze, ack_timeout=2) as mocks:
 
-            async def dynamic_bull(state):
+            async def dynamic_bull(state, **kwargs):
                 turn = state["current_turn"] + 1
                 return {
                     "messages": state.get("messages", [])
@@ -343,7 +343,7 @@ class TestEndToEndDebateLifecycle:
                     "current_agent": "bear",
                 }
 
-            async def dynamic_bear(state):
+            async def dynamic_bear(state, **kwargs):
                 turn = state["current_turn"] + 1
                 msgs = state.get("messages", [])
                 return {
@@ -433,7 +433,7 @@ class TestEndToEndDebateLifecycle:
 
         with patched_debate_engine(safe_fn) as mocks:
 
-            async def dynamic_bull(state):
+            async def dynamic_bull(state, **kwargs):
                 turn = state["current_turn"] + 1
                 return {
                     "messages": state.get("messages", [])
@@ -442,7 +442,7 @@ class TestEndToEndDebateLifecycle:
                     "current_agent": "bear",
                 }
 
-            async def dynamic_bear(state):
+            async def dynamic_bear(state, **kwargs):
                 turn = state["current_turn"] + 1
                 msgs = state.get("messages", [])
                 return {
@@ -88,7 +88,7 @@ class TestDebateEngine:
             with patch("app.services.debate.engine.BearAgent") as mock_bear_class:
                 turn_counter = [0]
 
-                async def mock_bull_generate(state):
+                async def mock_bull_generate(state, **kwargs):
                     turn_counter[0] += 1
                     new_message = {
                         "role": "bull",
@@ -100,7 +100,7 @@ class TestDebateEngine:
                         "current_agent": "bear",
                     }
 
-                async def mock_bear_generate(state):
+                async def mock_bear_generate(state, **kwargs):
                     turn_counter[0] += 1
                     new_message = {
                         "role": "bear",
@@ -1,9 +1,11 @@
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.debate.engine import stream_debate
 from app.services.market.schemas import FreshnessStatus
+from app.services.market.watcher import get_market_watcher
 
 
 class TestDebateEngineStaleData:
@@ -37,10 +39,11 @@ class TestDebateEngineStaleData:
     @pytest.mark.asyncio
     async def test_stream_debate_raises_on_stale_data(self, mock_manager, stale_status):
         with patch(
-            "app.services.debate.engine.StaleDataGuardian"
+            "app.services.market.watcher.StaleDataGuardian"
         ) as mock_guardian_class:
             mock_guardian = MagicMock()
             mock_guardian.get_freshness_status = AsyncMock(return_value=stale_status)
+            mock_guardian.close = AsyncMock()
             mock_guardian_class.return_value = mock_guardian
 
             with patch("app.services.debate.engine.stream_state") as mock_stream_state:
@@ -63,10 +66,11 @@ class TestDebateEngineStaleData:
         self, mock_manager, fresh_status
     ):
         with patch(
-            "app.services.debate.engine.StaleDataGuardian"
+            "app.services.market.watcher.StaleDataGuardian"
         ) as mock_guardian_class:
             mock_guardian = MagicMock()
             mock_guardian.get_freshness_status = AsyncMock(return_value=fresh_status)
+            mock_guardian.close = AsyncMock()
             mock_guardian_class.return_value = mock_guardian
 
             with patch("app.services.debate.engine.stream_state") as mock_stream_state:
@@ -99,3 +103,65 @@ class TestDebateEngineStaleData:
                         )
 
                         assert result["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_debates_share_one_watcher(
+        self, mock_manager, fresh_status
+    ):
+        stats_during_run = []
+
+        async def bull_node(state, manager=None, debate_id=None):
+            await asyncio.sleep(0.02)
+            stats_during_run.append(get_market_watcher().get_stats())
+            return {
+                "messages": [{"role": "bull", "content": "Bull arg"}],
+                "current_turn": 1,
+                "current_agent": "bear",
+            }
+
+        async def bear_node(state, manager=None, debate_id=None):
+            return {
+                "messages": [{"role": "bear", "content": "Bear arg"}],
+                "current_turn": 2,
+                "current_agent": "bull",
+            }
+
+        with patch(
+            "app.services.market.watcher.StaleDataGuardian"
+        ) as mock_guardian_class:
+            mock_guardian = MagicMock()
+            mock_guardian.get_freshness_status = AsyncMock(return_value=fresh_status)
+            mock_guardian.close = AsyncMock()
+            mock_guardian_class.return_value = mock_guardian
+
+            with (
+                patch("app.services.debate.engine.stream_state") as mock_stream_state,
+                patch(
+                    "app.services.debate.engine.bull_agent_node",
+                    side_effect=bull_node,
+                ),
+                patch(
+                    "app.services.debate.engine.bear_agent_node",
+                    side_effect=bear_node,
+                ),
+            ):
+                mock_stream_state.save_state = AsyncMock()
+
+                results = await asyncio.gather(
+                    *(
+                        stream_debate(
+                            debate_id=f"shared-{i}",
+                            asset="BTC",
+                            market_context={"price": 45000},
+                            manager=mock_manager,
+                            max_turns=2,
+                        )
+                        for i in range(3)
+                    )
+                )
+
+        assert [r["status"] for r in results] == ["completed"] * 3
+        mock_guardian_class.assert_called_once()
+        assert stats_during_run[0]["subscribers"] == 3
+        assert stats_during_run[0]["freshness_pollers"] == 1
+        assert get_market_watcher().get_stats()["assets"] == 0
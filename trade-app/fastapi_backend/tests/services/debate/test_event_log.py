@@ -0,0 +1,250 @@
+import asyncio
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.debate.backplane import RedisBackplane
+from app.services.debate.event_log import InMemoryEventLog, RedisEventLog
+from app.services.debate.frames import ActionFrame
+from app.services.debate.streaming import (
+    send_connected_action,
+    send_replay,
+)
+
+
+def _token(i: int) -> dict:
+    return {"type": "DEBATE/TOKEN_RECEIVED", "payload": {"token": f"t{i}"}}
+
+
+class TestInMemoryEventLog:
+    @pytest.mark.asyncio
+    async def test_append_stamps_increasing_seq(self):
+        log = InMemoryEventLog()
+        frames = [ActionFrame(_token(i)) for i in range(3)]
+
+        seqs = [await log.append("debate-1", f) for f in frames]
+
+        assert seqs == [1, 2, 3]
+        assert json.loads(frames[2].text)["seq"] == 3
+
+    @pytest.mark.asyncio
+    async def test_replay_returns_only_missed_frames(self):
+        log = InMemoryEventLog()
+        for i in range(5):
+            await log.append("debate-1", ActionFrame(_token(i)))
+
+        replay = json.loads((await log.replay("debate-1", since=2)).text)
+
+        assert replay["type"] == "DEBATE/REPLAY"
+        assert replay["payload"]["lastSeq"] == 5
+        assert replay["payload"]["truncated"] is False
+        assert [e["seq"] for e in replay["payload"]["events"]] == [3, 4, 5]
+        assert replay["payload"]["events"][0]["payload"]["token"] == "t2"
+
+    @pytest.mark.asyncio
+    async def test_replay_flags_frames_trimmed_from_log(self):
+        log = InMemoryEventLog(maxlen=3)
+        for i in range(6):
+            await log.append("debate-1", ActionFrame(_token(i)))
+
+        replay = json.loads((await log.replay("debate-1", since=1)).text)
+
+        assert replay["payload"]["truncated"] is True
+        assert [e["seq"] for e in replay["payload"]["events"]] == [4, 5, 6]
+
+    @pytest.mark.asyncio
+    async def test_replay_flags_client_ahead_of_log(self):
+        log = InMemoryEventLog()
+        await log.append("debate-1", ActionFrame(_token(0)))
+
+        replay = json.loads((await log.replay("debate-1", since=40)).text)
+
+        assert replay["payload"]["truncated"] is True
+        assert replay["payload"]["events"] == []
+
+    @pytest.mark.asyncio
+    async def test_replay_unknown_debate_returns_none(self):
+        assert await InMemoryEventLog().replay("missing", since=0) is None
+
+    @pytest.mark.asyncio
+    async def test_least_recent_debate_is_evicted(self):
+        log = InMemoryEventLog(max_debates=2)
+        for debate_id in ("a", "b", "c"):
+            await log.append(debate_id, ActionFrame(_token(0)))
+
+        assert await log.replay("a", since=0) is None
+        assert await log.replay("c", since=0) is not None
+
+
+class TestManagerReplay:
+    @pytest.mark.asyncio
+    async def test_reconnecting_client_receives_missed_frames(self, make_manager):
+        manager = make_manager()
+        for i in range(4):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws, hold=True)
+        await send_connected_action(manager, "debate-1", "running")
+        await send_replay(manager, "debate-1", ws, since=2)
+        await manager.drain("debate-1", timeout=1)
+
+        connected, replay = [json.loads(c.args[0]) for c in ws.send_text.call_args_list]
+        assert "seq" not in connected
+        assert [e["payload"]["token"] for e in replay["payload"]["events"]] == [
+            "t2",
+            "t3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_frames_broadcast_during_reconnect_arrive_once_in_order(
+        self, make_manager
+    ):
+        manager = make_manager()
+        for i in range(2):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+        read_replay = manager.event_log.replay
+
+        async def replay_then_broadcast(debate_id, since):
+            frame = await read_replay(debate_id, since)
+            await manager.broadcast_to_debate(debate_id, _token(4))
+            return frame
+
+        manager.event_log.replay = replay_then_broadcast
+
+        ws = AsyncMock()
+        await manager.connect("debate-1", ws, hold=True)
+        await manager.broadcast_to_debate("debate-1", _token(2))
+        await send_connected_action(manager, "debate-1", "running")
+        await manager.broadcast_to_debate("debate-1", _token(3))
+        await send_replay(manager, "debate-1", ws, since=1)
+        await manager.drain("debate-1", timeout=1)
+
+        sent = [json.loads(c.args[0]) for c in ws.send_text.call_args_list]
+        assert [a["type"] for a in sent] == [
+            "DEBATE/CONNECTED",
+            "DEBATE/REPLAY",
+            "DEBATE/TOKEN_RECEIVED",
+        ]
+        seqs = [e["seq"] for e in sent[1]["payload"]["events"]] + [sent[2]["seq"]]
+        assert seqs == [2, 3, 4, 5]
+
+
+class TestRedisEventLog:
+    @pytest.mark.asyncio
+    async def test_append_uses_script_seq(self):
+        redis = MagicMock()
+        script = AsyncMock(return_value=7)
+        redis.register_script = MagicMock(return_value=script)
+        log = RedisEventLog(redis, maxlen=100)
+        frame = ActionFrame(_token(0))
+
+        assert await log.append("debate-1", frame) == 7
+
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == ["debate_log_seq:debate-1", "debate_log:debate-1"]
+        assert json.loads(kwargs["args"][1]) == _token(0)
+        assert json.loads(frame.text) == {**_token(0), "seq": 7}
+
+    @pytest.mark.asyncio
+    async def test_append_failure_leaves_frame_unsequenced(self):
+        redis = MagicMock()
+        redis.register_script = MagicMock(
+            return_value=AsyncMock(side_effect=ConnectionError("redis down"))
+        )
+        frame = ActionFrame(_token(0))
+
+        assert await RedisEventLog(redis).append("debate-1", frame) is None
+        assert "seq" not in frame
+
+    @pytest.mark.asyncio
+    async def test_replay_reads_stream_after_since(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value="5")
+        redis.xrange = AsyncMock(
+            return_value=[
+                ("4-0", {"f": ActionFrame(_token(3)).text}),
+                ("5-0", {"f": ActionFrame(_token(4)).text}),
+            ]
+        )
+
+        replay = json.loads((await RedisEventLog(redis).replay("debate-1", 3)).text)
+
+        redis.xrange.assert_awaited_once_with(
+            "debate_log:debate-1", min="4-0", max="5-0"
+        )
+        assert replay["payload"]["truncated"] is False
+        assert [e["seq"] for e in replay["payload"]["events"]] == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_replay_flags_expired_entries(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value="9")
+        redis.xrange = AsyncMock(return_value=[])
+
+        replay = json.loads((await RedisEventLog(redis).replay("debate-1", 3)).text)
+
+        assert replay["payload"]["truncated"] is True
+
+
+class TestLoggedBroadcastOverRedis:
+    """Redis log + Redis backplane: the append script also does the PUBLISH."""
+
+    ROUND_TRIP = 0.005
+    FRAMES = 20
+
+    def _redis(self, script):
+        redis = MagicMock()
+        redis.register_script = MagicMock(return_value=script)
+        redis.publish = AsyncMock()
+        return redis
+
+    @pytest.mark.asyncio
+    async def test_append_publishes_in_the_same_script(self, make_manager):
+        script = AsyncMock(return_value=3)
+        redis = self._redis(script)
+        manager = make_manager(
+            backplane=RedisBackplane(redis), event_log=RedisEventLog(redis)
+        )
+
+        await manager.broadcast_to_debate("debate-1", _token(0))
+
+        assert script.await_args.kwargs["args"][3] == "debate_ws:debate-1"
+        redis.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_append_still_publishes_unsequenced(self, make_manager):
+        redis = self._redis(AsyncMock(side_effect=ConnectionError("redis down")))
+        manager = make_manager(
+            backplane=RedisBackplane(redis), event_log=RedisEventLog(redis)
+        )
+
+        await manager.broadcast_to_debate("debate-1", _token(0))
+
+        channel, text = redis.publish.await_args.args
+        assert channel == "debate_ws:debate-1"
+        assert "seq" not in json.loads(text)
+
+    @pytest.mark.p2
+    @pytest.mark.asyncio
+    async def test_logging_adds_no_round_trip_per_frame(self, make_manager):
+        async def round_trip(*args, **kwargs):
+            await asyncio.sleep(self.ROUND_TRIP)
+            return 1
+
+        redis = self._redis(AsyncMock(side_effect=round_trip))
+        redis.publish = AsyncMock(side_effect=round_trip)
+        manager = make_manager(
+            backplane=RedisBackplane(redis), event_log=RedisEventLog(redis)
+        )
+
+        started = time.perf_counter()
+        for i in range(self.FRAMES):
+            await manager.broadcast_to_debate("debate-1", _token(i))
+        per_frame = (time.perf_counter() - started) / self.FRAMES
+
+        # EVAL then PUBLISH would be two round trips per frame.
+        assert per_frame < 1.5 * self.ROUND_TRIP
+        redis.publish.assert_not_awaited()
@@ -0,0 +1,71 @@
+import json
+import logging
+import time
+
+import pytest
+
+from app.services.debate.frames import build_frame
+from app.services.debate.ws_schemas import (
+    ArgumentCompletePayload,
+    TokenReceivedPayload,
+    WebSocketAction,
+)
+
+logger = logging.getLogger(__name__)
+
+TOKENS_PER_RUN = 20
+
+
+def _legacy_encode(viewers: int, payload_model) -> list[str]:
+    """Previous path: two model_dumps per broadcast, one json encode per viewer."""
+    action = WebSocketAction(
+        type="DEBATE/TOKEN_RECEIVED",
+        payload=payload_model.model_dump(by_alias=True),
+    ).model_dump(by_alias=True)
+    return [json.dumps(action) for _ in range(viewers)]
+
+
+def _frame_encode(viewers: int, payload_model) -> list[str]:
+    frame = build_frame("DEBATE/TOKEN_RECEIVED", payload_model)
+    return [frame.text for _ in range(viewers)]
+
+
+def _time(fn, viewers: int, payload_model) -> float:
+    start = time.perf_counter()
+    for _ in range(TOKENS_PER_RUN):
+        fn(viewers, payload_model)
+    return time.perf_counter() - start
+
+
+@pytest.mark.p2
+@pytest.mark.parametrize("viewers", [1_000, 10_000])
+def test_frame_encoding_beats_per_viewer_json(viewers):
+    payload = TokenReceivedPayload(
+        debate_id="deb_bench", agent="bull", token="Momentum is building " * 4
+    )
+
+    legacy = _time(_legacy_encode, viewers, payload)
+    framed = _time(_frame_encode, viewers, payload)
+
+    logger.info(
+        f"{viewers} viewers x {TOKENS_PER_RUN} tokens: "
+        f"legacy={legacy * 1000:.1f}ms frame={framed * 1000:.1f}ms"
+    )
+    assert framed < legacy / 5
+
+
+@pytest.mark.p2
+def test_frame_matches_legacy_wire_shape():
+    payload = ArgumentCompletePayload(
+        debate_id="deb_bench", agent="bear", content="Resistance holds", turn=2
+    )
+    legacy = WebSocketAction(
+        type="DEBATE/ARGUMENT_COMPLETE",
+        payload=payload.model_dump(by_alias=True),
+    ).model_dump(by_alias=True)
+    frame = build_frame("DEBATE/ARGUMENT_COMPLETE", payload)
+
+    decoded = json.loads(frame.text)
+    assert decoded.keys() == legacy.keys()
+    assert decoded["type"] == legacy["type"]
+    assert decoded["payload"] == legacy["payload"]
@@ -26,14 +26,12 @@ class TestGuardianAgentAnalyze:
         )
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value=interrupt_result)
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -54,14 +52,12 @@ class TestGuardianAgentAnalyze:
         safe_result = make_guardian_result()
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value=safe_result)
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -123,14 +119,12 @@ class TestGuardianAgentAnalyze:
         self, debate_state_with_arguments
     ):
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(side_effect=Exception("LLM timeout"))
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -144,14 +138,12 @@ class TestGuardianAgentAnalyze:
         self, debate_state_with_arguments
     ):
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value="not a pydantic model")
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -177,14 +169,12 @@ class TestGuardianAgentAnalyze:
         )
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value=result_with_forbidden)
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -213,10 +203,8 @@ class TestGetLlmConfigWiring:
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
 
             with patch(
-                "app.services.debate.agents.guardian.ChatPromptTemplate"
-            ) as mock_prompt_class:
-                mock_prompt_class.from_template.return_value = mock_prompt
-
+                "app.services.debate.agents.guardian.GUARDIAN_PROMPT", mock_prompt
+            ):
                 with patch("app.config.settings") as mock_settings:
                     mock_settings.guardian_llm_model = "gpt-4o"
                     mock_settings.guardian_llm_temperature = 0.1
@@ -254,14 +242,12 @@ class TestGuardianWithMissingOptionalFields:
         }
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value=make_guardian_result())
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
@@ -289,8 +275,8 @@ class TestGuardianWithMissingOptionalFields:
         }
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(
                 return_value=make_guardian_result(
@@ -304,9 +290,7 @@ class TestGuardianWithMissingOptionalFields:
                 )
             )
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
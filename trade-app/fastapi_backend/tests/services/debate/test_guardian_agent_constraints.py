@@ -123,14 +123,12 @@ class TestIndividualFallacyCategories:
         )
 
         with patch(
-            "app.services.debate.agents.guardian.ChatPromptTemplate"
-        ) as mock_prompt_class:
+            "app.services.debate.agents.guardian.GUARDIAN_PROMPT"
+        ) as mock_prompt:
             chain_mock = MagicMock()
             chain_mock.ainvoke = AsyncMock(return_value=result)
 
-            mock_prompt = MagicMock()
             mock_prompt.__or__ = MagicMock(return_value=chain_mock)
-            mock_prompt_class.from_template.return_value = mock_prompt
 
             mock_llm = MagicMock()
             mock_llm.with_structured_output.return_value = mock_llm
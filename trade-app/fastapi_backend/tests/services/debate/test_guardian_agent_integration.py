@@ -13,7 +13,7 @@ def _patch_engine_mocks(
 
     mock_bull = MagicMock()
     mock_bull.generate = AsyncMock(
-        side_effect=lambda s: {
+        side_effect=lambda s, **kwargs: {
             "messages": s["messages"] + [{"role": "bull", "content": "Bull arg"}],
             "current_turn": s["current_turn"] + 1,
             "current_agent": "bear",
@@ -23,7 +23,7 @@ def _patch_engine_mocks(
 
     mock_bear = MagicMock()
     mock_bear.generate = AsyncMock(
-        side_effect=lambda s: {
+        side_effect=lambda s, **kwargs: {
             "messages": s["messages"] + [{"role": "bear", "content": "Bear arg"}],
             "current_turn": s["current_turn"] + 1,
             "current_agent": "bull",
@@ -1,11 +1,15 @@
 import typing
 import pytest
-from unittest.mock import MagicMock
 
-from app.services.debate.agents.guardian import GuardianAgent
+from app.services.debate.agents.guardian_context import GuardianContext
 from app.services.debate.ws_schemas import WebSocketAction, WebSocketActionType
 
 
+def _arguments(state: dict) -> str:
+    """The arguments section the Guardian sends for ``state``, uncapped."""
+    return GuardianContext(token_budget=0).build(state)[1]
+
+
 class TestDebateStateBackwardCompat:
     def test_2_1_unit_016_old_state_without_guardian_fields(self):
         state: dict = {
@@ -90,11 +94,10 @@ class TestGuardianConfigSettings:
         assert fields["guardian_enabled"].default is True
 
 
-class TestFormatAllArgumentsEdgeCases:
+class TestGuardianArgumentsEdgeCases:
     @pytest.mark.asyncio
     async def test_2_1_unit_023_empty_messages(self, debate_state):
-        agent = GuardianAgent(llm=MagicMock())
-        result = agent._format_all_arguments(debate_state)
+        result = _arguments(debate_state)
         assert result == "No arguments yet."
 
     @pytest.mark.asyncio
@@ -103,8 +106,7 @@ class TestFormatAllArgumentsEdgeCases:
             **debate_state,
             "messages": [{"role": "bull", "content": "BTC is bullish."}],
         }
-        agent = GuardianAgent(llm=MagicMock())
-        result = agent._format_all_arguments(state)
+        result = _arguments(state)
         assert "[BULL]: BTC is bullish." in result
 
     @pytest.mark.asyncio
@@ -122,8 +124,7 @@ class TestFormatAllArgumentsEdgeCases:
             "current_agent": "bear",
             "status": "running",
         }
-        agent = GuardianAgent(llm=MagicMock())
-        result = agent._format_all_arguments(state)
+        result = _arguments(state)
         assert "[BULL]: ETH will rise." in result
         assert "[BEAR]: ETH faces headwinds." in result
         assert "[BULL]: Institutional buying supports ETH." in result
@@ -139,6 +140,5 @@ class TestFormatAllArgumentsEdgeCases:
             "current_agent": "bull",
             "status": "running",
         }
-        agent = GuardianAgent(llm=MagicMock())
-        result = agent._format_all_arguments(state)
+        result = _arguments(state)
         assert "[UNKNOWN]: Orphan message" in result
@@ -0,0 +1,169 @@
+import json
+
+import pytest
+from unittest.mock import patch
+
+from app.services.debate.agents import guardian_context
+from app.services.debate.agents.guardian_context import (
+    GuardianContext,
+    compact_market_context,
+    estimate_tokens,
+    render_market_context,
+    trim_market_context,
+)
+
+
+def _market(candles: int = 60) -> dict:
+    return {
+        "asset": "BTC",
+        "price": 61250.5,
+        "news_summary": [f"Headline {i}" for i in range(10)],
+        "is_stale": False,
+        "ohlcv": [
+            {
+                "time": 1_700_000_000 + i * 3600,
+                "open": 61000.0 + i,
+                "high": 61500.0 + i,
+                "low": 60500.0 + i,
+                "close": 61200.0 + i,
+                "volume": 1000 + i,
+            }
+            for i in range(candles)
+        ],
+        "technicals": {"rsi_14": 54.2, "sma_20": 60900.0, "macd": None},
+        "forex_meta": None,
+    }
+
+
+RECENT_ROWS = guardian_context.RECENT_CANDLES
+
+
+def _state(turns: int, market: dict | None = None, words: int = 60) -> dict:
+    messages = [
+        {
+            "role": "bull" if i % 2 == 0 else "bear",
+            "content": f"Turn {i + 1} opening claim. " + "evidence " * words,
+        }
+        for i in range(turns)
+    ]
+    return {
+        "asset": "BTC",
+        "market_context": market if market is not None else _market(),
+        "messages": messages,
+        "current_turn": turns,
+        "max_turns": 12,
+        "current_agent": "bull",
+        "status": "running",
+    }
+
+
+class TestMarketContext:
+    def test_candles_summarised_and_empty_fields_dropped(self):
+        rendered = render_market_context(_market())
+
+        assert '"count":60' in rendered
+        assert "forex_meta" not in rendered
+        assert "macd" not in rendered
+        assert "Headline 9" not in rendered
+
+    def test_rendered_once_per_debate(self):
+        context = GuardianContext(recent_arguments=2, token_budget=0)
+        market = _market()
+        with patch.object(
+            guardian_context,
+            "compact_market_context",
+            wraps=compact_market_context,
+        ) as render:
+            for turns in range(1, 6):
+                context.build(_state(turns, market))
+
+        assert render.call_count == 1
+
+    def test_trimming_drops_candle_rows_then_largest_fields(self):
+        compact = compact_market_context(_market())
+        full = render_market_context(_market())
+
+        fewer_rows = json.loads(trim_market_context(compact, len(full) - 20))
+        tiny = json.loads(trim_market_context(compact, 40))
+
+        assert len(fewer_rows["ohlcv"]["recent_ohlc"]) < RECENT_ROWS
+        assert fewer_rows["news_summary"] == compact["news_summary"]
+        assert len(json.dumps(tiny, separators=(",", ":"))) <= 40
+        assert trim_market_context(compact, 0) == "{}"
+        assert len(compact["ohlcv"]["recent_ohlc"]) == RECENT_ROWS
+
+
+class TestArguments:
+    def test_short_debate_matches_full_transcript(self):
+        state = _state(3)
+        _, arguments = GuardianContext(recent_arguments=4, token_budget=0).build(state)
+
+        assert arguments == "\n".join(
+            f"[{m['role'].upper()}]: {m['content']}" for m in state["messages"]
+        )
+
+    def test_older_turns_summarised_incrementally(self):
+        context = GuardianContext(recent_arguments=2, token_budget=0)
+        market = _market()
+        with patch.object(
+            guardian_context, "_summary_line", wraps=guardian_context._summary_line
+        ) as summarise:
+            for turns in range(1, 9):
+                _, arguments = context.build(_state(turns, market))
+
+        assert summarise.call_count == 6
+        assert "- [BULL] Turn 1 opening claim." in arguments
+        assert "Turn 1 opening claim. evidence" not in arguments
+        assert arguments.count("opening claim. evidence") == 2
+
+    def test_new_transcript_resets_summary(self):
+        context = GuardianContext(recent_arguments=1, token_budget=0)
+        context.build(_state(5))
+
+        _, arguments = context.build(_state(1))
+
+        assert arguments.startswith("[BULL]: Turn 1")
+
+
+class TestTokenBudget:
+    @pytest.mark.parametrize("budget", [300, 800, 2000])
+    def test_context_never_exceeds_budget(self, budget):
+        context = GuardianContext(recent_arguments=4, token_budget=budget)
+
+        market, arguments = context.build(_state(12, words=400))
+
+        assert estimate_tokens(market) + estimate_tokens(arguments) <= budget
+        assert "Turn 12 opening claim." in arguments
+
+    def test_market_is_trimmed_to_valid_json_before_latest_argument(self):
+        state = _state(1, words=300)
+        latest = f"[BULL]: {state['messages'][0]['content']}"
+        budget = estimate_tokens(latest) + 60
+        context = GuardianContext(recent_arguments=1, token_budget=budget)
+
+        market, arguments = context.build(state)
+
+        assert arguments == latest
+        assert isinstance(json.loads(market), dict)
+        assert estimate_tokens(market) + estimate_tokens(arguments) <= budget
+
+    def test_omitted_turns_are_flagged(self):
+        context = GuardianContext(recent_arguments=2, token_budget=600)
+
+        _, arguments = context.build(_state(12, words=100))
+
+        assert "oldest omitted" in arguments
+
+
+class TestSavings:
+    def test_reports_savings_for_a_long_debate(self):
+        context = GuardianContext(recent_arguments=4, token_budget=3000)
+        market = _market()
+        for turns in range(1, 13):
+            context.build(_state(turns, market))
+
+        stats = context.get_stats()
+
+        assert stats["prompts"] == 12
+        assert stats["sent_tokens"] < stats["full_tokens"]
+        assert stats["saved_ratio"] > 0.5
@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.debate.engine import (
+    _DeferredBroadcast,
+    _pause_events,
+    stream_debate,
+)
+from app.services.debate.agents.guardian import GuardianAnalysisResult
+from tests.services.debate.test_helpers import (
+    get_action_types,
+    patched_debate_engine,
+    schedule_ack,
+)
+
+GENERATE_DELAY = 0.1
+ANALYZE_DELAY = 0.1
+
+
+def _analysis(should_interrupt: bool) -> dict:
+    return GuardianAnalysisResult(
+        should_interrupt=should_interrupt,
+        risk_level="high" if should_interrupt else "low",
+        reason="Caution warranted" if should_interrupt else "All clear",
+        safe=not should_interrupt,
+        summary_verdict="Caution" if should_interrupt else "Wait",
+    ).model_dump()
+
+
+def _slow_generate(agent: str, next_agent: str):
+    async def generate(state, **kwargs):
+        await asyncio.sleep(GENERATE_DELAY)
+        return {
+            "messages": state.get("messages", [])
+            + [{"role": agent, "content": f"{agent} turn {state['current_turn'] + 1}"}],
+            "current_turn": state["current_turn"] + 1,
+            "current_agent": next_agent,
+        }
+
+    return AsyncMock(side_effect=generate)
+
+
+def _manager() -> MagicMock:
+    manager = MagicMock()
+    manager.broadcast_to_debate = AsyncMock()
+    manager.active_debates = {}
+    return manager
+
+
+async def _run(debate_id: str, analyze, pipelined: bool, max_turns: int = 4):
+    manager = _manager()
+    with (
+        patched_debate_engine(analyze, ack_timeout=2) as mocks,
+        patch("app.config.settings.guardian_pipelined", pipelined),
+        patch("app.services.debate.engine.archive_with_retry", AsyncMock()),
+    ):
+        mocks["bull"].generate = _slow_generate("bull", "bear")
+        mocks["bear"].generate = _slow_generate("bear", "bull")
+        stale_guardian = MagicMock()
+        stale_guardian.get_freshness_status = AsyncMock(
+            return_value=MagicMock(is_stale=False)
+        )
+        start = time.perf_counter()
+        await stream_debate(
+            debate_id,
+            "BTC",
+            {"summary": "Loaded"},
+            manager,
+            max_turns=max_turns,
+            stale_guardian=stale_guardian,
+        )
+        elapsed = time.perf_counter() - start
+    return manager, mocks, elapsed
+
+
+def _frames(manager: MagicMock) -> list[tuple[str, dict]]:
+    return [
+        (c.args[1]["type"], c.args[1]["payload"])
+        for c in manager.broadcast_to_debate.call_args_list
+    ]
+
+
+class TestPipelinedGuardian:
+    def setup_method(self):
+        _pause_events.clear()
+
+    def teardown_method(self):
+        _pause_events.clear()
+
+    @pytest.mark.asyncio
+    async def test_safe_debate_is_faster_with_identical_frames(self):
+        async def analyze(state):
+            await asyncio.sleep(ANALYZE_DELAY)
+            return _analysis(False)
+
+        sequential, _, sequential_time = await _run("deb_seq", analyze, False)
+        pipelined, _, pipelined_time = await _run("deb_pipe", analyze, True)
+
+        assert get_action_types(pipelined) == get_action_types(sequential)
+        # Three of the four Guardian calls overlap the next turn.
+        assert pipelined_time < sequential_time - ANALYZE_DELAY
+
+    @pytest.mark.asyncio
+    async def test_interrupt_discards_speculative_turn(self):
+        calls = 0
+
+        async def analyze(state):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(ANALYZE_DELAY)
+            return _analysis(calls == 1)
+
+        await schedule_ack("deb_pipe_interrupt", delay=0.3)
+        manager, mocks, _ = await _run("deb_pipe_interrupt", analyze, True)
+
+        frames = _frames(manager)
+        kinds = [kind for kind, _ in frames]
+        resumed = kinds.index("DEBATE/DEBATE_RESUMED")
+        bear_turns = [
+            i
+            for i, (kind, payload) in enumerate(frames)
+            if kind == "DEBATE/ARGUMENT_COMPLETE" and payload["agent"] == "bear"
+        ]
+        assert kinds.index("DEBATE/DEBATE_PAUSED") < resumed
+        assert kinds.count("DEBATE/ARGUMENT_COMPLETE") == 4
+        assert len(bear_turns) == 2
+        assert min(bear_turns) > resumed
+        # The discarded speculative bear turn plus the real one after resume.
+        first_bear_state = mocks["bear"].generate.call_args_list[0].args[0]
+        retried_bear_state = mocks["bear"].generate.call_args_list[1].args[0]
+        assert all(m["role"] != "guardian" for m in first_bear_state["messages"])
+        assert retried_bear_state["messages"][-1]["role"] == "guardian"
+
+
+class TestDeferredBroadcast:
+    @pytest.mark.asyncio
+    async def test_publish_replays_in_order_then_passes_through(self):
+        manager = _manager()
+        deferred = _DeferredBroadcast(manager)
+        audit = AsyncMock()
+
+        await deferred.broadcast_to_debate("d", {"type": "A"})
+        await deferred.when_published(audit)
+        await deferred.broadcast_to_debate("d", {"type": "B"})
+        manager.broadcast_to_debate.assert_not_called()
+
+        await deferred.publish()
+        await deferred.broadcast_to_debate("d", {"type": "C"})
+
+        assert get_action_types(manager) == ["A", "B", "C"]
+        audit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_discard_drops_frames_and_actions(self):
+        manager = _manager()
+        deferred = _DeferredBroadcast(manager)
+        audit = AsyncMock()
+
+        await deferred.broadcast_to_debate("d", {"type": "A"})
+        await deferred.when_published(audit)
+        deferred.discard()
+        await deferred.broadcast_to_debate("d", {"type": "late token"})
+
+        manager.broadcast_to_debate.assert_not_called()
+        audit.assert_not_called()
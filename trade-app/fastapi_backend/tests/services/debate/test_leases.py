@@ -0,0 +1,282 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from app.services.debate import DebateService
+from app.services.debate import leases as leases_module
+from app.services.debate.engine import create_debate_graph
+from app.services.debate.leases import INFLIGHT_KEY, DebateLeaseManager
+
+
+class FakeRedis:
+    """Just enough Redis for leases: expiring strings, hashes, two scripts."""
+
+    def __init__(self):
+        self.strings: dict[str, tuple[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def _live(self, key):
+        entry = self.strings.get(key)
+        if entry and entry[1] <= time.monotonic():
+            del self.strings[key]
+            return None
+        return entry
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and self._live(key):
+            return None
+        self.strings[key] = (value, time.monotonic() + px / 1000)
+        return True
+
+    async def exists(self, key):
+        return 1 if self._live(key) else 0
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def expire_now(self, key):
+        self.strings.pop(key, None)
+
+    def register_script(self, script):
+        async def run(keys, args):
+            entry = self._live(keys[0])
+            if not entry or entry[0] != args[0]:
+                return 0
+            if script == leases_module._RENEW_SCRIPT:
+                self.strings[keys[0]] = (entry[0], time.monotonic() + args[1] / 1000)
+            else:
+                del self.strings[keys[0]]
+            return 1
+
+        return run
+
+
+def _leases(redis, worker_id, **kwargs) -> DebateLeaseManager:
+    return DebateLeaseManager(
+        redis=redis, worker_id=worker_id, ttl_seconds=30, renew_interval=10, **kwargs
+    )
+
+
+class TestDebateLeaseManager:
+    @pytest.mark.asyncio
+    async def test_held_lease_is_not_orphaned_or_claimable(self):
+        redis = FakeRedis()
+        owner, peer = _leases(redis, "w1"), _leases(redis, "w2")
+
+        assert await owner.acquire("deb_1", {"asset": "BTC"})
+
+        assert await peer.orphaned() == {}
+        assert not await peer.claim("deb_1")
+        await owner.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_orphaned_and_claimable(self):
+        redis = FakeRedis()
+        owner, peer = _leases(redis, "w1"), _leases(redis, "w2")
+        await owner.acquire("deb_1", {"asset": "BTC"})
+
+        redis.expire_now("debate_lease:deb_1")
+
+        assert await peer.orphaned() == {"deb_1": {"asset": "BTC"}}
+        assert await peer.claim("deb_1")
+        await owner.close()
+        await peer.close()
+
+    @pytest.mark.asyncio
+    async def test_release_forgets_debate_but_handoff_keeps_it(self):
+        redis = FakeRedis()
+        owner, peer = _leases(redis, "w1"), _leases(redis, "w2")
+        await owner.acquire("deb_done", {"asset": "BTC"})
+        await owner.acquire("deb_moved", {"asset": "ETH"})
+
+        await owner.release("deb_done")
+        await owner.handoff("deb_moved")
+
+        assert "deb_done" not in redis.hashes[INFLIGHT_KEY]
+        assert await peer.orphaned() == {"deb_moved": {"asset": "ETH"}}
+        await owner.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_owner_cannot_release_successors_lease(self):
+        redis = FakeRedis()
+        lost = MagicMock()
+        owner = _leases(redis, "w1", on_lost=lost)
+        peer = _leases(redis, "w2")
+        await owner.acquire("deb_1", {"asset": "BTC"})
+        redis.expire_now("debate_lease:deb_1")
+        await peer.claim("deb_1")
+
+        await owner.renew()
+        await owner.handoff("deb_1")
+
+        lost.assert_called_once_with("deb_1")
+        assert not owner.owns("deb_1")
+        assert await redis.exists("debate_lease:deb_1")
+        await owner.close()
+        await peer.close()
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_degrades_to_unleased(self):
+        redis = MagicMock()
+        redis.register_script = MagicMock()
+        redis.hset = AsyncMock(side_effect=ConnectionError("down"))
+        redis.hgetall = AsyncMock(side_effect=ConnectionError("down"))
+
+        leases = _leases(redis, "w1")
+
+        assert await leases.acquire("deb_1", {"asset": "BTC"}) is False
+        assert await leases.orphaned() == {}
+
+
+def _turn_node(role: str, next_agent: str, calls: list, gate: asyncio.Event | None):
+    async def node(state, manager=None, debate_id=None):
+        turn = state["current_turn"] + 1
+        if gate is not None and turn == 3:
+            await gate.wait()
+        calls.append((role, turn))
+        return {
+            "messages": state["messages"]
+            + [{"role": role, "content": f"{role} turn {turn}"}],
+            "current_turn": turn,
+            "current_agent": next_agent,
+        }
+
+    return node
+
+
+class TestCrashSafeResume:
+    @pytest.fixture
+    def service_factory(self):
+        checkpointer = MemorySaver()
+        redis = FakeRedis()
+        calls: list = []
+        hang = asyncio.Event()
+
+        def make(worker_id: str, hang_on_turn_three: bool = False):
+            gate = hang if hang_on_turn_three else None
+            with (
+                patch("app.config.Settings.validate_llm_config"),
+                patch(
+                    "app.services.debate.engine.bull_agent_node",
+                    _turn_node("bull", "bear", calls, gate),
+                ),
+                patch(
+                    "app.services.debate.engine.bear_agent_node",
+                    _turn_node("bear", "bull", calls, gate),
+                ),
+                patch(
+                    "app.services.debate.create_debate_graph",
+                    side_effect=lambda: create_debate_graph(checkpointer),
+                ),
+            ):
+                service = DebateService("redis://localhost:6379/0")
+            service.leases = _leases(redis, worker_id, on_lost=service._on_lease_lost)
+            return service
+
+        return make, redis, calls
+
+    @pytest.fixture(autouse=True)
+    def debate_side_effects(self):
+        with (
+            patch("app.services.debate.archive_with_retry", AsyncMock()) as archive,
+            patch(
+                "app.services.debate.generate_trading_analysis",
+                AsyncMock(return_value={"direction": "long"}),
+            ),
+            patch.object(
+                DebateService, "_debate_status", AsyncMock(return_value="running")
+            ),
+        ):
+            yield archive
+
+    @pytest.mark.asyncio
+    async def test_peer_resumes_from_checkpoint_after_worker_dies(
+        self, service_factory, debate_side_effects
+    ):
+        make, redis, calls = service_factory
+        dying = make("w1", hang_on_turn_three=True)
+        state = {
+            "asset": "BTC",
+            "market_context": {"technicals": {"rsi_14": 50}},
+            "messages": [],
+            "current_turn": 0,
+            "max_turns": 6,
+            "current_agent": "bull",
+            "status": "running",
+        }
+        await dying.leases.acquire("deb_crash", {"asset": "BTC"})
+        run = dying._start_run("deb_crash", "BTC", state)
+        config = {"configurable": {"thread_id": "deb_crash"}}
+        while (await dying.graph.aget_state(config)).values.get("current_turn") != 2:
+            await asyncio.sleep(0.001)
+
+        # The worker dies mid-turn-3: its run stops and its lease lapses.
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        await dying.leases.close()
+        redis.expire_now("debate_lease:deb_crash")
+
+        survivor = make("w2")
+        assert await survivor.recover_orphaned() == ["deb_crash"]
+        await survivor.scheduler.join()
+
+        assert calls == [
+            ("bull", 1),
+            ("bear", 2),
+            ("bull", 3),
+            ("bear", 4),
+            ("bull", 5),
+            ("bear", 6),
+        ]
+        archived_state = debate_side_effects.call_args.args[1]
+        assert archived_state["current_turn"] == 6
+        assert len(archived_state["messages"]) == 6
+        assert INFLIGHT_KEY not in redis.hashes or not redis.hashes[INFLIGHT_KEY]
+        await survivor.leases.close()
+
+    @pytest.mark.asyncio
+    async def test_drain_hands_off_runs_that_do_not_finish(self, service_factory):
+        make, redis, _ = service_factory
+        service = make("w1", hang_on_turn_three=True)
+        state = {
+            "asset": "BTC",
+            "market_context": {},
+            "messages": [],
+            "current_turn": 0,
+            "max_turns": 6,
+            "current_agent": "bull",
+            "status": "running",
+        }
+        await service.leases.acquire("deb_drain", {"asset": "BTC"})
+        service._start_run("deb_drain", "BTC", state)
+        await asyncio.sleep(0.05)
+
+        await service.drain(timeout=0.05)
+
+        assert not await redis.exists("debate_lease:deb_drain")
+        assert "deb_drain" in redis.hashes[INFLIGHT_KEY]
+        assert service._runs == {}
+
+    @pytest.mark.asyncio
+    async def test_finished_debate_is_not_resumed(self, service_factory):
+        make, redis, _ = service_factory
+        service = make("w1")
+        await redis.hset(INFLIGHT_KEY, "deb_old", '{"asset": "BTC"}')
+
+        with patch.object(
+            DebateService, "_debate_status", AsyncMock(return_value="completed")
+        ):
+            assert await service.recover_orphaned() == []
+
+        assert "deb_old" not in redis.hashes[INFLIGHT_KEY]
+        await service.leases.close()
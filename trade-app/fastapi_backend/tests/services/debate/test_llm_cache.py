@@ -0,0 +1,204 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+
+from app.services.debate import llm_cache
+from app.services.debate.agents.guardian import GuardianAgent
+from app.services.debate.agents.trading_analyst import generate_trading_analysis
+from app.services.debate.llm_cache import (
+    LLMResponseCache,
+    get_llm_cache,
+    llm_cache_key,
+)
+from app.services.metrics import LLM_CACHE_EVICTIONS, LLM_CACHE_REQUESTS
+from tests.services.debate.conftest import make_guardian_result
+
+
+class FakeCacheRedis:
+    """Strings with TTLs ignored, one sorted set, and a queued pipeline."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.zset: dict[str, float] = {}
+
+    def pipeline(self, transaction=True):
+        redis = self
+        calls = []
+
+        class Pipe:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: calls.append(
+                    getattr(redis, name)(*args, **kwargs)
+                )
+
+            async def execute(self):
+                return [await call for call in calls]
+
+        return Pipe()
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def zadd(self, key, mapping):
+        self.zset.update(mapping)
+
+    async def zremrangebyscore(self, key, low, high):
+        for member in [m for m, score in self.zset.items() if score <= high]:
+            del self.zset[member]
+
+    async def zcard(self, key):
+        return len(self.zset)
+
+    async def zrange(self, key, start, stop):
+        return sorted(self.zset, key=self.zset.get)[start : stop + 1]
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.zset.pop(member, None)
+
+
+@pytest.fixture
+def enabled_cache():
+    """Every cacheable site enabled, backed by one fake Redis."""
+    redis = FakeCacheRedis()
+    caches = {
+        site: LLMResponseCache(site, redis=redis, ttl_seconds=60, max_entries=100)
+        for site in llm_cache.CACHEABLE_SITES
+    }
+    with (
+        patch.object(llm_cache.settings, "llm_cache_sites", "guardian,trading_analyst"),
+        patch.dict(llm_cache._caches, caches, clear=True),
+    ):
+        yield redis
+
+
+MESSAGES = [SystemMessage("judge"), HumanMessage("transcript")]
+
+
+class TestCacheKey:
+    def test_identical_calls_share_a_key(self):
+        assert llm_cache_key("m", 0.3, MESSAGES) == llm_cache_key(
+            "m", 0.3, list(MESSAGES)
+        )
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            ("other", 0.3, MESSAGES, None),
+            ("m", 0.7, MESSAGES, None),
+            ("m", 0.3, [SystemMessage("judge"), HumanMessage("edited")], None),
+            ("m", 0.3, MESSAGES, {"title": "Schema"}),
+        ],
+    )
+    def test_model_temperature_prompt_and_schema_change_the_key(self, changed):
+        assert llm_cache_key(*changed) != llm_cache_key("m", 0.3, MESSAGES)
+
+
+class TestLLMResponseCache:
+    @pytest.mark.asyncio
+    async def test_round_trip_counts_miss_then_hit(self):
+        cache = LLMResponseCache("guardian", redis=FakeCacheRedis())
+        misses = LLM_CACHE_REQUESTS.get("guardian", "miss")
+        hits = LLM_CACHE_REQUESTS.get("guardian", "hit")
+
+        assert await cache.get("k") is None
+        await cache.set("k", {"safe": True})
+
+        assert await cache.get("k") == {"safe": True}
+        assert LLM_CACHE_REQUESTS.get("guardian", "miss") == misses + 1
+        assert LLM_CACHE_REQUESTS.get("guardian", "hit") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_oldest_entries_are_evicted_past_the_size_bound(self):
+        redis = FakeCacheRedis()
+        cache = LLMResponseCache("guardian", redis=redis, max_entries=2)
+        evicted = LLM_CACHE_EVICTIONS.get("guardian")
+
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") == "c"
+        assert set(redis.zset) == {"b", "c"}
+        assert LLM_CACHE_EVICTIONS.get("guardian") == evicted + 1
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_is_a_miss(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.pipeline = MagicMock(side_effect=ConnectionError("down"))
+        cache = LLMResponseCache("trading_analyst", redis=redis)
+        errors = LLM_CACHE_REQUESTS.get("trading_analyst", "error")
+
+        assert await cache.get("k") is None
+        await cache.set("k", {})
+        assert LLM_CACHE_REQUESTS.get("trading_analyst", "error") == errors + 1
+
+
+class TestCallSites:
+    def test_sites_are_opt_in_and_agent_turns_are_never_cacheable(self):
+        with patch.object(llm_cache.settings, "llm_cache_sites", "trading_analyst"):
+            assert get_llm_cache("guardian") is None
+            assert get_llm_cache("trading_analyst") is not None
+            with pytest.raises(ValueError):
+                get_llm_cache("bull")
+
+    @pytest.mark.asyncio
+    async def test_guardian_reuses_analysis_of_identical_transcript(
+        self, enabled_cache, debate_state_with_arguments
+    ):
+        calls = []
+
+        def review(prompt_value):
+            calls.append(prompt_value)
+            return make_guardian_result(reason="Looks balanced.")
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value = RunnableLambda(review)
+
+        first = await GuardianAgent(llm=llm).analyze(debate_state_with_arguments)
+        second = await GuardianAgent(llm=llm).analyze(debate_state_with_arguments)
+
+        assert len(calls) == 1
+        assert first == second
+        assert second["reason"] == "Looks balanced."
+
+    @pytest.mark.asyncio
+    async def test_trading_analysis_is_cached_only_when_it_parses(self, enabled_cache):
+        llm = RunnableLambda(lambda _: MagicMock(content='{"winner": "bull"}'))
+        messages = [
+            {"role": "bull", "content": "Up"},
+            {"role": "bear", "content": "Down"},
+        ]
+        with patch(
+            "app.services.debate.agents.trading_analyst.get_llm_with_failover",
+            AsyncMock(return_value=llm),
+        ) as get_llm:
+            first = await generate_trading_analysis("btc", messages)
+            second = await generate_trading_analysis("btc", messages)
+
+        assert first == second == {"winner": "bull"}
+        get_llm.assert_awaited_once()
+
+        with patch(
+            "app.services.debate.agents.trading_analyst.get_llm_with_failover",
+            AsyncMock(return_value=RunnableLambda(lambda _: MagicMock(content="nope"))),
+        ) as get_llm:
+            await generate_trading_analysis("eth", messages)
+            await generate_trading_analysis("eth", messages)
+
+        assert get_llm.await_count == 2
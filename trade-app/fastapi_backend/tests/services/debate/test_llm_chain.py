@@ -0,0 +1,174 @@
+import time
+
+import pytest
+from unittest.mock import patch
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.services.debate import llm_provider
+from app.services.debate.exceptions import LLMProviderError
+from app.services.debate.llm_chain import (
+    FakeChatModel,
+    HedgedChatModel,
+    provider_health,
+    reset_provider_health,
+)
+from app.services.debate.llm_provider import clear_llm_pool, get_llm_with_failover
+from app.services.metrics import LLM_FAILOVERS, LLM_HEDGES
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    reset_provider_health()
+    clear_llm_pool()
+    yield
+    reset_provider_health()
+    clear_llm_pool()
+
+
+class TokenCollector(AsyncCallbackHandler):
+    def __init__(self):
+        self.tokens = []
+        self.ends = 0
+
+    async def on_llm_new_token(self, token, **kwargs):
+        self.tokens.append(token)
+
+    async def on_llm_end(self, response, **kwargs):
+        self.ends += 1
+
+
+def _chain(primary: FakeChatModel, backup: FakeChatModel, **kwargs) -> HedgedChatModel:
+    return HedgedChatModel(
+        providers=[("primary", primary), ("backup", backup)], **kwargs
+    )
+
+
+class TestFailover:
+    @pytest.mark.asyncio
+    async def test_error_before_first_token_fails_over(self):
+        failovers = LLM_FAILOVERS.get("backup")
+        chain = _chain(
+            FakeChatModel(error="quota exceeded"),
+            FakeChatModel(responses=["backup answer"]),
+        )
+
+        response = await chain.ainvoke("hello")
+
+        assert response.content == "backup answer"
+        assert provider_health("primary").failures == 1
+        assert provider_health("backup").successes == 1
+        assert LLM_FAILOVERS.get("backup") == failovers + 1
+
+    @pytest.mark.asyncio
+    async def test_every_provider_failing_raises_the_last_error(self):
+        chain = _chain(FakeChatModel(error="a down"), FakeChatModel(error="b down"))
+
+        with pytest.raises(RuntimeError, match="b down"):
+            await chain.ainvoke("hello")
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_provider_is_tried_last(self):
+        chain = _chain(FakeChatModel(error="down"), FakeChatModel(responses=["ok"]))
+        for _ in range(4):
+            await chain.ainvoke("hello")
+
+        assert not provider_health("primary").healthy()
+        assert [name for name, _ in chain._ordered()] == ["backup", "primary"]
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_backup_wins(self):
+        won = LLM_HEDGES.get("backup_won")
+        primary = FakeChatModel(responses=["primary answer"], first_token_delay=1.0)
+        backup = FakeChatModel(responses=["backup answer"])
+        chain = _chain(primary, backup, initial_hedge_delay=0.05)
+
+        started = time.monotonic()
+        response = await chain.ainvoke("hello")
+
+        assert response.content == "backup answer"
+        assert time.monotonic() - started < 0.5
+        assert LLM_HEDGES.get("backup_won") == won + 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_never_starts_the_backup(self):
+        backup = FakeChatModel()
+        chain = _chain(
+            FakeChatModel(responses=["fast"]), backup, initial_hedge_delay=0.2
+        )
+
+        response = await chain.ainvoke("hello")
+
+        assert response.content == "fast"
+        assert backup.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_only_the_winner_streams_to_callbacks(self):
+        primary = FakeChatModel(responses=["slow words here"], first_token_delay=0.5)
+        backup = FakeChatModel(responses=["quick reply"])
+        chain = _chain(primary, backup, streaming=True, initial_hedge_delay=0.02)
+        prompt = ChatPromptTemplate.from_messages([("human", "{question}")])
+        collector = TokenCollector()
+
+        # Through a prompt pipe, as the agents call it: the children must not
+        # inherit the caller's handlers from the runnable context either.
+        await (prompt | chain).ainvoke(
+            {"question": "hello"}, config={"callbacks": [collector]}
+        )
+
+        assert collector.tokens == ["quick ", "reply"]
+        assert collector.ends == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_delay_follows_rolling_p95(self):
+        chain = _chain(FakeChatModel(), FakeChatModel(), initial_hedge_delay=5.0)
+        assert chain._hedge_delay("primary") == 5.0
+
+        for _ in range(20):
+            await chain.ainvoke("hello")
+
+        assert chain._hedge_delay("primary") < 0.1
+
+    @pytest.mark.asyncio
+    async def test_works_behind_a_prompt_and_with_tools_bound(self):
+        chain = _chain(FakeChatModel(responses=["from prompt"]), FakeChatModel())
+        prompt = ChatPromptTemplate.from_messages([("human", "{question}")])
+
+        response = await (prompt | chain.bind_tools([])).ainvoke({"question": "hi"})
+
+        assert response.content == "from prompt"
+        assert response.usage_metadata["output_tokens"] == 2
+
+
+class TestProviderChainSettings:
+    @pytest.mark.asyncio
+    async def test_missing_key_skips_gemini_when_another_provider_exists(self):
+        with (
+            patch.object(llm_provider.settings, "google_api_key", ""),
+            patch.object(llm_provider.settings, "llm_providers", "gemini,fake"),
+        ):
+            llm = await get_llm_with_failover()
+
+        assert isinstance(llm, FakeChatModel)
+
+    @pytest.mark.asyncio
+    async def test_several_providers_are_wrapped_in_a_hedged_chain(self):
+        with patch.object(
+            llm_provider.settings, "llm_providers", "fake, fake:backup-model"
+        ):
+            llm = await get_llm_with_failover(True)
+
+        assert isinstance(llm, HedgedChatModel)
+        assert llm.streaming is True
+        assert [name for name, _ in llm.providers] == [
+            f"fake:{llm_provider.settings.debate_llm_model}",
+            "fake:backup-model",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_provider_only_raises(self):
+        with patch.object(llm_provider.settings, "llm_providers", "nope"):
+            with pytest.raises(LLMProviderError, match="nope"):
+                await get_llm_with_failover()
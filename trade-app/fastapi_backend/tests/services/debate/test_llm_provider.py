@@ -0,0 +1,219 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.debate.agents.bull import BULL_PROMPT, BullAgent
+from app.services.debate.exceptions import LLMProviderError
+from app.services.debate import llm_provider
+from app.services.debate.llm_provider import (
+    PRIORITY_AGENT,
+    PRIORITY_ANALYSIS,
+    PRIORITY_GUARDIAN,
+    LLMGovernor,
+    clear_llm_pool,
+    get_llm_with_failover,
+    governed_ainvoke,
+    llm_call_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    clear_llm_pool()
+    yield
+    clear_llm_pool()
+
+
+@pytest.fixture
+def api_key():
+    with patch.object(llm_provider.settings, "google_api_key", "test-key"):
+        yield
+
+
+class TestClientPool:
+    @pytest.mark.asyncio
+    async def test_same_settings_reuse_one_client(self, api_key):
+        with patch(
+            "app.services.debate.llm_provider._build_gemini",
+            side_effect=lambda **kwargs: MagicMock(),
+        ) as build:
+            first = await get_llm_with_failover(True)
+            second = await get_llm_with_failover(True)
+
+        assert first is second
+        build.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_pool_is_keyed_by_model_temperature_and_streaming(self, api_key):
+        with patch(
+            "app.services.debate.llm_provider._build_gemini",
+            side_effect=lambda **kwargs: MagicMock(),
+        ) as build:
+            streaming = await get_llm_with_failover(True)
+            plain = await get_llm_with_failover(False)
+            cooler = await get_llm_with_failover(False, temperature=0.1)
+            other = await get_llm_with_failover(False, model="other-model")
+
+        assert len({id(streaming), id(plain), id(cooler), id(other)}) == 4
+        assert build.call_count == 4
+        for call in build.call_args_list:
+            assert "callbacks" not in call.kwargs
+
+    @pytest.mark.asyncio
+    async def test_missing_api_key_raises(self):
+        with patch.object(llm_provider.settings, "google_api_key", ""):
+            with pytest.raises(LLMProviderError):
+                await get_llm_with_failover()
+
+
+class TestCallConfig:
+    def test_streaming_handler_comes_first(self):
+        handler, timing = MagicMock(), MagicMock()
+
+        assert llm_call_config(handler, [timing]) == {"callbacks": [handler, timing]}
+
+    def test_no_callbacks_means_no_config(self):
+        assert llm_call_config() is None
+
+
+class TestSharedAgent:
+    def test_prompt_is_compiled_once(self):
+        assert BullAgent().prompt is BullAgent().prompt is BULL_PROMPT
+
+    @pytest.mark.asyncio
+    async def test_streaming_handler_is_passed_per_call(self, debate_state):
+        handler = MagicMock()
+        response = MagicMock(content="Bull case")
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(return_value=response)
+        with (
+            patch(
+                "app.services.debate.agents.bull.get_llm_with_failover",
+                new_callable=AsyncMock,
+            ) as get_llm,
+            patch("app.services.debate.agents.bull.BULL_PROMPT") as prompt,
+        ):
+            prompt.__or__ = MagicMock(return_value=chain)
+            agent = BullAgent()
+            await agent.generate(debate_state, streaming_handler=handler)
+            await agent.generate(debate_state)
+
+        assert [c.args for c in get_llm.await_args_list] == [(True,), (False,)]
+        configs = [c.kwargs["config"] for c in chain.ainvoke.await_args_list]
+        assert configs == [{"callbacks": [handler]}, None]
+
+
+async def _hold(
+    governor, gate, order, name, model="m", priority=PRIORITY_AGENT, tokens=0
+):
+    async with governor.slot(model, priority, tokens):
+        order.append(name)
+        await gate.wait()
+
+
+class TestLLMGovernor:
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_queues_instead_of_failing(self):
+        governor = LLMGovernor(max_concurrent=2)
+        gate, order = asyncio.Event(), []
+        tasks = [
+            asyncio.create_task(_hold(governor, gate, order, f"call_{i}"))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)
+
+        assert governor.inflight == 2 and governor.queued == 3
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == [f"call_{i}" for i in range(5)]
+        assert governor.inflight == 0 and governor.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_guardian_before_agents_before_analysis(self):
+        governor = LLMGovernor(max_concurrent=1)
+        first_gate, gate, order = asyncio.Event(), asyncio.Event(), []
+        gate.set()
+        running = asyncio.create_task(_hold(governor, first_gate, order, "running"))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(_hold(governor, gate, order, name, priority=priority))
+            for name, priority in (
+                ("analysis", PRIORITY_ANALYSIS),
+                ("agent", PRIORITY_AGENT),
+                ("guardian", PRIORITY_GUARDIAN),
+            )
+        ]
+        await asyncio.sleep(0)
+
+        first_gate.set()
+        await asyncio.gather(running, *queued)
+
+        assert order == ["running", "guardian", "agent", "analysis"]
+
+    @pytest.mark.asyncio
+    async def test_empty_token_bucket_delays_only_that_model(self):
+        governor = LLMGovernor(max_concurrent=4, tokens_per_minute=6000)
+        governor._model_buckets("slow")[1].level = 0
+        gate, order = asyncio.Event(), []
+        gate.set()
+
+        started = time.monotonic()
+        slow = asyncio.create_task(
+            _hold(governor, gate, order, "slow", "slow", tokens=5)
+        )
+        fast = asyncio.create_task(
+            _hold(governor, gate, order, "fast", "fast", tokens=5)
+        )
+        await asyncio.gather(slow, fast)
+
+        assert order == ["fast", "slow"]
+        assert time.monotonic() - started >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_request_bucket_limits_calls_per_minute(self):
+        governor = LLMGovernor(max_concurrent=4, requests_per_minute=2)
+        gate, order = asyncio.Event(), []
+        gate.set()
+        for name in ("a", "b"):
+            await _hold(governor, gate, order, name)
+
+        third = asyncio.create_task(_hold(governor, gate, order, "c"))
+        await asyncio.sleep(0.01)
+
+        assert order == ["a", "b"] and governor.queued == 1
+        third.cancel()
+        await asyncio.gather(third, return_exceptions=True)
+        assert governor.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_settle_refunds_overestimated_tokens(self):
+        governor = LLMGovernor(tokens_per_minute=1000)
+        async with governor.slot("m", tokens=800) as grant:
+            grant.settle(100)
+
+        assert governor._model_buckets("m")[1].level == pytest.approx(900, abs=5)
+
+    @pytest.mark.asyncio
+    async def test_governed_ainvoke_settles_from_reported_usage(self):
+        governor = LLMGovernor(tokens_per_minute=100_000)
+        response = MagicMock(usage_metadata={"total_tokens": 50})
+        chain = MagicMock()
+        chain.ainvoke = AsyncMock(return_value=response)
+
+        with patch(
+            "app.services.debate.llm_provider.get_llm_governor", return_value=governor
+        ):
+            result = await governed_ainvoke(
+                chain,
+                {"asset": "BTC"},
+                agent="bull",
+                model="m",
+                priority=PRIORITY_AGENT,
+            )
+
+        assert result is response
+        chain.ainvoke.assert_awaited_once_with({"asset": "BTC"}, config=None)
+        assert governor._model_buckets("m")[1].level == pytest.approx(99_950, abs=5)
@@ -0,0 +1,203 @@
+import json
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.prompts import ChatPromptTemplate
+
+from app.services.debate import llm_provider
+from app.services.debate.agents.bear import BearAgent
+from app.services.debate.agents.bull import BullAgent
+from app.services.debate.agents.guardian import GuardianAgent, GuardianAnalysisResult
+from app.services.debate.engine import _shared_agents, stream_debate
+from app.services.debate.exceptions import LLMProviderError
+from app.services.debate.llm_chain import FakeChatModel
+from app.services.debate.llm_provider import clear_llm_pool, get_llm_with_failover
+from app.services.debate.llm_replay import (
+    RecordingChatModel,
+    ReplayChatModel,
+    clear_tapes,
+    exchange_key,
+)
+from tests.services.debate.test_helpers import get_action_types
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    clear_tapes()
+    clear_llm_pool()
+    yield
+    clear_tapes()
+    clear_llm_pool()
+
+
+@pytest.fixture
+def tape(tmp_path):
+    return str(tmp_path / "tape.jsonl")
+
+
+def _replay(path: str, **kwargs) -> ReplayChatModel:
+    return ReplayChatModel(path=path, model_name="m", temperature=0.7, **kwargs)
+
+
+class TestRecordReplay:
+    @pytest.mark.asyncio
+    async def test_recorded_exchange_replays_identically(self, tape):
+        recorder = RecordingChatModel(
+            inner=FakeChatModel(responses=["prices look firm"], token_delay=0.01),
+            path=tape,
+            model_name="m",
+            temperature=0.7,
+        )
+        original = await recorder.ainvoke("bull case?")
+
+        [record] = [json.loads(line) for line in open(tape)]
+        offsets = [chunk["t"] for chunk in record["chunks"]]
+        replayed = await _replay(tape, speedup=0).ainvoke("bull case?")
+
+        assert len(offsets) == 3 and offsets == sorted(offsets) and offsets[-1] > 0
+        assert replayed.content == original.content == "prices look firm"
+        assert replayed.usage_metadata == original.usage_metadata
+
+    @pytest.mark.asyncio
+    async def test_recording_behind_a_prompt_streams_each_token_once(self, tape):
+        class Collector(AsyncCallbackHandler):
+            def __init__(self):
+                self.tokens = []
+                self.ends = 0
+
+            async def on_llm_new_token(self, token, **kwargs):
+                self.tokens.append(token)
+
+            async def on_llm_end(self, response, **kwargs):
+                self.ends += 1
+
+        recorder = RecordingChatModel(
+            inner=FakeChatModel(responses=["a b c"]),
+            path=tape,
+            model_name="m",
+            temperature=0.7,
+            streaming=True,
+        )
+        prompt = ChatPromptTemplate.from_messages([("human", "{question}")])
+        collector = Collector()
+
+        await (prompt | recorder).ainvoke(
+            {"question": "bull case?"}, config={"callbacks": [collector]}
+        )
+
+        assert collector.tokens == ["a ", "b ", "c"]
+        assert collector.ends == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_timing_divided_by_speedup(self, tape):
+        chunks = [{"t": 0.1 * i, "content": f"w{i} "} for i in range(1, 6)]
+        key = exchange_key("m", 0.7, [], [])
+        with open(tape, "w") as f:
+            f.write(json.dumps({"key": key, "tools": [], "chunks": chunks}) + "\n")
+
+        started = time.monotonic()
+        response = await _replay(tape, speedup=5).ainvoke("anything")
+        elapsed = time.monotonic() - started
+
+        assert response.content == "w1 w2 w3 w4 w5 "
+        assert 0.08 <= elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_unrecorded_prompt_gets_next_answer_with_same_tools(self, tape):
+        args = json.dumps(
+            {
+                "should_interrupt": True,
+                "risk_level": "high",
+                "reason": "Guaranteed returns",
+                "summary_verdict": "High Risk",
+                "safe": False,
+            }
+        )
+        tool_call = {
+            "name": "GuardianAnalysisResult",
+            "args": args,
+            "id": "1",
+            "index": 0,
+        }
+        records = [
+            {"key": "agent", "tools": [], "chunks": [{"t": 0, "content": "text"}]},
+            {
+                "key": "guardian",
+                "tools": ["GuardianAnalysisResult"],
+                "chunks": [{"t": 0, "content": "", "toolCallChunks": [tool_call]}],
+            },
+        ]
+        with open(tape, "w") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+
+        structured = _replay(tape, speedup=0).with_structured_output(
+            GuardianAnalysisResult
+        )
+        result = await structured.ainvoke("a live prompt never recorded")
+
+        assert isinstance(result, GuardianAnalysisResult)
+        assert result.should_interrupt and result.risk_level == "high"
+
+
+class TestOfflineProviders:
+    @pytest.mark.asyncio
+    async def test_replay_without_a_tape_raises(self, tape):
+        with (
+            patch.object(llm_provider.settings, "llm_providers", "replay"),
+            patch.object(llm_provider.settings, "llm_record_path", tape),
+        ):
+            with pytest.raises(LLMProviderError, match="tape not found"):
+                await get_llm_with_failover()
+
+    @pytest.mark.asyncio
+    async def test_synthetic_streams_n_tokens_at_target_rate(self):
+        with (
+            patch.object(llm_provider.settings, "llm_providers", "synthetic"),
+            patch.object(llm_provider.settings, "llm_synthetic_tokens", 20),
+            patch.object(llm_provider.settings, "llm_synthetic_tokens_per_second", 200),
+            patch.object(llm_provider.settings, "llm_synthetic_first_token_seconds", 0),
+        ):
+            llm = await get_llm_with_failover(True)
+            started = time.monotonic()
+            response = await llm.ainvoke("go")
+            elapsed = time.monotonic() - started
+
+        assert len(response.content.split()) == 20
+        assert 0.08 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_stream_debate_runs_end_to_end_on_synthetic_llm(
+        self, mock_manager, mock_stale_guardian
+    ):
+        _shared_agents.clear()
+        mock_manager.admission.token_fps_scale.return_value = 1.0
+        with (
+            patch.object(llm_provider.settings, "llm_providers", "synthetic"),
+            patch.object(llm_provider.settings, "llm_synthetic_tokens", 10),
+            patch.object(
+                llm_provider.settings, "llm_synthetic_tokens_per_second", 1000
+            ),
+            patch.object(llm_provider.settings, "llm_synthetic_first_token_seconds", 0),
+            patch("app.services.debate.engine.stream_state") as stream_state,
+            patch("app.services.debate.engine.archive_with_retry", AsyncMock()),
+            # Real agents end to end, whatever an earlier test left patched.
+            patch("app.services.debate.engine.BullAgent", BullAgent),
+            patch("app.services.debate.engine.BearAgent", BearAgent),
+            patch("app.services.debate.engine.GuardianAgent", GuardianAgent),
+        ):
+            stream_state.save_state = AsyncMock()
+            result = await stream_debate(
+                "deb_synthetic",
+                "BTC",
+                {"summary": "Bitcoin market data loaded", "price": 45000},
+                mock_manager,
+                max_turns=2,
+                stale_guardian=mock_stale_guardian,
+            )
+        _shared_agents.clear()
+
+        assert result["status"] == "completed"
+        assert result["current_turn"] == 2
+        assert "DEBATE/TOKEN_RECEIVED" in get_action_types(mock_manager)
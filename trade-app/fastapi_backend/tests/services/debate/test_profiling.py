@@ -0,0 +1,189 @@
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from app.services.debate.engine import _generate_turn
+from app.services.debate.profiling import (
+    MAX_SPANS,
+    PHASE_BROADCAST,
+    PHASE_GUARDIAN,
+    PHASE_LLM,
+    PHASE_SANITIZATION,
+    DebateProfile,
+    LLMTimingHandler,
+    activate,
+    current_profile,
+    profiled,
+    summarize_profiles,
+)
+
+
+class TestDebateProfile:
+    def test_record_accumulates_phase_totals_and_spans(self):
+        profile = DebateProfile()
+        profile.record(PHASE_GUARDIAN, 0.2, turn=1)
+        profile.record(PHASE_GUARDIAN, 0.5, turn=2)
+
+        count, total_ms, max_ms = profile.phases[PHASE_GUARDIAN]
+        assert count == 2
+        assert total_ms == pytest.approx(700)
+        assert max_ms == pytest.approx(500)
+        assert [span[3] for span in profile.spans] == [1, 2]
+
+    def test_broadcasts_feed_totals_only(self):
+        profile = DebateProfile()
+        for _ in range(50):
+            profile.record(PHASE_BROADCAST, 0.001)
+
+        assert profile.phases[PHASE_BROADCAST][0] == 50
+        assert profile.spans == []
+
+    def test_timeline_is_capped(self):
+        profile = DebateProfile()
+        for _ in range(MAX_SPANS + 10):
+            profile.record(PHASE_SANITIZATION, 0.001)
+
+        assert len(profile.spans) == MAX_SPANS
+        assert profile.phases[PHASE_SANITIZATION][0] == MAX_SPANS + 10
+
+    def test_measure_offsets_spans_from_profile_start(self):
+        profile = DebateProfile(started_at=time.time() - 2)
+        with profile.measure(PHASE_GUARDIAN, turn=3):
+            pass
+
+        phase, offset_ms, _, turn = profile.spans[0]
+        assert (phase, turn) == (PHASE_GUARDIAN, 3)
+        assert 1900 <= offset_ms <= 2500
+
+    def test_record_turn_derives_tokens_per_second(self):
+        profile = DebateProfile()
+        profile.record_turn(1, "bull", 2.0, first_token_seconds=0.25, output_tokens=100)
+        profile.record_turn(2, "bear", 1.0)
+
+        assert profile.turns[0] == {
+            "turn": 1,
+            "agent": "bull",
+            "ttftMs": 250.0,
+            "genMs": 2000.0,
+            "tokens": 100,
+            "tokensPerSec": 50.0,
+        }
+        assert profile.turns[1]["ttftMs"] is None
+        assert profile.turns[1]["tokensPerSec"] is None
+
+    def test_round_trip_continues_the_same_profile(self):
+        profile = DebateProfile()
+        profile.record(PHASE_GUARDIAN, 0.1, turn=1)
+        profile.record_turn(1, "bull", 1.0, output_tokens=10)
+
+        resumed = DebateProfile.from_dict(profile.to_dict())
+        resumed.record(PHASE_GUARDIAN, 0.1, turn=2)
+        data = resumed.to_dict()
+
+        assert data["startedAt"] == round(profile.started_at, 3)
+        assert data["phases"][PHASE_GUARDIAN][0] == 2
+        assert len(data["turns"]) == 1
+        assert len(data["spans"]) == 2
+
+
+class TestProfileContext:
+    def test_profiled_without_active_profile_is_a_noop(self):
+        assert current_profile() is None
+        with profiled(PHASE_GUARDIAN):
+            pass
+        assert current_profile() is None
+
+    def test_profiled_records_into_active_profile(self):
+        profile = DebateProfile()
+        with activate(profile):
+            with profiled(PHASE_SANITIZATION, turn=4):
+                pass
+
+        assert profile.phases[PHASE_SANITIZATION][0] == 1
+        assert profile.spans[0][3] == 4
+        assert current_profile() is None
+
+
+class TestLLMTimingHandler:
+    @pytest.mark.asyncio
+    async def test_measures_first_token_and_usage_tokens(self):
+        handler = LLMTimingHandler()
+        await handler.on_chat_model_start({}, [])
+        await handler.on_llm_new_token("Hello")
+        await handler.on_llm_new_token(" world")
+        message = AIMessage(
+            content="Hello world",
+            usage_metadata={"input_tokens": 5, "output_tokens": 7, "total_tokens": 12},
+        )
+        await handler.on_llm_end(
+            LLMResult(generations=[[ChatGeneration(message=message)]])
+        )
+
+        assert handler.first_token is not None and handler.first_token >= 0
+        assert handler.output_tokens == 7
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_chunk_count(self):
+        handler = LLMTimingHandler()
+        await handler.on_llm_start({}, [])
+        for token in ("a", "b", "c"):
+            await handler.on_llm_new_token(token)
+        await handler.on_llm_end(LLMResult(generations=[]))
+
+        assert handler.output_tokens == 3
+
+
+class TestGenerateTurn:
+    @pytest.mark.asyncio
+    async def test_records_turn_when_profiling(self):
+        agent = MagicMock()
+        agent.generate = AsyncMock(return_value={"messages": [], "current_turn": 1})
+        state = {"current_turn": 0}
+        profile = DebateProfile()
+
+        with activate(profile):
+            await _generate_turn(agent, state, "bull")
+
+        assert agent.generate.await_args.kwargs["callbacks"]
+        assert profile.phases[PHASE_LLM][0] == 1
+        assert profile.turns[0]["agent"] == "bull"
+        assert profile.turns[0]["turn"] == 1
+
+    @pytest.mark.asyncio
+    async def test_plain_call_without_profile(self):
+        agent = MagicMock()
+        agent.generate = AsyncMock(return_value={"messages": []})
+
+        await _generate_turn(agent, {"current_turn": 0}, "bear")
+
+        agent.generate.assert_awaited_once_with({"current_turn": 0})
+
+
+class TestSummarizeProfiles:
+    def test_percentiles_across_debates(self):
+        profiles = [
+            {
+                "totalMs": total,
+                "phases": {PHASE_GUARDIAN: [2, total / 10, total / 20]},
+                "turns": [{"ttftMs": 100.0, "genMs": total / 2, "tokensPerSec": 40.0}],
+            }
+            for total in range(1000, 11000, 1000)
+        ]
+
+        summary = summarize_profiles(profiles)
+
+        assert summary["debates"] == 10
+        assert summary["totalMs"] == {"p50": 5000, "p90": 9000, "p99": 10000}
+        assert summary["phasesMs"][PHASE_GUARDIAN]["p50"] == 500
+        assert summary["llm"]["ttftMs"]["p99"] == 100.0
+        assert summary["llm"]["genMs"]["p90"] == 4500
+
+    def test_empty_input(self):
+        summary = summarize_profiles([])
+
+        assert summary["debates"] == 0
+        assert summary["totalMs"] is None
+        assert summary["phasesMs"] == {}
@@ -2,7 +2,6 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.debate.engine import stream_debate, StaleDataError
-from app.services.debate.streaming import DebateConnectionManager
 
 
 DEBATE_ID = "debate-abc12345-def6-7890"
@@ -11,8 +10,8 @@ SHORT_ID = DEBATE_ID[:8]
 
 
 @pytest.fixture
-def manager():
-    return DebateConnectionManager()
+def manager(make_manager):
+    return make_manager()
 
 
 @pytest.fixture
@@ -1,8 +1,8 @@
+import json
 import pytest
 from unittest.mock import AsyncMock
 
 from app.services.debate.streaming import (
-    DebateConnectionManager,
     send_reasoning_node,
 )
 from app.services.debate.ws_schemas import ReasoningNodePayload
@@ -10,13 +10,13 @@ from app.services.debate.ws_schemas import ReasoningNodePayload
 
 class TestReasoningGraphWebSocket:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def mock_websocket(self):
         ws = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         return ws
 
     @pytest.mark.asyncio
@@ -31,9 +31,10 @@ class TestReasoningGraphWebSocket:
             label="BTC Market Data",
             summary="Market data loaded",
         )
+        await manager.drain("debate-1")
 
-        mock_websocket.send_json.assert_called_once()
-        action = mock_websocket.send_json.call_args[0][0]
+        mock_websocket.send_text.assert_called_once()
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["type"] == "DEBATE/REASONING_NODE"
         assert action["payload"]["debateId"] == "debate-1"
         assert action["payload"]["nodeId"] == "data-BTC-abc12345"
@@ -56,8 +57,9 @@ class TestReasoningGraphWebSocket:
             parent_id="data-BTC-abc12345",
             turn=1,
         )
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["payload"]["agent"] == "bull"
         assert action["payload"]["parentId"] == "data-BTC-abc12345"
         assert action["payload"]["turn"] == 1
@@ -77,8 +79,9 @@ class TestReasoningGraphWebSocket:
             parent_id="bull-turn-1",
             turn=1,
         )
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["payload"]["nodeType"] == "bear_counter"
 
     @pytest.mark.asyncio
@@ -96,8 +99,9 @@ class TestReasoningGraphWebSocket:
             is_winning=True,
             turn=1,
         )
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["payload"]["isWinning"] is True
 
     @pytest.mark.asyncio
@@ -114,8 +118,9 @@ class TestReasoningGraphWebSocket:
             parent_id="parent-1",
             is_winning=True,
         )
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert "debateId" in action["payload"]
         assert "nodeId" in action["payload"]
         assert "nodeType" in action["payload"]
@@ -136,8 +141,9 @@ class TestReasoningGraphWebSocket:
             label="Risk Assessment",
             summary="Pending guardian...",
         )
+        await manager.drain("debate-1")
 
-        action = mock_websocket.send_json.call_args[0][0]
+        action = json.loads(mock_websocket.send_text.call_args[0][0])
         assert action["payload"]["nodeType"] == "risk_check"
         assert action["payload"]["agent"] is None
 
@@ -1,6 +1,6 @@
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from pydantic import BaseModel
 
 from app.services.debate.sanitization import (
@@ -8,6 +8,8 @@ from app.services.debate.sanitization import (
     sanitize_response,
     SanitizationResult,
     SanitizationContext,
+    get_phrase_set,
+    reload_forbidden_phrases,
 )
 
 
@@ -172,36 +174,29 @@ class TestSanitizeContentWithContext:
 
 
 class TestSanitizeContentConfigurable:
+    @pytest.fixture(autouse=True)
+    def _restore_phrases(self):
+        original = list(get_phrase_set().phrases)
+        yield
+        reload_forbidden_phrases(original)
+
     def test_custom_phrase_list_overrides(self):
-        import re as _re
-
-        custom_phrases = ["custombad"]
-        custom_patterns = [
-            _re.compile(_re.escape(p), _re.IGNORECASE) for p in custom_phrases
-        ]
-
-        with (
-            patch("app.services.debate.sanitization.FORBIDDEN_PHRASES", custom_phrases),
-            patch(
-                "app.services.debate.sanitization._COMPILED_PATTERNS", custom_patterns
-            ),
-        ):
-            result = sanitize_content("This has custombad word")
-            assert "[REDACTED]" in result.content
-            assert result.is_redacted is True
-            assert "custombad" in result.redacted_phrases
+        reload_forbidden_phrases(["custombad"])
+
+        result = sanitize_content("This has custombad word")
+        assert "[REDACTED]" in result.content
+        assert result.is_redacted is True
+        assert "custombad" in result.redacted_phrases
 
     def test_empty_phrase_list_returns_content_unchanged(self):
-        """When patched to empty lists (simulating runtime override), no redaction occurs."""
-        with (
-            patch("app.services.debate.sanitization.FORBIDDEN_PHRASES", []),
-            patch("app.services.debate.sanitization._COMPILED_PATTERNS", []),
-        ):
-            result = sanitize_content("This is guaranteed")
-            assert result.content == "This is guaranteed"
-            assert result.is_redacted is False
-            assert result.redacted_phrases == []
-            assert result.redaction_ratio == 0.0
+        """When reloaded with an empty list (runtime override), no redaction occurs."""
+        reload_forbidden_phrases([])
+
+        result = sanitize_content("This is guaranteed")
+        assert result.content == "This is guaranteed"
+        assert result.is_redacted is False
+        assert result.redacted_phrases == []
+        assert result.redaction_ratio == 0.0
 
 
 class TestTruncationQuality:
@@ -0,0 +1,156 @@
+import logging
+import random
+import re
+import time
+
+import pytest
+
+from app.services.debate.sanitization import (
+    FORBIDDEN_PHRASES,
+    PhraseSet,
+    StreamingSanitizer,
+    get_phrase_set,
+    reload_forbidden_phrases,
+    sanitize_content,
+)
+
+logger = logging.getLogger(__name__)
+
+_SENTENCES = [
+    "BTC is holding the 200-day SMA at $61,250 with RSI at 54.",
+    "Volume on the last three candles is 30% above the 20-day average.",
+    "MACD crossed above its signal line, but the histogram is flattening.",
+    "Support sits at $58,900; a daily close below it invalidates the setup.",
+    "The Bear ignores that funding rates are neutral and open interest is flat.",
+    "Bollinger Bands are tightening, which usually precedes a volatile move.",
+    "EUR/USD is 12 pips off the session high after the ECB minutes.",
+    "ATR has expanded to 1.8%, so position size should shrink accordingly.",
+]
+
+
+def _corpus(seed: int, sentences: int) -> str:
+    """Realistic debate text with forbidden phrases sprinkled in."""
+    rng = random.Random(seed)
+    parts = []
+    for _ in range(sentences):
+        sentence = rng.choice(_SENTENCES)
+        if rng.random() < 0.3:
+            phrase = rng.choice(FORBIDDEN_PHRASES)
+            phrase = "".join(c.upper() if rng.random() < 0.3 else c for c in phrase)
+            words = sentence.split(" ")
+            words.insert(rng.randrange(len(words)), phrase)
+            sentence = " ".join(words)
+        parts.append(sentence)
+    return " ".join(parts)
+
+
+def _three_pass(content: str, phrases: list[str]) -> tuple[str, list[str], float]:
+    """The previous search / substitute / re-substitute implementation."""
+    patterns = [re.compile(re.escape(p), re.IGNORECASE) for p in phrases]
+    matched = [p for p, pattern in zip(phrases, patterns) if pattern.search(content)]
+    sanitized = content
+    for pattern in patterns:
+        sanitized = pattern.sub("[REDACTED]", sanitized)
+    ratio = 0.0
+    if matched:
+        stripped = content
+        for phrase in matched:
+            stripped = re.sub(re.escape(phrase), "", stripped, flags=re.IGNORECASE)
+        ratio = round(1 - len(stripped) / len(content), 4)
+    return sanitized, matched, ratio
+
+
+@pytest.fixture
+def restore_phrases():
+    original = list(get_phrase_set().phrases)
+    yield
+    reload_forbidden_phrases(original)
+
+
+class TestSinglePassEquivalence:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_three_pass_on_corpus(self, seed):
+        text = _corpus(seed, 40)
+
+        result = sanitize_content(text)
+
+        assert (
+            result.content,
+            result.redacted_phrases,
+            result.redaction_ratio,
+        ) == _three_pass(text, FORBIDDEN_PHRASES)
+
+    def test_phrases_reported_in_list_order(self):
+        result = sanitize_content("to the moon, it is guaranteed")
+        assert result.redacted_phrases == ["guaranteed", "to the moon"]
+
+    def test_longest_overlapping_phrase_wins(self):
+        phrase_set = PhraseSet(["guaranteed", "guaranteed returns"], version=1)
+
+        sanitized, matched, chars = phrase_set.scan("guaranteed returns ahead")
+
+        assert sanitized == "[REDACTED] ahead"
+        assert matched == ["guaranteed returns"]
+        assert chars == len("guaranteed returns")
+
+    def test_case_folded_match_reports_its_phrase(self):
+        result = sanitize_content("a \u017fafe bet")
+        assert result.redacted_phrases == ["safe bet"]
+
+    def test_blank_and_duplicate_phrases_are_dropped(self):
+        phrase_set = PhraseSet(["moonshot", " ", "", "moonshot"], version=1)
+        assert phrase_set.phrases == ("moonshot",)
+
+
+class TestReload:
+    def test_reload_bumps_version_and_applies_new_phrases(self, restore_phrases):
+        before = get_phrase_set().version
+
+        phrase_set = reload_forbidden_phrases(["diamond hands"])
+
+        assert phrase_set.version == before + 1
+        assert sanitize_content("diamond hands only").content == "[REDACTED] only"
+        assert sanitize_content("guaranteed").is_redacted is False
+
+    def test_reload_without_phrases_rereads_settings(
+        self, restore_phrases, monkeypatch
+    ):
+        monkeypatch.setenv("FORBIDDEN_PHRASES", '["wen lambo"]')
+
+        phrase_set = reload_forbidden_phrases()
+
+        assert phrase_set.phrases == ("wen lambo",)
+
+    def test_stream_keeps_the_set_it_started_with(self, restore_phrases):
+        sanitizer = StreamingSanitizer()
+        released = sanitizer.feed("a sure ")
+
+        reload_forbidden_phrases(["weak"])
+
+        released += sanitizer.feed("thing, not weak") + sanitizer.finish()
+        assert released == "a [REDACTED], not weak"
+
+
+@pytest.mark.p2
+def test_single_pass_faster_than_three_pass_on_corpus():
+    corpus = [_corpus(seed, 40) for seed in range(200)]
+    logging.disable(logging.WARNING)
+    try:
+        start = time.perf_counter()
+        for text in corpus:
+            _three_pass(text, FORBIDDEN_PHRASES)
+        three_pass = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for text in corpus:
+            sanitize_content(text)
+        single_pass = time.perf_counter() - start
+    finally:
+        logging.disable(logging.NOTSET)
+
+    chars = sum(len(text) for text in corpus)
+    logger.info(
+        f"sanitize {chars} chars: three-pass={three_pass * 1000:.1f}ms "
+        f"single-pass={single_pass * 1000:.1f}ms"
+    )
+    assert single_pass < three_pass
@@ -0,0 +1,336 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.debate import scheduler as scheduler_module
+from app.services.debate.exceptions import DebateQueueFullError
+from app.services.debate.scheduler import (
+    PAYLOADS_KEY,
+    PRIORITY_RESUME,
+    QUEUE_KEY,
+    DebateJob,
+    DebateScheduler,
+    QueueTicket,
+    RedisDebateScheduler,
+)
+from app.services.debate.worker import DebateWorker
+
+
+def _job(debate_id: str, **kwargs) -> DebateJob:
+    return DebateJob(
+        debate_id=debate_id,
+        asset="btc",
+        initial_state={"asset": "btc", "current_turn": 0},
+        **kwargs,
+    )
+
+
+class GatedRunner:
+    """Runner whose jobs block until released, recording start order."""
+
+    def __init__(self):
+        self.started: list[str] = []
+        self.peak = 0
+        self._running = 0
+        self._gates: dict[str, asyncio.Event] = {}
+
+    def gate(self, debate_id: str) -> asyncio.Event:
+        return self._gates.setdefault(debate_id, asyncio.Event())
+
+    async def __call__(self, job: DebateJob) -> None:
+        self.started.append(job.debate_id)
+        self._running += 1
+        self.peak = max(self.peak, self._running)
+        try:
+            await self.gate(job.debate_id).wait()
+        finally:
+            self._running -= 1
+
+    def release_all(self):
+        for debate_id in list(self._gates) + self.started:
+            self.gate(debate_id).set()
+
+    async def finish(self, scheduler: DebateScheduler) -> None:
+        """Release jobs as they start until the scheduler is idle."""
+        while scheduler.running or scheduler.queued:
+            self.release_all()
+            await asyncio.sleep(0)
+        await scheduler.join()
+
+
+class TestDebateScheduler:
+    @pytest.mark.asyncio
+    async def test_burst_never_exceeds_concurrency_limit(self):
+        runner = GatedRunner()
+        scheduler = DebateScheduler(runner, max_concurrent=3, max_queued=50)
+
+        tickets = [await scheduler.submit(_job(f"deb_{i}")) for i in range(10)]
+        await asyncio.sleep(0)
+
+        assert [t.position for t in tickets[:3]] == [0, 0, 0]
+        assert [t.position for t in tickets[3:]] == list(range(1, 8))
+        assert scheduler.running == 3 and scheduler.queued == 7
+
+        await runner.finish(scheduler)
+
+        assert runner.peak == 3
+        assert runner.started == [f"deb_{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_resumes_jump_ahead_of_new_debates(self):
+        runner = GatedRunner()
+        scheduler = DebateScheduler(runner, max_concurrent=1, max_queued=10)
+        await scheduler.submit(_job("deb_running"))
+        await scheduler.submit(_job("deb_new"))
+
+        ticket = await scheduler.submit(
+            _job("deb_resume", priority=PRIORITY_RESUME), force=True
+        )
+
+        assert ticket.position == 1
+        assert (await scheduler.position("deb_new")).position == 2
+        runner.gate("deb_running").set()
+        await asyncio.sleep(0.01)
+        assert runner.started == ["deb_running", "deb_resume"]
+        await runner.finish(scheduler)
+
+    @pytest.mark.asyncio
+    async def test_eta_counts_waves_of_average_run_time(self):
+        scheduler = DebateScheduler(
+            GatedRunner(), max_concurrent=2, max_queued=10, average_run_seconds=60
+        )
+        for i in range(2):
+            await scheduler.submit(_job(f"deb_run_{i}"))
+
+        third = await scheduler.submit(_job("deb_q1"))
+        fourth = await scheduler.submit(_job("deb_q2"))
+        fifth = await scheduler.submit(_job("deb_q3"))
+
+        assert third == QueueTicket(debate_id="deb_q1", position=1, eta_seconds=60)
+        assert fourth.eta_seconds == 60
+        assert fifth.eta_seconds == 120
+        for job in scheduler.drain():
+            assert job.debate_id.startswith("deb_q")
+        for task in list(scheduler._active.values()):
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_retry_hint(self):
+        scheduler = DebateScheduler(
+            GatedRunner(), max_concurrent=1, max_queued=1, average_run_seconds=30
+        )
+        await scheduler.submit(_job("deb_a"))
+        await scheduler.submit(_job("deb_b"))
+
+        with pytest.raises(DebateQueueFullError) as exc:
+            await scheduler.submit(_job("deb_c"))
+
+        assert exc.value.retry_after == 60
+        assert (await scheduler.get_stats())["rejected"] == 1
+        scheduler.drain()
+        for task in list(scheduler._active.values()):
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_failed_run_frees_its_slot(self):
+        calls = []
+
+        async def runner(job):
+            calls.append(job.debate_id)
+            if job.debate_id == "deb_bad":
+                raise RuntimeError("boom")
+
+        scheduler = DebateScheduler(runner, max_concurrent=1, max_queued=5)
+        await scheduler.submit(_job("deb_bad"))
+        await scheduler.submit(_job("deb_good"))
+        await asyncio.sleep(0.01)
+        await scheduler.join()
+
+        assert calls == ["deb_bad", "deb_good"]
+        assert (await scheduler.get_stats())["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_average_run_time_follows_measurements(self):
+        async def runner(job):
+            await asyncio.sleep(0.01)
+
+        scheduler = DebateScheduler(runner, max_concurrent=1, average_run_seconds=100)
+        await scheduler.submit(_job("deb_a"))
+        await scheduler.join()
+
+        assert scheduler.average_run_seconds < 100
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_unstarted_jobs_and_refuses_new_ones(self):
+        scheduler = DebateScheduler(GatedRunner(), max_concurrent=1, max_queued=5)
+        await scheduler.submit(_job("deb_a"))
+        await scheduler.submit(_job("deb_b"))
+
+        pending = scheduler.drain()
+
+        assert [job.debate_id for job in pending] == ["deb_b"]
+        with pytest.raises(DebateQueueFullError):
+            await scheduler.submit(_job("deb_c"))
+        for task in list(scheduler._active.values()):
+            task.cancel()
+
+
+class FakeQueueRedis:
+    """Sorted set, hashes and the queue scripts, enough for the Redis scheduler."""
+
+    def __init__(self):
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def register_script(self, script):
+        # Neither body awaits, so each runs atomically like a Lua script.
+        async def submit(keys, args):
+            debate_id, score, payload, cap = args
+            zset = self.zsets.setdefault(keys[0], {})
+            if cap >= 0 and len(zset) >= cap:
+                return 0
+            self.hashes.setdefault(keys[1], {})[debate_id] = payload
+            zset[debate_id] = score
+            return 1
+
+        async def pop(keys, args):
+            zset = self.zsets.get(keys[0], {})
+            if not zset:
+                return None
+            member = min(zset, key=zset.get)
+            del zset[member]
+            return [member, self.hashes.get(keys[1], {}).pop(member, None)]
+
+        return submit if script == scheduler_module._SUBMIT_SCRIPT else pop
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    async def zrank(self, key, member):
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+        for rank, (name, _) in enumerate(ordered):
+            if name == member:
+                return rank
+        return None
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hdel(self, key, field):
+        self.hashes.get(key, {}).pop(field, None)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class TestRedisDebateScheduler:
+    @pytest.mark.asyncio
+    async def test_jobs_pop_in_priority_then_fifo_order(self):
+        queue = RedisDebateScheduler(redis=FakeQueueRedis(), max_queued=10)
+        now = time.time()
+        await queue.submit(_job("deb_old", enqueued_at=now))
+        await queue.submit(_job("deb_newer", enqueued_at=now + 1))
+        await queue.submit(
+            DebateJob("deb_resume", "eth", None, PRIORITY_RESUME, enqueued_at=now + 2)
+        )
+
+        popped = [(await queue.pop()).debate_id for _ in range(3)]
+
+        assert popped == ["deb_resume", "deb_old", "deb_newer"]
+        assert await queue.pop(timeout=0) is None
+
+    @pytest.mark.asyncio
+    async def test_job_payload_round_trips(self):
+        queue = RedisDebateScheduler(redis=FakeQueueRedis())
+        job = _job("deb_a")
+
+        await queue.submit(job)
+
+        assert await queue.pop() == job
+
+    @pytest.mark.asyncio
+    async def test_eta_uses_live_worker_capacity(self):
+        redis = FakeQueueRedis()
+        queue = RedisDebateScheduler(redis=redis, max_queued=10)
+        assert (await queue.submit(_job("deb_a"))).eta_seconds is None
+
+        await queue.report("w1", slots=2, run_seconds=90)
+        await queue.report("w2", slots=2, run_seconds=30)
+        for i in range(4):
+            await queue.submit(_job(f"deb_{i}", enqueued_at=time.time() + i))
+        ticket = await queue.position("deb_3")
+
+        assert ticket.position == 5
+        assert ticket.eta_seconds == 2 * 60
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        redis = FakeQueueRedis()
+        queue = RedisDebateScheduler(redis=redis, max_queued=1)
+        await queue.submit(_job("deb_a"))
+
+        with pytest.raises(DebateQueueFullError):
+            await queue.submit(_job("deb_b"))
+        assert await redis.zcard(QUEUE_KEY) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_never_overshoot_the_cap(self):
+        redis = FakeQueueRedis()
+        queues = [RedisDebateScheduler(redis=redis, max_queued=2) for _ in range(5)]
+
+        results = await asyncio.gather(
+            *(q.submit(_job(f"deb_{i}")) for i, q in enumerate(queues)),
+            return_exceptions=True,
+        )
+
+        rejected = [r for r in results if isinstance(r, DebateQueueFullError)]
+        assert len(rejected) == 3
+        assert await redis.zcard(QUEUE_KEY) == 2
+        assert len(redis.hashes[PAYLOADS_KEY]) == 2
+
+    @pytest.mark.asyncio
+    async def test_pop_takes_job_and_payload_together(self):
+        redis = FakeQueueRedis()
+        queue = RedisDebateScheduler(redis=redis)
+        await queue.submit(_job("deb_a"))
+
+        assert (await queue.pop(timeout=0)).debate_id == "deb_a"
+        assert redis.hashes[PAYLOADS_KEY] == {}
+        assert await queue.pop(timeout=0) is None
+
+
+class TestDebateWorker:
+    @pytest.mark.asyncio
+    async def test_worker_only_pops_jobs_it_has_slots_for(self):
+        runner = GatedRunner()
+        redis = FakeQueueRedis()
+        queue = RedisDebateScheduler(redis=redis, max_queued=10)
+        service = MagicMock()
+        service.scheduler = DebateScheduler(runner, max_concurrent=2)
+        service.drain = AsyncMock()
+        service.close = AsyncMock()
+        worker = DebateWorker(
+            service=service, queue=queue, worker_id="w1", pop_timeout=0.01
+        )
+        for i in range(5):
+            await queue.submit(_job(f"deb_{i}", enqueued_at=time.time() + i))
+
+        run = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+
+        assert runner.started == ["deb_0", "deb_1"]
+        assert await redis.zcard(QUEUE_KEY) == 3
+        assert "w1" in redis.hashes["debate_jobs:workers"]
+
+        runner.gate("deb_0").set()
+        await asyncio.sleep(0.05)
+        assert runner.started == ["deb_0", "deb_1", "deb_2"]
+
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        await worker.shutdown()
+        service.drain.assert_awaited_once()
+        assert "w1" not in redis.hashes["debate_jobs:workers"]
+        await runner.finish(service.scheduler)
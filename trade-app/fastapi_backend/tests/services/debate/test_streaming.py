@@ -1,8 +1,8 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, patch
 
 from app.services.debate.streaming import (
-    DebateConnectionManager,
     TokenStreamingHandler,
     DebateStreamState,
     send_connected_action,
@@ -19,13 +19,13 @@ from app.services.debate.ws_schemas import (
 
 class TestDebateConnectionManager:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def mock_websocket(self):
         ws = AsyncMock()
-        ws.send_json = AsyncMock()
+        ws.send_text = AsyncMock()
         return ws
 
     @pytest.mark.asyncio
@@ -38,7 +38,7 @@ class TestDebateConnectionManager:
     @pytest.mark.asyncio
     async def test_connect_adds_to_existing_debate(self, manager, mock_websocket):
         ws2 = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
 
         await manager.connect("debate-1", mock_websocket)
         await manager.connect("debate-1", ws2)
@@ -57,7 +57,7 @@ class TestDebateConnectionManager:
         self, manager, mock_websocket
     ):
         ws2 = AsyncMock()
-        ws2.send_json = AsyncMock()
+        ws2.send_text = AsyncMock()
 
         await manager.connect("debate-1", mock_websocket)
         await manager.connect("debate-1", ws2)
@@ -72,23 +72,30 @@ class TestDebateConnectionManager:
 
         action = {"type": "DEBATE/TOKEN_RECEIVED", "payload": {"token": "test"}}
         await manager.broadcast_to_debate("debate-1", action)
+        await manager.drain("debate-1")
 
-        mock_websocket.send_json.assert_called_once_with(action)
+        mock_websocket.send_text.assert_called_once()
+        assert json.loads(mock_websocket.send_text.call_args[0][0]) == {
+            **action,
+            "seq": 1,
+        }
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_disconnected_client(self, manager, mock_websocket):
-        mock_websocket.send_json.side_effect = Exception("Connection lost")
+        mock_websocket.send_text.side_effect = Exception("Connection lost")
         await manager.connect("debate-1", mock_websocket)
 
         action = {"type": "DEBATE/TOKEN_RECEIVED", "payload": {"token": "test"}}
         await manager.broadcast_to_debate("debate-1", action)
+        await manager.drain("debate-1")
 
         assert "debate-1" not in manager.active_debates
 
-    def test_get_connection_count(self, manager, mock_websocket):
+    @pytest.mark.asyncio
+    async def test_get_connection_count(self, manager, mock_websocket):
         assert manager.get_connection_count("debate-1") == 0
 
-        manager.active_debates["debate-1"] = {mock_websocket}
+        await manager.connect("debate-1", mock_websocket)
         assert manager.get_connection_count("debate-1") == 1
 
 
@@ -165,8 +172,8 @@ class TestConnectionRateLimit:
 
 class TestTokenStreamingHandler:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def handler(self, manager):
@@ -175,13 +182,14 @@ class TestTokenStreamingHandler:
     @pytest.mark.asyncio
     async def test_on_llm_new_token_broadcasts(self, handler, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await handler.on_llm_new_token("Hello")
+        await manager.drain("debate-1")
 
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called_once()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/TOKEN_RECEIVED"
         assert call_args["payload"]["token"] == "Hello"
         assert call_args["payload"]["agent"] == "bull"
@@ -228,18 +236,19 @@ class TestDebateStreamState:
 
 class TestWebSocketActions:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.mark.asyncio
     async def test_send_connected_action(self, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await send_connected_action(manager, "debate-1", "running")
+        await manager.drain("debate-1")
 
-        call_args = mock_ws.send_json.call_args[0][0]
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/CONNECTED"
         assert call_args["payload"]["debateId"] == "debate-1"
         assert call_args["payload"]["status"] == "running"
@@ -247,36 +256,39 @@ class TestWebSocketActions:
     @pytest.mark.asyncio
     async def test_send_status_update(self, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await send_status_update(manager, "debate-1", "completed")
+        await manager.drain("debate-1")
 
-        call_args = mock_ws.send_json.call_args[0][0]
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/STATUS_UPDATE"
         assert call_args["payload"]["status"] == "completed"
 
     @pytest.mark.asyncio
     async def test_send_error(self, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await send_error(manager, "debate-1", "INTERNAL_ERROR", "Something went wrong")
+        await manager.drain("debate-1")
 
-        call_args = mock_ws.send_json.call_args[0][0]
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/ERROR"
         assert call_args["payload"]["code"] == "INTERNAL_ERROR"
 
     @pytest.mark.asyncio
     async def test_send_argument_complete(self, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await send_argument_complete(manager, "debate-1", "bull", "Test argument", 1)
+        await manager.drain("debate-1")
 
-        call_args = mock_ws.send_json.call_args[0][0]
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/ARGUMENT_COMPLETE"
         assert call_args["payload"]["agent"] == "bull"
         assert call_args["payload"]["content"] == "Test argument"
@@ -284,12 +296,13 @@ class TestWebSocketActions:
     @pytest.mark.asyncio
     async def test_send_turn_change(self, manager):
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         await manager.connect("debate-1", mock_ws)
 
         await send_turn_change(manager, "debate-1", "bear")
+        await manager.drain("debate-1")
 
-        call_args = mock_ws.send_json.call_args[0][0]
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "DEBATE/TURN_CHANGE"
         assert call_args["payload"]["currentAgent"] == "bear"
 
@@ -323,8 +336,8 @@ class TestWebSocketSchemas:
 
 class TestReconnectionFlow:
     @pytest.fixture
-    def manager(self):
-        return DebateConnectionManager()
+    def manager(self, make_manager):
+        return make_manager()
 
     @pytest.fixture
     def stream_state(self):
@@ -339,7 +352,7 @@ class TestReconnectionFlow:
     @pytest.mark.asyncio
     async def test_reconnect_recovers_state(self, manager, stream_state):
         mock_ws1 = AsyncMock()
-        mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
 
         await manager.connect("debate-reconnect", mock_ws1)
         await stream_state.save_state(
@@ -349,7 +362,7 @@ class TestReconnectionFlow:
         await manager.disconnect("debate-reconnect", mock_ws1)
 
         mock_ws2 = AsyncMock()
-        mock_ws2.send_json = AsyncMock()
+        mock_ws2.send_text = AsyncMock()
         await manager.connect("debate-reconnect", mock_ws2)
 
         state = await stream_state.get_state("debate-reconnect")
@@ -358,7 +371,9 @@ class TestReconnectionFlow:
         assert state["current_turn"] == 2
 
         await send_connected_action(manager, "debate-reconnect", state["status"])
-        mock_ws2.send_json.assert_called()
+        await manager.drain("debate-reconnect")
+
+        mock_ws2.send_text.assert_called()
 
     @pytest.mark.asyncio
     async def test_completed_debate_reconnect_shows_final_state(
@@ -369,7 +384,7 @@ class TestReconnectionFlow:
         )
 
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
 
         await manager.connect("debate-completed", mock_ws)
 
@@ -377,5 +392,7 @@ class TestReconnectionFlow:
         assert state["status"] == "completed"
 
         await send_connected_action(manager, "debate-completed", state["status"])
-        call_args = mock_ws.send_json.call_args[0][0]
+        await manager.drain("debate-completed")
+
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["payload"]["status"] == "completed"
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -60,6 +62,9 @@ class TestTokenStreamingHandlerBuffering:
         handler._BUFFER_FLUSH_THRESHOLD = 10
         await handler.on_llm_new_token("bitcoin is guaranteed")
         await handler.on_llm_new_token(" to rise " + "x" * 60)
+        # The phrase is held until the next chunk rules out a longer match,
+        # which then goes out on the frame-rate-capped follow-up flush.
+        await asyncio.sleep(0.2)
         tokens = _get_sent_tokens(mock_manager)
         sent_text = "".join(tokens)
         assert "guaranteed" not in sent_text
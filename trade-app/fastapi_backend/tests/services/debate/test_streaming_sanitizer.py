@@ -0,0 +1,99 @@
+import logging
+import random
+import time
+
+import pytest
+
+from app.services.debate.sanitization import (
+    FORBIDDEN_PHRASES,
+    StreamingSanitizer,
+    sanitize_response,
+)
+
+logger = logging.getLogger(__name__)
+
+_FILLER = [
+    "the ",
+    "market ",
+    "is ",
+    "volatile ",
+    "so ",
+    "size ",
+    "risk. ",
+    "\n",
+    "a ",
+    "t",
+]
+
+
+def _stream(text: str, chunks: list[int]) -> str:
+    sanitizer = StreamingSanitizer()
+    out, pos = [], 0
+    for size in chunks:
+        out.append(sanitizer.feed(text[pos : pos + size]))
+        pos += size
+    out.append(sanitizer.feed(text[pos:]))
+    out.append(sanitizer.finish())
+    return "".join(out)
+
+
+def _random_text(rng: random.Random, words: int) -> str:
+    parts = []
+    for _ in range(words):
+        if rng.random() < 0.15:
+            phrase = rng.choice(FORBIDDEN_PHRASES)
+            parts.append(
+                "".join(c.upper() if rng.random() < 0.5 else c for c in phrase)
+            )
+        else:
+            parts.append(rng.choice(_FILLER))
+    return "".join(parts)
+
+
+class TestStreamingSanitizer:
+    def test_phrase_split_across_chunks_is_redacted(self):
+        assert _stream("it's a sure thing indeed", [9, 5]) == "it's a [REDACTED] indeed"
+
+    def test_only_possible_phrase_prefix_is_held(self):
+        sanitizer = StreamingSanitizer()
+
+        released = sanitizer.feed("prices look sur")
+
+        assert released == "prices look "
+        assert sanitizer.held == len("sur")
+
+    def test_clean_text_is_released_immediately(self):
+        sanitizer = StreamingSanitizer()
+        assert sanitizer.feed("prices look weak") == "prices look weak"
+        assert sanitizer.held == 0
+
+    def test_held_tail_is_released_when_phrase_does_not_complete(self):
+        sanitizer = StreamingSanitizer()
+        sanitizer.feed("this is a safe")
+        assert sanitizer.feed(" harbour.") == "safe harbour."
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_sanitize_response_for_any_chunking(self, seed):
+        rng = random.Random(seed)
+        text = _random_text(rng, 200)
+        chunks = [rng.randint(1, 12) for _ in range(len(text) // 4)]
+
+        assert _stream(text, chunks) == sanitize_response(text)
+
+
+@pytest.mark.p2
+def test_streaming_cost_is_linear_in_argument_length():
+    def cost(chars: int) -> float:
+        rng = random.Random(1)
+        text = _random_text(rng, chars // 6)[:chars]
+        start = time.perf_counter()
+        _stream(text, [8] * (len(text) // 8))
+        return time.perf_counter() - start
+
+    short, long = cost(10_000), cost(40_000)
+
+    logger.info(
+        f"streaming sanitizer: 10k={short * 1000:.1f}ms 40k={long * 1000:.1f}ms"
+    )
+    # 4x the text at 8-char flushes: linear is ~4x, the old full re-scan ~16x.
+    assert long < short * 8
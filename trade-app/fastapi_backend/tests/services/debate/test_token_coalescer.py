@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.debate.streaming import (
+    TOKEN_MAX_FPS,
+    TOKEN_MIN_FPS,
+    TokenStreamingHandler,
+    get_stream_stats,
+    max_token_fps,
+)
+
+
+def _sent_tokens(manager: AsyncMock) -> list[str]:
+    return [
+        c[0][1]["payload"]["token"] for c in manager.broadcast_to_debate.call_args_list
+    ]
+
+
+def _handler(
+    debate_id: str, viewers: int = 0
+) -> tuple[TokenStreamingHandler, AsyncMock]:
+    manager = AsyncMock()
+    manager.broadcast_to_debate = AsyncMock()
+    return TokenStreamingHandler(manager, debate_id, "bull", viewers=viewers), manager
+
+
+class TestFlushTriggers:
+    @pytest.mark.asyncio
+    async def test_deadline_flushes_short_buffer_without_new_tokens(self):
+        handler, manager = _handler("coalesce-deadline")
+
+        await handler.on_llm_new_token("slow")
+        manager.broadcast_to_debate.assert_not_called()
+
+        await asyncio.sleep(handler._MAX_FLUSH_LATENCY * 3)
+
+        assert _sent_tokens(manager) == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_char_budget_flushes_immediately(self):
+        handler, manager = _handler("coalesce-budget")
+        handler._BUFFER_FLUSH_THRESHOLD = 10
+
+        await handler.on_llm_new_token("x" * 12)
+
+        assert _sent_tokens(manager) == ["x" * 12]
+
+    @pytest.mark.asyncio
+    async def test_frame_rate_cap_defers_back_to_back_flushes(self):
+        handler, manager = _handler("coalesce-cap")
+        handler._BUFFER_FLUSH_THRESHOLD = 1
+
+        await handler.on_llm_new_token("one ")
+        await handler.on_llm_new_token("two ")
+        await handler.on_llm_new_token("three")
+        assert _sent_tokens(manager) == ["one "]
+
+        await asyncio.sleep(1 / TOKEN_MAX_FPS * 2)
+
+        assert _sent_tokens(manager) == ["one ", "two three"]
+
+    @pytest.mark.asyncio
+    async def test_llm_end_cancels_pending_timer(self):
+        handler, manager = _handler("coalesce-end")
+
+        await handler.on_llm_new_token("bye")
+        await handler.on_llm_end(None)
+        await asyncio.sleep(handler._MAX_FLUSH_LATENCY * 3)
+
+        assert _sent_tokens(manager) == ["bye"]
+
+
+class TestFrameRateCap:
+    def test_cap_shrinks_with_audience(self):
+        assert max_token_fps(0) == TOKEN_MAX_FPS
+        assert max_token_fps(500) == TOKEN_MAX_FPS / 2
+        assert max_token_fps(100_000) == TOKEN_MIN_FPS
+
+    def test_handler_spaces_frames_for_large_audience(self):
+        small, _ = _handler("coalesce-small", viewers=1)
+        large, _ = _handler("coalesce-large", viewers=10_000)
+        assert large._min_frame_interval > small._min_frame_interval
+
+
+class TestStreamStats:
+    @pytest.mark.asyncio
+    async def test_reports_frames_and_latency(self):
+        handler, _ = _handler("coalesce-stats")
+
+        await handler.on_llm_new_token("first")
+        await asyncio.sleep(handler._MAX_FLUSH_LATENCY * 3)
+        await handler.on_llm_new_token("second")
+        await handler.on_llm_end(None)
+
+        stats = get_stream_stats("coalesce-stats")
+        assert stats["frames"] == 2
+        assert stats["frames_per_sec"] > 0
+        assert stats["max_latency_ms"] >= handler._MAX_FLUSH_LATENCY * 1000 * 0.9
+
+    def test_unknown_debate_has_no_stats(self):
+        assert get_stream_stats("never-streamed") is None
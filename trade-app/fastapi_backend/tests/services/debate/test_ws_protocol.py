@@ -0,0 +1,133 @@
+from typing import get_args
+
+import ormsgpack
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.debate.event_log import build_replay_frame
+from app.services.debate.frames import build_frame
+from app.services.debate.protocol import (
+    ACTION_CODES,
+    FIELD_CODES,
+    JSON_CODEC,
+    MSGPACK_CODEC,
+    MSGPACK_SUBPROTOCOL,
+    compact_action,
+    negotiate_codec,
+)
+from app.services.debate.ws_schemas import WebSocketActionType
+
+
+def _token_frame(token: str = "Momentum is building"):
+    return build_frame(
+        "DEBATE/TOKEN_RECEIVED",
+        {"debateId": "deb_123", "agent": "bull", "token": token},
+    )
+
+
+async def _packed(frame) -> bytes:
+    ws = AsyncMock()
+    await MSGPACK_CODEC.send(ws, frame)
+    return ws.send_bytes.call_args[0][0]
+
+
+def _ws(subprotocols: list[str] | None = None) -> MagicMock:
+    ws = MagicMock()
+    ws.scope = {"subprotocols": subprotocols or []}
+    return ws
+
+
+class TestNegotiation:
+    def test_json_is_default(self):
+        assert negotiate_codec(_ws()) == (JSON_CODEC, None)
+
+    def test_query_param_selects_msgpack(self):
+        assert negotiate_codec(_ws(), "msgpack") == (MSGPACK_CODEC, None)
+
+    def test_subprotocol_selects_msgpack_and_is_echoed(self):
+        codec, subprotocol = negotiate_codec(_ws([MSGPACK_SUBPROTOCOL]))
+        assert codec is MSGPACK_CODEC
+        assert subprotocol == MSGPACK_SUBPROTOCOL
+
+    def test_unknown_protocol_falls_back_to_json(self):
+        assert negotiate_codec(_ws(["graphql-ws"]), "cbor") == (JSON_CODEC, None)
+
+
+class TestCompactEncoding:
+    def test_every_action_type_has_a_code(self):
+        assert set(ACTION_CODES) == set(get_args(WebSocketActionType))
+        assert len(set(ACTION_CODES.values())) == len(ACTION_CODES)
+
+    def test_action_uses_integer_codes_and_drops_debate_id(self):
+        frame = _token_frame()
+        frame.stamp_seq(42)
+
+        code, seq, ts_ms, payload = compact_action(frame)
+
+        assert code == ACTION_CODES["DEBATE/TOKEN_RECEIVED"]
+        assert seq == 42
+        assert isinstance(ts_ms, int)
+        assert payload == {
+            FIELD_CODES["agent"]: "bull",
+            FIELD_CODES["token"]: "Momentum is building",
+        }
+
+    def test_unknown_fields_keep_their_names(self):
+        frame = build_frame("DEBATE/STATUS_UPDATE", {"status": "running", "extra": 1})
+        assert compact_action(frame)[3] == {
+            FIELD_CODES["status"]: "running",
+            "extra": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_replay_events_are_compacted(self):
+        event = _token_frame()
+        event.stamp_seq(3)
+        replay = build_replay_frame("deb_123", 2, 3, False, [event.text])
+
+        payload = ormsgpack.unpackb(
+            await _packed(replay), option=ormsgpack.OPT_NON_STR_KEYS
+        )[3]
+
+        (compact_event,) = payload[FIELD_CODES["events"]]
+        assert compact_event[0] == ACTION_CODES["DEBATE/TOKEN_RECEIVED"]
+        assert compact_event[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_msgpack_frame_is_smaller_than_json(self):
+        frame = _token_frame("ok")
+        assert len(await _packed(frame)) < len(frame.text.encode()) / 2
+
+
+class TestMixedProtocolBroadcast:
+    @pytest.mark.asyncio
+    async def test_each_codec_encodes_once_per_broadcast(self, make_manager):
+        manager = make_manager()
+        json_viewers = [AsyncMock() for _ in range(2)]
+        msgpack_viewers = [AsyncMock() for _ in range(2)]
+        for ws in json_viewers:
+            await manager.connect("debate-1", ws)
+        for ws in msgpack_viewers:
+            await manager.connect("debate-1", ws, MSGPACK_CODEC)
+
+        await manager.broadcast_to_debate("debate-1", _token_frame())
+        await manager.drain("debate-1", timeout=1)
+
+        texts = [ws.send_text.call_args[0][0] for ws in json_viewers]
+        blobs = [ws.send_bytes.call_args[0][0] for ws in msgpack_viewers]
+        assert texts[0] is texts[1]
+        assert blobs[0] is blobs[1]
+        for ws in msgpack_viewers:
+            ws.send_text.assert_not_called()
+
+        decoded = ormsgpack.unpackb(blobs[0], option=ormsgpack.OPT_NON_STR_KEYS)
+        assert decoded[0] == ACTION_CODES["DEBATE/TOKEN_RECEIVED"]
+        assert decoded[1] == 1
+
+    def test_handshake_carries_dictionaries(self):
+        handshake = ormsgpack.unpackb(
+            MSGPACK_CODEC.handshake(), option=ormsgpack.OPT_NON_STR_KEYS
+        )
+        assert handshake["v"] == 1
+        assert handshake["actions"][ACTION_CODES["DEBATE/PING"]] == "DEBATE/PING"
+        assert handshake["fields"][FIELD_CODES["token"]] == "token"
@@ -0,0 +1,229 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.market.schemas import FreshnessStatus
+from app.services.market.watcher import MarketWatcherHub, PriceTick
+
+
+def _status(is_stale: bool) -> FreshnessStatus:
+    age = 75 if is_stale else 5
+    return FreshnessStatus(
+        asset="EURUSD",
+        is_stale=is_stale,
+        last_update=datetime.now(timezone.utc) - timedelta(seconds=age),
+        age_seconds=age,
+        threshold_seconds=60,
+    )
+
+
+def _guardian(*statuses: bool) -> MagicMock:
+    """Guardian returning ``statuses`` in order, then repeating the last one."""
+    calls = 0
+
+    async def get_freshness_status(asset: str) -> FreshnessStatus:
+        nonlocal calls
+        calls += 1
+        return _status(statuses[min(calls, len(statuses)) - 1])
+
+    guardian = MagicMock()
+    guardian.get_freshness_status = AsyncMock(side_effect=get_freshness_status)
+    guardian.close = AsyncMock()
+    return guardian
+
+
+def _provider(*prices: float) -> MagicMock:
+    provider = MagicMock()
+    provider.fetch_price = AsyncMock(
+        side_effect=[{"price": p, "last_updated": 0} for p in prices] + [None] * 100
+    )
+    provider.close = AsyncMock()
+    return provider
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> None:
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestFreshnessFanOut:
+    @pytest.mark.asyncio
+    async def test_one_poll_notifies_every_subscriber_once(self):
+        guardian = _guardian(False, True)
+        hub = MarketWatcherHub(stale_guardian=guardian, freshness_interval=0)
+        received: list[int] = []
+
+        def on_stale(i):
+            async def callback(freshness):
+                received.append(i)
+
+            return callback
+
+        subscriptions = [
+            hub.subscribe("EURUSD", on_stale=on_stale(i)) for i in range(50)
+        ]
+        await _wait_for(lambda: len(received) == 50)
+        polls = guardian.get_freshness_status.await_count
+        await asyncio.sleep(0.01)
+
+        assert sorted(received) == list(range(50))
+        assert hub.get_stats()["freshness_pollers"] == 1
+        assert guardian.get_freshness_status.await_count > polls
+        assert len(received) == 50
+        for subscription in subscriptions:
+            await hub.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_keeps_checking_while_fresh(self):
+        guardian = _guardian(False, False, True)
+        hub = MarketWatcherHub(stale_guardian=guardian, freshness_interval=0)
+        stale = asyncio.Event()
+
+        async def on_stale(freshness):
+            stale.set()
+
+        subscription = hub.subscribe("EURUSD", on_stale=on_stale)
+        await asyncio.wait_for(stale.wait(), 1)
+
+        assert guardian.get_freshness_status.await_count >= 3
+        await hub.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_guardian_error_does_not_stop_polling(self):
+        guardian = MagicMock()
+        guardian.get_freshness_status = AsyncMock(
+            side_effect=[ConnectionError("redis down"), _status(True)]
+        )
+        hub = MarketWatcherHub(stale_guardian=guardian, freshness_interval=0)
+        stale = asyncio.Event()
+
+        async def on_stale(freshness):
+            stale.set()
+
+        subscription = hub.subscribe("EURUSD", on_stale=on_stale)
+        await asyncio.wait_for(stale.wait(), 1)
+        await hub.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_block_others(self):
+        hub = MarketWatcherHub(stale_guardian=_guardian(True), freshness_interval=0)
+        stale = asyncio.Event()
+
+        async def broken(freshness):
+            raise RuntimeError("socket closed")
+
+        async def healthy(freshness):
+            stale.set()
+
+        first = hub.subscribe("EURUSD", on_stale=broken)
+        second = hub.subscribe("EURUSD", on_stale=healthy)
+        await asyncio.wait_for(stale.wait(), 1)
+
+        await hub.unsubscribe(first)
+        await hub.unsubscribe(second)
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_pollers_stop_with_last_subscriber(self):
+        hub = MarketWatcherHub(stale_guardian=_guardian(False), freshness_interval=0)
+
+        first = hub.subscribe("EURUSD", on_stale=AsyncMock())
+        second = hub.subscribe("eurusd", on_stale=AsyncMock())
+        other = hub.subscribe("BTC", on_stale=AsyncMock())
+        assert hub.get_stats() == {
+            "assets": 2,
+            "subscribers": 3,
+            "freshness_pollers": 2,
+            "price_pollers": 0,
+        }
+
+        await hub.unsubscribe(first)
+        assert hub.get_stats()["freshness_pollers"] == 2
+        await hub.unsubscribe(second)
+        await hub.unsubscribe(other)
+
+        assert hub.get_stats()["assets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_releases_only_owned_clients(self):
+        injected = _guardian(False)
+        hub = MarketWatcherHub(stale_guardian=injected, freshness_interval=0)
+        hub.subscribe("EURUSD", on_stale=AsyncMock())
+
+        await hub.close()
+
+        injected.close.assert_not_called()
+        assert hub.get_stats()["assets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_guardian_is_created_once(self):
+        with patch("app.services.market.watcher.StaleDataGuardian") as guardian_cls:
+            guardian_cls.return_value = _guardian(False)
+            hub = MarketWatcherHub()
+
+            await hub.check_freshness("EURUSD")
+            await hub.check_freshness("BTC")
+            await hub.close()
+
+        guardian_cls.assert_called_once()
+        guardian_cls.return_value.close.assert_awaited_once()
+
+
+class TestPriceFanOut:
+    @pytest.mark.asyncio
+    async def test_ticks_reach_all_subscribers_with_change(self):
+        provider = _provider(1.1000, 1.1011)
+        hub = MarketWatcherHub(
+            stale_guardian=_guardian(False),
+            price_provider=provider,
+            freshness_interval=0,
+            price_interval=0,
+        )
+        ticks: dict[int, list[PriceTick]] = {0: [], 1: []}
+
+        def on_price(i):
+            async def callback(tick):
+                ticks[i].append(tick)
+
+            return callback
+
+        subscriptions = [
+            hub.subscribe("EURUSD", on_stale=AsyncMock(), on_price=on_price(i))
+            for i in ticks
+        ]
+        await _wait_for(lambda: all(len(t) == 2 for t in ticks.values()))
+
+        assert ticks[0] == ticks[1]
+        assert ticks[0][0] == PriceTick(asset="EURUSD", price=1.1)
+        assert ticks[0][1].previous_price == 1.1
+        assert ticks[0][1].change_pct == 0.1
+        assert hub.get_stats()["price_pollers"] == 1
+        for subscription in subscriptions:
+            await hub.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_non_forex_asset_is_not_price_polled(self):
+        provider = _provider(100.0)
+        hub = MarketWatcherHub(stale_guardian=_guardian(False), price_provider=provider)
+
+        subscription = hub.subscribe("BTC", on_price=AsyncMock())
+
+        assert hub.get_stats()["price_pollers"] == 0
+        await hub.unsubscribe(subscription)
+        provider.fetch_price.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_api_key_means_no_price_poller(self):
+        hub = MarketWatcherHub(stale_guardian=_guardian(False))
+
+        with patch("app.services.market.watcher.settings") as mock_settings:
+            mock_settings.TWELVEDATA_API_KEY = ""
+            subscription = hub.subscribe("EURUSD", on_price=AsyncMock())
+
+        assert hub.get_stats()["price_pollers"] == 0
+        await hub.unsubscribe(subscription)
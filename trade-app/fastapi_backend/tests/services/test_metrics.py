@@ -0,0 +1,89 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.metrics import (
+    RATE_LIMIT_DECISIONS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from app.services.rate_limiter import RateLimiter
+
+
+class TestMetricTypes:
+    def test_counter_renders_labelled_series(self):
+        counter = Counter("frames_total", "Frames.", ("type",))
+        counter.inc("token")
+        counter.inc("token", amount=2)
+        counter.inc("status")
+
+        rendered = counter.render()
+
+        assert "# TYPE frames_total counter" in rendered
+        assert 'frames_total{type="token"} 3' in rendered
+        assert 'frames_total{type="status"} 1' in rendered
+
+    def test_counter_rejects_wrong_label_count(self):
+        counter = Counter("frames_total", "Frames.", ("type",))
+        with pytest.raises(ValueError):
+            counter.inc()
+
+    def test_gauge_replace_drops_missing_series(self):
+        gauge = Gauge("viewers", "Viewers.", ("debate_id",))
+        gauge.set(3, "deb_a")
+        gauge.replace({("deb_b",): 1})
+
+        assert gauge.get("deb_a") == 0
+        assert 'viewers{debate_id="deb_b"} 1' in gauge.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+
+        rendered = histogram.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in rendered
+        assert 'latency_seconds_bucket{le="1"} 3' in rendered
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in rendered
+        assert "latency_seconds_count 4" in rendered
+        assert "latency_seconds_sum 5.65" in rendered
+
+    def test_label_values_are_escaped(self):
+        counter = Counter("odd_total", "Odd.", ("name",))
+        counter.inc('a"b\\c')
+
+        assert 'odd_total{name="a\\"b\\\\c"} 1' in counter.render()
+
+    def test_registry_refuses_duplicate_names(self):
+        registry = MetricsRegistry()
+        registry.counter("dup_total", "Dup.")
+        with pytest.raises(ValueError):
+            registry.gauge("dup_total", "Dup.")
+
+
+class TestRateLimiterMetrics:
+    @pytest.mark.asyncio
+    async def test_check_counts_allow_and_deny(self):
+        mock_redis = AsyncMock()
+        mock_pipeline = AsyncMock()
+        mock_pipeline.incr = MagicMock(return_value=mock_pipeline)
+        mock_pipeline.ttl = MagicMock(return_value=mock_pipeline)
+        mock_pipeline.execute = AsyncMock(side_effect=[[1, -2], [2, 30]])
+        mock_pipeline.__aenter__ = AsyncMock(return_value=mock_pipeline)
+        mock_pipeline.__aexit__ = AsyncMock(return_value=None)
+        mock_redis.pipeline = MagicMock(return_value=mock_pipeline)
+        mock_redis.expire = AsyncMock()
+        allowed = RATE_LIMIT_DECISIONS.get("metrics_test", "allow")
+        denied = RATE_LIMIT_DECISIONS.get("metrics_test", "deny")
+
+        with patch(
+            "app.services.rate_limiter.get_redis_client", return_value=mock_redis
+        ):
+            limiter = RateLimiter(prefix="metrics_test", max_requests=1)
+            await limiter.check("user_1")
+            await limiter.check("user_1")
+
+        assert RATE_LIMIT_DECISIONS.get("metrics_test", "allow") == allowed + 1
+        assert RATE_LIMIT_DECISIONS.get("metrics_test", "deny") == denied + 1
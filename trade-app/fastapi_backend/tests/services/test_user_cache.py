@@ -0,0 +1,84 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.user_cache import UserCache
+
+
+def _user(user_id: str = "user-1") -> dict:
+    return {"id": user_id, "email": f"{user_id}@example.com"}
+
+
+class TestUserCache:
+    def test_get_returns_cached_user(self):
+        cache = UserCache(ttl_seconds=60, max_size=10)
+        cache.put("user-1", _user())
+
+        assert cache.get("user-1") == _user()
+        assert cache.get_stats() == {"size": 1, "hits": 1, "misses": 0}
+
+    def test_entries_expire_after_ttl(self):
+        cache = UserCache(ttl_seconds=60, max_size=10)
+        with patch("app.services.user_cache.time.monotonic", return_value=100.0):
+            cache.put("user-1", _user())
+        with patch("app.services.user_cache.time.monotonic", return_value=161.0):
+            assert cache.get("user-1") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = UserCache(ttl_seconds=60, max_size=2)
+        cache.put("a", _user("a"))
+        cache.put("b", _user("b"))
+        cache.get("a")
+        cache.put("c", _user("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_invalidate_accepts_uuid(self):
+        cache = UserCache(ttl_seconds=60, max_size=10)
+        user_id = uuid.uuid4()
+        cache.put(str(user_id), _user(str(user_id)))
+
+        cache.invalidate(user_id)
+
+        assert cache.get(str(user_id)) is None
+
+    def test_zero_ttl_disables_caching(self):
+        cache = UserCache(ttl_seconds=0, max_size=10)
+        cache.put("user-1", _user())
+        assert cache.get("user-1") is None
+
+
+class TestUserManagerInvalidation:
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate_cached_user(self):
+        from app.services.user_cache import user_cache
+        from app.users import UserManager
+
+        manager = UserManager(MagicMock())
+        user = MagicMock(id=uuid.uuid4())
+
+        user_cache.put(str(user.id), _user(str(user.id)))
+        await manager.on_after_update(user, {"is_active": False})
+        assert user_cache.get(str(user.id)) is None
+
+        user_cache.put(str(user.id), _user(str(user.id)))
+        await manager.on_after_delete(user)
+        assert user_cache.get(str(user.id)) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_published_to_other_workers(self):
+        from app.services.debate.streaming import connection_manager
+        from app.users import UserManager
+
+        user = MagicMock(id=uuid.uuid4())
+        with patch.object(
+            connection_manager.backplane, "publish_control", AsyncMock()
+        ) as publish:
+            await UserManager(MagicMock()).on_after_update(user, {"is_active": False})
+
+        publish.assert_awaited_once_with(
+            {"type": "user_invalidate", "user_id": str(user.id)}
+        )
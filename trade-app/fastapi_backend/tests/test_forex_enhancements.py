@@ -63,10 +63,10 @@ class TestTradingAnalystForex:
                 return_value=mock_llm,
             ),
             patch(
-                "app.services.debate.agents.trading_analyst.ChatPromptTemplate",
-            ) as mock_prompt_cls,
+                "app.services.debate.agents.trading_analyst.TRADING_ANALYST_CHAT_PROMPT",
+                mock_prompt,
+            ),
         ):
-            mock_prompt_cls.from_template.return_value = mock_prompt
             result = await generate_trading_analysis(
                 asset="EURUSD",
                 messages=[
@@ -125,10 +125,10 @@ class TestTradingAnalystForex:
                 return_value=mock_llm,
             ),
             patch(
-                "app.services.debate.agents.trading_analyst.ChatPromptTemplate",
-            ) as mock_prompt_cls,
+                "app.services.debate.agents.trading_analyst.TRADING_ANALYST_CHAT_PROMPT",
+                mock_prompt,
+            ),
         ):
-            mock_prompt_cls.from_template.return_value = mock_prompt
             result = await generate_trading_analysis(
                 asset="AAPL",
                 messages=[{"role": "bull", "content": "Strong earnings"}],